@@ -12,12 +12,16 @@ from .core import (
     BackendError,
     CRSMismatchError,
     EEOError,
+    EEOTimeSeries,
     MissingDependencyError,
     ValidationError,
     load_array,
     load_raster,
+    run_tiled,
 )
 from .core.adapters import *
+from .core.options import get_options, set_options
+from .core.stats_cache import clear_stats_cache
 from .io import from_xarray, stac_search
 from .ops import *
 from .preprocessing import *
@@ -27,9 +31,14 @@ __all__ = [
     "datasets",
     "load_raster",
     "load_array",
+    "run_tiled",
+    "EEOTimeSeries",
     "stac_search",
     "from_xarray",
     "show_versions",
+    "set_options",
+    "get_options",
+    "clear_stats_cache",
     "EEOError",
     "ValidationError",
     "CRSMismatchError",
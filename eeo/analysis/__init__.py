@@ -1,5 +1,9 @@
-"""Analysis operations: spectral indices and pixel statistics."""
+"""Analysis operations: indices, the calculator, pixel and zonal statistics, composites."""
 
+# Registers EEORasterDataset.eval. Not re-exported: a module-level ``eval``
+# would shadow the builtin under ``from eeo import *``.
+from . import calculator  # noqa: F401
+from .composite import composite
 from .indices import (
     evi,
     ndbi,
@@ -11,14 +15,18 @@ from .indices import (
 )
 from .stats import (
     extract_value_at_coordinate,
+    extract_values_at_coordinates,
     get_maximum_pixel,
     get_mean_pixel,
     get_minimum_pixel,
     get_percentile_pixel,
 )
+from .zonal import zonal_stats
 
 __all__ = [
+    "composite",
     "extract_value_at_coordinate",
+    "extract_values_at_coordinates",
     "normalized_difference",
     "ndvi",
     "ndwi",
@@ -30,4 +38,5 @@ __all__ = [
     "get_percentile_pixel",
     "get_mean_pixel",
     "get_maximum_pixel",
+    "zonal_stats",
 ]
@@ -0,0 +1,223 @@
+"""Temporal compositing: reduce a stack of co-registered scenes to one raster.
+
+A composite takes, for every pixel, one value per band out of all the
+observations of that pixel over time — their median, mean or a percentile, or
+the observation with the greenest NDVI. It is computed block by block: each
+window of the output reads only the same window of every scene, so the working
+set is one window times the number of scenes, never a scene times the number
+of scenes. Scenes held on disk (or behind HTTP range requests) are only ever
+read a window at a time.
+
+Every scene window goes through :func:`~eeo.common.apply_nodata_contract`
+before it is reduced, so a pixel that is nodata in a scene is NaN in the stack
+and never enters the reduction of that pixel.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+import numpy as np
+import rasterio as rio
+from rasterio.windows import Window
+
+from eeo.common import apply_nodata_contract, get_nodata, resolve_band_index
+from eeo.core.blocks import execute_blocks, parallel_windows, resolve_workers
+from eeo.core.core import EEORasterDataset
+from eeo.core.exceptions import AlignmentError, ValidationError
+from eeo.core.options import get_option
+from eeo.core.timeseries import EEOTimeSeries
+
+_PERCENTILE = re.compile(r"p(\d+(?:\.\d+)?)")
+
+
+def _parse_method(method: str) -> tuple[str, float | None]:
+    """Split ``method`` into the reduction to run and, for a percentile, its q."""
+    if method in ("median", "mean", "max_ndvi"):
+        return method, None
+    match = _PERCENTILE.fullmatch(method) if isinstance(method, str) else None
+    if match is not None and float(match.group(1)) <= 100:
+        return "percentile", float(match.group(1))
+    raise ValidationError(
+        'method must be "median", "mean", "max_ndvi", or a percentile such as "p90"; '
+        f"got {method!r}"
+    )
+
+
+def _scenes(source: EEOTimeSeries | Iterable[EEORasterDataset]) -> list[EEORasterDataset]:
+    """Return the scenes of ``source``, checked to share one grid and band layout."""
+    if isinstance(source, EEORasterDataset):
+        raise ValidationError(
+            "composite needs several scenes; got a single EEORasterDataset. "
+            "Pass an EEOTimeSeries or a list of datasets."
+        )
+    scenes = list(source)
+    if not scenes:
+        raise ValidationError("composite needs at least one scene; got none")
+    for scene in scenes:
+        if not isinstance(scene, EEORasterDataset):
+            raise ValidationError(
+                f"composite takes EEORasterDataset scenes; got {type(scene).__name__}"
+            )
+
+    first = scenes[0]
+    for index, scene in enumerate(scenes[1:], start=1):
+        if (
+            scene.get_shape() != first.get_shape()
+            or scene.get_transform() != first.get_transform()
+            or scene.get_crs() != first.get_crs()
+        ):
+            raise AlignmentError(
+                f"scene {index} is not on the first scene's grid; got shape "
+                f"{scene.get_shape()} vs {first.get_shape()}. Load the series onto one grid "
+                "with STACSearchResult.to_cube(grid=...), or resample the scenes first."
+            )
+        if scene.get_count() != first.get_count():
+            raise ValidationError(
+                f"scene {index} has {scene.get_count()} bands where the first has "
+                f"{first.get_count()}; every scene must share the band layout"
+            )
+    return scenes
+
+
+def _reduce(stack: np.ndarray, reduction: str, q: float | None) -> np.ndarray:
+    """Reduce a NaN-masked ``(time, band, rows, cols)`` stack over time.
+
+    A pixel with no valid observation comes out NaN. Those pixels are filled
+    before reducing and blanked after, so NumPy's NaN reducers never meet an
+    all-NaN slice (and never warn about one).
+    """
+    valid = np.count_nonzero(~np.isnan(stack), axis=0)
+    if reduction == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (np.nansum(stack, axis=0) / valid).astype(np.float32)
+
+    empty = valid == 0
+    stack[0][empty] = 0
+    if reduction == "median":
+        result = np.nanmedian(stack, axis=0)
+    else:
+        assert q is not None  # parsed with the method
+        result = np.nanpercentile(stack, q, axis=0)
+    result[empty] = np.nan
+    return result.astype(np.float32, copy=False)
+
+
+def _greenest(stack: np.ndarray, red: int, nir: int) -> np.ndarray:
+    """Take every band from the observation with the highest NDVI, per pixel."""
+    red_band, nir_band = stack[:, red], stack[:, nir]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        index = (nir_band - red_band) / (nir_band + red_band)
+    # A zero denominator counts as NDVI 0, as in ``ndvi()``; NaN stays NaN.
+    index[(nir_band + red_band) == 0] = 0
+    missing = np.isnan(index)
+    index[missing] = -np.inf
+    best = np.argmax(index, axis=0)
+    result = np.take_along_axis(stack, best[np.newaxis, np.newaxis], axis=0)[0]
+    result[:, missing.all(axis=0)] = np.nan
+    return result
+
+
+def composite(
+    source: EEOTimeSeries | Iterable[EEORasterDataset],
+    method: str = "median",
+    *,
+    red: int | str | None = None,
+    nir: int | str | None = None,
+    workers: int | None = None,
+) -> EEORasterDataset:
+    """Composite a stack of scenes into one raster, one block at a time.
+
+    Parameters
+    ----------
+    source : EEOTimeSeries or iterable of EEORasterDataset
+        The scenes to composite, e.g. from
+        :meth:`eeo.io.STACSearchResult.to_cube`, or datasets loaded with
+        :func:`eeo.load_raster`. Every scene must share one grid (CRS,
+        transform and shape) and band layout. File-backed scenes are read
+        one window at a time, so they need never fit in memory together.
+    method : str, default "median"
+        ``"median"``, ``"mean"``, a percentile written ``"pXX"`` (``"p10"``,
+        ``"p90"``, ``"p2.5"``), or ``"max_ndvi"``. The first three reduce
+        each band of each pixel over its valid observations on its own;
+        ``"max_ndvi"`` takes every band from the one observation of the pixel
+        with the highest NDVI, so the bands of a pixel stay consistent.
+    red, nir : int, str, or None, default None
+        The red and NIR bands, as 1-based indexes or band names. Required for
+        ``"max_ndvi"``; ignored otherwise.
+    workers : int or None, default None
+        Threads computing blocks concurrently; None uses the ``num_threads``
+        option.
+
+    Returns
+    -------
+    EEORasterDataset
+        NumPy-backed float32 composite on the scenes' grid, with the first
+        scene's band names and no timestamp. A pixel with no valid
+        observation in any scene is NaN, and the nodata value is NaN whenever
+        a scene declares one.
+
+    Raises
+    ------
+    ValidationError
+        If ``method`` is unknown, ``"max_ndvi"`` is asked for without
+        ``red`` and ``nir``, ``workers`` is not a positive int, ``source`` is
+        a single dataset or empty, or the scenes' band counts differ.
+    AlignmentError
+        If the scenes are not on one grid.
+
+    Notes
+    -----
+    Each block reads one window of every scene into a float32 stack. The
+    windows are sized so that the scenes' source pixels for one window stay
+    within the ``block_budget`` option, which caps the working set at a small
+    multiple of that budget per thread, whatever the scene size and however
+    many scenes there are.
+
+    Examples
+    --------
+    >>> cube = results.to_cube(["B02", "B03", "B04", "B08"])  # doctest: +SKIP
+    >>> median = eeo.composite(cube, "median")  # doctest: +SKIP
+    >>> greenest = eeo.composite(cube, "max_ndvi", red="B04", nir="B08")  # doctest: +SKIP
+    >>> scenes = [eeo.load_raster(path) for path in paths]  # doctest: +SKIP
+    >>> p90 = eeo.composite(scenes, "p90", workers=4)  # doctest: +SKIP
+    """
+    reduction, q = _parse_method(method)
+    workers = resolve_workers(workers)
+    scenes = _scenes(source)
+    first = scenes[0]
+    if reduction == "max_ndvi":
+        if red is None or nir is None:
+            raise ValidationError('method="max_ndvi" needs the red= and nir= bands')
+        red_index = resolve_band_index(first, red) - 1
+        nir_index = resolve_band_index(first, nir) - 1
+    nodatas = [get_nodata(scene) for scene in scenes]
+
+    def compute(window: Window) -> np.ndarray:
+        stack = np.empty(
+            (len(scenes), first.get_count(), int(window.height), int(window.width)),
+            dtype=rio.float32,
+        )
+        for scene, nodata, out in zip(scenes, nodatas, stack, strict=True):
+            raw = scene._adapter.read_window(window)
+            apply_nodata_contract(raw, [(raw, nodata)], fractional=True, ds_nodata=nodata, out=out)
+        if reduction == "max_ndvi":
+            return _greenest(stack, red_index, nir_index)
+        return _reduce(stack, reduction, q)
+
+    # The budget bounds one window of every scene together, not of each.
+    budget = max(1, get_option("block_budget") // len(scenes))
+    windows = parallel_windows(first._adapter, workers, budget=budget)
+    height, width = first.get_shape()
+    out = np.empty((first.get_count(), height, width), dtype=rio.float32)
+    execute_blocks(compute, windows, out, workers=workers)
+
+    declares_nodata = any(nodata is not None for nodata in nodatas)
+    return EEORasterDataset.from_array(
+        out,
+        transform=first.get_transform(),
+        crs=first.get_crs(),
+        nodata=float("nan") if declares_nodata else None,
+        band_names=first.band_names,
+    )
@@ -22,8 +22,17 @@ result: ``.get_band(1)`` for the 2D band, or ``.to_array()`` for the
 
 The general two-operand primitive, :func:`normalized_difference`, is also kept
 here: any normalized-difference index can be expressed with it directly.
+
+Indices are computed block by block, reading one window of each required band
+at a time (see :mod:`eeo.core.blocks`), so their peak memory is bounded by the
+``block_budget`` option rather than by the scene size. With ``workers=`` (or
+the ``num_threads`` option) above 1 the blocks run concurrently. On a
+dask-backed (lazy) raster, an index is instead added to the dask graph, one
+task per chunk, and nothing is computed until its pixels are needed.
 """
 
+from functools import partial
+
 import numpy as np
 import rasterio as rio
 
@@ -33,6 +42,8 @@ from eeo.common import (
     get_nodata,
     resolve_band_index,
 )
+from eeo.core.adapters import DaskAdapter
+from eeo.core.blocks import execute_blocks, map_elementwise, parallel_windows, resolve_workers
 from eeo.core.core import EEORasterDataset
 from eeo.core.decorators import eeo_raster_op
 from eeo.core.exceptions import AlignmentError, ValidationError
@@ -58,14 +69,14 @@ def _safe_ratio(numerator, denominator):
 
 
 def _resolve_band(ds, spec, *, auto_align, method):
-    """Resolve a band spec to ``(band_float32, band_raw, nodata)``.
+    """Resolve a band spec to ``(dataset, band_index, nodata)``.
 
     ``spec`` is a 1-based ``int`` band index into ``ds``, the ``str`` name of
     one of ``ds``'s bands, or a separate ``EEORasterDataset`` (its first band
     is used, aligned onto ``ds``'s grid when ``auto_align`` is True). Index and
     name specs both go through the shared resolver, so a string is always a
-    name and never an index. ``band_raw`` keeps its source dtype so the nodata
-    mask compares against the declared sentinel exactly.
+    name and never an index. The returned dataset is on ``ds``'s grid; the
+    band is read from it window by window.
     """
     if isinstance(spec, EEORasterDataset):
         other = spec
@@ -76,59 +87,90 @@ def _resolve_band(ds, spec, *, auto_align, method):
                 raise AlignmentError(
                     _ALIGN_MISMATCH.format(other=other.get_shape(), ds=ds.get_shape())
                 )
-        raw = other.get_band(1)
-        nodata = get_nodata(other)
-    elif isinstance(spec, (int, str)) and not isinstance(spec, bool):
-        raw = ds.get_band(resolve_band_index(ds, spec))
-        nodata = get_nodata(ds)
-    else:
-        raise ValidationError(
-            "band must be an EEORasterDataset, a 1-based int band index, or a "
-            f"band name; got {type(spec).__name__}"
-        )
-    return raw.astype(rio.float32), raw, nodata
+        return other, 1, get_nodata(other)
+    if isinstance(spec, (int, str)) and not isinstance(spec, bool):
+        return ds, resolve_band_index(ds, spec), get_nodata(ds)
+    raise ValidationError(
+        "band must be an EEORasterDataset, a 1-based int band index, or a "
+        f"band name; got {type(spec).__name__}"
+    )
+
+
+def _index_kernel(formula, *raws):
+    """Apply ``formula`` to raw band windows cast to float32."""
+    return formula([raw.astype(rio.float32) for raw in raws])
 
 
-def _compute_index(ds, band_specs, formula, *, auto_align, method, name=None):
-    """Resolve band specs, apply ``formula``, and package the float32 result.
+def _compute_index(ds, band_specs, formula, *, auto_align, method, name=None, workers=None):
+    """Resolve band specs, apply ``formula`` block by block, and package the result.
 
     ``band_specs`` is the ordered list of band specs; the first is the primary
-    band. ``formula`` maps the list of float32 band arrays to a 2D result. The
-    result is masked per the nodata contract (contagious across every band) and
-    returned as a single-band float32 ``EEORasterDataset`` whose band carries
-    ``name`` (unnamed when ``name`` is None).
+    band. ``formula`` maps the list of float32 band windows to the result.
+    Each block is masked per the nodata contract (contagious across every band)
+    and written into a single-band float32 ``EEORasterDataset`` whose band
+    carries ``name`` (unnamed when ``name`` is None). The blocks run on
+    ``workers`` threads (None uses the ``num_threads`` option). If any band is
+    dask-backed, the result is a lazy dask-backed dataset instead, computed
+    per chunk by the same ``formula`` and contract.
     """
-    ds = ds.to_rasterio()
+    workers = resolve_workers(workers)
+    # Keeps every resolved dataset, aligned copies included, alive while
+    # their adapters are read.
     resolved = [
         _resolve_band(ds, spec, auto_align=auto_align, method=method) for spec in band_specs
     ]
-    floats = [band for band, _raw, _nodata in resolved]
-    operands = [(raw, nodata) for _band, raw, nodata in resolved]
-    primary_nodata = resolved[0][2]
+    lazy = [
+        band_ds._adapter for band_ds, _, _ in resolved if isinstance(band_ds._adapter, DaskAdapter)
+    ]
+    if lazy:
+        # Each band becomes a single-band view chunked like the first lazy
+        # one, so the index joins their graph like any element-wise op.
+        chunks = lazy[0].get_block_shape()
+        assert chunks is not None  # a dask array always has chunks
+        bands: list[EEORasterDataset | float | int] = [
+            EEORasterDataset(
+                DaskAdapter.from_adapter(band_ds._adapter, chunks=chunks).select_bands(
+                    [index], keep_alive=(band_ds,)
+                )
+            )
+            for band_ds, index, _ in resolved
+        ]
+        result = map_elementwise(partial(_index_kernel, formula), bands, fractional=True)
+    else:
+        result = _eager_index(ds, resolved, formula, workers)
+    if name is not None:
+        result.set_band_name(1, name)
+    return result
 
-    result = formula(floats)
 
-    index, out_nodata = apply_nodata_contract(
-        result, operands, fractional=True, ds_nodata=primary_nodata
-    )
+def _eager_index(ds, resolved, formula, workers):
+    """Compute the index of the ``resolved`` bands block by block into memory."""
+    primary_nodata = resolved[0][2]
 
-    data = index[np.newaxis, ...] if index.ndim == 2 else index
-    meta = ds.get_metadata().copy()
-    meta.update(
-        driver="GTiff",
-        dtype="float32",
-        nodata=out_nodata,
-        height=data.shape[-2],
-        width=data.shape[-1],
-        count=data.shape[0],
+    def compute(window):
+        raws = [band_ds._adapter.read_window(window, [index])[0] for band_ds, index, _ in resolved]
+        result = _index_kernel(formula, *raws)
+        # Mask nodata last so a masked pixel is NaN regardless of its ratio.
+        index, _ = apply_nodata_contract(
+            result,
+            [(raw, nodata) for raw, (_, _, nodata) in zip(raws, resolved, strict=True)],
+            fractional=True,
+            ds_nodata=primary_nodata,
+        )
+        return index
+
+    out = np.empty(ds.get_shape(), dtype=np.float32)
+    execute_blocks(compute, parallel_windows(ds._adapter, workers), out, workers=workers)
+    # A fractional result is float32, so the contract's nodata is NaN as soon
+    # as any band declares one.
+    declares_nodata = any(nodata is not None for _, _, nodata in resolved)
+
+    return EEORasterDataset.from_array(
+        out,
+        transform=ds.get_transform(),
+        crs=ds.get_crs(),
+        nodata=float("nan") if declares_nodata else None,
     )
-    memfile = rio.io.MemoryFile()
-    out_ds = memfile.open(**meta)
-    out_ds.write(data)
-    result = EEORasterDataset.from_rasterio(out_ds)
-    if name is not None:
-        result.set_band_name(1, name)
-    return result
 
 
 def _normalized_difference(bands):
@@ -137,6 +179,11 @@ def _normalized_difference(bands):
     return _safe_ratio(a - b, a + b)
 
 
+def _nd_kernel(a, b):
+    """Element-wise normalized difference of two raw windows, in float32."""
+    return _normalized_difference([a.astype(rio.float32), b.astype(rio.float32)])
+
+
 @eeo_raster_op(propagate_band_names=False)
 def normalized_difference(
     ds: EEORasterDataset,
@@ -145,15 +192,15 @@ def normalized_difference(
     auto_align: bool = True,
     method: str = "bilinear",
     name: str | None = None,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Compute the normalized difference ``(ds - other) / (ds + other)``.
 
     This is the general primitive underlying the normalized-difference indices
     (NDVI, NDWI, NDMI, NDBI): ``ds`` is the first band of the pair, ``other``
     the second. Unlike the named indices, it operates on whole datasets
-    band-by-band rather than selecting a single band. NumPy-backed inputs are
-    promoted to rasterio, and ``other`` is resampled onto ``ds``'s grid when
-    ``auto_align`` is True.
+    band-by-band rather than selecting a single band. ``other`` is resampled
+    onto ``ds``'s grid when ``auto_align`` is True.
 
     Parameters
     ----------
@@ -171,6 +218,9 @@ def normalized_difference(
         Optional name for the output band. The result is never named
         automatically; ``name`` applies only to a single-band result — for a
         multi-band one, assign ``band_names`` on the result instead.
+    workers : int or None, default None
+        Threads to compute the index's blocks on. None uses the
+        ``num_threads`` option; the result is identical for every value.
 
     Returns
     -------
@@ -185,11 +235,12 @@ def normalized_difference(
     AlignmentError
         If the two rasters are on different grids and ``auto_align`` is False.
     ValidationError
-        If ``name`` is given for a result with more than one band.
+        If ``name`` is given for a result with more than one band, or if
+        ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads both rasters fully into memory rather than streaming block-wise.
+    Computed block by block, one window of each raster at a time.
     Nodata pixels are masked before the ratio; separately, a zero denominator
     (``ds + other == 0``) is guarded by setting those pixels to 0.
 
@@ -198,45 +249,13 @@ def normalized_difference(
     >>> ndvi = ds_nir.normalized_difference(ds_red)
     >>> ndvi_array = ds_nir.normalized_difference(ds_red).to_array()
     """
-    ds = ds.to_rasterio()
     if ds.get_shape() != other.get_shape() or ds.get_transform() != other.get_transform():
         if auto_align:
             other = align_raster_to_target(other, ds, method=method)
         else:
             raise AlignmentError(_ALIGN_MISMATCH.format(other=other.get_shape(), ds=ds.get_shape()))
 
-    ds_nodata = get_nodata(ds)
-    other_nodata = get_nodata(other)
-    a_raw = ds.read()
-    b_raw = other.read()
-    a = a_raw.astype(rio.float32)
-    b = b_raw.astype(rio.float32)
-
-    nd = _safe_ratio(a - b, a + b)
-
-    # Mask nodata last so a masked pixel is NaN regardless of its ratio.
-    nd, out_nodata = apply_nodata_contract(
-        nd,
-        [(a_raw, ds_nodata), (b_raw, other_nodata)],
-        fractional=True,
-        ds_nodata=ds_nodata,
-    )
-
-    meta = ds.get_metadata().copy()
-    meta.update(
-        driver="GTiff",
-        dtype="float32",
-        nodata=out_nodata,
-        height=nd.shape[-2],
-        width=nd.shape[-1],
-        count=nd.shape[0],
-    )
-
-    memfile = rio.io.MemoryFile()
-    out_ds = memfile.open(**meta)
-    out_ds.write(nd)
-
-    result = EEORasterDataset.from_rasterio(out_ds)
+    result = map_elementwise(_nd_kernel, [ds, other], fractional=True, workers=workers)
     if name is not None:
         if result.get_count() != 1:
             raise ValidationError(
@@ -256,6 +275,7 @@ def ndvi(
     auto_align: bool = True,
     method: str = "bilinear",
     name: str | None = None,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Compute the Normalized Difference Vegetation Index.
 
@@ -290,6 +310,9 @@ def ndvi(
         band, so it is never named automatically: it stays unnamed unless a
         name is given here or assigned later via ``band_names`` /
         ``set_band_name``.
+    workers : int or None, default None
+        Threads to compute the index's blocks on. None uses the
+        ``num_threads`` option; the result is identical for every value.
 
     Returns
     -------
@@ -307,12 +330,12 @@ def ndvi(
         If an int band index is outside the range of available bands.
     ValidationError
         If a band argument is not an ``EEORasterDataset``, an int index, or a
-        band name, or if a band name is unknown or matches more than one band.
+        band name, if a band name is unknown or matches more than one band,
+        or if ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the required bands fully into memory rather than streaming
-    block-wise.
+    Computed block by block, one window of each required band at a time.
 
     Examples
     --------
@@ -326,6 +349,7 @@ def ndvi(
         auto_align=auto_align,
         method=method,
         name=name,
+        workers=workers,
     )
 
 
@@ -338,6 +362,7 @@ def ndwi(
     auto_align: bool = True,
     method: str = "bilinear",
     name: str | None = None,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Compute the Normalized Difference Water Index (McFeeters, 1996).
 
@@ -372,6 +397,9 @@ def ndwi(
         band, so it is never named automatically: it stays unnamed unless a
         name is given here or assigned later via ``band_names`` /
         ``set_band_name``.
+    workers : int or None, default None
+        Threads to compute the index's blocks on. None uses the
+        ``num_threads`` option; the result is identical for every value.
 
     Returns
     -------
@@ -389,12 +417,12 @@ def ndwi(
         If an int band index is outside the range of available bands.
     ValidationError
         If a band argument is not an ``EEORasterDataset``, an int index, or a
-        band name, or if a band name is unknown or matches more than one band.
+        band name, if a band name is unknown or matches more than one band,
+        or if ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the required bands fully into memory rather than streaming
-    block-wise. This is McFeeters' water NDWI; the moisture variant is
+    Computed block by block, one window of each required band at a time. This is McFeeters' water NDWI; the moisture variant is
     :meth:`ndmi`.
 
     Examples
@@ -409,6 +437,7 @@ def ndwi(
         auto_align=auto_align,
         method=method,
         name=name,
+        workers=workers,
     )
 
 
@@ -421,6 +450,7 @@ def ndmi(
     auto_align: bool = True,
     method: str = "bilinear",
     name: str | None = None,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Compute the Normalized Difference Moisture Index.
 
@@ -454,6 +484,9 @@ def ndmi(
         band, so it is never named automatically: it stays unnamed unless a
         name is given here or assigned later via ``band_names`` /
         ``set_band_name``.
+    workers : int or None, default None
+        Threads to compute the index's blocks on. None uses the
+        ``num_threads`` option; the result is identical for every value.
 
     Returns
     -------
@@ -471,12 +504,12 @@ def ndmi(
         If an int band index is outside the range of available bands.
     ValidationError
         If a band argument is not an ``EEORasterDataset``, an int index, or a
-        band name, or if a band name is unknown or matches more than one band.
+        band name, if a band name is unknown or matches more than one band,
+        or if ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the required bands fully into memory rather than streaming
-    block-wise. Sentinel-2's SWIR1 (B11) is 20 m; pass ``auto_align=True``
+    Computed block by block, one window of each required band at a time. Sentinel-2's SWIR1 (B11) is 20 m; pass ``auto_align=True``
     (the default) to resample it onto a 10 m NIR grid.
 
     Examples
@@ -491,6 +524,7 @@ def ndmi(
         auto_align=auto_align,
         method=method,
         name=name,
+        workers=workers,
     )
 
 
@@ -503,6 +537,7 @@ def ndbi(
     auto_align: bool = True,
     method: str = "bilinear",
     name: str | None = None,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Compute the Normalized Difference Built-up Index.
 
@@ -537,6 +572,9 @@ def ndbi(
         band, so it is never named automatically: it stays unnamed unless a
         name is given here or assigned later via ``band_names`` /
         ``set_band_name``.
+    workers : int or None, default None
+        Threads to compute the index's blocks on. None uses the
+        ``num_threads`` option; the result is identical for every value.
 
     Returns
     -------
@@ -554,12 +592,12 @@ def ndbi(
         If an int band index is outside the range of available bands.
     ValidationError
         If a band argument is not an ``EEORasterDataset``, an int index, or a
-        band name, or if a band name is unknown or matches more than one band.
+        band name, if a band name is unknown or matches more than one band,
+        or if ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the required bands fully into memory rather than streaming
-    block-wise. Sentinel-2's SWIR1 (B11) is 20 m; pass ``auto_align=True``
+    Computed block by block, one window of each required band at a time. Sentinel-2's SWIR1 (B11) is 20 m; pass ``auto_align=True``
     (the default) to resample it onto a 10 m NIR grid.
 
     Examples
@@ -574,6 +612,7 @@ def ndbi(
         auto_align=auto_align,
         method=method,
         name=name,
+        workers=workers,
     )
 
 
@@ -587,6 +626,7 @@ def evi(
     auto_align: bool = True,
     method: str = "bilinear",
     name: str | None = None,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Compute the Enhanced Vegetation Index.
 
@@ -628,6 +668,9 @@ def evi(
         band, so it is never named automatically: it stays unnamed unless a
         name is given here or assigned later via ``band_names`` /
         ``set_band_name``.
+    workers : int or None, default None
+        Threads to compute the index's blocks on. None uses the
+        ``num_threads`` option; the result is identical for every value.
 
     Returns
     -------
@@ -646,12 +689,12 @@ def evi(
         If an int band index is outside the range of available bands.
     ValidationError
         If a band argument is not an ``EEORasterDataset``, an int index, or a
-        band name, or if a band name is unknown or matches more than one band.
+        band name, if a band name is unknown or matches more than one band,
+        or if ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the required bands fully into memory rather than streaming
-    block-wise.
+    Computed block by block, one window of each required band at a time.
 
     Examples
     --------
@@ -665,6 +708,7 @@ def evi(
         auto_align=auto_align,
         method=method,
         name=name,
+        workers=workers,
     )
 
 
@@ -684,6 +728,7 @@ def savi(
     auto_align: bool = True,
     method: str = "bilinear",
     name: str | None = None,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Compute the Soil-Adjusted Vegetation Index.
 
@@ -721,6 +766,9 @@ def savi(
         band, so it is never named automatically: it stays unnamed unless a
         name is given here or assigned later via ``band_names`` /
         ``set_band_name``.
+    workers : int or None, default None
+        Threads to compute the index's blocks on. None uses the
+        ``num_threads`` option; the result is identical for every value.
 
     Returns
     -------
@@ -738,12 +786,12 @@ def savi(
         If an int band index is outside the range of available bands.
     ValidationError
         If a band argument is not an ``EEORasterDataset``, an int index, or a
-        band name, or if a band name is unknown or matches more than one band.
+        band name, if a band name is unknown or matches more than one band,
+        or if ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the required bands fully into memory rather than streaming
-    block-wise.
+    Computed block by block, one window of each required band at a time.
 
     Examples
     --------
@@ -757,6 +805,7 @@ def savi(
         auto_align=auto_align,
         method=method,
         name=name,
+        workers=workers,
     )
 
 
@@ -1,14 +1,31 @@
 """Per-pixel statistics and coordinate sampling."""
 
-import numpy as np
+import threading
+from collections.abc import Sequence
+from typing import Any
 
-from eeo.common import get_nodata, mask_nodata
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from rasterio.crs import CRS
+from rasterio.transform import rowcol
+from rasterio.warp import transform as transform_coordinates
+from rasterio.windows import Window
+
+from eeo.common import get_nodata, mask_nodata, resolve_band_index
+from eeo.core.blocks import block_windows, parallel_windows, resolve_workers, run_blocks
 from eeo.core.core import EEORasterDataset
 from eeo.core.decorators import eeo_raster_op
 from eeo.core.exceptions import ValidationError
+from eeo.core.stats_cache import cached_percentiles
 
 Coordinate = tuple[float, float] | list[float]
 
+# Accepted forms for the ``points`` of ``extract_values_at_coordinates``: an
+# ``(n, 2)`` array-like of ``(x, y)`` pairs, or a GeoDataFrame / GeoSeries of
+# point geometries.
+Points = Any
+
 
 @eeo_raster_op
 def extract_value_at_coordinate(
@@ -19,7 +36,7 @@ def extract_value_at_coordinate(
     Parameters
     ----------
     ds : EEORasterDataset
-        Raster to sample. NumPy-backed inputs are promoted to rasterio.
+        Raster to sample.
     coordinates : tuple of float or list of float
         ``(x, y)`` position in the raster's CRS units. Must contain exactly
         two values and fall within the raster extent.
@@ -57,14 +74,11 @@ def extract_value_at_coordinate(
             f"coordinates must contain exactly 2 values (x, y); got {len(coordinates)}"
         )
 
-    # No-op when the dataset is already rasterio-backed
-    ds = ds.to_rasterio()
-    backend = ds._adapter.backend
-
     x, y = coordinates
-    # rasterio's DatasetReader.index returns ints on 1.5+ but floats on 1.4,
-    # so coerce before indexing to stay correct across the supported range.
-    row, col = backend.index(x, y)
+    # Map through the geotransform directly: any backend can answer this, so
+    # nothing is promoted. rowcol returns ints on rasterio 1.5+ but floats on
+    # 1.4, so coerce before indexing to stay correct across the supported range.
+    row, col = rowcol(ds.get_transform(), x, y)
     row, col = int(row), int(col)
 
     value = ds.get_band(band_idx)[row, col]
@@ -80,6 +94,171 @@ def extract_value_at_coordinate(
     return value
 
 
+def _point_coordinates(
+    ds: EEORasterDataset, points: Points, crs: Any
+) -> tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Return the x and y of ``points`` in ``ds``'s CRS, and the index labelling them."""
+    if isinstance(points, (gpd.GeoDataFrame, gpd.GeoSeries)):
+        if crs is not None:
+            raise ValidationError(
+                "crs= is for coordinate arrays; a GeoDataFrame or GeoSeries carries its own CRS"
+            )
+        geometry = points.geometry if isinstance(points, gpd.GeoDataFrame) else points
+        if not (geometry.geom_type == "Point").all():
+            kinds = sorted(set(geometry.geom_type.dropna()) - {"Point"}) or ["empty"]
+            raise ValidationError(
+                f"points must all be Point geometries; got {', '.join(kinds)}. "
+                "Sample polygons with zonal_stats, or take their centroids first."
+            )
+        # A layer without a CRS is taken to be in the raster's, as in clipping.
+        if geometry.crs is not None and ds.get_crs() is not None:
+            geometry = geometry.to_crs(ds.get_crs())
+        return geometry.x.to_numpy(), geometry.y.to_numpy(), points.index
+
+    array = np.asarray(points, dtype="float64")
+    if array.size == 0:
+        array = array.reshape(0, 2)
+    if array.ndim != 2 or array.shape[1] != 2:
+        raise ValidationError(
+            f"points must be (x, y) pairs shaped (n, 2), or point geometries; "
+            f"got an array shaped {array.shape}"
+        )
+    xs, ys = array[:, 0], array[:, 1]
+    if crs is not None and len(xs) and CRS.from_user_input(crs) != ds.get_crs():
+        # One batched call transforms every point.
+        xs, ys = (np.asarray(v) for v in transform_coordinates(crs, ds.get_crs(), xs, ys))
+    return xs, ys, pd.RangeIndex(len(xs))
+
+
+def _sampling_lattice(ds: EEORasterDataset) -> tuple[int, int]:
+    """Return the ``(rows, cols)`` of the blocks points are grouped by.
+
+    The backend's native block, so each read fetches exactly one stored block;
+    a backend without one falls back to the budget-sized windows of a
+    block-wise pass, which keeps a deferred source's evaluation bounded.
+    """
+    block_shape = ds._adapter.get_block_shape()
+    if block_shape is not None:
+        return block_shape
+    first = block_windows(ds._adapter)[0]
+    return int(first.height), int(first.width)
+
+
+@eeo_raster_op
+def extract_values_at_coordinates(
+    ds: EEORasterDataset,
+    points: Points,
+    bands: int | str | Sequence[int | str] | None = None,
+    *,
+    crs: Any = None,
+    workers: int | None = None,
+) -> pd.DataFrame:
+    """Sample the raster at many points at once, reading only the blocks they fall in.
+
+    Parameters
+    ----------
+    ds : EEORasterDataset
+        Raster to sample.
+    points : array-like, GeoDataFrame, or GeoSeries
+        ``(x, y)`` pairs shaped ``(n, 2)``, or point geometries. A
+        GeoDataFrame or GeoSeries is reprojected onto the raster's CRS when
+        it declares a CRS, and taken to be in it otherwise.
+    bands : int, str, sequence of (int or str), or None, default None
+        Bands to sample, as 1-based indexes or band names; None samples
+        every band.
+    crs : rasterio.crs.CRS, int, str, or None, default None
+        CRS of array ``points``, when it is not the raster's (e.g. ``4326``
+        for lon/lat). Not allowed with geometries, which carry their own.
+    workers : int or None, default None
+        Threads reading blocks concurrently; None uses the ``num_threads``
+        option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per point, in input order and with the input's index (a
+        ``RangeIndex`` for arrays), and one float64 column per sampled band,
+        named after the band (``band_<n>`` for an unnamed one). A point
+        outside the raster, or on a nodata pixel, is NaN.
+
+    Raises
+    ------
+    ValidationError
+        If ``points`` is neither ``(n, 2)`` coordinates nor point geometries,
+        ``crs`` is combined with geometries, a band name is unknown or
+        ambiguous, or ``workers`` is not a positive int.
+    IndexError
+        If a band index is out of range.
+
+    Notes
+    -----
+    All points are transformed onto the raster's CRS in one batch, mapped to
+    pixels through the geotransform, and grouped by the native block (for a
+    tiled GeoTIFF, the tile) they fall in. Each block holding at least one
+    point is read once, for the requested bands only, and every point in it
+    is picked out of that read. Blocks no point falls in are never read.
+    Unlike :func:`extract_value_at_coordinate`, the raster is never read
+    whole.
+
+    Examples
+    --------
+    >>> table = ds.extract_values_at_coordinates([(500_010.0, 4_199_990.0), (500_250.0, 4_199_750.0)])
+    >>> plots = gpd.read_file("plots.gpkg")  # doctest: +SKIP
+    >>> values = ds.extract_values_at_coordinates(plots, bands=["B04", "B08"])  # doctest: +SKIP
+    >>> plots.join(values)  # doctest: +SKIP
+    """
+    workers = resolve_workers(workers)
+    if bands is None:
+        indexes = list(range(1, ds.get_count() + 1))
+    elif isinstance(bands, (int, str)):
+        indexes = [resolve_band_index(ds, bands)]
+    else:
+        indexes = [resolve_band_index(ds, band) for band in bands]
+    names = [ds.band_names[i - 1] or f"band_{i}" for i in indexes]
+    xs, ys, index = _point_coordinates(ds, points, crs)
+    values = np.full((len(xs), len(indexes)), np.nan)
+
+    # Pixel position of every point, through the inverse geotransform; the
+    # floor matches ``rowcol``. NaN coordinates compare False and fall out.
+    inverse = ~ds.get_transform()
+    cols_f = inverse.a * xs + inverse.b * ys + inverse.c
+    rows_f = inverse.d * xs + inverse.e * ys + inverse.f
+    height, width = ds.get_shape()
+    inside = np.flatnonzero((rows_f >= 0) & (rows_f < height) & (cols_f >= 0) & (cols_f < width))
+    rows = np.floor(rows_f[inside]).astype(np.int64)
+    cols = np.floor(cols_f[inside]).astype(np.int64)
+
+    # Sort the points by the block they fall in, and read each block once.
+    block_rows, block_cols = _sampling_lattice(ds)
+    blocks_across = -(-width // block_cols)
+    block = (rows // block_rows) * blocks_across + cols // block_cols
+    order = np.argsort(block, kind="stable")
+    keys, starts = np.unique(block[order], return_index=True)
+    groups = dict(
+        zip(keys.tolist(), np.split(order, starts[1:]) if len(order) else [], strict=True)
+    )
+    windows = []
+    for key in groups:
+        row, col = (key // blocks_across) * block_rows, (key % blocks_across) * block_cols
+        windows.append(
+            Window(col, row, min(block_cols, width - col), min(block_rows, height - row))
+        )
+    nodata = get_nodata(ds)
+
+    def sample(window: Window) -> None:
+        row_off, col_off = int(window.row_off), int(window.col_off)
+        group = groups[(row_off // block_rows) * blocks_across + col_off // block_cols]
+        data = ds._adapter.read_window(window, indexes)
+        picked = data[:, rows[group] - row_off, cols[group] - col_off].T
+        result = picked.astype(np.float64)
+        if nodata is not None:
+            result[picked == nodata] = np.nan
+        values[inside[group]] = result
+
+    run_blocks(sample, windows, workers=workers)
+    return pd.DataFrame(values, index=index, columns=names)
+
+
 @eeo_raster_op
 def get_maximum_pixel(
     ds: EEORasterDataset,
@@ -262,6 +441,33 @@ def get_mean_pixel(
     return {"value": mean_value, "position": position}
 
 
+def _nearest_pixel(ds: EEORasterDataset, band: int, value: float) -> tuple[int, int]:
+    """Return the ``(row, col)`` of the valid pixel of ``band`` nearest ``value``.
+
+    Reads block by block; among equally near pixels the first in row-major
+    order wins, as with ``np.nanargmin`` over the whole band.
+    """
+    workers = resolve_workers(None)
+    windows = parallel_windows(ds._adapter, workers)
+    best: list[tuple[float, int, int]] = []
+    lock = threading.Lock()
+
+    def search(window: Window) -> None:
+        block = mask_nodata(ds, ds._adapter.read_window(window, [band])[0])
+        diff = np.abs(block - value)
+        if np.isnan(diff).all():
+            return
+        row, col = np.unravel_index(np.nanargmin(diff), diff.shape)
+        with lock:
+            best.append(
+                (float(diff[row, col]), window.row_off + int(row), window.col_off + int(col))
+            )
+
+    run_blocks(search, windows, workers=workers)
+    _, row, col = min(best)
+    return row, col
+
+
 @eeo_raster_op
 def get_percentile_pixel(
     ds: EEORasterDataset,
@@ -300,23 +506,26 @@ def get_percentile_pixel(
         If ``band_idx`` is an index outside the range of available bands.
     ValidationError
         If ``band_idx`` is a name that is unknown or matches more than one
-        band.
+        band, if ``percentile`` is outside ``[0, 100]``, or if the band has
+        no valid pixel.
 
     Notes
     -----
-    Reads the band into memory. Nodata pixels are masked to NaN and ignored.
+    Streams the band block by block and never holds it in memory: the
+    percentile comes from :func:`eeo.core.histogram.band_percentiles` (exact,
+    as ``numpy.nanpercentile``), and a further pass finds the nearest pixel.
+    Nodata pixels are ignored. Ties go to the first pixel in row-major order.
 
     Examples
     --------
     >>> p95 = ds.get_percentile_pixel(95)
     >>> p95["value"], p95["position"]
     """
-    band = mask_nodata(ds, ds.get_band(band_idx))
-
-    perc_value = float(np.nanpercentile(band, percentile))
-    diff = np.abs(band - perc_value)
-
-    row, col = np.unravel_index(np.nanargmin(diff), diff.shape)
+    band = resolve_band_index(ds, band_idx)
+    perc_value = float(cached_percentiles(ds._adapter, percentile, bands=[band])[0, 0])
+    if np.isnan(perc_value):
+        raise ValidationError(f"band {band_idx!r} has no valid pixels")
+    row, col = _nearest_pixel(ds, band, perc_value)
 
     if return_position_as_pixel_coordinate:
         position = (row, col)
@@ -1,10 +1,13 @@
-"""Shared helpers used across operations (alignment, resampling)."""
+"""Shared helpers used across operations (alignment, resampling, nodata, labels)."""
 
 from __future__ import annotations
 
+import math
+import threading
 from typing import TYPE_CHECKING
 
 import numpy as np
+from affine import Affine
 from rasterio.enums import Resampling
 
 if TYPE_CHECKING:
@@ -12,8 +15,20 @@ if TYPE_CHECKING:
     # eeo.ops/eeo.analysis/etc, which import from this module - a real
     # runtime import here would be circular. Neither function below needs
     # EEORasterDataset at runtime; both just call duck-typed methods on it.
+    import geopandas as gpd
+
     from eeo.core.core import EEORasterDataset
 
+# Per-thread scratch buffers for the nodata contract (see _scratch_mask).
+_SCRATCH = threading.local()
+
+# Held around rasterio's rasterize and geometry_mask when they run on worker
+# threads. They burn into a scratch in-memory dataset and silence its
+# NotGeoreferencedWarning with ``warnings.catch_warnings``, which is not
+# thread-safe: concurrent calls can restore the filters while another one is
+# warning. Burning shapes is cheap beside reading the pixels they cover.
+RASTERIZE_LOCK = threading.Lock()
+
 
 def is_rasterio_backed(ds: EEORasterDataset) -> bool:
     """Return True if ``ds`` is backed by the rasterio adapter.
@@ -21,9 +36,8 @@ def is_rasterio_backed(ds: EEORasterDataset) -> bool:
     Detection is based on the adapter type, not the class of the backend
     object. A rasterio-backed dataset's ``backend`` may be a
     ``rasterio.io.DatasetReader`` (opened from a file) or a
-    ``rasterio.io.DatasetWriter`` (produced in memory by an operation, e.g.
-    the result of any algebra op or ``to_rasterio()``); both are valid
-    rasterio backends. Checking ``isinstance(backend, DatasetReader)`` misses
+    ``rasterio.io.DatasetWriter`` (an in-memory dataset, e.g. the result of
+    ``to_rasterio()``); both are valid rasterio backends. Checking ``isinstance(backend, DatasetReader)`` misses
     the writer case and wrongly rejects genuinely rasterio-backed datasets.
 
     Parameters
@@ -36,9 +50,14 @@ def is_rasterio_backed(ds: EEORasterDataset) -> bool:
     bool
         True if ``ds`` uses the rasterio adapter, False otherwise.
     """
-    from eeo.core.adapters import RasterioAdapter
+    from eeo.core.adapters import DeferredAdapter, RasterioAdapter
 
-    return isinstance(ds._adapter, RasterioAdapter)
+    adapter = ds._adapter
+    if isinstance(adapter, DeferredAdapter):
+        # A deferred result has no backend until it is evaluated; callers ask
+        # because they are about to need its pixels, so evaluate it now.
+        adapter = adapter.materialize()
+    return isinstance(adapter, RasterioAdapter)
 
 
 def normalize_resampling_method(value):
@@ -74,7 +93,7 @@ def align_raster_to_target(
 # helper to mask nodata values from an EEORasterDataset
 def mask_nodata(ds: EEORasterDataset, array: np.ndarray) -> np.ndarray:
     """Replace ``ds``'s nodata pixels in ``array`` with NaN."""
-    nodata = ds.get_metadata().get("nodata", None)
+    nodata = get_nodata(ds)
     if nodata is not None:
         array = np.where(array == nodata, np.nan, array)
     return array
@@ -82,7 +101,7 @@ def mask_nodata(ds: EEORasterDataset, array: np.ndarray) -> np.ndarray:
 
 def get_nodata(ds: EEORasterDataset):
     """Return ``ds``'s declared nodata value, or None if it declares none."""
-    return ds.get_metadata().get("nodata", None)
+    return ds.get_nodata()
 
 
 def resolve_band_index(ds: EEORasterDataset, band: int | str) -> int:
@@ -150,18 +169,70 @@ def resolve_band_index(ds: EEORasterDataset, band: int | str) -> int:
     )
 
 
+def label_layers(
+    geometries: gpd.GeoSeries, transform: Affine, *, all_touched: bool = False
+) -> np.ndarray:
+    """Assign every geometry a label layer that no geometry sharing a pixel with it is in.
+
+    Burning many geometries into one label array gives a pixel they share to
+    only one of them. Geometries that can share a pixel of the ``transform``
+    grid — that intersect (a pixel centre on a shared edge belongs to both)
+    or, with ``all_touched``, come within a pixel diagonal of each other —
+    are colored greedily, in order, so each pixel of a layer belongs to one
+    geometry. A partition such as a parcel map needs only a handful of layers.
+
+    Returns
+    -------
+    numpy.ndarray
+        The 0-based layer of each geometry, as int64.
+    """
+    layers = np.zeros(len(geometries), dtype=np.int64)
+    values = geometries.values
+    if all_touched:
+        reach = math.hypot(transform.a, transform.b, transform.d, transform.e)
+        left, right = geometries.sindex.query(values, predicate="dwithin", distance=reach)
+    else:
+        left, right = geometries.sindex.query(values, predicate="intersects")
+    earlier = left < right
+    left, right = left[earlier], right[earlier]
+    if not len(right):
+        return layers
+    order = np.lexsort((left, right))
+    later, starts = np.unique(right[order], return_index=True)
+    for geometry, neighbours in zip(later, np.split(left[order], starts[1:]), strict=True):
+        taken = set(layers[neighbours].tolist())
+        layers[geometry] = min(set(range(len(taken) + 1)) - taken)
+    return layers
+
+
+def _scratch_mask(shape: tuple[int, ...]) -> np.ndarray:
+    """Return a boolean scratch buffer of ``shape``, reused across calls.
+
+    One buffer is kept per thread (block-parallel ops call the nodata
+    contract from several threads at once) and grown when a larger block
+    needs it, so repeated calls on same-sized blocks allocate nothing.
+    """
+    size = int(np.prod(shape))
+    buffer = getattr(_SCRATCH, "mask", None)
+    if buffer is None or buffer.size < size:
+        buffer = np.empty(size, dtype=bool)
+        _SCRATCH.mask = buffer
+    return buffer[:size].reshape(shape)
+
+
 def _declared_nodata_mask(array, nodata):
     """Boolean mask of ``array`` pixels equal to a declared ``nodata`` value.
 
     Returns None when ``nodata`` is None (the operand marks no pixels invalid),
-    so callers can skip masking. Uses only dispatchable NumPy public-API calls
-    so the expression stays valid on lazy array backends.
+    so callers can skip masking. The mask is written into the thread's
+    scratch buffer, so it is only valid until the next call.
     """
     if nodata is None:
         return None
+    mask = _scratch_mask(np.shape(array))
     if isinstance(nodata, float) and np.isnan(nodata):
-        return np.isnan(array)
-    return array == nodata
+        return np.isnan(array, out=mask)
+    return np.equal(array, nodata, out=mask)
 
 
 def _output_dtype(result, *, fractional: bool):
@@ -178,7 +249,7 @@ def _output_dtype(result, *, fractional: bool):
     return dtype
 
 
-def apply_nodata_contract(result, operands, *, fractional: bool, ds_nodata):
+def apply_nodata_contract(result, operands, *, fractional: bool, ds_nodata, out=None):
     """Apply the library nodata & dtype contract to a pixel-wise result.
 
     Masks the pixels that are nodata in any operand (nodata is contagious),
@@ -187,10 +258,12 @@ def apply_nodata_contract(result, operands, *, fractional: bool, ds_nodata):
 
     Parameters
     ----------
-    result : array-like
+    result : numpy.ndarray
         Values computed over every pixel. Nodata pixels are overwritten here,
         so computing them first (then masking) is equivalent to masking first
-        for element-wise operations.
+        for element-wise operations. A ``result`` already in the output dtype
+        is masked in place and returned, so it must be an array the caller
+        owns, not a view of an input.
     operands : list of tuple
         ``(array, nodata)`` for each raster operand; scalar operands are
         omitted since they carry no nodata.
@@ -200,6 +273,11 @@ def apply_nodata_contract(result, operands, *, fractional: bool, ds_nodata):
     ds_nodata : int, float, or None
         The primary operand's declared nodata, used as the sentinel for
         integer outputs.
+    out : numpy.ndarray or None, default None
+        Destination for the final array, of ``result``'s shape and the output
+        dtype (e.g. the block's window of a preallocated result). If None, the
+        final array is ``result`` itself when its dtype already matches, and
+        a cast copy of it otherwise.
 
     Returns
     -------
@@ -208,27 +286,32 @@ def apply_nodata_contract(result, operands, *, fractional: bool, ds_nodata):
         the nodata value for the output metadata (``float('nan')`` for
         floating outputs, the integer sentinel for integer outputs, or None
         when no operand declares nodata).
+
+    Notes
+    -----
+    The cast is the only step that may allocate an output-sized array, and
+    only when neither ``out`` is given nor ``result`` is already in the
+    output dtype. Each operand's nodata mask is computed into a per-thread
+    scratch buffer that is reused from call to call, and the marker is
+    written with ``numpy.copyto(..., where=mask)``, so no mask is combined
+    into another array.
     """
     out_dtype = _output_dtype(result, fractional=fractional)
-    is_float_out = np.issubdtype(out_dtype, np.floating)
 
-    combined = None
-    declared = []
-    for array, nodata in operands:
-        if nodata is not None:
-            declared.append(nodata)
-        mask = _declared_nodata_mask(array, nodata)
-        if mask is None:
-            continue
-        combined = mask if combined is None else (combined | mask)
-
-    result = result.astype(out_dtype)
+    if out is not None:
+        np.copyto(out, result, casting="unsafe")
+        final = out
+    elif result.dtype == out_dtype:
+        final = result
+    else:
+        final = result.astype(out_dtype)
 
-    if combined is None:
+    declared = [nodata for _, nodata in operands if nodata is not None]
+    if not declared:
         # No operand declared nodata: nothing to mask, no output nodata.
-        return result, None
+        return final, None
 
-    if is_float_out:
+    if np.issubdtype(out_dtype, np.floating):
         marker = np.array(np.nan, dtype=out_dtype)
         out_nodata: float = float("nan")
     else:
@@ -236,5 +319,8 @@ def apply_nodata_contract(result, operands, *, fractional: bool, ds_nodata):
         marker = np.array(sentinel, dtype=out_dtype)
         out_nodata = marker.item()
 
-    final = np.where(combined, marker, result).astype(out_dtype)
+    for array, nodata in operands:
+        mask = _declared_nodata_mask(array, nodata)
+        if mask is not None:
+            np.copyto(final, marker, where=mask)
     return final, out_nodata
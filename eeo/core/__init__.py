@@ -11,13 +11,17 @@ from .exceptions import (
 )
 from .loader import load_array, load_raster
 from .plugins import load_ops
+from .scheduler import run_tiled
+from .timeseries import EEOTimeSeries
 
 load_ops()
 
 __all__ = [
     "EEORasterDataset",
+    "EEOTimeSeries",
     "load_raster",
     "load_array",
+    "run_tiled",
     "EEOError",
     "ValidationError",
     "CRSMismatchError",
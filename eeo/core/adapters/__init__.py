@@ -1,6 +1,8 @@
-"""Backend adapters abstracting NumPy- and rasterio-backed rasters."""
+"""Backend adapters abstracting NumPy-, rasterio-, and dask-backed rasters."""
 
 from .base import BaseRasterAdapter
+from .dask import DaskAdapter
+from .deferred import DeferredAdapter
 from .numpy import NumpyRasterioAdapter
 from .rasterio import RasterioAdapter
 
@@ -8,4 +10,6 @@ __all__ = [
     "BaseRasterAdapter",
     "RasterioAdapter",
     "NumpyRasterioAdapter",
+    "DeferredAdapter",
+    "DaskAdapter",
 ]
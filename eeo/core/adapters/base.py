@@ -9,6 +9,7 @@ import numpy as np
 from rasterio.coords import BoundingBox
 from rasterio.crs import CRS
 from rasterio.transform import Affine
+from rasterio.windows import Window
 
 from eeo.core.types import StrPath
 
@@ -65,6 +66,14 @@ class BaseRasterAdapter(ABC):
         """Return the nodata value, or ``None`` if unset."""
         ...
 
+    def get_dtype(self) -> np.dtype:
+        """Return the pixel dtype shared by every band.
+
+        The default reads it from ``get_metadata()``; backends that hold the
+        dtype directly override it to skip building the profile.
+        """
+        return np.dtype(self.get_metadata()["dtype"])
+
     @abstractmethod
     def get_metadata(self) -> dict[Any, Any]:
         """Return the raster profile (dtype, nodata, transform, crs, ...)."""
@@ -94,6 +103,25 @@ class BaseRasterAdapter(ABC):
         """Read a single band by its 1-based index."""
         ...
 
+    def read_window(self, window: Window, indexes: list[int] | None = None) -> np.ndarray:
+        """Read the pixels inside a pixel ``window``, shaped ``(bands, rows, cols)``.
+
+        The window must lie within the raster. ``indexes`` selects 1-based
+        bands, in order; None reads every band. The default forwards to
+        ``read(indexes, window=...)``; backends whose ``read`` cannot window
+        override it.
+        """
+        return self.read(indexes, window=window)
+
+    def get_block_shape(self) -> tuple[int, int] | None:
+        """Return the backend's native ``(rows, cols)`` block, or None if it has none.
+
+        Block-wise operations align their windows to this layout so each read
+        touches whole blocks. Backends without a storage layout (an in-memory
+        array) return None and are processed in full-width row strips.
+        """
+        return None
+
     ###########################
     # Persistence
     ##########################
@@ -0,0 +1,484 @@
+"""Dask-backed (chunked, lazy) raster adapter."""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import numpy as np
+import rasterio as rio
+from rasterio.coords import BoundingBox
+from rasterio.crs import CRS
+from rasterio.transform import Affine
+from rasterio.windows import Window
+
+from eeo._optional import import_optional
+from eeo.common import apply_nodata_contract
+from eeo.core.exceptions import ValidationError
+from eeo.core.types import StrPath
+
+from .base import BaseRasterAdapter
+from .numpy import NumpyRasterioAdapter
+from .rasterio import RasterioAdapter
+
+# Chunk specification accepted by the factories: "auto" (aligned to the
+# source's native blocks and sized by the block_budget option), or explicit
+# (rows, cols) spatial chunk sizes. Bands always form a single chunk.
+Chunks = str | tuple[int, int]
+
+# Placeholder for a raster operand's position in an element-wise call; scalar
+# operands are stored in place.
+_RASTER = object()
+
+
+def _dask_array() -> Any:
+    """Import ``dask.array`` through the ``lazy`` extra."""
+    return import_optional("dask.array", extra="lazy", purpose="the lazy (dask) backend")
+
+
+def is_dask_array(obj: Any) -> bool:
+    """Return True if ``obj`` is a dask array (without importing dask)."""
+    dask_array = sys.modules.get("dask.array")
+    return dask_array is not None and isinstance(obj, dask_array.Array)
+
+
+class _WindowReader:
+    """Array-like view of a raster file that reads only the slice requested.
+
+    dask calls ``__getitem__`` once per chunk. Each call opens the file itself,
+    so chunks are read concurrently with no shared handle (rasterio dataset
+    handles are not thread-safe) and the reader pickles to other processes.
+    """
+
+    def __init__(self, path: StrPath, shape: tuple[int, int, int], dtype: np.dtype) -> None:
+        self.path = path
+        self.shape = shape
+        self.dtype = dtype
+        self.ndim = 3
+
+    def __getitem__(self, key: tuple[slice, slice, slice]) -> np.ndarray:
+        bands, rows, cols = (k.indices(n) for k, n in zip(key, self.shape, strict=True))
+        window = Window.from_slices(rows[:2], cols[:2])
+        with rio.open(self.path) as src:
+            data = src.read(list(range(bands[0] + 1, bands[1] + 1)), window=window)
+        return data
+
+
+class DaskAdapter(BaseRasterAdapter):
+    """Dask-backed raster adapter for EEORasterDataset.
+
+    Pixels are a chunked ``dask.array.Array`` of shape ``(bands, height,
+    width)``, with every band in one chunk. Nothing is read or computed until
+    pixels are requested; reading computes only the chunks the request
+    touches, in parallel on dask's scheduler. Requires the ``lazy`` extra.
+    """
+
+    def __init__(
+        self,
+        array: Any,
+        transform: Affine,
+        crs: CRS,
+        driver: str = "GTiff",
+        nodata: float | None = None,
+        *,
+        band_descriptions: list[str | None] | None = None,
+        keep_alive: tuple[Any, ...] = (),
+    ) -> None:
+        if array.ndim == 2:
+            array = array[np.newaxis, ...]
+        # One chunk along the band axis, so a chunk is a spatial block of
+        # every band, like a window read.
+        if array.numblocks[0] != 1:
+            array = array.rechunk({0: -1})
+
+        self._array = array
+        self._transform = transform
+        self._crs = crs
+        self._nodata = nodata
+        self._driver = driver
+        self._band_descriptions = band_descriptions
+        # Objects that close a wrapped adapter when garbage-collected (the
+        # datasets wrapping the graph's sources) live as long as the graph.
+        self._keep_alive = keep_alive
+
+    # ========================
+    # Factories
+    # ========================
+    @classmethod
+    def from_path(cls, path: StrPath, *, chunks: Chunks = "auto") -> DaskAdapter:
+        """Open a raster file lazily, one dask chunk per window read.
+
+        Parameters
+        ----------
+        path : str or path-like
+            GDAL-readable raster.
+        chunks : "auto" or tuple of int, default "auto"
+            Spatial chunk size. ``"auto"`` aligns chunks to the file's native
+            blocks and sizes them by the ``block_budget`` option.
+
+        Returns
+        -------
+        DaskAdapter
+            Adapter whose chunks each read one window of the file on demand.
+        """
+        da = _dask_array()
+        source = RasterioAdapter.from_path(path)
+        try:
+            spatial = _resolve_chunks(source, chunks)
+            meta = source.get_metadata()
+            descriptions = source.get_band_descriptions()
+        finally:
+            source.close()
+
+        shape = (meta["count"], meta["height"], meta["width"])
+        reader = _WindowReader(path, shape, np.dtype(meta["dtype"]))
+        array = da.from_array(
+            reader, chunks=(-1, *spatial), lock=False, meta=np.array((), meta["dtype"])
+        )
+        return cls(
+            array,
+            transform=meta["transform"],
+            crs=meta["crs"],
+            driver=meta["driver"],
+            nodata=meta["nodata"],
+            band_descriptions=descriptions,
+        )
+
+    @classmethod
+    def from_adapter(cls, adapter: BaseRasterAdapter, *, chunks: Chunks = "auto") -> DaskAdapter:
+        """Wrap another backend lazily, one dask chunk per window read.
+
+        Parameters
+        ----------
+        adapter : BaseRasterAdapter
+            Backend to wrap. Its ``read_window`` serves the chunks; a backend
+            whose reads are not thread-safe is read under a lock.
+        chunks : "auto" or tuple of int, default "auto"
+            Spatial chunk size, as for :meth:`from_path`.
+
+        Returns
+        -------
+        DaskAdapter
+            Adapter over the same pixels and georeferencing.
+        """
+        if isinstance(adapter, DaskAdapter):
+            if chunks == "auto":
+                return adapter
+            array = adapter._array.rechunk((-1, *chunks))
+        else:
+            da = _dask_array()
+            spatial = _resolve_chunks(adapter, chunks)
+            path = _file_path(adapter)
+            if isinstance(adapter, NumpyRasterioAdapter):
+                # In-memory pixels: chunks are views, no lock needed.
+                array = da.from_array(adapter.backend, chunks=(-1, *spatial))
+            elif path is not None:
+                return cls.from_path(path, chunks=spatial)
+            else:
+                count = adapter.get_count()
+                height, width = adapter.get_shape()
+                reader = _AdapterReader(adapter, (count, height, width))
+                array = da.from_array(
+                    reader, chunks=(-1, *spatial), lock=True, meta=np.array((), reader.dtype)
+                )
+        return cls(
+            array,
+            transform=adapter.get_transform(),
+            crs=adapter.get_crs(),
+            nodata=adapter.get_nodata(),
+        )
+
+    @classmethod
+    def elementwise(
+        cls,
+        kernel: Callable[..., Any],
+        operands: list[BaseRasterAdapter | float | int],
+        *,
+        fractional: bool,
+        keep_alive: tuple[Any, ...] = (),
+    ) -> DaskAdapter:
+        """Build the lazy result of an element-wise operation.
+
+        The operation becomes one task per chunk: each task applies ``kernel``
+        and the nodata contract to one chunk of every operand, exactly as the
+        block-wise executor does for one window. Consecutive element-wise
+        steps therefore fuse into a single pass when the graph is computed.
+
+        Parameters
+        ----------
+        kernel : callable
+            Element-wise function of one block of each operand.
+        operands : list
+            Primary adapter first, then further adapters (any backend, on the
+            primary's grid) or scalars. Non-dask adapters are wrapped lazily
+            and rechunked to match the first dask operand.
+        fractional : bool
+            Passed to the nodata contract.
+        keep_alive : tuple, default ()
+            Objects the result must keep alive while its graph may still read
+            from them.
+
+        Returns
+        -------
+        DaskAdapter
+            Lazy result sharing the primary's georeferencing.
+        """
+        da = _dask_array()
+        template = next(op for op in operands if isinstance(op, DaskAdapter))
+        spatial = template._array.chunks[1:]
+
+        layout: list[Any] = []
+        arrays = []
+        nodatas = []
+        for op in operands:
+            if isinstance(op, BaseRasterAdapter):
+                array = cls.from_adapter(op, chunks=(spatial[0][0], spatial[1][0]))._array
+                arrays.append(array.rechunk((-1, *spatial)))
+                nodatas.append(op.get_nodata())
+                layout.append(_RASTER)
+            else:
+                layout.append(op)
+
+        block = partial(_elementwise_block, kernel, tuple(layout), fractional, tuple(nodatas))
+        # Learn the output dtype, nodata, and band count from one dummy pixel
+        # per operand: the contract fixes them from dtypes and nodata alone.
+        probe, out_nodata = block(*(np.ones((a.shape[0], 1, 1), a.dtype) for a in arrays))
+        result = da.map_blocks(
+            partial(_block_only, block),
+            *arrays,
+            chunks=((probe.shape[0],), *spatial),
+            dtype=probe.dtype,
+            meta=np.array((), probe.dtype),
+        )
+        primary = operands[0]
+        assert isinstance(primary, BaseRasterAdapter)
+        return cls(
+            result,
+            transform=primary.get_transform(),
+            crs=primary.get_crs(),
+            nodata=out_nodata,
+            keep_alive=keep_alive
+            + tuple(op._keep_alive for op in operands if isinstance(op, DaskAdapter)),
+        )
+
+    def select_bands(self, indexes: list[int], *, keep_alive: tuple[Any, ...] = ()) -> DaskAdapter:
+        """Return a lazy view of the 1-based bands ``indexes``, in that order.
+
+        Nothing is computed: the view is a slice of this adapter's graph, so
+        the bands left out are never read. ``keep_alive`` adds objects the
+        view must keep alive, e.g. the dataset whose adapter the graph reads.
+        """
+        positions = [index - 1 for index in indexes]
+        descriptions = self._band_descriptions
+        return DaskAdapter(
+            self._array[positions],
+            transform=self._transform,
+            crs=self._crs,
+            driver=self._driver,
+            nodata=self._nodata,
+            band_descriptions=None
+            if descriptions is None
+            else [descriptions[i] for i in positions],
+            keep_alive=self._keep_alive + keep_alive,
+        )
+
+    # ========================
+    # Metadata
+    # ========================
+    def get_crs(self) -> CRS:
+        return self._crs
+
+    def get_transform(self) -> Affine:
+        return self._transform
+
+    def get_bounds(self):
+        h, w = self.get_shape()
+        return BoundingBox(*rio.transform.array_bounds(h, w, self._transform))
+
+    def get_shape(self) -> tuple[int, int]:
+        h, w = self._array.shape[-2:]
+        return int(h), int(w)
+
+    def get_width(self) -> int:
+        return self.get_shape()[1]
+
+    def get_height(self) -> int:
+        return self.get_shape()[0]
+
+    def get_count(self) -> int:
+        return int(self._array.shape[0])
+
+    def get_nodata(self) -> float | None:
+        return self._nodata
+
+    def get_dtype(self) -> np.dtype:
+        return self._array.dtype
+
+    def get_band_descriptions(self) -> list[str | None]:
+        # A file opened lazily keeps its GDAL descriptions; otherwise band
+        # names live on the EEORasterDataset, as for the NumPy backend.
+        return self._band_descriptions or [None] * self.get_count()
+
+    def get_metadata(self) -> dict:
+        return {
+            "dtype": self._array.dtype,
+            "nodata": self._nodata,
+            "transform": self._transform,
+            "crs": self._crs,
+            "driver": self._driver,
+            "count": self.get_count(),
+            "width": self.get_width(),
+            "height": self.get_height(),
+        }
+
+    def get_block_shape(self) -> tuple[int, int] | None:
+        # Windows aligned to the chunk grid compute each chunk exactly once.
+        return int(self._array.chunks[1][0]), int(self._array.chunks[2][0])
+
+    # ========================
+    # Data Access
+    # ========================
+    def read(self, indexes=None, *args, window=None, **kwargs) -> np.ndarray:
+        if args or kwargs:
+            # Decimated, resampled, masked, or boundless reads are GDAL
+            # features: compute the bands asked for and serve the read from a
+            # temporary in-memory rasterio copy of them.
+            bands = None if indexes is None else [indexes] if isinstance(indexes, int) else indexes
+            pixels = self._array if bands is None else self._array[self._positions(bands)]
+            adapter = RasterioAdapter.from_array(
+                np.asarray(pixels.compute()),
+                transform=self._transform,
+                crs=self._crs,
+                nodata=self._nodata,
+            )
+            try:
+                # The copy holds only the selected bands, renumbered from 1.
+                local = (
+                    None
+                    if bands is None
+                    else 1
+                    if isinstance(indexes, int)
+                    else list(range(1, len(bands) + 1))
+                )
+                return adapter.read(local, *args, window=window, **kwargs)
+            finally:
+                adapter.close()
+
+        height, width = self.get_shape()
+        full = Window(0, 0, width, height)
+        # Like rasterio, a window reaching past the edge is cropped to it.
+        window = full if window is None else window.intersection(full)
+        if isinstance(indexes, int):
+            return self.read_window(window, [indexes])[0]
+        return self.read_window(window, None if indexes is None else list(indexes))
+
+    def read_band(self, idx: int) -> np.ndarray:
+        return np.asarray(self._array[self._positions([idx])[0]].compute())
+
+    def _positions(self, indexes: list[int]) -> list[int]:
+        """Return the 0-based positions of 1-based ``indexes``, checked in range."""
+        for idx in indexes:
+            if idx < 1 or idx > self.get_count():
+                raise IndexError(
+                    f"band index {idx} out of range; dataset has {self.get_count()} "
+                    f"band(s) (valid 1..{self.get_count()})"
+                )
+        return [idx - 1 for idx in indexes]
+
+    def read_window(self, window: Window, indexes: list[int] | None = None) -> np.ndarray:
+        (row_start, row_stop), (col_start, col_stop) = window.toranges()
+        block = self._array[:, row_start:row_stop, col_start:col_stop]
+        if indexes is not None:
+            # Select bands before computing, so unread bands are never computed.
+            block = block[self._positions(indexes)]
+        return np.asarray(block.compute())
+
+    # ========================
+    # Persistence
+    # ========================
+    def write(
+        self, path: StrPath, driver: str = "GTiff", band_names: list[str | None] | None = None
+    ) -> None:
+        # Imported here: eeo.core.writer depends on the dataset class through
+        # eeo.core.blocks, which itself imports this package.
+        from eeo.core.writer import write_windows
+
+        # Windows are aligned to the chunk grid, so at most one window of the
+        # result is ever in memory.
+        write_windows(self, path, driver=driver, band_names=band_names)
+
+    def close(self) -> None:
+        pass
+
+    # ========================
+    # Backend Access
+    # ========================
+    @property
+    def backend(self) -> Any:
+        return self._array
+
+
+class _AdapterReader:
+    """Array-like view of another adapter, serving slices via ``read_window``."""
+
+    def __init__(self, adapter: BaseRasterAdapter, shape: tuple[int, int, int]) -> None:
+        self.adapter = adapter
+        self.shape = shape
+        self.dtype = adapter.get_dtype()
+        self.ndim = 3
+
+    def __getitem__(self, key: tuple[slice, slice, slice]) -> np.ndarray:
+        bands, rows, cols = (k.indices(n) for k, n in zip(key, self.shape, strict=True))
+        data = self.adapter.read_window(Window.from_slices(rows[:2], cols[:2]))
+        return data[bands[0] : bands[1]]
+
+
+def _file_path(adapter: BaseRasterAdapter) -> str | None:
+    """Return the file behind a rasterio-backed ``adapter``, or None.
+
+    A file can be reopened per chunk (parallel, lock-free reads); an in-memory
+    dataset cannot.
+    """
+    if not isinstance(adapter, RasterioAdapter) or adapter._memory_file is not None:
+        return None
+    name = adapter.backend.name
+    return name if os.path.isfile(name) else None
+
+
+def _block_only(block: Callable[..., tuple[np.ndarray, Any]], *blocks: np.ndarray) -> np.ndarray:
+    """Return just the array from an element-wise ``block`` call."""
+    return block(*blocks)[0]
+
+
+def _resolve_chunks(adapter: BaseRasterAdapter, chunks: Chunks) -> tuple[int, int]:
+    """Return the spatial ``(rows, cols)`` chunk size for ``adapter``."""
+    if isinstance(chunks, str):
+        if chunks != "auto":
+            raise ValidationError(f'chunks must be "auto" or a (rows, cols) tuple; got {chunks!r}')
+        from eeo.core.blocks import block_windows
+
+        first = block_windows(adapter)[0]
+        return int(first.height), int(first.width)
+    rows, cols = chunks
+    return int(rows), int(cols)
+
+
+def _elementwise_block(
+    kernel: Callable[..., Any],
+    layout: tuple[Any, ...],
+    fractional: bool,
+    nodatas: tuple[float | None, ...],
+    *blocks: np.ndarray,
+) -> tuple[np.ndarray, float | None]:
+    """Apply ``kernel`` and the nodata contract to one chunk of each raster operand."""
+    values = iter(blocks)
+    args = [next(values) if item is _RASTER else item for item in layout]
+    return apply_nodata_contract(
+        kernel(*args),
+        list(zip(blocks, nodatas, strict=True)),
+        fractional=fractional,
+        ds_nodata=nodatas[0],
+    )
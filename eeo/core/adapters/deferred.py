@@ -0,0 +1,203 @@
+"""Deferred (not yet evaluated) raster adapter."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from rasterio.windows import Window
+
+from eeo.common import apply_nodata_contract
+from eeo.core.types import StrPath
+
+from .base import BaseRasterAdapter
+
+
+class DeferredAdapter(BaseRasterAdapter):
+    """Adapter for the pending result of an element-wise operation.
+
+    Holds one node of an expression graph: a ``kernel`` and the operands it
+    combines, each either another adapter (possibly itself deferred) or a
+    scalar. Nothing is computed when the node is built. Georeferencing comes
+    from the primary (first) operand; band count, dtype, and nodata are learned
+    by evaluating a single pixel.
+
+    ``read_window`` evaluates the graph for one window only, recursing into
+    deferred operands window by window, so a chain of element-wise steps runs
+    as one fused pass per block with no full-size intermediate. Any access that
+    needs the whole raster (``read``, ``read_band``, ``write``, ``backend``)
+    materializes the graph once into a concrete in-memory adapter, which then
+    serves every later call; the graph is dropped at that point.
+    """
+
+    def __init__(
+        self,
+        kernel: Callable[..., Any],
+        operands: list[BaseRasterAdapter | float | int],
+        *,
+        fractional: bool,
+        keep_alive: tuple[Any, ...] = (),
+        workers: int | None = None,
+    ) -> None:
+        self._kernel: Callable[..., Any] | None = kernel
+        self._operands = operands
+        self._fractional = fractional
+        # Threads to materialize with; None defers to the num_threads option
+        # in effect at that time.
+        self._workers = workers
+        # Objects that close an operand adapter when garbage-collected (the
+        # datasets wrapping them) are held until the graph is evaluated.
+        self._keep_alive = keep_alive
+        primary = operands[0]
+        assert isinstance(primary, BaseRasterAdapter)
+        self._primary: BaseRasterAdapter = primary
+        self._probe: tuple[np.dtype, float | None, int] | None = None
+        self._concrete: BaseRasterAdapter | None = None
+
+    # ========================
+    # Evaluation
+    # ========================
+    def _evaluate(self, window: Window) -> tuple[np.ndarray, float | None]:
+        """Compute ``window`` of the result: ``(block, nodata)`` per the contract."""
+        blocks = [
+            op.read_window(window) if isinstance(op, BaseRasterAdapter) else op
+            for op in self._operands
+        ]
+        rasters = [
+            (block, op.get_nodata())
+            for block, op in zip(blocks, self._operands, strict=True)
+            if isinstance(op, BaseRasterAdapter)
+        ]
+        assert self._kernel is not None
+        return apply_nodata_contract(
+            self._kernel(*blocks),
+            rasters,
+            fractional=self._fractional,
+            ds_nodata=rasters[0][1],
+        )
+
+    def _describe(self) -> tuple[np.dtype, float | None, int]:
+        """Return the result's ``(dtype, nodata, count)``, evaluating one pixel once.
+
+        The nodata contract fixes the output dtype and nodata from the operand
+        dtypes and declared nodata alone, so one pixel decides them for all.
+        """
+        if self._probe is None:
+            block, nodata = self._evaluate(Window(0, 0, 1, 1))
+            self._probe = (block.dtype, nodata, block.shape[0])
+        return self._probe
+
+    def materialize(self) -> BaseRasterAdapter:
+        """Evaluate the graph block by block (once) and return the concrete adapter."""
+        if self._concrete is None:
+            # Imported here: eeo.core.blocks depends on the dataset class,
+            # which itself imports this package.
+            from eeo.core.blocks import resolve_workers, write_blocks
+
+            self._concrete = write_blocks(self, workers=resolve_workers(self._workers))
+            self._kernel = None
+            self._operands = []
+            self._keep_alive = ()
+            self._primary = self._concrete
+        return self._concrete
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the graph has been evaluated."""
+        return self._concrete is not None
+
+    # ========================
+    # Metadata
+    # ========================
+    def get_crs(self):
+        return self._primary.get_crs()
+
+    def get_transform(self):
+        return self._primary.get_transform()
+
+    def get_bounds(self):
+        return self._primary.get_bounds()
+
+    def get_shape(self):
+        return self._primary.get_shape()
+
+    def get_width(self):
+        return self._primary.get_width()
+
+    def get_height(self):
+        return self._primary.get_height()
+
+    def get_count(self):
+        if self._concrete is not None:
+            return self._concrete.get_count()
+        return self._describe()[2]
+
+    def get_nodata(self):
+        if self._concrete is not None:
+            return self._concrete.get_nodata()
+        return self._describe()[1]
+
+    def get_dtype(self):
+        if self._concrete is not None:
+            return self._concrete.get_dtype()
+        return self._describe()[0]
+
+    def get_metadata(self):
+        if self._concrete is not None:
+            return self._concrete.get_metadata()
+        dtype, nodata, count = self._describe()
+        meta = self._primary.get_metadata()
+        meta.update(dtype=dtype, nodata=nodata, count=count)
+        return meta
+
+    def get_band_descriptions(self) -> list[str | None]:
+        # A computed result carries no GDAL descriptions; band names live on
+        # the EEORasterDataset.
+        return [None] * self.get_count()
+
+    def get_block_shape(self) -> tuple[int, int] | None:
+        return self._primary.get_block_shape()
+
+    # ========================
+    # Data Access
+    # ========================
+    def read(self, *args, **kwargs) -> np.ndarray:
+        return self.materialize().read(*args, **kwargs)
+
+    def read_band(self, idx: int) -> np.ndarray:
+        return self.materialize().read_band(idx)
+
+    def read_window(self, window: Window, indexes: list[int] | None = None) -> np.ndarray:
+        if self._concrete is not None:
+            return self._concrete.read_window(window, indexes)
+        block = self._evaluate(window)[0]
+        return block if indexes is None else block[[idx - 1 for idx in indexes]]
+
+    # ========================
+    # Persistence
+    # ========================
+    def write(
+        self, path: StrPath, driver: str = "GTiff", band_names: list[str | None] | None = None
+    ) -> None:
+        if self._concrete is not None:
+            self._concrete.write(path, driver=driver, band_names=band_names)
+            return
+        # Imported here: eeo.core.writer depends on the dataset class through
+        # eeo.core.blocks, which itself imports this package.
+        from eeo.core.writer import write_windows
+
+        # Each window is one fused pass over the chain; the result is never
+        # held whole.
+        write_windows(self, path, driver=driver, band_names=band_names)
+
+    def close(self) -> None:
+        if self._concrete is not None:
+            self._concrete.close()
+
+    # ========================
+    # Backend Access
+    # ========================
+    @property
+    def backend(self) -> Any:
+        return self.materialize().backend
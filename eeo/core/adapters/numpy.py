@@ -2,8 +2,10 @@
 
 import numpy as np
 import rasterio as rio
+from rasterio.coords import BoundingBox
 from rasterio.crs import CRS
 from rasterio.transform import Affine
+from rasterio.windows import Window
 
 from eeo.core.adapters.base import BaseRasterAdapter
 from eeo.core.adapters.rasterio import RasterioAdapter
@@ -26,7 +28,9 @@ class NumpyRasterioAdapter(BaseRasterAdapter):
 
         self._array = array
         self._transform = transform
-        self._crs = crs
+        # Normalise EPSG codes, strings, and pyproj CRSs to the rasterio CRS
+        # every other backend reports.
+        self._crs = None if crs is None else CRS.from_user_input(crs)
         self._nodata = nodata
         self._driver = driver
 
@@ -41,7 +45,7 @@ class NumpyRasterioAdapter(BaseRasterAdapter):
 
     def get_bounds(self):
         h, w = self.get_shape()
-        return rio.transform.array_bounds(h, w, self._transform)
+        return BoundingBox(*rio.transform.array_bounds(h, w, self._transform))
 
     def get_shape(self) -> tuple[int, int]:
         h, w = self._array.shape[-2:]
@@ -59,6 +63,9 @@ class NumpyRasterioAdapter(BaseRasterAdapter):
     def get_nodata(self) -> float | None:
         return self._nodata
 
+    def get_dtype(self) -> np.dtype:
+        return self._array.dtype
+
     def get_band_descriptions(self) -> list[str | None]:
         # The NumPy backend has no native band-description concept; band names
         # live on the EEORasterDataset itself.
@@ -79,16 +86,53 @@ class NumpyRasterioAdapter(BaseRasterAdapter):
     # ========================
     # Data Access
     # ========================
-    def read(self, *args, **kwargs) -> np.ndarray:
-        return self._array
+    def read(self, indexes=None, *args, window=None, **kwargs) -> np.ndarray:
+        if args or kwargs:
+            # Decimated, resampled, masked, or boundless reads are GDAL
+            # features: serve them from a temporary in-memory rasterio copy.
+            adapter = RasterioAdapter.from_array(
+                self._array, transform=self._transform, crs=self._crs, nodata=self._nodata
+            )
+            try:
+                return adapter.read(indexes, *args, window=window, **kwargs)
+            finally:
+                adapter.close()
+
+        if indexes is None and window is None:
+            return self._array
+
+        height, width = self.get_shape()
+        full = Window(0, 0, width, height)
+        # Like rasterio, a window reaching past the edge is cropped to it.
+        window = full if window is None else window.intersection(full)
+        if isinstance(indexes, int):
+            return self.read_window(window, [indexes])[0]
+        return self.read_window(window, None if indexes is None else list(indexes))
 
     def read_band(self, idx: int) -> np.ndarray:
+        self._check_band(idx)
+        return self._array[idx - 1]
+
+    def _check_band(self, idx: int) -> None:
+        """Raise IndexError unless ``idx`` is a valid 1-based band index."""
         if idx < 1 or idx > self.get_count():
             raise IndexError(
                 f"band index {idx} out of range; dataset has {self.get_count()} "
                 f"band(s) (valid 1..{self.get_count()})"
             )
-        return self._array[idx - 1]
+
+    def read_window(self, window, indexes: list[int] | None = None) -> np.ndarray:
+        # Basic slicing returns a view: a window of every band costs no copy.
+        (row_start, row_stop), (col_start, col_stop) = window.toranges()
+        block = self._array[:, row_start:row_stop, col_start:col_stop]
+        if indexes is None:
+            return block
+        for idx in indexes:
+            self._check_band(idx)
+        if len(indexes) == 1:
+            # A one-band slice is still a view.
+            return block[indexes[0] - 1 : indexes[0]]
+        return block[[idx - 1 for idx in indexes]]
 
     # ========================
     # Persistence
@@ -96,14 +140,13 @@ class NumpyRasterioAdapter(BaseRasterAdapter):
     def write(
         self, path: StrPath, driver: str = "GTiff", band_names: list[str | None] | None = None
     ) -> None:
-        adapter = RasterioAdapter.from_array(
-            array=self._array,
-            transform=self._transform,
-            crs=self._crs,
-            nodata=self._nodata,
-        )
-        adapter.write(path, driver=driver, band_names=band_names)
-        adapter.close()
+        # Imported here: eeo.core.writer depends on the dataset class through
+        # eeo.core.blocks, which itself imports this package.
+        from eeo.core.writer import write_windows
+
+        # Windows of the array are views, written straight to the file: no
+        # in-memory GeoTIFF copy of the array is made first.
+        write_windows(self, path, driver=driver, band_names=band_names)
 
     def close(self) -> None:
         pass
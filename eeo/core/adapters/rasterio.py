@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from types import MappingProxyType
+
 import numpy as np
 import rasterio as rio
 from rasterio.io import DatasetReader, MemoryFile
+from rasterio.windows import Window
 
 from eeo.core.exceptions import BackendError
 from eeo.core.types import StrPath
@@ -23,6 +28,20 @@ class RasterioAdapter(BaseRasterAdapter):
     ) -> None:
         self._ds = dataset
         self._memory_file = memory_file
+        # A GDAL dataset handle must not be read from two threads at once.
+        # Only the thread that opened it reads ``_ds`` directly; any other
+        # thread reading windows gets a handle of its own, opened once and
+        # kept for the adapter's lifetime. A dataset that cannot be reopened
+        # by name (one still open for writing) is read under ``_lock``.
+        self._owner = threading.get_ident()
+        self._handles: dict[int, DatasetReader] = {}
+        self._lock = threading.Lock()
+        self._reopenable = dataset.mode == "r"
+        # The profile is fixed for the adapter's lifetime, so it is read from
+        # GDAL once. Every metadata accessor serves from this snapshot, and
+        # ``get_metadata`` hands out a copy of it rather than rebuilding
+        # ``meta`` per call.
+        self._profile = MappingProxyType(dataset.meta)
 
     # ========================
     # Factories
@@ -68,31 +87,40 @@ class RasterioAdapter(BaseRasterAdapter):
     # Metadata
     # ========================
     def get_crs(self):
-        return self._ds.crs
+        return self._profile["crs"]
 
     def get_transform(self):
-        return self._ds.transform
+        return self._profile["transform"]
 
     def get_bounds(self):
         return self._ds.bounds
 
     def get_shape(self):
-        return self._ds.shape
+        return self._profile["height"], self._profile["width"]
 
     def get_width(self):
-        return self._ds.width
+        return self._profile["width"]
 
     def get_height(self):
-        return self._ds.height
+        return self._profile["height"]
 
     def get_count(self):
-        return self._ds.count
+        return self._profile["count"]
 
     def get_nodata(self):
-        return self._ds.nodata
+        return self._profile["nodata"]
+
+    def get_dtype(self) -> np.dtype:
+        return np.dtype(self._profile["dtype"])
 
     def get_metadata(self):
-        return self._ds.meta.copy()
+        return dict(self._profile)
+
+    def get_block_shape(self) -> tuple[int, int] | None:
+        # Every band of a GeoTIFF shares one layout in practice; the first
+        # band's is the one windows are aligned to.
+        rows, cols = self._ds.block_shapes[0]
+        return int(rows), int(cols)
 
     def get_band_descriptions(self) -> list[str | None]:
         # rasterio exposes GDAL band descriptions as a length-count tuple with
@@ -106,6 +134,31 @@ class RasterioAdapter(BaseRasterAdapter):
     def read(self, *args, **kwargs) -> np.ndarray:
         return self._ds.read(*args, **kwargs)
 
+    def read_window(self, window: Window, indexes: list[int] | None = None) -> np.ndarray:
+        handle = self._thread_handle()
+        if handle is None:
+            with self._lock:
+                return self._ds.read(indexes, window=window)
+        return handle.read(indexes, window=window)
+
+    def _thread_handle(self) -> DatasetReader | None:
+        """Return the calling thread's dataset handle, or None to read under the lock."""
+        if not self._reopenable:
+            return None
+        thread = threading.get_ident()
+        if thread == self._owner:
+            return self._ds
+        handle = self._handles.get(thread)
+        if handle is None:
+            try:
+                handle = rio.open(self._ds.name)
+            except Exception:
+                self._reopenable = False
+                return None
+            with self._lock:
+                self._handles[thread] = handle
+        return handle
+
     def read_band(self, idx: int) -> np.ndarray:
         if idx < 1 or idx > self._ds.count:
             raise IndexError(
@@ -120,19 +173,19 @@ class RasterioAdapter(BaseRasterAdapter):
     def write(
         self, path: StrPath, driver: str = "GTiff", band_names: list[str | None] | None = None
     ) -> None:
-        meta = self._ds.meta.copy()
-        meta.update(driver=driver)
-
-        with rio.open(path, "w", **meta) as dst:
-            for i in range(1, self._ds.count + 1):
-                dst.write(self._ds.read(i), i)
-            # Flush the in-memory names to GDAL band descriptions; unnamed
-            # bands are left alone so the file records no description at all.
-            for i, name in enumerate(band_names or [], start=1):
-                if name:
-                    dst.set_band_description(i, name)
+        # Imported here: eeo.core.writer depends on the dataset class through
+        # eeo.core.blocks, which itself imports this package.
+        from eeo.core.writer import write_windows
+
+        # Windows follow the file's tiles or strips, so each is read once and
+        # no band is read whole.
+        write_windows(self, path, driver=driver, band_names=band_names)
 
     def close(self) -> None:
+        with self._lock:
+            handles, self._handles = list(self._handles.values()), {}
+        for handle in handles:
+            handle.close()
         try:
             self._ds.close()
         finally:
@@ -145,3 +198,15 @@ class RasterioAdapter(BaseRasterAdapter):
     @property
     def backend(self) -> DatasetReader:
         return self._ds
+
+    @property
+    def file_path(self) -> str | None:
+        """Path of the file the dataset was opened from read-only, or None.
+
+        None for an in-memory dataset, one open for writing, or one whose
+        name is not a local file (a ``/vsi*`` path or a URL).
+        """
+        if self._memory_file is not None or self._ds.mode != "r":
+            return None
+        name = self._ds.name
+        return name if os.path.isfile(name) else None
@@ -0,0 +1,350 @@
+"""Block-wise execution of pixel-wise operations.
+
+A pixel-wise operation needs only the pixels under one window of each operand
+to compute the same window of its result. Running it window by window — and
+writing each finished window straight into the output — bounds the working set
+by the window size instead of the scene size: the full-size temporaries an
+eager ``read()``-then-compute pass builds (the operand arrays, the raw result,
+the nodata masks) never exist at once.
+
+Windows are aligned to the primary operand's native block layout so every read
+touches whole blocks, and sized so that one window of source pixels stays
+within the ``block_budget`` option (see :func:`eeo.set_options`).
+
+Element-wise steps can also be chained without evaluating them: under the
+``deferred`` option each step only records a node of an expression graph
+(:class:`~eeo.core.adapters.DeferredAdapter`), and the chain is evaluated in a
+single fused pass per block when its pixels are first needed.
+
+Blocks are independent, so with the ``num_threads`` option (or an op's
+``workers=`` argument) above 1 they run concurrently on a thread pool: NumPy's
+ufuncs and GDAL's reads release the GIL. Each block writes only its own region
+of a preallocated output, so the result is identical however the blocks are
+scheduled.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+from rasterio.windows import Window
+
+from eeo.core.adapters import (
+    BaseRasterAdapter,
+    DaskAdapter,
+    DeferredAdapter,
+    NumpyRasterioAdapter,
+)
+from eeo.core.core import EEORasterDataset
+from eeo.core.options import _positive_int, get_option
+
+# One long-lived pool per thread count. Reusing the threads across operations
+# lets each keep the per-thread dataset handles it opened (see
+# RasterioAdapter.read_window) instead of reopening files on every call.
+_POOLS: dict[int, ThreadPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+# Set inside pool threads, so a block that itself runs a block-wise pass does
+# it inline rather than waiting on the pool it occupies.
+_WORKER = threading.local()
+
+
+def block_windows(
+    adapter: BaseRasterAdapter,
+    *,
+    budget: int | None = None,
+    block_shape: tuple[int, int] | None = None,
+) -> list[Window]:
+    """Plan the windows a block-wise pass over ``adapter`` visits, in native order.
+
+    Windows are whole multiples of the backend's native block. When a full row
+    of blocks fits the budget, windows are full-width strips of several block
+    rows — the cheapest read for both striped and tiled GeoTIFFs. Otherwise a
+    window is a run of blocks along one block row. A backend without a native
+    layout is cut into full-width row strips. No window is ever smaller than
+    one native block, so a budget below one block's size yields one block per
+    window.
+
+    Parameters
+    ----------
+    adapter : BaseRasterAdapter
+        Backend whose shape, band count, dtype, and block layout drive the plan.
+    budget : int or None, default None
+        Bytes of source pixels (all bands) one window may hold. None uses the
+        ``block_budget`` option.
+    block_shape : tuple of int or None, default None
+        ``(rows, cols)`` of the block to align windows to instead of the
+        backend's native one, e.g. the tiles of a file being written.
+
+    Returns
+    -------
+    list of rasterio.windows.Window
+        Non-overlapping windows tiling the raster, row-major over the block
+        grid; edge windows are clipped to the raster.
+    """
+    if budget is None:
+        budget = get_option("block_budget")
+    height, width = adapter.get_shape()
+    pixel_bytes = adapter.get_count() * adapter.get_dtype().itemsize
+
+    block_rows, block_cols = block_shape or adapter.get_block_shape() or (1, width)
+    block_rows, block_cols = min(block_rows, height), min(block_cols, width)
+    max_pixels = max(budget // pixel_bytes, block_rows * block_cols)
+
+    if block_rows * width <= max_pixels:
+        rows = block_rows * (max_pixels // (block_rows * width))
+        cols = width
+    else:
+        rows = block_rows
+        cols = block_cols * (max_pixels // (block_rows * block_cols))
+
+    return [
+        Window(col, row, min(cols, width - col), min(rows, height - row))
+        for row in range(0, height, rows)
+        for col in range(0, width, cols)
+    ]
+
+
+def tile_windows(
+    adapter: BaseRasterAdapter, block_shape: tuple[int, int] | None = None
+) -> list[Window]:
+    """Cut ``adapter`` into ``block_shape`` tiles, row-major over the tile grid.
+
+    Parameters
+    ----------
+    adapter : BaseRasterAdapter
+        Backend whose shape, and native block layout, drive the tiling.
+    block_shape : tuple of int or None, default None
+        ``(rows, cols)`` of one tile. None uses the backend's native block, so
+        each tile is exactly one stored block; a backend without a native
+        layout falls back to the budget-sized windows of :func:`block_windows`.
+
+    Returns
+    -------
+    list of rasterio.windows.Window
+        Non-overlapping windows tiling the raster; edge tiles are clipped to it.
+    """
+    block_shape = block_shape or adapter.get_block_shape()
+    if block_shape is None:
+        return block_windows(adapter)
+    height, width = adapter.get_shape()
+    rows, cols = block_shape
+    return [
+        Window(col, row, min(cols, width - col), min(rows, height - row))
+        for row in range(0, height, rows)
+        for col in range(0, width, cols)
+    ]
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Return the thread count for a block-wise pass: ``workers``, else the option.
+
+    Raises
+    ------
+    ValidationError
+        If ``workers`` is given and is not a positive int.
+    """
+    if workers is None:
+        return get_option("num_threads")
+    return _positive_int("workers", workers)
+
+
+def _mark_worker() -> None:
+    """Pool-thread initializer: flag the thread as a block worker."""
+    _WORKER.active = True
+
+
+def _pool(workers: int) -> ThreadPoolExecutor:
+    """Return the shared pool with ``workers`` threads, creating it once."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="eeo-block", initializer=_mark_worker
+            )
+            _POOLS[workers] = pool
+        return pool
+
+
+def parallel_windows(
+    adapter: BaseRasterAdapter, workers: int, *, budget: int | None = None
+) -> list[Window]:
+    """Plan the windows of a pass run on ``workers`` threads.
+
+    Like :func:`block_windows`, but when more than one thread is used the
+    budget is also capped at an even share of the raster, so there is at least
+    one window per thread whenever the native block layout allows it. Peak
+    memory stays within ``workers`` windows of the budget.
+    """
+    if budget is None:
+        budget = get_option("block_budget")
+    if workers > 1:
+        height, width = adapter.get_shape()
+        pixel_bytes = adapter.get_count() * adapter.get_dtype().itemsize
+        budget = min(budget, max(1, height * width * pixel_bytes // workers))
+    return block_windows(adapter, budget=budget)
+
+
+def run_blocks(task: Callable[[Window], None], windows: list[Window], *, workers: int = 1) -> None:
+    """Call ``task(window)`` for every window, on up to ``workers`` threads.
+
+    The tasks must be independent of one another: with more than one worker
+    they run concurrently, in no particular order. An exception raised by any
+    task propagates to the caller.
+
+    Parameters
+    ----------
+    task : callable
+        Processes one window. With more than one worker it is called from
+        pool threads and must only read through adapters' ``read_window``,
+        which is safe to call concurrently.
+    windows : list of rasterio.windows.Window
+        The windows to process.
+    workers : int, default 1
+        Threads to run on. 1 (or a single window) runs inline, in order.
+    """
+    if workers == 1 or len(windows) < 2 or getattr(_WORKER, "active", False):
+        for window in windows:
+            task(window)
+        return
+    # map() re-raises the first failure when its results are consumed.
+    for _ in _pool(workers).map(task, windows):
+        pass
+
+
+def execute_blocks(
+    compute: Callable[[Window], np.ndarray],
+    windows: list[Window],
+    out: np.ndarray,
+    *,
+    workers: int = 1,
+) -> None:
+    """Fill ``out`` window by window with ``compute(window)``, on up to ``workers`` threads.
+
+    Each call writes only its own window of ``out`` (the last two axes are
+    rows and columns), so the windows may be computed in any order, or
+    concurrently, with an identical result (see :func:`run_blocks`).
+
+    Parameters
+    ----------
+    compute : callable
+        Maps a window to the output pixels for it.
+    windows : list of rasterio.windows.Window
+        Non-overlapping windows covering the part of ``out`` to fill.
+    out : numpy.ndarray
+        Preallocated output, ``(rows, cols)`` or ``(bands, rows, cols)``.
+    workers : int, default 1
+        Threads to run on.
+    """
+
+    def fill(window: Window) -> None:
+        (row_start, row_stop), (col_start, col_stop) = window.toranges()
+        out[..., row_start:row_stop, col_start:col_stop] = compute(window)
+
+    run_blocks(fill, windows, workers=workers)
+
+
+def write_blocks(source: BaseRasterAdapter, *, workers: int = 1) -> NumpyRasterioAdapter:
+    """Copy ``source`` window by window into a new in-memory array.
+
+    Each window is read with ``source.read_window`` and written straight into
+    a preallocated output array, so a deferred ``source`` is evaluated one
+    fused block at a time and no window is ever encoded into a GeoTIFF.
+
+    Parameters
+    ----------
+    source : BaseRasterAdapter
+        Backend to copy; its metadata (dtype, nodata, band count,
+        georeferencing) becomes the output's.
+    workers : int, default 1
+        Threads evaluating windows concurrently (see :func:`execute_blocks`).
+
+    Returns
+    -------
+    NumpyRasterioAdapter
+        The copy, wrapping the filled array.
+    """
+    height, width = source.get_shape()
+    out = np.empty((source.get_count(), height, width), dtype=source.get_dtype())
+    execute_blocks(source.read_window, parallel_windows(source, workers), out, workers=workers)
+    return NumpyRasterioAdapter(
+        out,
+        transform=source.get_transform(),
+        crs=source.get_crs(),
+        nodata=source.get_nodata(),
+    )
+
+
+def map_elementwise(
+    kernel: Callable[..., Any],
+    operands: list[EEORasterDataset | float | int],
+    *,
+    fractional: bool,
+    workers: int | None = None,
+) -> EEORasterDataset:
+    """Apply an element-wise ``kernel`` block by block under the nodata contract.
+
+    Builds a :class:`~eeo.core.adapters.DeferredAdapter` node combining the
+    operands. For each window, every raster operand's window is read,
+    ``kernel`` is called with the windows (and any scalar operands) in
+    ``operands`` order, and the block is masked and cast by
+    :func:`~eeo.common.apply_nodata_contract`. Only one window of each operand
+    is in memory at a time.
+
+    If any operand is dask-backed, the result is a dask-backed dataset instead:
+    the same per-block computation becomes one task per chunk in the dask
+    graph, computed lazily on dask's scheduler.
+
+    Otherwise the node is evaluated into the result straight away by default. With the
+    ``deferred`` option set, the result is returned unevaluated: a later
+    element-wise operation on it extends the graph, and the whole chain runs as
+    one fused pass per block when the pixels are first needed.
+
+    Parameters
+    ----------
+    kernel : callable
+        Maps one window of each operand to the raw result for that window. It
+        must be purely element-wise (a pixel of the result depends only on the
+        same pixel of the operands) and must return a new array.
+    operands : list
+        The primary ``EEORasterDataset`` first, then further datasets or
+        scalars. Every dataset must already share the primary's grid.
+    fractional : bool
+        Passed to the nodata contract: True for fractional-result operations
+        (float32 output).
+    workers : int or None, default None
+        Threads evaluating blocks concurrently; None uses the ``num_threads``
+        option in effect when the result is evaluated. Ignored for a
+        dask-backed result, which runs on dask's scheduler.
+
+    Returns
+    -------
+    EEORasterDataset
+        The result, sharing the primary's georeferencing, in the dtype and with
+        the nodata value the contract assigns.
+
+    Raises
+    ------
+    ValidationError
+        If ``workers`` is given and is not a positive int.
+    """
+    if workers is not None:
+        resolve_workers(workers)
+    adapters = [op._adapter if isinstance(op, EEORasterDataset) else op for op in operands]
+    keep_alive = tuple(op for op in operands if isinstance(op, EEORasterDataset))
+    if any(isinstance(adapter, DaskAdapter) for adapter in adapters):
+        # A dask operand makes the result part of its task graph: lazy,
+        # chunked, and computed on dask's scheduler.
+        return EEORasterDataset(
+            DaskAdapter.elementwise(kernel, adapters, fractional=fractional, keep_alive=keep_alive)
+        )
+
+    node = DeferredAdapter(
+        kernel, adapters, fractional=fractional, keep_alive=keep_alive, workers=workers
+    )
+    if get_option("deferred"):
+        return EEORasterDataset(node)
+    return EEORasterDataset(node.materialize())
@@ -3,19 +3,32 @@
 from __future__ import annotations
 
 import contextlib
+from collections.abc import Iterator, Sequence
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import rasterio as rio
 from rasterio import CRS
 from rasterio.coords import BoundingBox
+from rasterio.enums import Resampling
 from rasterio.transform import Affine
-
-from eeo.common import is_rasterio_backed, mask_nodata, resolve_band_index
-from eeo.core.adapters import BaseRasterAdapter, NumpyRasterioAdapter, RasterioAdapter
+from rasterio.windows import Window, from_bounds, intersect
+
+from eeo.common import is_rasterio_backed, normalize_resampling_method, resolve_band_index
+from eeo.core.adapters import (
+    BaseRasterAdapter,
+    DaskAdapter,
+    DeferredAdapter,
+    NumpyRasterioAdapter,
+    RasterioAdapter,
+)
 from eeo.core.exceptions import ValidationError
-from eeo.core.types import StrPath
+from eeo.core.overviews import add_overviews, overview_factors
+from eeo.core.types import OverviewLevels, ResamplingMethod, StrPath
+
+if TYPE_CHECKING:
+    from eeo.core.statistics import BandStatistics
 
 # Approximate (decimated) statistics never read more than this many pixels per
 # side; a larger raster is decimated to fit, served from overviews when present.
@@ -98,24 +111,14 @@ def _band_names_row(ds: EEORasterDataset) -> str:
 
 
 def _band_stats_line(
-    ds: EEORasterDataset, band_idx: int, array, approximate: bool, width: int = 11
+    ds: EEORasterDataset, band_idx: int, stats: BandStatistics, approximate: bool, width: int = 11
 ) -> str:
     """Build one nodata-aware per-band statistics line for ``describe``."""
     label = _band_label(ds, band_idx)
-    masked = mask_nodata(ds, array)
-    if np.issubdtype(masked.dtype, np.floating):
-        valid = ~np.isnan(masked)
-    else:  # no nodata declared -> every pixel is valid
-        valid = np.ones(masked.shape, dtype=bool)
-
-    n_valid = int(valid.sum())
-    if n_valid == 0:
+    if stats.count == 0:
         return f"  {label:<{width}} : all nodata"
 
-    with np.errstate(all="ignore"):
-        vmin, vmax = float(np.nanmin(masked)), float(np.nanmax(masked))
-        vmean, vstd = float(np.nanmean(masked)), float(np.nanstd(masked))
-    pct = 100.0 * n_valid / masked.size
+    pct = 100.0 * stats.count / stats.total
 
     m = "~" if approximate else ""
 
@@ -123,16 +126,21 @@ def _band_stats_line(
         return f"{value:.6g}"
 
     line = (
-        f"  {label:<{width}} : min{m} {f(vmin)}   max{m} {f(vmax)}   "
-        f"mean{m} {f(vmean)}   std{m} {f(vstd)}   valid{m} {pct:.1f}%"
+        f"  {label:<{width}} : min{m} {f(stats.min)}   max{m} {f(stats.max)}   "
+        f"mean{m} {f(stats.mean)}   std{m} {f(stats.std)}   valid{m} {pct:.1f}%"
     )
     if not approximate:
-        line += f" ({masked.size - n_valid:,} nodata)"
+        line += f" ({stats.nodata:,} nodata)"
     return line
 
 
 def _stats_lines(ds: EEORasterDataset, mode: str) -> list[str]:
     """Build the statistics block of ``describe`` (may read pixel data)."""
+    # Imported here: eeo.core.statistics depends on the dataset class through
+    # eeo.core.blocks.
+    from eeo.core.statistics import BandStatistics
+    from eeo.core.stats_cache import cached_band_statistics, cached_entries
+
     out_shape = None
     if mode == "approx" and is_rasterio_backed(ds):
         out_shape = _decimated_stats_shape(ds.get_shape(), _STATS_DECIMATION_CAP)
@@ -141,8 +149,20 @@ def _stats_lines(ds: EEORasterDataset, mode: str) -> list[str]:
     if approximate:
         height, width = out_shape
         header = f"approximate — decimated read at {height} × {width} (set stats='exact' for exact)"
+        nodata = ds.get_nodata()
+        bands = range(1, ds.get_count() + 1)
+        values = cached_entries(
+            ds._adapter,
+            [f"{i}:stats approx {height}x{width}" for i in bands],
+            lambda: [
+                BandStatistics().update(ds.read(i, out_shape=out_shape), nodata).to_dict()
+                for i in bands
+            ],
+        )
+        stats = [BandStatistics.from_dict(value) for value in values]
     else:
         header = "exact — full read"
+        stats = cached_band_statistics(ds._adapter)
 
     # Named bands make the labels longer, so size the label column to the
     # widest one and keep the ` : ` separators aligned.
@@ -150,9 +170,8 @@ def _stats_lines(ds: EEORasterDataset, mode: str) -> list[str]:
     width = max(11, *(len(label) for label in labels)) if labels else 11
 
     lines = ["", f"  {'statistics':<{width}} : {header}"]
-    for band_idx in range(1, ds.get_count() + 1):
-        array = ds.read(band_idx, out_shape=out_shape) if approximate else ds.get_band(band_idx)
-        lines.append(_band_stats_line(ds, band_idx, array, approximate, width))
+    for band_idx, band_stats in enumerate(stats, start=1):
+        lines.append(_band_stats_line(ds, band_idx, band_stats, approximate, width))
     return lines
 
 
@@ -224,6 +243,44 @@ def _resolve_initial_band_names(adapter: BaseRasterAdapter, band_names) -> list[
 
 
 # Core class
+def _is_positive_int(value) -> bool:
+    """Return True for an int greater than zero (bools excluded)."""
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool) and value > 0
+
+
+def _resolve_bands(ds: EEORasterDataset, bands) -> tuple[list[int] | None, bool]:
+    """Resolve a ``bands=`` argument to ``(indexes, single)``.
+
+    ``indexes`` are 1-based (None for every band); ``single`` is True when one
+    band was asked for on its own, so the caller returns it as a 2D array.
+    """
+    if bands is None:
+        return None, False
+    if isinstance(bands, (int, str)):
+        return [resolve_band_index(ds, bands)], True
+    return [resolve_band_index(ds, band) for band in bands], False
+
+
+def _resolve_window(ds: EEORasterDataset, window) -> Window:
+    """Resolve a ``Window`` or ``(minx, miny, maxx, maxy)`` bounds, cropped to ``ds``."""
+    if not isinstance(window, Window):
+        if not (isinstance(window, (tuple, list)) and len(window) == 4):
+            raise ValidationError(
+                "window must be a rasterio Window or bounds (minx, miny, maxx, maxy); "
+                f"got {window!r}"
+            )
+        window = from_bounds(*window, transform=ds.get_transform())
+        window = window.round_offsets().round_lengths()
+
+    height, width = ds.get_shape()
+    full = Window(0, 0, width, height)
+    if window.width <= 0 or window.height <= 0 or not intersect([window, full]):
+        raise ValidationError(
+            f"window does not overlap the raster; raster is {height}x{width} pixels, got {window!r}"
+        )
+    return window.intersection(full)
+
+
 class EEORasterDataset:
     """A chainable raster dataset backed by a swappable adapter.
 
@@ -283,7 +340,7 @@ class EEORasterDataset:
         try:
             count = self.get_count()
             height, width = self.get_shape()
-            dtype = self.get_metadata().get("dtype", "?")
+            dtype = self.get_dtype()
             crs = self.get_crs()
             epsg = crs.to_epsg() if crs is not None else None
             crs_str = f"EPSG:{epsg}" if epsg else "no CRS"
@@ -322,6 +379,44 @@ class EEORasterDataset:
         adapter = RasterioAdapter.from_path(path)
         return cls(adapter=adapter, path=path)
 
+    @classmethod
+    def from_dask(
+        cls,
+        array: Any,
+        transform: Affine,
+        crs: CRS | str | int,
+        nodata=None,
+        timestamp: datetime | None = None,
+        attrs: dict | None = None,
+        band_names: list[str | None] | None = None,
+    ) -> EEORasterDataset:
+        """Wrap a dask array as a lazy, chunked dataset.
+
+        Parameters
+        ----------
+        array : dask.array.Array
+            Raster values, ``(height, width)`` or ``(bands, height, width)``.
+        transform : affine.Affine
+            Affine geotransform.
+        crs : rasterio.crs.CRS or str or int
+            Coordinate reference system.
+        nodata : float or int or None, default None
+            Nodata value stored in the metadata.
+        timestamp : datetime.datetime or None, default None
+            Optional acquisition time carried with the dataset.
+        attrs : dict or None, default None
+            Optional free-form tags dict carried with the dataset.
+        band_names : list of (str or None) or None, default None
+            Optional per-band names. Must match the band count.
+
+        Returns
+        -------
+        EEORasterDataset
+            Dask-backed dataset.
+        """
+        adapter = DaskAdapter(array=array, transform=transform, crs=crs, nodata=nodata)
+        return cls(adapter=adapter, timestamp=timestamp, attrs=attrs, band_names=band_names)
+
     @classmethod
     def from_rasterio(cls, dataset: rio.DatasetReader) -> EEORasterDataset:
         """Wrap an already-open rasterio dataset.
@@ -410,10 +505,10 @@ class EEORasterDataset:
         --------
         >>> rio_ds = ds.to_rasterio()
         """
-        # Detect by adapter type, not backend class: an op result's backend is
-        # a rasterio DatasetWriter, which a DatasetReader isinstance check
-        # would wrongly re-promote (full read + copy).
-        if isinstance(self._adapter, RasterioAdapter):
+        # Detect by adapter type, not backend class: a promoted dataset's
+        # backend is a rasterio DatasetWriter, which a DatasetReader isinstance
+        # check would wrongly re-promote (full read + copy).
+        if is_rasterio_backed(self):
             return self
 
         array = self.read()
@@ -434,6 +529,82 @@ class EEORasterDataset:
             band_names=self.band_names,
         )
 
+    def compute(self) -> EEORasterDataset:
+        """Evaluate any deferred operations now.
+
+        Under the ``deferred`` option (see :func:`eeo.set_options`),
+        element-wise operations return an unevaluated result that is computed
+        the first time its pixels are needed. ``compute`` forces that
+        evaluation — one fused pass per block over the whole recorded chain —
+        so that a result reused by several later operations is computed once
+        rather than re-fused into each of them. A dask-backed dataset (see
+        :meth:`chunk`) is computed into memory and becomes NumPy-backed.
+
+        Returns
+        -------
+        EEORasterDataset
+            ``self``, now holding its evaluated pixels. A dataset with nothing
+            deferred is returned unchanged.
+
+        Examples
+        --------
+        >>> with eeo.set_options(deferred=True):
+        ...     reflectance = ds.multiply(0.0001).add(-0.1).compute()
+        """
+        if isinstance(self._adapter, DeferredAdapter):
+            self._adapter.materialize()
+        elif isinstance(self._adapter, DaskAdapter):
+            self._adapter = NumpyRasterioAdapter(
+                array=self._adapter.read(),
+                transform=self.get_transform(),
+                crs=self.get_crs(),
+                nodata=self._adapter.get_nodata(),
+            )
+        return self
+
+    def chunk(self, chunks: tuple[int, int] | str = "auto") -> EEORasterDataset:
+        """Return a lazy, chunked (dask-backed) view of this dataset.
+
+        Operations on the result build a dask task graph instead of computing:
+        element-wise operations (the pixel-wise algebra) stay lazy and
+        chunked, and pixels are computed, in parallel across chunks, only when
+        read, saved, or passed to an operation that needs them in memory.
+
+        Parameters
+        ----------
+        chunks : "auto" or tuple of int, default "auto"
+            Spatial ``(rows, cols)`` chunk size; every band of a block shares
+            one chunk. ``"auto"`` aligns chunks to the source's native block
+            layout and sizes them by the ``block_budget`` option (see
+            :func:`eeo.set_options`).
+
+        Returns
+        -------
+        EEORasterDataset
+            Dask-backed dataset over the same pixels, carrying this dataset's
+            band names, ``timestamp``, and ``attrs``. A file-backed source is
+            re-read per chunk rather than loaded up front.
+
+        Raises
+        ------
+        MissingDependencyError
+            If the ``lazy`` extra (dask) is not installed.
+
+        Examples
+        --------
+        >>> lazy = ds.chunk((1024, 1024))
+        >>> ratio = lazy.divide(red.chunk((1024, 1024)))   # nothing computed yet
+        >>> ratio.save_raster("ratio.tif")                  # computed chunk by chunk
+        """
+        adapter = DaskAdapter.from_adapter(self._adapter, chunks=chunks)
+        return EEORasterDataset(
+            adapter=adapter,
+            path=self.path,
+            timestamp=self.timestamp,
+            attrs=self.attrs,
+            band_names=self.band_names,
+        )
+
     def to_xarray(self) -> Any:
         """Convert the raster to a georeferenced xarray DataArray.
 
@@ -514,9 +685,10 @@ class EEORasterDataset:
     def read(self, *args, **kwargs) -> np.ndarray:
         """Read pixel data, forwarding all arguments to the backend.
 
-        For the rasterio backend, the arguments are
-        ``rasterio.DatasetReader.read`` options (band indexes, ``out_shape``,
-        ``window``, ...). The NumPy backend returns its stored array.
+        For every backend, the arguments are ``rasterio.DatasetReader.read``
+        options (band indexes, ``out_shape``, ``window``, ...). Called without
+        arguments, the NumPy backend returns its stored array; the dask
+        backend computes only the bands and window asked for.
 
         Returns
         -------
@@ -525,6 +697,140 @@ class EEORasterDataset:
         """
         return self._adapter.read(*args, **kwargs)
 
+    def read_window(
+        self,
+        window: Window | BoundingBox | tuple | list,
+        *,
+        bands: int | str | Sequence[int | str] | None = None,
+    ) -> np.ndarray:
+        """Read the pixels inside a window or a bounding box.
+
+        Only the requested region, and only the requested bands, are read;
+        the rest of the raster is never touched.
+
+        Parameters
+        ----------
+        window : rasterio.windows.Window or tuple
+            Either a pixel ``Window``, or bounds ``(minx, miny, maxx, maxy)``
+            in the raster's CRS units (a ``BoundingBox`` works too). A region
+            that overhangs the raster edge is cropped to the overlap.
+        bands : int or str or sequence of (int or str) or None, default None
+            Bands to read, each a 1-based index or a band name. A single band
+            returns a 2D array; a sequence returns the bands stacked in the
+            order given; None reads every band.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(rows, cols)`` for a single band, else ``(bands, rows, cols)``.
+            Nodata pixels keep their sentinel value.
+
+        Raises
+        ------
+        ValidationError
+            If ``window`` is neither a ``Window`` nor four bounds, does not
+            overlap the raster, or a band name is unknown or ambiguous.
+        IndexError
+            If a band index is outside the range of available bands.
+
+        Examples
+        --------
+        >>> from rasterio.windows import Window
+        >>> corner = ds.read_window(Window(0, 0, 256, 256))
+        >>> nir = ds.read_window((500000, 4190000, 510000, 4200000), bands="nir")
+        """
+        indexes, single = _resolve_bands(self, bands)
+        block = self._adapter.read_window(_resolve_window(self, window), indexes)
+        return block[0] if single else block
+
+    def iter_blocks(
+        self,
+        block_shape: tuple[int, int] | None = None,
+        overlap: int = 0,
+        *,
+        bands: int | str | Sequence[int | str] | None = None,
+    ) -> Iterator[tuple[Window, np.ndarray]]:
+        """Iterate over the raster block by block, as ``(window, array)`` pairs.
+
+        Only one block is in memory at a time, so a raster of any size can be
+        processed with bounded memory. Blocks come in the backend's native
+        order: row-major over the block grid, which for a tiled or striped
+        GeoTIFF is the order its blocks are stored in.
+
+        Parameters
+        ----------
+        block_shape : tuple of int or None, default None
+            ``(rows, cols)`` of one block. None uses the backend's native
+            block (the file's tiles or strips, or a dask backend's chunks); a
+            backend without one, such as the NumPy backend, is cut into
+            full-width strips sized by the ``block_budget`` option (see
+            :func:`eeo.set_options`).
+        overlap : int, default 0
+            Extra pixels read on every side of each block, for neighbourhood
+            operations such as filters. Blocks still advance by
+            ``block_shape``, so neighbouring arrays share ``2 * overlap``
+            pixels; at the raster edge the overlap is cropped.
+        bands : int or str or sequence of (int or str) or None, default None
+            Bands to read, as in :meth:`read_window`.
+
+        Yields
+        ------
+        window : rasterio.windows.Window
+            The pixel window ``array`` covers, overlap included. Pass it to
+            ``rasterio.windows.transform`` for the block's geotransform.
+        array : numpy.ndarray
+            The block's pixels, shaped as in :meth:`read_window`. Nodata pixels
+            keep their sentinel value.
+
+        Raises
+        ------
+        ValidationError
+            If ``block_shape`` is not two positive ints, ``overlap`` is not a
+            non-negative int, or a band name is unknown or ambiguous.
+        IndexError
+            If a band index is outside the range of available bands.
+
+        Examples
+        --------
+        >>> for window, block in ds.iter_blocks(bands="nir"):
+        ...     total += np.count_nonzero(block > 3000)
+        """
+        # Imported here: eeo.core.blocks depends on this class.
+        from eeo.core.blocks import tile_windows
+
+        if block_shape is not None and not (
+            isinstance(block_shape, (tuple, list))
+            and len(block_shape) == 2
+            and all(_is_positive_int(n) for n in block_shape)
+        ):
+            raise ValidationError(
+                f"block_shape must be (rows, cols) of positive ints; got {block_shape!r}"
+            )
+        if isinstance(overlap, bool) or not isinstance(overlap, (int, np.integer)) or overlap < 0:
+            raise ValidationError(f"overlap must be a non-negative int; got {overlap!r}")
+        indexes, single = _resolve_bands(self, bands)
+        # Arguments are checked when iter_blocks is called, not on the first
+        # next(); the blocks themselves are read lazily, as the caller iterates.
+        return self._blocks(tile_windows(self._adapter, block_shape), overlap, indexes, single)
+
+    def _blocks(
+        self, cores: list[Window], overlap: int, indexes: list[int] | None, single: bool
+    ) -> Iterator[tuple[Window, np.ndarray]]:
+        """Yield ``(window, array)`` for each core window grown by ``overlap``."""
+        height, width = self.get_shape()
+        full = Window(0, 0, width, height)
+        for core in cores:
+            window = core
+            if overlap:
+                window = Window(
+                    core.col_off - overlap,
+                    core.row_off - overlap,
+                    core.width + 2 * overlap,
+                    core.height + 2 * overlap,
+                ).intersection(full)
+            block = self._adapter.read_window(window, indexes)
+            yield window, block[0] if single else block
+
     def get_crs(self) -> CRS:
         """Return the coordinate reference system.
 
@@ -617,7 +923,9 @@ class EEORasterDataset:
         -----
         Statistics exclude nodata pixels. ``stats="exact"`` reads the whole
         raster; ``stats="approx"`` reads a decimated array capped at
-        ``1024`` pixels per side.
+        ``1024`` pixels per side. Statistics of a file-backed raster are kept
+        in the statistics cache (the ``stats_cache`` option), so describing
+        the same unchanged file again reads no pixels.
 
         Examples
         --------
@@ -656,6 +964,29 @@ class EEORasterDataset:
         """
         return self._adapter.get_count()
 
+    def get_nodata(self) -> float | None:
+        """Return the declared nodata value.
+
+        Cheaper than ``get_metadata()["nodata"]``: the value is read from the
+        backend's cached profile without building a metadata dict.
+
+        Returns
+        -------
+        float or None
+            The nodata value, or None if the raster declares none.
+        """
+        return self._adapter.get_nodata()
+
+    def get_dtype(self) -> np.dtype:
+        """Return the pixel data type.
+
+        Returns
+        -------
+        numpy.dtype
+            The dtype shared by every band.
+        """
+        return self._adapter.get_dtype()
+
     def get_index(self):
         """Return the backend's coordinate-to-pixel index method.
 
@@ -756,7 +1087,19 @@ class EEORasterDataset:
     # ========================
     # Saving
     # ========================
-    def save_raster(self, path: StrPath, driver: str = "GTiff") -> None:
+    def save_raster(
+        self,
+        path: StrPath,
+        driver: str = "GTiff",
+        *,
+        overviews: OverviewLevels | None = None,
+        overview_resampling: Resampling | ResamplingMethod = "nearest",
+        cog: bool = False,
+        compress: str | None = None,
+        predictor: bool | int | None = None,
+        blocksize: int | None = None,
+        num_threads: int | str | None = None,
+    ) -> None:
         """Write the raster to disk.
 
         Parameters
@@ -765,22 +1108,117 @@ class EEORasterDataset:
             Output file path.
         driver : str, default "GTiff"
             GDAL driver name for the output format.
+        overviews : "auto", int, sequence of int, or None, default None
+            Overview (pyramid) levels to build into the file after writing
+            it; None builds none. ``"auto"`` halves the raster until the
+            smallest level is at most 256 pixels per side, an int builds that
+            many levels (factors 2 to ``2**overviews``), and a sequence gives
+            the decimation factors. See :func:`eeo.build_overviews`.
+        overview_resampling : str or rasterio.enums.Resampling, default "nearest"
+            How overview pixels are computed. ``"nearest"`` keeps categorical
+            values intact; ``"average"`` suits continuous data.
+        cog : bool, default False
+            Write a Cloud-Optimized GeoTIFF: tiled, with internal overviews
+            (``overviews`` defaults to ``"auto"``) laid out so that readers
+            can fetch any region at any level with a few range requests.
+            ``driver`` must be ``"GTiff"`` or ``"COG"``.
+        compress : str or None, default None
+            GeoTIFF compression: ``"zstd"``, ``"deflate"``, ``"lzw"``,
+            ``"lerc"``, ... None writes uncompressed, or LZW for a COG.
+        predictor : bool, int, or None, default None
+            Compression predictor: 2 (horizontal differencing, integers) or 3
+            (floating point); True picks the one matching the dtype. It often
+            halves the size of continuous data. None uses none.
+        blocksize : int or None, default None
+            Side of the square internal tiles, a multiple of 16. None uses 512
+            for a COG or a compressed GeoTIFF, and strips otherwise.
+        num_threads : int, "ALL_CPUS", or None, default None
+            Threads GDAL compresses tiles on. None follows the ``num_threads``
+            option.
 
         Returns
         -------
         None
 
+        Raises
+        ------
+        ValidationError
+            If an overview or creation setting is invalid, or a GeoTIFF
+            setting is given for another driver.
+        BackendError
+            If GDAL fails to build the overviews or to write the COG.
+
         Notes
         -----
         Band names are written to the output's GDAL band descriptions, so they
         are read back automatically by :func:`eeo.load_raster`. Formats that
         cannot store band descriptions simply drop them.
 
+        Decimated reads of the saved file (``describe(stats=True)``, every
+        plot) are served from its overviews, reading a fraction of the bytes
+        they would decimate from full resolution. GeoTIFF overviews are stored
+        inside the file; other formats get an external ``.ovr``.
+
+        With ``cog=True`` or any of ``compress``, ``predictor``,
+        ``blocksize`` and ``num_threads``, the raster is streamed to the file
+        window by window, so no band is read whole. A COG is staged in a
+        temporary tiled GeoTIFF beside ``path``, given its overviews, and
+        copied into the COG layout by GDAL's ``COG`` driver.
+
         Examples
         --------
         >>> ds.save_raster("out.tif")
+        >>> ds.save_raster("out.tif", overviews="auto", overview_resampling="average")
+        >>> ds.save_raster("out.tif", cog=True, compress="zstd", predictor=True,
+        ...                num_threads="ALL_CPUS")
         """
-        self._adapter.write(path=path, driver=driver, band_names=self.band_names)
+        # Imported here: eeo.core.writer depends on the dataset class through
+        # eeo.core.blocks.
+        from eeo.core.writer import geotiff_options, write_cog, write_windows
+
+        if cog:
+            if driver not in ("GTiff", "COG"):
+                raise ValidationError(f"cog=True writes a GeoTIFF; got driver={driver!r}")
+            overviews = "auto" if overviews is None else overviews
+        if overviews is not None:
+            # Validate before writing, so a bad argument leaves no file behind.
+            overview_factors(self.get_shape(), overviews)
+            normalize_resampling_method(overview_resampling)
+
+        if cog:
+            write_cog(
+                self._adapter,
+                path,
+                band_names=self.band_names,
+                compress=compress,
+                predictor=predictor,
+                blocksize=blocksize,
+                num_threads=num_threads,
+                overviews=overviews,
+                overview_resampling=overview_resampling,
+            )
+            return
+
+        if any(v is not None for v in (compress, predictor, blocksize, num_threads)):
+            if driver != "GTiff":
+                raise ValidationError(
+                    "compress=, predictor=, blocksize= and num_threads= are GeoTIFF "
+                    f"settings; got driver={driver!r}"
+                )
+            options = geotiff_options(
+                self.get_dtype(),
+                compress=compress,
+                predictor=predictor,
+                blocksize=blocksize,
+                num_threads=num_threads,
+            )
+            write_windows(
+                self._adapter, path, driver=driver, band_names=self.band_names, options=options
+            )
+        else:
+            self._adapter.write(path=path, driver=driver, band_names=self.band_names)
+        if overviews is not None:
+            add_overviews(path, overviews, overview_resampling)
 
     # ========================
     # Lifecycle
@@ -795,8 +1233,8 @@ class EEORasterDataset:
         Notes
         -----
         Safe to call more than once. A dataset created from an in-memory
-        ``MemoryFile`` (e.g. any operation result) cannot be reopened after
-        closing.
+        ``MemoryFile`` (e.g. the result of :meth:`to_rasterio`) cannot be
+        reopened after closing.
         """
         self._adapter.close()
 
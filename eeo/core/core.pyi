@@ -4,23 +4,26 @@
 # including the methods bound dynamically by the @eeo_raster_op / @eeo_raster_viz
 # decorators. Regenerate after adding or changing a bound op or a core.py method:
 #     python scripts/generate_core_stub.py
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pyproj
 import rasterio as rio
 from affine import Affine
 from rasterio import CRS
 from rasterio.coords import BoundingBox
 from rasterio.enums import Resampling
+from rasterio.windows import Window
 
 from eeo.analysis.indices import BandSpec
-from eeo.analysis.stats import Coordinate
+from eeo.analysis.stats import Coordinate, Points
 from eeo.core.adapters import BaseRasterAdapter
-from eeo.core.types import ResamplingMethod, StrPath
+from eeo.core.types import OverviewLevels, ResamplingMethod, StrPath
 
 class EEORasterDataset:
     _adapter: BaseRasterAdapter
@@ -43,6 +46,17 @@ class EEORasterDataset:
     @classmethod
     def from_path(cls, path: StrPath) -> EEORasterDataset: ...
     @classmethod
+    def from_dask(
+        cls,
+        array: Any,
+        transform: Affine,
+        crs: CRS | str | int,
+        nodata=...,
+        timestamp: datetime | None = ...,
+        attrs: dict | None = ...,
+        band_names: list[str | None] | None = ...,
+    ) -> EEORasterDataset: ...
+    @classmethod
     def from_rasterio(cls, dataset: rio.DatasetReader) -> EEORasterDataset: ...
     @classmethod
     def from_array(
@@ -58,9 +72,27 @@ class EEORasterDataset:
         band_names: list[str | None] | None = ...,
     ) -> EEORasterDataset: ...
     def to_rasterio(self) -> EEORasterDataset: ...
+    def compute(self) -> EEORasterDataset: ...
+    def chunk(self, chunks: tuple[int, int] | str = ...) -> EEORasterDataset: ...
     def to_xarray(self) -> Any: ...
     def to_array(self) -> np.ndarray: ...
     def read(self, *args, **kwargs) -> np.ndarray: ...
+    def read_window(
+        self,
+        window: Window | BoundingBox | tuple | list,
+        *,
+        bands: int | str | Sequence[int | str] | None = ...,
+    ) -> np.ndarray: ...
+    def iter_blocks(
+        self,
+        block_shape: tuple[int, int] | None = ...,
+        overlap: int = ...,
+        *,
+        bands: int | str | Sequence[int | str] | None = ...,
+    ) -> Iterator[tuple[Window, np.ndarray]]: ...
+    def _blocks(
+        self, cores: list[Window], overlap: int, indexes: list[int] | None, single: bool
+    ) -> Iterator[tuple[Window, np.ndarray]]: ...
     def get_crs(self) -> CRS: ...
     def get_transform(self) -> Affine: ...
     def get_shape(self) -> tuple[int, int]: ...
@@ -70,6 +102,8 @@ class EEORasterDataset:
     def get_width(self) -> int: ...
     def get_height(self) -> int: ...
     def get_count(self) -> int: ...
+    def get_nodata(self) -> float | None: ...
+    def get_dtype(self) -> np.dtype: ...
     def get_index(self): ...
     def get_band(self, idx: int | str) -> np.ndarray: ...
     @property
@@ -77,7 +111,19 @@ class EEORasterDataset:
     @band_names.setter
     def band_names(self, names: list[str | None] | None) -> None: ...
     def set_band_name(self, band: int, new_name: str | None) -> None: ...
-    def save_raster(self, path: StrPath, driver: str = ...) -> None: ...
+    def save_raster(
+        self,
+        path: StrPath,
+        driver: str = ...,
+        *,
+        overviews: OverviewLevels | None = ...,
+        overview_resampling: Resampling | ResamplingMethod = ...,
+        cog: bool = ...,
+        compress: str | None = ...,
+        predictor: bool | int | None = ...,
+        blocksize: int | None = ...,
+        num_threads: int | str | None = ...,
+    ) -> None: ...
     def close(self) -> None: ...
     def __del__(self): ...
     def _bind(self, func): ...
@@ -92,13 +138,32 @@ class EEORasterDataset:
     def __truediv__(self, other: EEORasterDataset | int | float) -> EEORasterDataset: ...
     def __rtruediv__(self, other: int | float) -> EEORasterDataset: ...
     def __pow__(self, exponent: int | float) -> EEORasterDataset: ...
-    def absolute(self) -> EEORasterDataset: ...
+    def absolute(self, *, workers: int | None = ...) -> EEORasterDataset: ...
     def add(
-        self, other: EEORasterDataset | float | int, *, auto_align: bool = ..., method: str = ...
+        self,
+        other: EEORasterDataset | float | int,
+        *,
+        auto_align: bool = ...,
+        method: str = ...,
+        workers: int | None = ...,
+    ) -> EEORasterDataset: ...
+    def build_overviews(
+        self, levels: OverviewLevels = ..., *, resampling: Resampling | ResamplingMethod = ...
     ) -> EEORasterDataset: ...
     def clip_raster_with_bbox(
         self, bbox: tuple | list, plot_kwargs=..., show_preview: bool = ...
     ) -> EEORasterDataset: ...
+    def clip_raster_with_features(
+        self,
+        features: gpd.GeoDataFrame | StrPath,
+        id_column: str | None = ...,
+        *,
+        all_touched: bool = ...,
+        nodata: int | float | None = ...,
+        out_dir: StrPath | None = ...,
+        save_kwargs: dict | None = ...,
+        workers: int | None = ...,
+    ) -> Iterator[tuple[Any, EEORasterDataset]] | dict[Any, Path]: ...
     def clip_raster_with_vector(
         self,
         vector_file: gpd.GeoDataFrame | StrPath,
@@ -118,6 +183,15 @@ class EEORasterDataset:
         auto_align: bool = ...,
         method: str = ...,
         safe: bool = ...,
+        workers: int | None = ...,
+    ) -> EEORasterDataset: ...
+    def eval(
+        self,
+        expression: str,
+        *,
+        bands: Mapping[str, EEORasterDataset | int | str] | None = ...,
+        name: str | None = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def evi(
         self,
@@ -128,10 +202,19 @@ class EEORasterDataset:
         auto_align: bool = ...,
         method: str = ...,
         name: str | None = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def extract_value_at_coordinate(
         self, coordinates: Coordinate, band_idx: int | str = ...
     ) -> int | float: ...
+    def extract_values_at_coordinates(
+        self,
+        points: Points,
+        bands: int | str | Sequence[int | str] | None = ...,
+        *,
+        crs: Any = ...,
+        workers: int | None = ...,
+    ) -> pd.DataFrame: ...
     def get_maximum_pixel(
         self, band_idx: int | str = ..., *, return_position_as_pixel_coordinate: bool = ...
     ) -> dict: ...
@@ -148,7 +231,7 @@ class EEORasterDataset:
         *,
         return_position_as_pixel_coordinate: bool = ...,
     ) -> dict: ...
-    def log(self, base: int | float = ...) -> EEORasterDataset: ...
+    def log(self, base: int | float = ..., *, workers: int | None = ...) -> EEORasterDataset: ...
     def mosaic(
         self,
         others: EEORasterDataset | Iterable[EEORasterDataset],
@@ -160,7 +243,12 @@ class EEORasterDataset:
         **kwargs,
     ) -> EEORasterDataset | None: ...
     def multiply(
-        self, other: EEORasterDataset | float | int, *, auto_align: bool = ..., method: str = ...
+        self,
+        other: EEORasterDataset | float | int,
+        *,
+        auto_align: bool = ...,
+        method: str = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def ndbi(
         self,
@@ -170,6 +258,7 @@ class EEORasterDataset:
         auto_align: bool = ...,
         method: str = ...,
         name: str | None = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def ndmi(
         self,
@@ -179,6 +268,7 @@ class EEORasterDataset:
         auto_align: bool = ...,
         method: str = ...,
         name: str | None = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def ndvi(
         self,
@@ -188,6 +278,7 @@ class EEORasterDataset:
         auto_align: bool = ...,
         method: str = ...,
         name: str | None = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def ndwi(
         self,
@@ -197,12 +288,18 @@ class EEORasterDataset:
         auto_align: bool = ...,
         method: str = ...,
         name: str | None = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def normalize_min_max(
-        self, *, new_min: float | int = ..., new_max: float | int = ...
+        self, *, new_min: float | int = ..., new_max: float | int = ..., workers: int | None = ...
     ) -> EEORasterDataset: ...
     def normalize_percentile(
-        self, *, lower_percentile: float | int = ..., upper_percentile: float | int = ...
+        self,
+        *,
+        lower_percentile: float | int = ...,
+        upper_percentile: float | int = ...,
+        method: str = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def normalized_difference(
         self,
@@ -211,6 +308,7 @@ class EEORasterDataset:
         auto_align: bool = ...,
         method: str = ...,
         name: str | None = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
     def plot_band_array(
         self,
@@ -290,7 +388,7 @@ class EEORasterDataset:
         dpi: int = ...,
         title: str | None = ...,
     ) -> None: ...
-    def power(self, exponent: int | float) -> EEORasterDataset: ...
+    def power(self, exponent: int | float, *, workers: int | None = ...) -> EEORasterDataset: ...
     def reproject_raster(
         self, *, target_crs: int | str | pyproj.CRS, resampling_method: Resampling = ...
     ) -> EEORasterDataset: ...
@@ -313,15 +411,30 @@ class EEORasterDataset:
         auto_align: bool = ...,
         method: str = ...,
         name: str | None = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
-    def sqrt(self) -> EEORasterDataset: ...
+    def sqrt(self, *, workers: int | None = ...) -> EEORasterDataset: ...
     def stack(
         self,
         others: EEORasterDataset | Iterable[EEORasterDataset],
         *,
         names: list[str | None] | None = ...,
     ) -> EEORasterDataset: ...
-    def standardize(self) -> EEORasterDataset: ...
+    def standardize(self, *, workers: int | None = ...) -> EEORasterDataset: ...
     def subtract(
-        self, other: EEORasterDataset | float | int, *, auto_align: bool = ..., method: str = ...
+        self,
+        other: EEORasterDataset | float | int,
+        *,
+        auto_align: bool = ...,
+        method: str = ...,
+        workers: int | None = ...,
     ) -> EEORasterDataset: ...
+    def zonal_stats(
+        self,
+        zones: gpd.GeoDataFrame | StrPath,
+        stats: str | Sequence[str] = ...,
+        bands: int | str | Sequence[int | str] | None = ...,
+        *,
+        all_touched: bool = ...,
+        workers: int | None = ...,
+    ) -> pd.DataFrame: ...
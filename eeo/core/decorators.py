@@ -27,11 +27,11 @@ def eeo_raster_op(func: Callable[P, R]) -> Callable[P, R]: ...
 
 @overload
 def eeo_raster_op(
-    *, preserve_none: bool = ..., propagate_band_names: bool = ...
+    *, preserve_none: bool = ..., propagate_band_names: bool = ..., tileable: bool = ...
 ) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 
 
-def eeo_raster_op(func=None, *, preserve_none=False, propagate_band_names=True):
+def eeo_raster_op(func=None, *, preserve_none=False, propagate_band_names=True, tileable=True):
     """Attach a free function to EEORasterDataset as a chainable method.
 
     Usable bare (``@eeo_raster_op``) or with arguments
@@ -51,6 +51,12 @@ def eeo_raster_op(func=None, *, preserve_none=False, propagate_band_names=True):
     set ``propagate_band_names=False`` and name their output themselves;
     inheriting names there would mislabel the data. The names of a result that
     already carries its own are never overwritten.
+
+    Set ``tileable=False`` for operations whose output pixels depend on the
+    whole raster, not only on the input pixels at the same place (e.g. those
+    rescaling by statistics of their input). :func:`~eeo.run_tiled` rejects
+    them as steps, since each tile would see only its own pixels. The flag is
+    recorded on the function as ``__eeo_tileable__``.
     """
     from .core import EEORasterDataset
 
@@ -87,6 +93,8 @@ def eeo_raster_op(func=None, *, preserve_none=False, propagate_band_names=True):
         # Bind to EEORasterDataset
         setattr(EEORasterDataset, func.__name__, method)
         _OP_REGISTRY.append((func, "op"))
+        # Read by the tile scheduler to reject whole-raster operations.
+        func.__eeo_tileable__ = tileable  # type: ignore[attr-defined]
 
         return func  # the original function is not altered
 
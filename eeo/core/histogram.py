@@ -0,0 +1,660 @@
+"""Mergeable histograms and streaming percentiles.
+
+``np.nanpercentile`` needs every value in memory as one float array, and
+partitions a NaN-free copy of it. Here a raster is instead walked block by
+block and each band is binned into a fixed-bin :class:`Histogram`. Histograms
+of the same bins merge by adding their counts, so blocks can be binned on
+different threads (or tiles in different processes) and combined afterwards.
+
+A percentile is read off the cumulative counts. In ``"approx"`` mode it is
+interpolated inside the bin holding its rank, so its error is below one bin
+width. In ``"exact"`` mode a further pass collects only the pixels of the bins
+holding the ranks needed, and the order statistics are taken from those. The
+result equals ``np.nanpercentile`` with its default (linear) method. A bin too
+full to collect, as skewed or near-constant data gives, is first split into
+finer bins by another pass, until the bin holding the rank is small enough or
+holds a single value, so memory stays bounded whatever the distribution.
+
+Integer data spanning at most 65,536 distinct values is binned one value per
+bin, which makes the histogram itself exact: 8- and 16-bit rasters are served
+in a single pass in either mode, with no range pass first.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any
+
+import numpy as np
+from rasterio.windows import Window
+
+from eeo.core.adapters import BaseRasterAdapter
+from eeo.core.blocks import parallel_windows, resolve_workers, run_blocks
+from eeo.core.exceptions import ValidationError
+from eeo.core.options import _positive_int
+from eeo.core.statistics import _valid_values
+
+# Bins of a float (or wide-integer) histogram; the approximate mode's error
+# is below (max - min) / DEFAULT_BINS.
+DEFAULT_BINS = 4096
+# Integer data spanning at most this many values gets one bin per value.
+_MAX_UNIT_BINS = 1 << 16
+
+# Most values the exact mode collects from one bin; a fuller bin is split
+# into finer bins first.
+_MAX_CANDIDATES = 1 << 18
+# Splits after which a bin still too full to collect is read off its counts,
+# within its width: the range over DEFAULT_BINS ** (_MAX_SPLITS + 1).
+_MAX_SPLITS = 6
+
+_METHODS = ("exact", "approx")
+
+# Runs ``fn`` on the valid values of every band of every block, returning the
+# results in block order.
+_Scan = Callable[[Callable[[list[np.ndarray]], Any]], list[Any]]
+
+
+class Histogram:
+    """Fixed-bin histogram of valid pixel values, mergeable by adding counts.
+
+    Parameters
+    ----------
+    low, high : float
+        Range the bins cover. Values outside it are counted in the end bins.
+    bins : int, default DEFAULT_BINS
+        Number of equal-width bins.
+    integer : bool, default False
+        Whether the values are integers. An integer range spanning at most
+        65,536 values is then binned one value per bin, and ``bins`` is
+        ignored.
+
+    Attributes
+    ----------
+    counts : numpy.ndarray
+        Values per bin (int64).
+    low, width : float
+        Left edge of the first bin, and the bin width.
+    exact : bool
+        Whether every bin holds a single distinct value (integer unit bins, or
+        a constant band), so percentiles read from the counts are exact.
+    min, max : float
+        Smallest and largest value counted (``inf`` and ``-inf`` when empty).
+    """
+
+    __slots__ = ("low", "width", "counts", "integer", "min", "max")
+
+    def __init__(
+        self, low: float, high: float, bins: int = DEFAULT_BINS, *, integer: bool = False
+    ) -> None:
+        self.integer = integer and high - low < _MAX_UNIT_BINS
+        if self.integer:
+            self.low: float = int(low)
+            self.width: float = 1
+            bins = int(high) - int(low) + 1
+        elif high > low:
+            self.low, self.width = float(low), (float(high) - float(low)) / bins
+        else:  # a single value: one bin holding only it
+            self.low, self.width, bins = float(low), 1.0, 1
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __repr__(self) -> str:
+        """Return the range, bin count, and number of values counted."""
+        return (
+            f"Histogram(low={self.low}, width={self.width}, bins={self.counts.size}, "
+            f"count={self.count}, exact={self.exact})"
+        )
+
+    @property
+    def exact(self) -> bool:
+        """Whether percentiles read from the counts alone are exact."""
+        return self.integer or self.min == self.max
+
+    @property
+    def count(self) -> int:
+        """Number of values counted."""
+        return int(self.counts.sum())
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Bin edges, one more than the bins."""
+        return self.low + self.width * np.arange(self.counts.size + 1, dtype=np.float64)
+
+    def empty_like(self) -> Histogram:
+        """Return an empty histogram with the same bins, ready to be merged into this one."""
+        other = Histogram.__new__(Histogram)
+        other.low, other.width, other.integer = self.low, self.width, self.integer
+        other.counts = np.zeros_like(self.counts)
+        other.min, other.max = math.inf, -math.inf
+        return other
+
+    def bin_indices(self, values: np.ndarray) -> np.ndarray:
+        """Return the bin of each of ``values`` (flat, NaN-free)."""
+        last = self.counts.size - 1
+        if self.integer:
+            index = np.subtract(values, self.low, dtype=np.int64)
+            return np.clip(index, 0, last, out=index)
+        # Clipped before the cast, so infinities land in the end bins.
+        position = np.floor(np.subtract(values, self.low, dtype=np.float64) / self.width)
+        return np.clip(position, 0, last, out=position).astype(np.int64)
+
+    def update(self, values: np.ndarray) -> Histogram:
+        """Count ``values``: a flat array of valid (NaN-free) values.
+
+        Returns
+        -------
+        Histogram
+            ``self``, for chaining.
+        """
+        if values.size:
+            self.counts += np.bincount(self.bin_indices(values), minlength=self.counts.size)
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+        return self
+
+    def merge(self, other: Histogram) -> Histogram:
+        """Add another histogram's counts to this one.
+
+        Returns
+        -------
+        Histogram
+            ``self``, for chaining.
+
+        Raises
+        ------
+        ValidationError
+            If the two histograms do not have the same bins.
+        """
+        if (other.low, other.width, other.counts.size, other.integer) != (
+            self.low,
+            self.width,
+            self.counts.size,
+            self.integer,
+        ):
+            raise ValidationError(
+                f"cannot merge histograms with different bins: {self} and {other}"
+            )
+        self.counts += other.counts
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentiles(self, q: float | Sequence[float]) -> np.ndarray:
+        """Return the ``q`` percentiles read from the counts.
+
+        Exact when :attr:`exact` is set; otherwise interpolated inside the bin
+        holding each rank, within one bin width of the true value. The lowest
+        and highest ranks are always the exact extremes.
+
+        Parameters
+        ----------
+        q : float or sequence of float
+            Percentiles, each in ``[0, 100]``.
+
+        Returns
+        -------
+        numpy.ndarray
+            One float64 value per percentile; NaN when nothing was counted.
+
+        Raises
+        ------
+        ValidationError
+            If a percentile is outside ``[0, 100]``.
+        """
+        return self._read(_check_percentiles(q))
+
+    def _read(self, levels: np.ndarray) -> np.ndarray:
+        """Return the validated percentiles ``levels`` read from the counts."""
+        total = self.count
+        if total == 0:
+            return np.full(levels.shape, np.nan)
+        lower, fraction = _virtual_ranks(levels, total)
+        upper = np.minimum(lower + 1, total - 1)
+        return _lerp(self._estimate(lower, total), self._estimate(upper, total), fraction)
+
+    def _locate(self, ranks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the bin holding each 0-based rank, and the count before that bin."""
+        cumulative = np.cumsum(self.counts)
+        bins = np.searchsorted(cumulative, ranks, side="right")
+        return bins, cumulative[bins] - self.counts[bins]
+
+    def _estimate(self, ranks: np.ndarray, total: int) -> np.ndarray:
+        """Estimate the value at each rank from the counts alone."""
+        bins, before = self._locate(ranks)
+        if self.integer:
+            return self.low + bins.astype(np.float64)
+        if self.min == self.max:
+            return np.full(ranks.shape, self.min)
+        # Spread a bin's values evenly across it.
+        within = (ranks - before + 0.5) / self.counts[bins]
+        values = np.clip(self.low + self.width * (bins + within), self.min, self.max)
+        values[ranks == 0] = self.min
+        values[ranks == total - 1] = self.max
+        return values
+
+
+def _check_percentiles(q: float | Sequence[float]) -> np.ndarray:
+    """Return ``q`` as a 1-d float64 array, validated to lie in ``[0, 100]``."""
+    try:
+        values = np.atleast_1d(np.asarray(q, dtype=np.float64))
+    except (TypeError, ValueError) as e:
+        raise ValidationError(f"percentiles must be numbers; got {q!r}") from e
+    if values.ndim != 1 or not np.all((values >= 0) & (values <= 100)):
+        raise ValidationError(f"percentiles must be between 0 and 100; got {q!r}")
+    return values
+
+
+def _check_method(method: str) -> None:
+    if method not in _METHODS:
+        raise ValidationError(f"method must be 'exact' or 'approx'; got {method!r}")
+
+
+def _virtual_ranks(q: np.ndarray, total: int) -> tuple[np.ndarray, np.ndarray]:
+    """Split each percentile's position among ``total`` sorted values, as NumPy's linear method does."""
+    position = q / 100 * (total - 1)
+    lower = np.floor(position)
+    return lower.astype(np.int64), position - lower
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Interpolate from ``a`` to ``b``, rounding the way ``np.percentile`` does."""
+    with np.errstate(invalid="ignore"):  # inf - inf is NaN, as in NumPy
+        diff = b - a
+        return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def _adapter_scan(
+    adapter: BaseRasterAdapter, bands: list[int], workers: int | None, budget: int | None
+) -> _Scan:
+    """Return a scan over the blocks of ``adapter``, run on the block pool."""
+    workers = resolve_workers(workers)
+    windows = parallel_windows(adapter, workers, budget=budget)
+    order = {(w.row_off, w.col_off): i for i, w in enumerate(windows)}
+    nodata = adapter.get_nodata()
+
+    def scan(fn: Callable[[list[np.ndarray]], Any]) -> list[Any]:
+        results: list[Any] = [None] * len(windows)
+
+        def task(window: Window) -> None:
+            block = adapter.read_window(window, bands)
+            results[order[window.row_off, window.col_off]] = fn(
+                [_valid_values(band, nodata) for band in block]
+            )
+
+        run_blocks(task, windows, workers=workers)
+        return results
+
+    return scan
+
+
+def _finite_range(values: np.ndarray) -> tuple[float, float] | None:
+    """Return the finite extremes of ``values``; ``(inf, -inf)`` if none is finite.
+
+    Returns None for no values at all. Infinities are left out so the bins
+    stay finite; they are counted in the end bins.
+    """
+    if not values.size:
+        return None
+    low, high = float(values.min()), float(values.max())
+    if math.isinf(low) or math.isinf(high):
+        finite = values[np.isfinite(values)]
+        if not finite.size:
+            return math.inf, -math.inf
+        low, high = float(finite.min()), float(finite.max())
+    return low, high
+
+
+def _small_integer_range(dtype: np.dtype) -> tuple[int, int] | None:
+    """Return the full range of an 8- or 16-bit integer dtype, else None."""
+    if np.issubdtype(dtype, np.integer) and dtype.itemsize <= 2:
+        info = np.iinfo(dtype)
+        return int(info.min), int(info.max)
+    return None
+
+
+def _histograms(
+    scan: _Scan, n_bands: int, dtype: np.dtype, *, combined: bool, bins: int
+) -> list[Histogram | None]:
+    """Bin every band (or, ``combined``, all bands together) in one or two passes.
+
+    A band without a valid value gets None.
+    """
+    integer = bool(np.issubdtype(dtype, np.integer))
+    full_range = _small_integer_range(dtype)
+    if full_range is not None:
+        ranges: list[tuple[float, float] | None] = [full_range] * n_bands
+    else:
+        extremes = scan(lambda values: [_finite_range(v) for v in values])
+        ranges = []
+        for band in range(n_bands):
+            seen = [block[band] for block in extremes if block[band] is not None]
+            ranges.append((min(lo for lo, _ in seen), max(hi for _, hi in seen)) if seen else None)
+    if combined:
+        known = [r for r in ranges if r is not None]
+        span = (min(lo for lo, _ in known), max(hi for _, hi in known)) if known else None
+        ranges = [span]
+    # Only infinities: any finite bins will do, as they all land in the end bins.
+    ranges = [None if r is None else (r if r[0] <= r[1] else (0.0, 0.0)) for r in ranges]
+
+    hists = [None if r is None else Histogram(r[0], r[1], bins, integer=integer) for r in ranges]
+    lock = threading.Lock()
+
+    def count(values: list[np.ndarray]) -> None:
+        # Counts add exactly, in any order, so partial histograms are merged
+        # as soon as each block is binned rather than held until the end.
+        partials = []
+        for band, band_values in enumerate(values):
+            hist = hists[0 if combined else band]
+            if hist is not None and band_values.size:
+                partials.append((hist, hist.empty_like().update(band_values)))
+        with lock:
+            for hist, partial in partials:
+                hist.merge(partial)
+
+    scan(count)
+    return hists
+
+
+def _members(values: np.ndarray, path: tuple[tuple[Histogram, int], ...]) -> np.ndarray:
+    """Return the ``values`` falling in the innermost bin of ``path``.
+
+    ``path`` lists a bin of each histogram, each histogram splitting the bin
+    before it; a value belongs if it falls in every one.
+    """
+    for hist, index in path:
+        values = values[hist.bin_indices(values) == index]
+    return values
+
+
+def _split(hist: Histogram, index: int, bins: int, integer: bool) -> Histogram:
+    """Return an empty histogram splitting bin ``index`` of ``hist`` into ``bins``."""
+    low = hist.low + hist.width * index
+    high = low + hist.width
+    if integer:
+        return Histogram(math.floor(low), math.ceil(high), bins, integer=True)
+    return Histogram(low, high, bins)
+
+
+def _serve(
+    wanted: list[dict[Any, Any]], combined: bool, lock: threading.Lock, block: list[np.ndarray]
+) -> None:
+    """Feed one block's values to the open bins of ``wanted``.
+
+    A bin mapped to a list gets its values appended; one mapped to a
+    histogram has them counted into it.
+    """
+    for band, band_values in enumerate(block):
+        requests = wanted[0 if combined else band]
+        if not band_values.size or not requests:
+            continue
+        # Every path of a slot starts in the same histogram: bin the block once.
+        top = next(iter(requests))[0][0].bin_indices(band_values)
+        for path, target in requests.items():
+            members = _members(band_values[top == path[0][1]], path[1:])
+            if not members.size:
+                continue
+            if isinstance(target, list):
+                with lock:
+                    target.append(members)
+            else:
+                # Counted outside the lock, merged under it, as in _histograms.
+                counted = target.empty_like().update(members)
+                with lock:
+                    target.merge(counted)
+
+
+def _refine(
+    scan: _Scan,
+    hists: list[Histogram | None],
+    q: np.ndarray,
+    combined: bool,
+    *,
+    bins: int,
+    integer: bool,
+) -> np.ndarray:
+    """Exact percentiles: collect the pixels of the bins holding the needed ranks.
+
+    A bin holding more than ``_MAX_CANDIDATES`` values is split into finer
+    bins by another pass instead, and the rank looked up among those, until
+    its bin is small enough to collect or is exact (a single value, or unit
+    integer bins). Each pass serves every band and rank still open.
+    """
+    # Per slot: the value at each rank, and the ranks still open as
+    # [position in values, rank within the bin, bin path, values in the bin].
+    values: list[np.ndarray] = []
+    open_ranks: list[list[list[Any]]] = []
+    for hist in hists:
+        if hist is None or hist.exact:
+            values.append(np.empty(0))
+            open_ranks.append([])
+            continue
+        total = hist.count
+        lower = _virtual_ranks(q, total)[0]
+        ranks = np.concatenate([lower, np.minimum(lower + 1, total - 1)])
+        located, before = hist._locate(ranks)
+        values.append(np.empty(ranks.size))
+        open_ranks.append(
+            [
+                [i, int(rank - skip), ((hist, int(b)),), int(hist.counts[b])]
+                for i, (rank, b, skip) in enumerate(zip(ranks, located, before, strict=True))
+            ]
+        )
+
+    lock = threading.Lock()
+    while any(open_ranks):
+        # What each open bin needs: its values collected (a list), or a split.
+        wanted: list[dict[Any, Any]] = [
+            {
+                path: []
+                if size <= _MAX_CANDIDATES
+                else _split(path[-1][0], path[-1][1], bins, integer)
+                for _, _, path, size in entries
+            }
+            for entries in open_ranks
+        ]
+        scan(partial(_serve, wanted, combined, lock))
+
+        for slot, entries in enumerate(open_ranks):
+            still_open = []
+            collected: dict[Any, np.ndarray] = {}
+            for entry in entries:
+                position, rank, path, _ = entry
+                target = wanted[slot][path]
+                if isinstance(target, list):
+                    if path not in collected:
+                        collected[path] = np.sort(
+                            np.concatenate(target).astype(np.float64, copy=False)
+                        )
+                    values[slot][position] = collected[path][rank]
+                    continue
+                if target.exact or len(path) > _MAX_SPLITS:
+                    estimate = target._estimate(np.array([rank]), target.count)
+                    values[slot][position] = estimate[0]
+                    continue
+                located, before = target._locate(np.array([rank]))
+                index = int(located[0])
+                entry[1] = rank - int(before[0])
+                entry[2] = (*path, (target, index))
+                entry[3] = int(target.counts[index])
+                still_open.append(entry)
+            open_ranks[slot] = still_open
+
+    results = []
+    n = q.size
+    for hist, found in zip(hists, values, strict=True):
+        if hist is None:
+            results.append(np.full(q.shape, np.nan))
+        elif hist.exact:
+            results.append(hist._read(q))
+        else:
+            fraction = _virtual_ranks(q, hist.count)[1]
+            results.append(_lerp(found[:n], found[n:], fraction))
+    return np.array(results)
+
+
+def band_histograms(
+    adapter: BaseRasterAdapter,
+    *,
+    bands: Sequence[int] | None = None,
+    combined: bool = False,
+    bins: int = DEFAULT_BINS,
+    workers: int | None = None,
+    budget: int | None = None,
+) -> list[Histogram | None]:
+    """Bin the valid pixels of each band, streaming the raster block by block.
+
+    Parameters
+    ----------
+    adapter : BaseRasterAdapter
+        Backend to read. Its declared nodata value (and NaN) is excluded.
+    bands : sequence of int or None, default None
+        1-based bands to bin. None bins every band.
+    combined : bool, default False
+        Bin all the selected bands into one histogram.
+    bins : int, default DEFAULT_BINS
+        Bins per histogram. 8- and 16-bit integer bands, and integer bands
+        spanning at most 65,536 values, get one bin per value instead.
+    workers : int or None, default None
+        Threads binning blocks concurrently. None uses the ``num_threads``
+        option.
+    budget : int or None, default None
+        Bytes of source pixels one window may hold. None uses the
+        ``block_budget`` option.
+
+    Returns
+    -------
+    list of Histogram or None
+        One histogram per band (one in all when ``combined``), or None for a
+        band without a valid pixel. Bands other than 8- and 16-bit integers
+        are read twice: once for their range, once to bin them.
+
+    Raises
+    ------
+    ValidationError
+        If ``bins`` or ``workers`` is not a positive int.
+    """
+    bins = _positive_int("bins", bins)
+    selected = list(bands) if bands is not None else list(range(1, adapter.get_count() + 1))
+    scan = _adapter_scan(adapter, selected, workers, budget)
+    return _histograms(scan, len(selected), adapter.get_dtype(), combined=combined, bins=bins)
+
+
+def band_percentiles(
+    adapter: BaseRasterAdapter,
+    q: float | Sequence[float],
+    *,
+    bands: Sequence[int] | None = None,
+    combined: bool = False,
+    method: str = "exact",
+    bins: int = DEFAULT_BINS,
+    workers: int | None = None,
+    budget: int | None = None,
+) -> np.ndarray:
+    """Compute nodata-aware percentiles of each band without holding it in memory.
+
+    Parameters
+    ----------
+    adapter : BaseRasterAdapter
+        Backend to read. Its declared nodata value (and NaN) is excluded.
+    q : float or sequence of float
+        Percentiles, each in ``[0, 100]``.
+    bands : sequence of int or None, default None
+        1-based bands. None uses every band.
+    combined : bool, default False
+        Take the percentiles over all the selected bands together, like
+        ``np.nanpercentile`` of the whole array, instead of per band.
+    method : {"exact", "approx"}, default "exact"
+        ``"exact"`` matches ``np.nanpercentile`` (linear interpolation) and
+        reads float bands three times: for their range, to bin them, and to
+        collect the pixels of the few bins holding the ranks needed. A bin too
+        full to collect, as in skewed or near-constant data, costs one more
+        read per split into finer bins.
+        ``"approx"`` skips the last pass and is within one bin width, i.e.
+        ``(max - min) / bins``. 8- and 16-bit integer bands are exact in one
+        pass either way.
+    bins : int, default DEFAULT_BINS
+        Bins per histogram.
+    workers : int or None, default None
+        Threads reading blocks concurrently. None uses the ``num_threads``
+        option.
+    budget : int or None, default None
+        Bytes of source pixels one window may hold. None uses the
+        ``block_budget`` option.
+
+    Returns
+    -------
+    numpy.ndarray
+        Float64 array of shape ``(bands, len(q))``, or ``(len(q),)`` when
+        ``combined``. A band without a valid pixel gives NaN.
+
+    Raises
+    ------
+    ValidationError
+        If a percentile is outside ``[0, 100]``, ``method`` is unknown, or
+        ``bins`` or ``workers`` is not a positive int.
+    """
+    levels = _check_percentiles(q)
+    _check_method(method)
+    bins = _positive_int("bins", bins)
+    selected = list(bands) if bands is not None else list(range(1, adapter.get_count() + 1))
+    scan = _adapter_scan(adapter, selected, workers, budget)
+    return _percentiles(scan, len(selected), adapter.get_dtype(), levels, combined, method, bins)
+
+
+def array_percentiles(
+    array: np.ndarray,
+    q: float | Sequence[float],
+    *,
+    nodata: float | None = None,
+    method: str = "exact",
+    bins: int = DEFAULT_BINS,
+) -> np.ndarray:
+    """Compute the percentiles of an in-memory array, ignoring NaN and ``nodata``.
+
+    A drop-in for ``np.nanpercentile(array, q)`` over the whole array that
+    bins the values instead of sorting a float copy of them. See
+    :func:`band_percentiles` for ``method`` and ``bins``.
+
+    Returns
+    -------
+    numpy.ndarray
+        One float64 value per percentile; NaN when no value is valid.
+
+    Raises
+    ------
+    ValidationError
+        If a percentile is outside ``[0, 100]``, or ``method`` is unknown.
+    """
+    levels = _check_percentiles(q)
+    _check_method(method)
+    bins = _positive_int("bins", bins)
+    array = np.asarray(array)
+    values = _valid_values(array, nodata)
+
+    def scan(fn: Callable[[list[np.ndarray]], Any]) -> list[Any]:
+        return [fn([values])]
+
+    return _percentiles(scan, 1, array.dtype, levels, False, method, bins)[0]
+
+
+def _percentiles(
+    scan: _Scan,
+    n_bands: int,
+    dtype: np.dtype,
+    q: np.ndarray,
+    combined: bool,
+    method: str,
+    bins: int,
+) -> np.ndarray:
+    """Histogram the bands, then read (or, for ``"exact"``, refine) the percentiles."""
+    hists = _histograms(scan, n_bands, dtype, combined=combined, bins=bins)
+    if method == "exact":
+        integer = bool(np.issubdtype(dtype, np.integer))
+        result = _refine(scan, hists, q, combined, bins=bins, integer=integer)
+    else:
+        result = np.array([np.full(q.shape, np.nan) if h is None else h._read(q) for h in hists])
+    return result[0] if combined else result
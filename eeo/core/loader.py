@@ -9,6 +9,9 @@ import numpy as np
 from rasterio.crs import CRS
 from rasterio.transform import Affine
 
+from eeo._optional import import_optional
+from eeo.core.adapters import DaskAdapter
+from eeo.core.adapters.dask import is_dask_array
 from eeo.core.core import EEORasterDataset
 from eeo.core.exceptions import BackendError, ValidationError
 from eeo.core.types import StrPath
@@ -20,6 +23,7 @@ def load_raster(
     timestamp: datetime | None = None,
     attrs: dict | None = None,
     band_names: list[str | None] | None = None,
+    chunks: tuple[int, int] | str | None = None,
 ) -> EEORasterDataset:
     """Open a raster file as an EEORasterDataset.
 
@@ -40,11 +44,18 @@ def load_raster(
         Optional per-band names, one entry per band. When omitted, names are
         read from the file's GDAL band descriptions; when given, they override
         whatever the file declares and must match the band count.
+    chunks : "auto" or tuple of int or None, default None
+        If given, open the file lazily as a chunked, dask-backed dataset
+        (requires the ``lazy`` extra): ``(rows, cols)`` spatial chunks, or
+        ``"auto"`` to align chunks to the file's internal blocks and size them
+        by the ``block_budget`` option. Each chunk is read from the file only
+        when computed. See :meth:`EEORasterDataset.chunk`.
 
     Returns
     -------
     EEORasterDataset
-        A rasterio-backed dataset.
+        A rasterio-backed dataset, or a dask-backed one when ``chunks`` is
+        given.
 
     Raises
     ------
@@ -55,16 +66,26 @@ def load_raster(
     ValidationError
         If ``band_names`` is given and its length does not match the band
         count.
+    MissingDependencyError
+        If ``chunks`` is given and the ``lazy`` extra is not installed.
 
     Examples
     --------
     >>> ds = load_raster("scene.tif")
     >>> ds = load_raster("stack.tif", band_names=["blue", "green", "red", "nir"])
+    >>> lazy = load_raster("mosaic.tif", chunks=(2048, 2048))
     """
     if not os.path.isfile(path):
         raise FileNotFoundError(f'the file "{path}" does not exist')
+    if chunks is not None:
+        # Imported before the try: a missing extra must surface as
+        # MissingDependencyError, not as an unreadable file.
+        import_optional("dask.array", extra="lazy", purpose="the lazy (dask) backend")
     try:
-        ds = EEORasterDataset.from_path(path)
+        if chunks is None:
+            ds = EEORasterDataset.from_path(path)
+        else:
+            ds = EEORasterDataset(DaskAdapter.from_path(path, chunks=chunks), path=path)
     except Exception as e:
         raise BackendError(f'file "{path}" could not be opened as a rasterio dataset') from e
 
@@ -91,9 +112,10 @@ def load_array(
 
     Parameters
     ----------
-    array : numpy.ndarray
+    array : numpy.ndarray or dask.array.Array
         Raster values, shaped ``(height, width)`` for a single band or
-        ``(bands, height, width)`` for multiple bands.
+        ``(bands, height, width)`` for multiple bands. A dask array gives a
+        lazy, chunked dataset (see :meth:`EEORasterDataset.chunk`).
     transform : affine.Affine or None, default None
         Affine geotransform mapping pixel to world coordinates. If None, the
         dataset has no meaningful georeferencing.
@@ -115,14 +137,15 @@ def load_array(
     Returns
     -------
     EEORasterDataset
-        A NumPy-backed dataset. The array is wrapped without copying;
+        A NumPy-backed (or, for a dask array, dask-backed) dataset. The array
+        is wrapped without copying;
         operations that need rasterio (clipping, resampling, ...) promote it
         on demand.
 
     Raises
     ------
     ValidationError
-        If ``array`` is not a NumPy array, is neither 2D nor 3D, or
+        If ``array`` is not a NumPy or dask array, is neither 2D nor 3D, or
         ``band_names`` is given and its length does not match the band count.
 
     Examples
@@ -131,6 +154,22 @@ def load_array(
     >>> ds = load_array(np.zeros((64, 64), dtype="float32"), crs=4326)
     >>> ds = load_array(rgb, crs=4326, band_names=["red", "green", "blue"])
     """
+    if is_dask_array(array):
+        if array.ndim not in (2, 3):
+            raise ValidationError(
+                "array must be 2D (height, width) or 3D (bands, height, width); "
+                f"got {array.ndim}D with shape {array.shape}"
+            )
+        return EEORasterDataset.from_dask(
+            array,
+            transform=transform,
+            crs=crs,
+            nodata=nodata,
+            timestamp=timestamp,
+            attrs=attrs,
+            band_names=band_names,
+        )
+
     if not isinstance(array, np.ndarray):
         raise ValidationError(f"array must be a NumPy ndarray; got {type(array).__name__}")
 
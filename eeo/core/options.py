@@ -0,0 +1,207 @@
+"""Library-wide runtime options (:func:`eeo.set_options`).
+
+Options tune *how* Easy-EO executes an operation, never *what* it computes: a
+result is identical under every setting. They live in one module-level mapping
+so that every operation reads the same values, and :class:`set_options` can be
+used either to change them for the rest of the session or, as a context
+manager, for one block of code only.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+from eeo.core.exceptions import ValidationError
+
+_MIB = 1024 * 1024
+
+
+def _positive_int(name: str, value: Any) -> int:
+    """Validate an option that must be a positive integer."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValidationError(f"{name} must be a positive integer; got {value!r}")
+    return value
+
+
+def _boolean(name: str, value: Any) -> bool:
+    """Validate an option that must be True or False."""
+    if not isinstance(value, bool):
+        raise ValidationError(f"{name} must be True or False; got {value!r}")
+    return value
+
+
+def _stats_cache_mode(name: str, value: Any) -> str:
+    """Validate the ``stats_cache`` option."""
+    if value not in ("off", "memory", "sidecar"):
+        raise ValidationError(f"{name} must be 'off', 'memory', or 'sidecar'; got {value!r}")
+    return value
+
+
+def _optional_directory(name: str, value: Any) -> str | None:
+    """Validate an option that is a directory path, or None for off."""
+    if value is None:
+        return None
+    if not isinstance(value, (str, os.PathLike)) or not os.fspath(value):
+        raise ValidationError(f"{name} must be a directory path or None; got {value!r}")
+    return os.path.expanduser(os.fspath(value))
+
+
+# Each option's default and validator. The validator returns the value to store
+# and raises ValidationError for anything it cannot accept.
+_DEFAULTS: dict[str, Any] = {
+    # Upper bound, in bytes, on the source pixels a block-wise operation holds
+    # at once (every band of one window). The per-block temporaries an op
+    # builds are a small constant multiple of this.
+    "block_budget": 64 * _MIB,
+    # Record element-wise operations as an expression graph instead of
+    # evaluating them, so a chain runs as one fused pass per block.
+    "deferred": False,
+    # Threads a block-wise operation runs its blocks on. 1 runs them in order
+    # on the calling thread.
+    "num_threads": 1,
+    # Where statistics computed from a file's pixels are kept for reuse: not
+    # at all, in an in-process LRU, or in the LRU and a JSON sidecar file.
+    "stats_cache": "memory",
+    # Entries the in-process statistics cache holds before evicting the
+    # least recently used.
+    "stats_cache_size": 256,
+    # Directory of the on-disk cache of byte ranges read from remote STAC
+    # assets, or None to read them with GDAL's in-memory cache only.
+    "remote_cache": None,
+    # Upper bound, in bytes, on the remote read cache before it evicts the
+    # least recently used blocks.
+    "remote_cache_size": 2 * 1024 * _MIB,
+}
+
+_VALIDATORS: dict[str, Callable[[str, Any], Any]] = {
+    "block_budget": _positive_int,
+    "deferred": _boolean,
+    "num_threads": _positive_int,
+    "stats_cache": _stats_cache_mode,
+    "stats_cache_size": _positive_int,
+    "remote_cache": _optional_directory,
+    "remote_cache_size": _positive_int,
+}
+
+_OPTIONS: dict[str, Any] = dict(_DEFAULTS)
+
+
+def get_options() -> dict[str, Any]:
+    """Return the current values of every library option.
+
+    Returns
+    -------
+    dict
+        A copy of the option mapping; editing it has no effect. Change options
+        with :class:`set_options`.
+
+    Examples
+    --------
+    >>> import eeo
+    >>> eeo.get_options()["block_budget"]
+    67108864
+    """
+    return dict(_OPTIONS)
+
+
+def get_option(name: str) -> Any:
+    """Return the current value of one option (internal accessor)."""
+    return _OPTIONS[name]
+
+
+class set_options:
+    """Set library options, globally or for the duration of a ``with`` block.
+
+    Called as a plain function the new values persist for the rest of the
+    session; used as a context manager they are restored on exit, even if the
+    block raises.
+
+    Parameters
+    ----------
+    **options
+        Option names and their new values:
+
+        - ``block_budget`` (int, default ``64 MiB``) — upper bound, in bytes,
+          on the source pixels a block-wise operation reads at once, summed
+          over every band of one window. Block-wise operations (the pixel-wise
+          algebra) process the raster in windows aligned to the source's
+          internal block layout and sized to this budget, so their peak
+          memory is bounded by it rather than by the scene size. Windows are
+          never smaller than one native block.
+        - ``deferred`` (bool, default False) — if True, element-wise
+          operations (the pixel-wise algebra) return an unevaluated result
+          that records the operation instead of computing it. Chaining further
+          element-wise operations extends the record, and the whole chain is
+          evaluated in one fused pass per block the first time its pixels are
+          needed — by ``read()``, ``save_raster()``, a plot, any
+          non-element-wise operation, or an explicit ``compute()``. No
+          intermediate raster of the chain is ever built.
+        - ``num_threads`` (int, default 1) — threads a block-wise operation
+          (the pixel-wise algebra and the spectral indices) runs its blocks
+          on. NumPy's ufuncs and GDAL's reads release the GIL, so on a large
+          raster the blocks run in parallel; the result is identical for
+          every setting. Each thread holds up to one window of
+          ``block_budget``, so peak memory grows with the thread count. A
+          per-call ``workers=`` argument on those operations overrides it.
+        - ``stats_cache`` (str, default ``"memory"``) — where statistics
+          computed from a file's pixels (``describe(stats=...)``, the
+          percentile and statistics normalizations, the plot stretches and
+          histograms) are kept for reuse. ``"memory"`` holds them in an
+          in-process LRU cache, ``"sidecar"`` also persists them to a JSON
+          file beside the raster (``<file>.eeo-stats.json``) so a new session
+          reuses them, and ``"off"`` recomputes every time. Entries are keyed
+          on the file's path, modification time and size, so a rewritten file
+          is never served stale statistics. In-memory datasets are never
+          cached.
+        - ``stats_cache_size`` (int, default 256) — entries the in-process
+          statistics cache holds before evicting the least recently used.
+        - ``remote_cache`` (str, path-like, or None, default None) — a
+          directory for an on-disk cache of the byte ranges that
+          :meth:`eeo.io.STACItem.load` reads from remote assets. With it set,
+          rerunning an analysis over the same area reads the tiles from disk
+          instead of downloading them again, across sessions. Entries are
+          keyed on the asset URL without its signature, so a re-signed
+          Planetary Computer URL still hits. None leaves remote reads to
+          GDAL's in-memory cache. See :func:`eeo.io.remote_cache_info`.
+        - ``remote_cache_size`` (int, default ``2 GiB``) — upper bound, in
+          bytes, on the remote read cache; the least recently used blocks
+          are evicted beyond it.
+
+    Raises
+    ------
+    ValidationError
+        If an option name is unknown or a value is invalid. No option is
+        changed in that case.
+
+    Examples
+    --------
+    >>> import eeo
+    >>> eeo.set_options(block_budget=16 * 1024 * 1024)  # doctest: +SKIP
+    >>> with eeo.set_options(block_budget=4 * 1024 * 1024):
+    ...     pass  # block-wise ops in here read at most 4 MiB per window
+    >>> with eeo.set_options(num_threads=8):
+    ...     pass  # block-wise ops in here run on 8 threads
+    >>> eeo.set_options(stats_cache="sidecar")  # doctest: +SKIP
+    >>> eeo.set_options(remote_cache="~/.cache/eeo")  # doctest: +SKIP
+    """
+
+    def __init__(self, **options: Any) -> None:
+        validated = {}
+        for name, value in options.items():
+            if name not in _VALIDATORS:
+                known = ", ".join(sorted(_VALIDATORS))
+                raise ValidationError(f"unknown option {name!r}; valid options are: {known}")
+            validated[name] = _VALIDATORS[name](name, value)
+
+        self._previous = {name: _OPTIONS[name] for name in validated}
+        _OPTIONS.update(validated)
+
+    def __enter__(self) -> set_options:
+        """Return the context manager; the options are already applied."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Restore the values the options held before this call."""
+        _OPTIONS.update(self._previous)
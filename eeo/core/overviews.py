@@ -0,0 +1,148 @@
+"""Overview (pyramid) levels for GDAL datasets.
+
+An overview is a reduced-resolution copy of every band, stored with the
+raster. GDAL serves a decimated read (rasterio's ``out_shape``) from the
+smallest overview that still covers the requested size, so the approximate
+``describe`` statistics and every plot read a small fraction of the pixels
+they would otherwise decimate from full resolution.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import rasterio as rio
+from rasterio.enums import Resampling
+
+from eeo.common import normalize_resampling_method
+from eeo.core.exceptions import BackendError, ValidationError
+from eeo.core.types import OverviewLevels, ResamplingMethod, StrPath
+
+# ``levels="auto"`` keeps halving until the smallest overview fits within this
+# many pixels per side (GDAL's own default block size).
+OVERVIEW_MIN_SIZE = 256
+
+
+def overview_factors(shape: tuple[int, int], levels: OverviewLevels = "auto") -> list[int]:
+    """Resolve an overview ``levels`` specification to decimation factors.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Raster shape as ``(height, width)``.
+    levels : "auto", int, or sequence of int, default "auto"
+        ``"auto"`` halves the raster (factors 2, 4, 8, ...) until the smallest
+        overview is at most ``OVERVIEW_MIN_SIZE`` pixels on its longer side;
+        a raster already that small gets none. An int builds that many
+        levels, 2 to ``2**levels``. A sequence gives the factors themselves.
+
+    Returns
+    -------
+    list of int
+        Increasing decimation factors, each at least 2; empty when no overview
+        is needed.
+
+    Raises
+    ------
+    ValidationError
+        If ``levels`` is not one of the forms above, or a factor is below 2.
+    """
+    if isinstance(levels, str):
+        if levels != "auto":
+            raise ValidationError(f'levels must be "auto", an int, or factors; got {levels!r}')
+        longest = max(shape)
+        factors = []
+        factor = 2
+        while math.ceil(longest / (factor // 2)) > OVERVIEW_MIN_SIZE:
+            factors.append(factor)
+            factor *= 2
+        return factors
+    if isinstance(levels, int):
+        if isinstance(levels, bool) or levels < 0:
+            raise ValidationError(f"levels must be a non-negative int; got {levels!r}")
+        return [2**i for i in range(1, levels + 1)]
+    try:
+        factors = sorted(set(levels))
+    except TypeError as e:
+        raise ValidationError(
+            f'levels must be "auto", an int, or a sequence of ints; got {levels!r}'
+        ) from e
+    if any(isinstance(f, bool) or not isinstance(f, int) or f < 2 for f in factors):
+        raise ValidationError(f"overview factors must be ints of at least 2; got {levels!r}")
+    return factors
+
+
+def build_dataset_overviews(
+    dataset: Any,
+    levels: OverviewLevels = "auto",
+    resampling: Resampling | ResamplingMethod = "nearest",
+) -> list[int]:
+    """Build overviews on an open, writable rasterio dataset.
+
+    Parameters
+    ----------
+    dataset : rasterio.io.DatasetWriter
+        Dataset open in ``"r+"``, ``"w"`` or ``"w+"`` mode.
+    levels : "auto", int, or sequence of int, default "auto"
+        Overview levels; see :func:`overview_factors`.
+    resampling : str or rasterio.enums.Resampling, default "nearest"
+        How each overview pixel is computed from the pixels it covers.
+
+    Returns
+    -------
+    list of int
+        The decimation factors built.
+
+    Raises
+    ------
+    ValidationError
+        If ``levels`` or ``resampling`` is invalid.
+    """
+    method = normalize_resampling_method(resampling)
+    factors = overview_factors(dataset.shape, levels)
+    if factors:
+        dataset.build_overviews(factors, method)
+        # Recorded the way ``rio overview`` does, so tools can report it.
+        dataset.update_tags(ns="rio_overview", resampling=method.name)
+    return factors
+
+
+def add_overviews(
+    path: StrPath,
+    levels: OverviewLevels = "auto",
+    resampling: Resampling | ResamplingMethod = "nearest",
+) -> list[int]:
+    """Build overviews into an existing raster file, in place.
+
+    GeoTIFFs store them internally; other formats get an external ``.ovr``.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Raster file to update.
+    levels : "auto", int, or sequence of int, default "auto"
+        Overview levels; see :func:`overview_factors`.
+    resampling : str or rasterio.enums.Resampling, default "nearest"
+        How each overview pixel is computed from the pixels it covers.
+
+    Returns
+    -------
+    list of int
+        The decimation factors built.
+
+    Raises
+    ------
+    ValidationError
+        If ``levels`` or ``resampling`` is invalid.
+    BackendError
+        If the file cannot be opened for update or GDAL fails to build them.
+    """
+    normalize_resampling_method(resampling)
+    try:
+        with rio.open(path, "r+") as dst:
+            return build_dataset_overviews(dst, levels, resampling)
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise BackendError(f"failed to build overviews for {path}") from e
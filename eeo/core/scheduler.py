@@ -0,0 +1,339 @@
+"""Tile scheduler: run a chain of registered operations over a file in parallel processes.
+
+Threads (the ``num_threads`` option) only help while the work is in NumPy or
+GDAL; a pipeline that spends its time in Python — several operations per
+tile, geometry handling, per-tile statistics — is held back by the GIL.
+:func:`run_tiled` instead fans the tiles of a raster file out to a
+:class:`~concurrent.futures.ProcessPoolExecutor`. Each worker reopens the
+source by path and reads only its tile's window, so no pixels are pickled on
+the way in; it runs the chain on that tile and returns the result, which the
+parent writes straight into its window of one output GeoTIFF.
+
+Steps are named operations, looked up in the registry every
+:func:`~eeo.core.decorators.eeo_raster_op` adds to, so anything chainable on
+an :class:`~eeo.core.core.EEORasterDataset` — including operations a plugin
+registers — can be scheduled.
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, NamedTuple
+
+import numpy as np
+import rasterio as rio
+from affine import Affine
+from rasterio.windows import Window
+from rasterio.windows import transform as window_transform
+
+from eeo.core.blocks import block_windows, tile_windows
+from eeo.core.core import EEORasterDataset
+from eeo.core.decorators import _OP_REGISTRY
+from eeo.core.exceptions import ValidationError
+from eeo.core.loader import load_raster
+from eeo.core.options import _positive_int
+from eeo.core.types import StrPath
+
+Step = str | tuple[str, Mapping[str, Any]]
+
+
+class _Tile(NamedTuple):
+    """A worker's result: the pixels for ``window`` and what they claim to be."""
+
+    window: Window
+    array: np.ndarray
+    nodata: Any
+    band_names: list[str | None]
+    crs: Any
+    transform: Affine
+
+
+def _resolve_steps(steps: Sequence[Step]) -> list[tuple[str, dict[str, Any]]]:
+    """Normalize ``steps`` to ``(name, kwargs)`` pairs of registered operations."""
+    known = {func.__name__: func for func, kind in _OP_REGISTRY if kind == "op"}
+    if isinstance(steps, (str, tuple)) or not steps:
+        raise ValidationError(
+            "steps must be a non-empty list of operation names or (name, kwargs) pairs"
+        )
+    resolved = []
+    for step in steps:
+        if isinstance(step, str):
+            name, kwargs = step, {}
+        elif (
+            isinstance(step, tuple)
+            and len(step) == 2
+            and isinstance(step[0], str)
+            and isinstance(step[1], Mapping)
+        ):
+            name, kwargs = step[0], dict(step[1])
+        else:
+            raise ValidationError(
+                f"each step must be an operation name or a (name, kwargs) pair; got {step!r}"
+            )
+        if name not in known:
+            raise ValidationError(
+                f"unknown operation {name!r}; steps must name a registered raster operation"
+            )
+        # An operation registered with tileable=False depends on the whole
+        # raster: on one tile it would see only that tile, and the stitched
+        # output would change at every tile edge.
+        if not getattr(known[name], "__eeo_tileable__", True):
+            raise ValidationError(
+                f"{name!r} depends on the whole raster, which a tile does not have, so it "
+                f"cannot run tiled; call it on the result instead, e.g. "
+                f"run_tiled(...).{name}()"
+            )
+        resolved.append((name, kwargs))
+    return resolved
+
+
+def _run_tile(path: str, window: Window, steps: list[tuple[str, dict[str, Any]]]) -> _Tile:
+    """Worker: read ``window`` of ``path``, run ``steps`` on it, return the pixels."""
+    source = load_raster(path)
+    tile = EEORasterDataset.from_array(
+        source.read_window(window),
+        transform=window_transform(window, source.get_transform()),
+        crs=source.get_crs(),
+        nodata=source.get_nodata(),
+        timestamp=source.timestamp,
+        attrs=source.attrs,
+        band_names=source.band_names,
+    )
+    source.close()
+
+    for name, kwargs in steps:
+        result = getattr(tile, name)(**kwargs)
+        if not isinstance(result, EEORasterDataset):
+            raise ValidationError(
+                f"step {name!r} returned {type(result).__name__}, not a raster; "
+                "only chainable raster operations can run tiled"
+            )
+        if result.get_shape() != tile.get_shape() or (
+            result.get_transform() != tile.get_transform()
+        ):
+            raise ValidationError(
+                f"step {name!r} changed the tile's grid (shape {tile.get_shape()} -> "
+                f"{result.get_shape()}); only operations that keep the input grid can "
+                "run tiled (for clip_raster_with_vector, pass crop=False)"
+            )
+        tile = result
+
+    return _Tile(
+        window,
+        tile.read(),
+        tile.get_nodata(),
+        tile.band_names,
+        tile.get_crs(),
+        tile.get_transform(),
+    )
+
+
+def run_tiled(
+    path: StrPath,
+    steps: Sequence[Step],
+    out_path: StrPath,
+    *,
+    tile_shape: tuple[int, int] | None = None,
+    max_workers: int | None = None,
+) -> EEORasterDataset:
+    """Run a chain of operations tile by tile in worker processes.
+
+    The raster at ``path`` is cut into tiles, and each tile is handed to a
+    process pool as a window, not as pixels: the worker reopens the file,
+    reads that window, applies ``steps`` in order, and sends the result back.
+    The parent writes each tile into its window of one GeoTIFF at
+    ``out_path`` as it arrives, and keeps at most two tiles per worker
+    submitted at once, so memory is bounded by the tiles in flight.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Raster file to process. Workers open it themselves, so it must be
+        readable by path from another process.
+    steps : list of str or (str, dict)
+        The chain, in order. Each step is the name of a registered raster
+        operation (any method added by ``eeo_raster_op``, e.g. ``"ndvi"``,
+        ``"normalize_percentile"``), or a ``(name, kwargs)`` pair giving its
+        keyword arguments, e.g. ``("ndvi", {"red": 4, "nir": 8})``. The
+        arguments are pickled to every worker.
+    out_path : str or path-like
+        GeoTIFF to write. It has the source's CRS and grid, and the dtype,
+        band count, nodata, and band names of the chain's result.
+    tile_shape : tuple of int or None, default None
+        ``(rows, cols)`` of one tile. None aligns tiles to the file's native
+        blocks and sizes them by the ``block_budget`` option.
+    max_workers : int or None, default None
+        Worker processes. None uses one per CPU.
+
+    Returns
+    -------
+    EEORasterDataset
+        The written file, opened with :func:`~eeo.load_raster`.
+
+    Raises
+    ------
+    FileNotFoundError
+        If ``path`` does not exist.
+    ValidationError
+        If a step does not name a registered operation, is malformed, or is
+        registered with ``tileable=False``, if ``tile_shape`` or
+        ``max_workers`` is invalid, if, from a worker, a step returns
+        something other than a raster on the tile's grid, or if tiles come
+        back disagreeing on band count, dtype, nodata, CRS, or grid.
+
+    Notes
+    -----
+    Every step sees one tile only. An operation that keeps the grid and whose
+    output pixel depends only on the input pixels at the same place (the
+    algebra, the indices, ``clip_raster_with_vector(crop=False)``) gives the
+    same result as running the chain on the whole raster. Operations that
+    depend on the whole raster, such as those rescaling by statistics of
+    their input (``standardize``, the ``normalize_*`` family), are registered
+    with ``eeo_raster_op(tileable=False)``; they would derive their
+    statistics per tile, so they are rejected before any worker starts. Run
+    them on the returned dataset. Operations
+    that change the grid (resampling, reprojection, cropping clips) cannot
+    run tiled either and are rejected by the worker.
+
+    Workers are started with the ``spawn`` method, which is safe alongside
+    GDAL's and Easy-EO's own threads; each pays a one-off import of Easy-EO,
+    so tiling pays off for pipelines that take seconds per tile, not for a
+    single cheap operation (use ``num_threads`` for those).
+
+    Examples
+    --------
+    >>> out = eeo.run_tiled(
+    ...     "scene.tif",
+    ...     [("ndvi", {"red": 4, "nir": 8}), ("clip_raster_with_vector",
+    ...      {"vector_file": "aoi.geojson", "crop": False})],
+    ...     "ndvi_aoi.tif",
+    ...     max_workers=8,
+    ... )  # doctest: +SKIP
+    """
+    resolved = _resolve_steps(steps)
+    if max_workers is not None:
+        _positive_int("max_workers", max_workers)
+    if tile_shape is not None and not (
+        isinstance(tile_shape, tuple)
+        and len(tile_shape) == 2
+        and all(isinstance(n, int) and not isinstance(n, bool) and n > 0 for n in tile_shape)
+    ):
+        raise ValidationError(f"tile_shape must be two positive ints; got {tile_shape!r}")
+
+    source = load_raster(path)
+    if tile_shape is None:
+        windows = block_windows(source._adapter)
+    else:
+        windows = tile_windows(source._adapter, tile_shape)
+    height, width = source.get_shape()
+    profile = {
+        "driver": "GTiff",
+        "height": height,
+        "width": width,
+        "crs": source.get_crs(),
+        "transform": source.get_transform(),
+    }
+    source.close()
+
+    workers = max_workers or os.cpu_count() or 1
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        _write_tiles(
+            lambda window: pool.submit(_run_tile, os.fspath(path), window, resolved),
+            windows,
+            out_path,
+            profile,
+            in_flight=2 * workers,
+        )
+
+    return load_raster(out_path)
+
+
+def _same_nodata(a: Any, b: Any) -> bool:
+    """Whether two nodata values are the same, NaN matching NaN."""
+    if a is None or b is None:
+        return a is None and b is None
+    return bool(a == b or (np.isnan(a) and np.isnan(b)))
+
+
+def _check_tile_grid(tile: _Tile, profile: dict[str, Any]) -> None:
+    """Raise unless ``tile`` is in ``profile``'s CRS and at its window of the grid."""
+    if tile.crs != profile["crs"]:
+        raise ValidationError(
+            f"a tile came back in CRS {tile.crs}, not the source's {profile['crs']}; "
+            "only operations that keep the input grid can run tiled"
+        )
+    expected = window_transform(tile.window, profile["transform"])
+    if not tile.transform.almost_equals(expected):
+        raise ValidationError(
+            f"a tile came back with transform {tuple(tile.transform)[:6]}, not "
+            f"{tuple(expected)[:6]} (its window of the source grid); only operations "
+            "that keep the input grid and resolution can run tiled"
+        )
+
+
+def _write_tiles(
+    submit: Callable[[Window], Future],
+    windows: Iterable[Window],
+    out_path: StrPath,
+    profile: dict[str, Any],
+    *,
+    in_flight: int,
+) -> None:
+    """Submit ``windows`` and write each finished tile into its window of ``out_path``.
+
+    At most ``in_flight`` tiles are submitted and not yet written at any time:
+    a finished tile is written and dropped before the next one is submitted,
+    so the parent never holds more than that many tiles' pixels. The output
+    is created from the first tile to arrive, which fixes its dtype, band
+    count, nodata, and band names; every later tile must agree, and every
+    tile must lie on ``profile``'s CRS and grid at its window.
+    """
+    remaining = iter(windows)
+    pending: set[Future] = set()
+    dst = None
+    try:
+        while True:
+            for window in itertools.islice(remaining, in_flight - len(pending)):
+                pending.add(submit(window))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            while done:
+                tile = done.pop().result()
+                window, array = tile.window, tile.array
+                _check_tile_grid(tile, profile)
+                if dst is None:
+                    dst = rio.open(
+                        out_path,
+                        "w",
+                        **profile,
+                        count=array.shape[0],
+                        dtype=array.dtype,
+                        nodata=tile.nodata,
+                    )
+                    for i, name in enumerate(tile.band_names, start=1):
+                        if name:
+                            dst.set_band_description(i, name)
+                elif (
+                    array.shape[0] != dst.count
+                    or array.dtype != dst.dtypes[0]
+                    or not _same_nodata(tile.nodata, dst.nodata)
+                ):
+                    raise ValidationError(
+                        f"tiles disagree on their result: {array.shape[0]} band(s) of "
+                        f"{array.dtype} with nodata {tile.nodata} vs {dst.count} of "
+                        f"{dst.dtypes[0]} with nodata {dst.nodata}"
+                    )
+                dst.write(array, window=window)
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    finally:
+        if dst is not None:
+            dst.close()
@@ -0,0 +1,209 @@
+"""Streaming per-band statistics.
+
+Exact statistics used to need a band (or the whole ``(bands, rows, cols)``
+array) in memory, promoted to float64 by the nodata mask. This module walks a
+raster block by block instead and folds each block into a small mergeable
+accumulator per band: the valid-pixel count, minimum, maximum, and a running
+mean and sum of squared deviations (Welford's method, merged across blocks
+with Chan et al.'s pairwise update). Memory is bounded by the block size, and
+the blocks can be summarized concurrently on the ``num_threads`` pool.
+
+Partial results are merged in window order, never in completion order, so the
+statistics are bit-identical whatever the thread count.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from rasterio.windows import Window
+
+from eeo.core.adapters import BaseRasterAdapter
+from eeo.core.blocks import parallel_windows, resolve_workers, run_blocks
+
+
+class BandStatistics:
+    """Mergeable nodata-aware summary of a set of pixels.
+
+    Attributes
+    ----------
+    count : int
+        Valid pixels seen.
+    total : int
+        All pixels seen, valid or not.
+    min, max : float
+        Extremes of the valid pixels (NaN while ``count`` is 0).
+    mean : float
+        Mean of the valid pixels (NaN while ``count`` is 0).
+    m2 : float
+        Sum of squared deviations from ``mean``.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.min = math.nan
+        self.max = math.nan
+        self.mean = math.nan
+        self.m2 = 0.0
+
+    def __repr__(self) -> str:
+        """Return the summary with its derived standard deviation."""
+        return (
+            f"BandStatistics(count={self.count}, total={self.total}, min={self.min}, "
+            f"max={self.max}, mean={self.mean}, std={self.std})"
+        )
+
+    @property
+    def nodata(self) -> int:
+        """Pixels seen that were nodata (or NaN)."""
+        return self.total - self.count
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the valid pixels (``ddof=0``, like ``np.nanvar``)."""
+        return self.m2 / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the valid pixels."""
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> dict[str, float]:
+        """Return the summary as a plain, JSON-serializable mapping."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, float]) -> BandStatistics:
+        """Rebuild a summary from the mapping :meth:`to_dict` returned."""
+        stats = cls()
+        for name in cls.__slots__:
+            setattr(stats, name, data[name])
+        return stats
+
+    def update(self, array: np.ndarray, nodata: float | None = None) -> BandStatistics:
+        """Fold the valid pixels of ``array`` into the summary.
+
+        Pixels equal to ``nodata``, and NaN pixels of a float array, are
+        counted in ``total`` but otherwise ignored.
+
+        Returns
+        -------
+        BandStatistics
+            ``self``, for chaining.
+        """
+        values = _valid_values(array, nodata)
+        part = BandStatistics()
+        part.total = array.size
+        if values.size:
+            part.count = values.size
+            part.min = float(values.min())
+            part.max = float(values.max())
+            part.mean = float(values.mean(dtype=np.float64))
+            deviations = np.subtract(values, part.mean, dtype=np.float64)
+            part.m2 = float(np.dot(deviations, deviations))
+        return self.merge(part)
+
+    def merge(self, other: BandStatistics) -> BandStatistics:
+        """Fold another summary into this one, as if its pixels had been seen here.
+
+        Returns
+        -------
+        BandStatistics
+            ``self``, for chaining.
+        """
+        self.total += other.total
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.min, self.max = other.count, other.min, other.max
+            self.mean, self.m2 = other.mean, other.m2
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+
+def _valid_values(array: np.ndarray, nodata: float | None) -> np.ndarray:
+    """Return the valid pixels of ``array`` as a flat array (a view when all are valid)."""
+    valid = None
+    if np.issubdtype(array.dtype, np.floating):
+        valid = ~np.isnan(array)
+    if nodata is not None and not (isinstance(nodata, float) and math.isnan(nodata)):
+        is_data = array != nodata
+        valid = is_data if valid is None else np.logical_and(valid, is_data, out=valid)
+    if valid is None or valid.all():
+        return array.reshape(-1)
+    return array[valid]
+
+
+def band_statistics(
+    adapter: BaseRasterAdapter,
+    *,
+    workers: int | None = None,
+    budget: int | None = None,
+) -> list[BandStatistics]:
+    """Compute exact nodata-aware statistics for every band in one streaming pass.
+
+    Each window of the raster is read once, with every band, and summarized
+    per band; the summaries are then merged. Only the windows in flight are
+    ever in memory.
+
+    Parameters
+    ----------
+    adapter : BaseRasterAdapter
+        Backend to summarize. Its declared nodata value (and NaN) marks the
+        pixels to exclude.
+    workers : int or None, default None
+        Threads summarizing windows concurrently. None uses the
+        ``num_threads`` option.
+    budget : int or None, default None
+        Bytes of source pixels one window may hold. None uses the
+        ``block_budget`` option.
+
+    Returns
+    -------
+    list of BandStatistics
+        One summary per band, in band order.
+
+    Raises
+    ------
+    ValidationError
+        If ``workers`` is given and is not a positive int.
+    """
+    workers = resolve_workers(workers)
+    windows = parallel_windows(adapter, workers, budget=budget)
+    nodata = adapter.get_nodata()
+    count = adapter.get_count()
+    partials: list[list[BandStatistics]] = [[] for _ in windows]
+    order = {(w.row_off, w.col_off): i for i, w in enumerate(windows)}
+
+    def summarize(window: Window) -> None:
+        block = adapter.read_window(window)
+        partials[order[window.row_off, window.col_off]] = [
+            BandStatistics().update(band, nodata) for band in block
+        ]
+
+    run_blocks(summarize, windows, workers=workers)
+
+    totals = [BandStatistics() for _ in range(count)]
+    for partial in partials:
+        for total, part in zip(totals, partial, strict=True):
+            total.merge(part)
+    return totals
+
+
+def combined_statistics(stats: list[BandStatistics]) -> BandStatistics:
+    """Merge per-band summaries into one summary over every pixel of every band."""
+    combined = BandStatistics()
+    for band in stats:
+        combined.merge(band)
+    return combined
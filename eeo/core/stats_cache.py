@@ -0,0 +1,250 @@
+"""Persistent per-file statistics cache.
+
+Statistics read from pixels (band summaries, percentiles, display stretches
+and histograms) depend only on the file they were computed from, so they are
+kept and reused instead of recomputed by every ``describe``, normalization and
+plot of the same scene. Each entry is keyed on the file's resolved path, its
+modification time and size, the band(s) and the quantity ("mode") computed:
+rewriting the file changes the key, so a stale entry can never be served.
+
+The ``stats_cache`` option (see :class:`eeo.set_options`) picks where entries
+live. ``"memory"`` keeps them in an in-process LRU cache bounded by
+``stats_cache_size``; ``"sidecar"`` additionally persists them to a JSON file
+beside the raster, ``<file>.eeo-stats.json`` (the counterpart of GDAL's
+``.aux.xml``), so a later session starts warm; ``"off"`` disables caching.
+
+Only datasets read from a local file are cached. In-memory, derived and
+remote datasets have no stable identity to key on and are always computed.
+Cached values are plain JSON data, so a hit from memory and a hit from a
+sidecar are indistinguishable.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+from eeo.core.adapters import BaseRasterAdapter, RasterioAdapter
+from eeo.core.histogram import _check_method, _check_percentiles, band_percentiles
+from eeo.core.options import get_option
+from eeo.core.statistics import BandStatistics, band_statistics
+
+SIDECAR_SUFFIX = ".eeo-stats.json"
+# Bumped whenever the layout of a sidecar or of its entries changes; a sidecar
+# of another version is ignored and rewritten.
+_SIDECAR_VERSION = 1
+
+# (resolved path, mtime in ns, size in bytes) of a cached file.
+Source = tuple[str, int, int]
+
+_MEMORY: OrderedDict[tuple[str, int, int, str], Any] = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def clear_stats_cache() -> None:
+    """Drop every statistic held in the in-process cache.
+
+    Sidecar files are left in place; delete ``<file>.eeo-stats.json`` to
+    discard persisted entries.
+
+    Examples
+    --------
+    >>> import eeo
+    >>> eeo.clear_stats_cache()
+    """
+    with _LOCK:
+        _MEMORY.clear()
+
+
+def _source(adapter: BaseRasterAdapter) -> Source | None:
+    """Return the identity of the local file behind ``adapter``, or None.
+
+    Only a rasterio dataset opened read-only from a file on disk qualifies.
+    """
+    if get_option("stats_cache") == "off":
+        return None
+    if not isinstance(adapter, RasterioAdapter) or adapter.file_path is None:
+        return None
+    path = os.path.realpath(adapter.file_path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _sidecar_path(path: str) -> str:
+    return path + SIDECAR_SUFFIX
+
+
+def _read_sidecar(source: Source) -> dict[str, Any]:
+    """Return the entries of ``source``'s sidecar, or {} if absent or stale."""
+    path, mtime_ns, size = source
+    try:
+        with open(_sidecar_path(path), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or (
+        data.get("version"),
+        data.get("mtime_ns"),
+        data.get("size"),
+    ) != (_SIDECAR_VERSION, mtime_ns, size):
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_sidecar(source: Source, values: dict[str, Any]) -> None:
+    """Merge ``values`` into ``source``'s sidecar, atomically.
+
+    A sidecar that cannot be written (a read-only directory, a full disk) is
+    skipped silently: the cache only ever saves work.
+    """
+    path, mtime_ns, size = source
+    target = _sidecar_path(path)
+    entries = {**_read_sidecar(source), **values}
+    data = {"version": _SIDECAR_VERSION, "mtime_ns": mtime_ns, "size": size, "entries": entries}
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".part")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, target)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+
+
+def _remember(source: Source, values: dict[str, Any]) -> None:
+    """Store entries in the in-process LRU, evicting the oldest past the limit."""
+    limit = get_option("stats_cache_size")
+    with _LOCK:
+        for entry, value in values.items():
+            key = (*source, entry)
+            _MEMORY[key] = value
+            _MEMORY.move_to_end(key)
+        while len(_MEMORY) > limit:
+            _MEMORY.popitem(last=False)
+
+
+def cached_entries(
+    adapter: BaseRasterAdapter,
+    entries: Sequence[str],
+    compute: Callable[[], Sequence[Any]],
+) -> list[Any]:
+    """Return cached values for ``entries``, computing them all on any miss.
+
+    Parameters
+    ----------
+    adapter : BaseRasterAdapter
+        Backend the values are computed from.
+    entries : sequence of str
+        Names of the values, unique per file, e.g. ``"2:stats"``.
+    compute : callable
+        Returns the values of every entry, in order, as JSON-serializable
+        data. Called only when some entry is cached nowhere.
+
+    Returns
+    -------
+    list
+        The values of ``entries``, in order, as JSON data.
+    """
+    source = _source(adapter)
+    if source is None:
+        return _as_json(list(compute()))
+
+    found: dict[str, Any] = {}
+    with _LOCK:
+        for entry in entries:
+            key = (*source, entry)
+            if key in _MEMORY:
+                _MEMORY.move_to_end(key)
+                found[entry] = _MEMORY[key]
+    sidecar = get_option("stats_cache") == "sidecar"
+    if len(found) < len(entries) and sidecar:
+        stored = _read_sidecar(source)
+        loaded = {e: stored[e] for e in entries if e not in found and e in stored}
+        _remember(source, loaded)
+        found.update(loaded)
+    if len(found) == len(entries):
+        return [found[entry] for entry in entries]
+
+    values = dict(zip(entries, _as_json(list(compute())), strict=True))
+    _remember(source, values)
+    if sidecar:
+        _write_sidecar(source, values)
+    return [values[entry] for entry in entries]
+
+
+def cached_entry(adapter: BaseRasterAdapter, entry: str, compute: Callable[[], Any]) -> Any:
+    """Return the cached value of one entry; see :func:`cached_entries`."""
+    return cached_entries(adapter, [entry], lambda: [compute()])[0]
+
+
+def _as_json(values: list[Any]) -> list[Any]:
+    """Round-trip values through JSON, so fresh and cached results match in type."""
+    return json.loads(json.dumps(values))
+
+
+def cached_band_statistics(
+    adapter: BaseRasterAdapter, *, workers: int | None = None
+) -> list[BandStatistics]:
+    """Return :func:`~eeo.core.statistics.band_statistics`, cached per band."""
+    entries = [f"{band}:stats" for band in range(1, adapter.get_count() + 1)]
+    values = cached_entries(
+        adapter,
+        entries,
+        lambda: [stats.to_dict() for stats in band_statistics(adapter, workers=workers)],
+    )
+    return [BandStatistics.from_dict(value) for value in values]
+
+
+def cached_percentiles(
+    adapter: BaseRasterAdapter,
+    q: float | Sequence[float],
+    *,
+    bands: Sequence[int] | None = None,
+    combined: bool = False,
+    method: str = "exact",
+    workers: int | None = None,
+) -> np.ndarray:
+    """Return :func:`~eeo.core.histogram.band_percentiles`, cached.
+
+    Results are cached per band, or per band selection when ``combined``.
+
+    Raises
+    ------
+    ValidationError
+        If a percentile is outside ``[0, 100]`` or ``method`` is unknown.
+    """
+    levels = _check_percentiles(q)
+    _check_method(method)
+    selected = list(bands) if bands is not None else list(range(1, adapter.get_count() + 1))
+    mode = f"percentiles {method} {','.join(repr(v) for v in levels.tolist())}"
+    labels = [",".join(map(str, selected))] if combined else [str(b) for b in selected]
+
+    def compute() -> list[Any]:
+        result = band_percentiles(
+            adapter,
+            levels.tolist(),
+            bands=selected,
+            combined=combined,
+            method=method,
+            workers=workers,
+        )
+        return [result.tolist()] if combined else result.tolist()
+
+    values = cached_entries(adapter, [f"{label}:{mode}" for label in labels], compute)
+    result = np.asarray(values, dtype=np.float64)
+    return result[0] if combined else result
@@ -0,0 +1,299 @@
+"""A stack of co-registered rasters over time, held as one array.
+
+:class:`EEOTimeSeries` is the multi-date counterpart of
+:class:`~eeo.core.core.EEORasterDataset`: one ``(time, band, y, x)`` array on
+a single grid, with an acquisition time, and free-form tags, per time step.
+Every step shares the grid, the band layout, the dtype and the nodata value,
+so a pixel means the same place at every date and reductions across time need
+no alignment.
+
+Build one from a STAC search with
+:meth:`eeo.io.STACSearchResult.to_cube`, or wrap an existing array directly.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+from typing import Any, overload
+
+import numpy as np
+from affine import Affine
+from rasterio.crs import CRS
+
+from eeo.core.core import EEORasterDataset
+from eeo.core.exceptions import ValidationError
+from eeo.core.loader import load_array
+
+
+class EEOTimeSeries(Sequence[EEORasterDataset]):
+    """A ``(time, band, y, x)`` raster cube with a timestamp per step.
+
+    Behaves like a sequence of datasets, one per time step, oldest first:
+    indexing gives the :class:`~eeo.core.core.EEORasterDataset` of one step
+    (a view onto the cube, carrying that step's timestamp and tags), and
+    slicing gives a shorter series. The whole cube is available at once as
+    :meth:`to_array` for reductions across time.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Pixel values shaped ``(time, band, height, width)``. Wrapped without
+        copying.
+    timestamps : sequence of (datetime.datetime or None)
+        Acquisition time of each step, one per entry along the time axis.
+    transform : affine.Affine
+        Pixel-to-world transform shared by every step.
+    crs : rasterio.crs.CRS or int or str or None
+        Coordinate reference system shared by every step.
+    nodata : float or int or None, default None
+        Value marking missing pixels in every step.
+    band_names : list of (str or None) or None, default None
+        Per-band names, one per entry along the band axis.
+    attrs : sequence of dict or None, default None
+        Free-form tags of each step, e.g. the STAC item it was read from.
+
+    Raises
+    ------
+    ValidationError
+        If ``data`` is not a 4-D NumPy array, or ``timestamps``, ``attrs`` or
+        ``band_names`` do not match its shape.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        *,
+        timestamps: Sequence[dt.datetime | None],
+        transform: Affine,
+        crs: CRS | int | str | None,
+        nodata: float | int | None = None,
+        band_names: list[str | None] | None = None,
+        attrs: Sequence[dict] | None = None,
+    ) -> None:
+        if not isinstance(data, np.ndarray) or data.ndim != 4:
+            shape = getattr(data, "shape", None)
+            raise ValidationError(
+                f"data must be a 4-D NumPy array shaped (time, band, y, x); got shape {shape}"
+            )
+        steps, count = data.shape[:2]
+        if len(timestamps) != steps:
+            raise ValidationError(
+                f"timestamps must give one time per step; got {len(timestamps)} for {steps} steps"
+            )
+        names: list[str | None] = [None] * count if band_names is None else list(band_names)
+        if len(names) != count:
+            raise ValidationError(
+                f"band_names must have one entry per band; expected {count}, got {len(names)}"
+            )
+        if attrs is not None and len(attrs) != steps:
+            raise ValidationError(
+                f"attrs must give one dict per step; got {len(attrs)} for {steps} steps"
+            )
+
+        self._data = data
+        self._timestamps = list(timestamps)
+        self._transform = transform
+        self._crs = CRS.from_user_input(crs) if crs is not None else None
+        self._nodata = nodata
+        self._band_names = names
+        self._attrs = [{} if attrs is None else dict(attrs[i]) for i in range(steps)]
+
+    @property
+    def timestamps(self) -> list[dt.datetime | None]:
+        """Return the acquisition time of each step, in order.
+
+        Returns
+        -------
+        list of (datetime.datetime or None)
+            One timestamp per step; None for an undated one.
+        """
+        return list(self._timestamps)
+
+    @property
+    def band_names(self) -> list[str | None]:
+        """Return the band names shared by every step.
+
+        Returns
+        -------
+        list of (str or None)
+            One name per band; None for an unnamed band.
+        """
+        return list(self._band_names)
+
+    @property
+    def attrs(self) -> list[dict]:
+        """Return the free-form tags of each step.
+
+        Returns
+        -------
+        list of dict
+            Copies of the per-step tags, so editing them does not change the
+            series.
+        """
+        return [dict(step) for step in self._attrs]
+
+    def get_crs(self) -> CRS | None:
+        """Return the coordinate reference system shared by every step.
+
+        Returns
+        -------
+        rasterio.crs.CRS or None
+            The cube's CRS.
+        """
+        return self._crs
+
+    def get_transform(self) -> Affine:
+        """Return the affine geotransform shared by every step.
+
+        Returns
+        -------
+        affine.Affine
+            Pixel-to-world transform.
+        """
+        return self._transform
+
+    def get_shape(self) -> tuple[int, int]:
+        """Return the spatial shape of every step.
+
+        Returns
+        -------
+        tuple of int
+            ``(height, width)`` in pixels.
+        """
+        height, width = self._data.shape[-2:]
+        return (height, width)
+
+    def get_count(self) -> int:
+        """Return the number of bands in every step.
+
+        Returns
+        -------
+        int
+            Band count.
+        """
+        return int(self._data.shape[1])
+
+    def get_nodata(self) -> float | int | None:
+        """Return the value marking missing pixels.
+
+        Returns
+        -------
+        float or int or None
+            Nodata value shared by every step, or None if there is none.
+        """
+        return self._nodata
+
+    def get_dtype(self) -> np.dtype:
+        """Return the data type of the cube.
+
+        Returns
+        -------
+        numpy.dtype
+            Pixel data type.
+        """
+        return self._data.dtype
+
+    def to_array(self) -> np.ndarray:
+        """Return the whole cube as one array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The cube's own array, shaped ``(time, band, height, width)``, not
+            a copy. Missing pixels hold the nodata value.
+        """
+        return self._data
+
+    def composite(
+        self,
+        method: str = "median",
+        *,
+        red: int | str | None = None,
+        nir: int | str | None = None,
+        workers: int | None = None,
+    ) -> EEORasterDataset:
+        """Reduce the series over time to one raster, block by block.
+
+        Parameters
+        ----------
+        method : str, default "median"
+            ``"median"``, ``"mean"``, a percentile such as ``"p90"``, or
+            ``"max_ndvi"``.
+        red, nir : int, str, or None, default None
+            The red and NIR bands, required for ``"max_ndvi"``.
+        workers : int or None, default None
+            Threads computing blocks concurrently.
+
+        Returns
+        -------
+        EEORasterDataset
+            The float32 composite; see :func:`eeo.composite`.
+        """
+        from eeo.analysis.composite import composite
+
+        return composite(self, method, red=red, nir=nir, workers=workers)
+
+    def __len__(self) -> int:
+        """Return the number of time steps.
+
+        Returns
+        -------
+        int
+            Length of the time axis.
+        """
+        return int(self._data.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> EEORasterDataset: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> EEOTimeSeries: ...
+
+    def __getitem__(self, index: int | slice) -> EEORasterDataset | EEOTimeSeries:
+        """Return one step as a dataset, or a slice of steps as a series.
+
+        Parameters
+        ----------
+        index : int or slice
+            Position of a single step, or a slice of positions.
+
+        Returns
+        -------
+        EEORasterDataset or EEOTimeSeries
+            A NumPy-backed dataset viewing the step's pixels, with its
+            timestamp, tags, band names and the cube's nodata value; or a
+            series over the sliced steps, sharing the cube's memory.
+        """
+        if isinstance(index, slice):
+            return EEOTimeSeries(
+                self._data[index],
+                timestamps=self._timestamps[index],
+                transform=self._transform,
+                crs=self._crs,
+                nodata=self._nodata,
+                band_names=self._band_names,
+                attrs=self._attrs[index],
+            )
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"time step {index} is out of range for {len(self)} steps")
+        index = int(index) % len(self)
+        return load_array(
+            self._data[index],
+            transform=self._transform,
+            crs=self._crs,
+            nodata=self._nodata,
+            timestamp=self._timestamps[index],
+            attrs=self._attrs[index],
+            band_names=self._band_names,
+        )
+
+    def __repr__(self) -> str:
+        """Return a one-line summary: steps, bands, grid size, and time span."""
+        steps, count, height, width = self._data.shape
+        dated: list[Any] = [ts for ts in self._timestamps if ts is not None]
+        span = f" from {dated[0].date()} to {dated[-1].date()}" if dated else ""
+        return (
+            f"<EEOTimeSeries: {steps} steps x {count} bands x {height}x{width} "
+            f"{self._data.dtype}{span}>"
+        )
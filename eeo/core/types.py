@@ -1,6 +1,7 @@
 """Shared type aliases for the public API."""
 
 import os
+from collections.abc import Sequence
 from typing import Literal
 
 #: Anything accepted where a filesystem path is expected: a ``str`` or any
@@ -23,3 +24,7 @@ ResamplingMethod = Literal[
     "q1",
     "q3",
 ]
+
+#: Overview levels to build: ``"auto"`` (halve until the smallest level fits
+#: in 256 pixels), a number of levels, or explicit decimation factors.
+OverviewLevels = Literal["auto"] | int | Sequence[int]
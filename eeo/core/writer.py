@@ -0,0 +1,297 @@
+"""Streaming raster writes: GeoTIFF creation options and Cloud-Optimized GeoTIFFs.
+
+A raster is written window by window: each window of the source is read with
+``read_window`` (evaluating a deferred source one fused block at a time) and
+written straight to the destination, so no band is ever materialized whole.
+
+A Cloud-Optimized GeoTIFF (COG) is a tiled GeoTIFF whose overviews and tiles
+are laid out so that a reader can fetch any region, at any level, with a few
+HTTP range requests. GDAL's ``COG`` driver can only copy an existing dataset,
+so a COG is streamed into a temporary tiled GeoTIFF next to the destination,
+given its overviews there, and then copied into the COG layout.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Any
+
+import numpy as np
+import rasterio as rio
+import rasterio.shutil
+from rasterio.enums import Resampling
+
+from eeo.core.adapters import BaseRasterAdapter
+from eeo.core.blocks import block_windows
+from eeo.core.exceptions import BackendError, ValidationError
+from eeo.core.options import get_option
+from eeo.core.overviews import build_dataset_overviews
+from eeo.core.types import OverviewLevels, ResamplingMethod, StrPath
+
+# Compression schemes GDAL's GeoTIFF and COG drivers accept.
+COMPRESSIONS = (
+    "none",
+    "lzw",
+    "deflate",
+    "zstd",
+    "lzma",
+    "packbits",
+    "jpeg",
+    "webp",
+    "lerc",
+    "lerc_deflate",
+    "lerc_zstd",
+)
+
+# GDAL's COG driver default; also the tile size of a tiled GeoTIFF when a
+# compression or predictor is asked for without a block size.
+DEFAULT_COG_BLOCKSIZE = 512
+
+
+def _check_compress(compress: str | None) -> str | None:
+    if compress is None:
+        return None
+    if not isinstance(compress, str) or compress.lower() not in COMPRESSIONS:
+        valid = ", ".join(COMPRESSIONS)
+        raise ValidationError(f"compress must be one of: {valid}; got {compress!r}")
+    return compress.lower()
+
+
+def _check_predictor(predictor: bool | int | None, dtype: np.dtype) -> int | None:
+    """Resolve ``predictor`` to GDAL's 1/2/3, or None for none."""
+    if predictor is None or predictor is False:
+        return None
+    floating = np.issubdtype(dtype, np.floating)
+    if predictor is True:
+        return 3 if floating else 2
+    if predictor not in (1, 2, 3) or isinstance(predictor, bool):
+        raise ValidationError(f"predictor must be True, False, None, 1, 2, or 3; got {predictor!r}")
+    if predictor == 3 and not floating:
+        raise ValidationError(f"predictor 3 (floating point) needs a float raster; got {dtype}")
+    return predictor
+
+
+def _check_blocksize(blocksize: int | None) -> int | None:
+    if blocksize is None:
+        return None
+    if isinstance(blocksize, bool) or not isinstance(blocksize, int) or blocksize < 16:
+        raise ValidationError(f"blocksize must be an int of at least 16; got {blocksize!r}")
+    if blocksize % 16:
+        raise ValidationError(f"blocksize must be a multiple of 16; got {blocksize}")
+    return blocksize
+
+
+def _check_num_threads(num_threads: int | str | None) -> str | None:
+    """Resolve ``num_threads`` to GDAL's ``NUM_THREADS`` value, or None to leave it unset.
+
+    None follows the ``num_threads`` option, leaving GDAL single-threaded when
+    that option is 1.
+    """
+    if num_threads is None:
+        threads = get_option("num_threads")
+        return str(threads) if threads > 1 else None
+    if num_threads == "ALL_CPUS":
+        return num_threads
+    if isinstance(num_threads, bool) or not isinstance(num_threads, int) or num_threads < 1:
+        raise ValidationError(
+            f'num_threads must be a positive int or "ALL_CPUS"; got {num_threads!r}'
+        )
+    return str(num_threads)
+
+
+def geotiff_options(
+    dtype: np.dtype,
+    *,
+    compress: str | None = None,
+    predictor: bool | int | None = None,
+    blocksize: int | None = None,
+    num_threads: int | str | None = None,
+) -> dict[str, Any]:
+    """Validate GeoTIFF creation settings and return them as rasterio profile keys.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Data type of the raster, which decides the automatic predictor.
+    compress : str or None, default None
+        Compression scheme (see ``COMPRESSIONS``); None writes uncompressed.
+    predictor : bool, int, or None, default None
+        1 (none), 2 (horizontal differencing) or 3 (floating point); True
+        picks 2 for an integer raster and 3 for a float one. None and False
+        use no predictor.
+    blocksize : int or None, default None
+        Side of the square tiles, a multiple of 16. None writes tiles of
+        ``DEFAULT_COG_BLOCKSIZE`` when compressing, and GDAL's strips
+        otherwise.
+    num_threads : int, "ALL_CPUS", or None, default None
+        Threads GDAL compresses blocks on. None follows the ``num_threads``
+        option.
+
+    Returns
+    -------
+    dict
+        Profile keys to pass to ``rasterio.open`` in write mode.
+
+    Raises
+    ------
+    ValidationError
+        If a setting is invalid.
+    """
+    compress = _check_compress(compress)
+    predictor_code = _check_predictor(predictor, dtype)
+    blocksize = _check_blocksize(blocksize)
+    threads = _check_num_threads(num_threads)
+
+    options: dict[str, Any] = {}
+    if compress is not None:
+        options["compress"] = compress
+    if predictor_code is not None:
+        options["predictor"] = predictor_code
+    if blocksize is None and compress not in (None, "none"):
+        blocksize = DEFAULT_COG_BLOCKSIZE
+    if blocksize is not None:
+        options.update(tiled=True, blockxsize=blocksize, blockysize=blocksize)
+    if threads is not None:
+        options["num_threads"] = threads
+    return options
+
+
+def write_windows(
+    adapter: BaseRasterAdapter,
+    path: StrPath,
+    *,
+    driver: str = "GTiff",
+    band_names: list[str | None] | None = None,
+    options: dict[str, Any] | None = None,
+) -> None:
+    """Stream ``adapter`` into a new raster file, one window at a time.
+
+    Only one window of the source is in memory at once, whatever its backend:
+    a NumPy array is sliced into views, a file is read window by window, and
+    a deferred or dask result is evaluated one block at a time. Windows follow
+    the source's block layout, or the output's tiles when it is tiled, so
+    GDAL writes (and compresses) each tile once, whole.
+
+    Parameters
+    ----------
+    adapter : BaseRasterAdapter
+        Backend to write; its metadata (dtype, nodata, band count,
+        georeferencing) becomes the file's.
+    path : str or path-like
+        Output file path.
+    driver : str, default "GTiff"
+        GDAL driver name.
+    band_names : list of (str or None) or None, default None
+        Names written to the GDAL band descriptions; None entries are skipped.
+    options : dict or None, default None
+        Extra profile keys (creation options), e.g. from
+        :func:`geotiff_options`.
+    """
+    height, width = adapter.get_shape()
+    profile = {
+        "driver": driver,
+        "height": height,
+        "width": width,
+        "count": adapter.get_count(),
+        "dtype": adapter.get_dtype(),
+        "crs": adapter.get_crs(),
+        "transform": adapter.get_transform(),
+        "nodata": adapter.get_nodata(),
+        **(options or {}),
+    }
+    with rio.open(path, "w", **profile) as dst:
+        tiles = dst.block_shapes[0] if profile.get("tiled") else None
+        for window in block_windows(adapter, block_shape=tiles):
+            dst.write(adapter.read_window(window), window=window)
+        # Unnamed bands are left alone so the file records no description.
+        for i, name in enumerate(band_names or [], start=1):
+            if name:
+                dst.set_band_description(i, name)
+
+
+def write_cog(
+    adapter: BaseRasterAdapter,
+    path: StrPath,
+    *,
+    band_names: list[str | None] | None = None,
+    compress: str | None = None,
+    predictor: bool | int | None = None,
+    blocksize: int | None = None,
+    num_threads: int | str | None = None,
+    overviews: OverviewLevels = "auto",
+    overview_resampling: Resampling | ResamplingMethod = "nearest",
+) -> None:
+    """Write ``adapter`` as a Cloud-Optimized GeoTIFF with internal overviews.
+
+    The source is streamed window by window into a temporary tiled GeoTIFF
+    beside ``path``, its overviews are built there, and GDAL's ``COG`` driver
+    then copies it into the cloud-optimized layout. The temporary file is
+    removed whatever happens.
+
+    Parameters
+    ----------
+    adapter : BaseRasterAdapter
+        Backend to write.
+    path : str or path-like
+        Output file path.
+    band_names : list of (str or None) or None, default None
+        Names written to the GDAL band descriptions.
+    compress, predictor, num_threads
+        As for :func:`geotiff_options`. ``compress=None`` uses the COG
+        driver's default (LZW).
+    blocksize : int or None, default None
+        Tile size; None uses ``DEFAULT_COG_BLOCKSIZE``.
+    overviews : "auto", int, or sequence of int, default "auto"
+        Overview levels; see :func:`eeo.core.overviews.overview_factors`.
+    overview_resampling : str or rasterio.enums.Resampling, default "nearest"
+        How overview pixels are computed.
+
+    Raises
+    ------
+    ValidationError
+        If a setting is invalid.
+    BackendError
+        If GDAL fails to write the file.
+    """
+    compress = _check_compress(compress)
+    predictor_code = _check_predictor(predictor, adapter.get_dtype())
+    blocksize = _check_blocksize(blocksize) or DEFAULT_COG_BLOCKSIZE
+    threads = _check_num_threads(num_threads)
+
+    cog_options: dict[str, Any] = {"BLOCKSIZE": blocksize}
+    if compress is not None:
+        cog_options["COMPRESS"] = compress.upper()
+    if predictor_code is not None:
+        cog_options["PREDICTOR"] = predictor_code
+    if threads is not None:
+        cog_options["NUM_THREADS"] = threads
+    # The intermediate is tiled like the COG, and compressed cheaply and
+    # losslessly so it costs a fraction of the raster's size on disk.
+    staging: dict[str, Any] = {
+        "tiled": True,
+        "blockxsize": blocksize,
+        "blockysize": blocksize,
+        "compress": "deflate",
+        "zlevel": 1,
+    }
+    if threads is not None:
+        staging["num_threads"] = threads
+
+    directory = os.path.dirname(os.path.abspath(os.fspath(path)))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tif")
+    os.close(fd)
+    try:
+        write_windows(adapter, tmp, band_names=band_names, options=staging)
+        with rio.open(tmp, "r+") as staged:
+            built = build_dataset_overviews(staged, overviews, overview_resampling)
+        cog_options["OVERVIEWS"] = "FORCE_USE_EXISTING" if built else "NONE"
+        rasterio.shutil.copy(tmp, path, driver="COG", **cog_options)
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise BackendError(f"failed to write a Cloud-Optimized GeoTIFF to {path}") from e
+    finally:
+        for leftover in (tmp, tmp + ".ovr"):
+            if os.path.exists(leftover):
+                os.unlink(leftover)
@@ -6,13 +6,24 @@ pulls in no optional dependency; an extra is only required when one of its
 features actually runs.
 """
 
-from .stac import PLANETARY_COMPUTER_STAC_URL, STACItem, STACSearchResult, stac_search
+from .range_cache import CacheInfo, clear_remote_cache, remote_cache_info
+from .stac import (
+    PLANETARY_COMPUTER_STAC_URL,
+    STACItem,
+    STACSearchResult,
+    astac_search,
+    stac_search,
+)
 from .xarray import from_xarray
 
 __all__ = [
     "stac_search",
+    "astac_search",
     "STACItem",
     "STACSearchResult",
     "PLANETARY_COMPUTER_STAC_URL",
     "from_xarray",
+    "remote_cache_info",
+    "clear_remote_cache",
+    "CacheInfo",
 ]
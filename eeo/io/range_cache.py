@@ -0,0 +1,530 @@
+"""Persistent on-disk cache of byte ranges read from remote rasters.
+
+GDAL's ``VSI_CACHE`` keeps the ranges it fetched only in process memory, and
+only while the dataset handle is open, so re-running an analysis over the same
+area downloads the same COG tiles again. With the ``remote_cache`` option set
+(see :class:`eeo.set_options`), STAC asset reads instead go through a Python
+file object that serves GDAL's reads from fixed-size blocks stored under that
+directory, and fetches only the blocks it does not yet hold, as HTTP range
+requests.
+
+Blocks are keyed by the asset's *unsigned* URL: the signature parameters a
+catalog appends (Planetary Computer's Azure SAS tokens, AWS and Google
+presigned-URL parameters) are dropped, because the same object read under a
+fresh signature is still the same object. The cache is bounded by the
+``remote_cache_size`` option and evicts the least recently used blocks.
+Remote objects are assumed immutable, as catalog assets are; clear the cache
+with :func:`clear_remote_cache` if one is replaced in place.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from eeo._optional import import_optional
+from eeo.core.options import get_option
+
+# Size of one cached block. GDAL's reads of a COG header are a few bytes each
+# and its tile reads are tens to hundreds of KiB, so a block serves the header
+# whole and a run of missing blocks is fetched in one request.
+BLOCK_SIZE = 256 * 1024
+
+# (connect, read) timeouts of one range request, in seconds. A stalled
+# connection would otherwise hang the GDAL read waiting on it forever.
+TIMEOUT = (10.0, 60.0)
+
+# Attempts after the first for a request that fails transiently: a dropped
+# connection or a 429/5xx answer, retried with exponential backoff (and after
+# the ``Retry-After`` the server asks for, if any).
+RETRIES = 3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Query parameters that sign a URL rather than identify the object: Azure SAS
+# tokens (Planetary Computer), AWS SigV4 and Google presigned URLs. Compared
+# case-insensitively.
+SIGNATURE_PARAMS = frozenset(
+    {
+        # Azure shared access signatures.
+        "sig",
+        "se",
+        "st",
+        "sp",
+        "sv",
+        "sr",
+        "spr",
+        "si",
+        "sip",
+        "ss",
+        "srt",
+        "sdd",
+        "skoid",
+        "sktid",
+        "skt",
+        "ske",
+        "sks",
+        "skv",
+        "ses",
+        # AWS SigV4 presigned URLs.
+        "x-amz-algorithm",
+        "x-amz-credential",
+        "x-amz-date",
+        "x-amz-expires",
+        "x-amz-signedheaders",
+        "x-amz-signature",
+        "x-amz-security-token",
+        # Google Cloud Storage signed URLs.
+        "x-goog-algorithm",
+        "x-goog-credential",
+        "x-goog-date",
+        "x-goog-expires",
+        "x-goog-signedheaders",
+        "x-goog-signature",
+    }
+)
+
+_META_NAME = "meta.json"
+_BLOCK_SUFFIX = ".blk"
+# Eviction frees down to this fraction of the size limit, so a cache at its
+# limit does not rescan the directory on every new block.
+_EVICT_TO = 0.9
+
+
+class CacheInfo(NamedTuple):
+    """Hit and miss counts of the remote read cache, since the last clear.
+
+    ``hits`` and ``misses`` count blocks; the byte counts are what GDAL was
+    served from disk and what had to be downloaded.
+    """
+
+    hits: int
+    misses: int
+    bytes_from_cache: int
+    bytes_fetched: int
+    evictions: int
+    size: int
+    max_size: int
+    directory: str | None
+
+
+def unsigned_url(href: str) -> str:
+    """Return ``href`` without the query parameters that only sign it.
+
+    Parameters
+    ----------
+    href : str
+        Asset URL, signed or not.
+
+    Returns
+    -------
+    str
+        The URL with signature parameters (see ``SIGNATURE_PARAMS``) and any
+        fragment removed; the other parameters keep their order.
+
+    Examples
+    --------
+    >>> unsigned_url("https://x.blob.core.windows.net/c/B04.tif?st=2026&se=2026&sig=abc")
+    'https://x.blob.core.windows.net/c/B04.tif'
+    """
+    parts = urlsplit(href)
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in SIGNATURE_PARAMS
+    ]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+class RangeCache:
+    """Size-bounded LRU store of fixed-size blocks of remote objects.
+
+    Each object gets a directory named after a hash of its unsigned URL,
+    holding a ``meta.json`` (the URL and object size) and one file per block.
+    A block's modification time records its last use, so eviction removes
+    the least recently used blocks of any object first. The directory is
+    scanned once, on first use, into an in-memory index in that order; later
+    reads and writes keep the index current, so a write costs no scan. Blocks
+    are written atomically, so several processes may share one directory.
+
+    Parameters
+    ----------
+    directory : str or path-like
+        Where the blocks are stored; created if missing.
+    max_size : int
+        Upper bound on the bytes of blocks kept.
+    block_size : int, default BLOCK_SIZE
+        Size of one block in bytes.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike, max_size: int, block_size: int = BLOCK_SIZE
+    ) -> None:
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        # Path -> size of every stored block, least recently used first;
+        # None until the directory is first scanned.
+        self._index: OrderedDict[str, int] | None = None
+        self._size = 0
+        self._hits = self._misses = self._evictions = 0
+        self._bytes_from_cache = self._bytes_fetched = 0
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def _object_dir(self, url: str) -> str:
+        digest = hashlib.sha256(unsigned_url(url).encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def _block_path(self, url: str, index: int) -> str:
+        return os.path.join(self._object_dir(url), f"{index}{_BLOCK_SUFFIX}")
+
+    def _block_files(self) -> list[tuple[float, int, str]]:
+        """Return (mtime, size, path) of every stored block."""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(_BLOCK_SUFFIX):
+                    path = os.path.join(root, name)
+                    with contextlib.suppress(OSError):
+                        stat = os.stat(path)
+                        files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _ensure_index(self) -> OrderedDict[str, int]:
+        """Return the LRU index, scanning the directory the first time.
+
+        Must be called with ``_lock`` held.
+        """
+        if self._index is None:
+            self._index = OrderedDict((path, size) for _, size, path in sorted(self._block_files()))
+            self._size = sum(self._index.values())
+        return self._index
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+    def object_size(self, url: str) -> int | None:
+        """Return the recorded size of the object at ``url``, or None."""
+        try:
+            with open(os.path.join(self._object_dir(url), _META_NAME)) as f:
+                return int(json.load(f)["size"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set_object_size(self, url: str, size: int) -> None:
+        """Record the size of the object at ``url``."""
+        meta = json.dumps({"url": unsigned_url(url), "size": size}).encode()
+        self._write_atomic(os.path.join(self._object_dir(url), _META_NAME), meta)
+
+    def get_block(self, url: str, index: int) -> bytes | None:
+        """Return a stored block, marking it recently used, or None on a miss."""
+        path = self._block_path(url, index)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._misses += 1
+                # Another process sharing the directory may have evicted it.
+                blocks = self._ensure_index()
+                self._size -= blocks.pop(path, 0)
+            return None
+        with self._lock:
+            self._hits += 1
+            self._bytes_from_cache += len(data)
+            blocks = self._ensure_index()
+            if path in blocks:
+                blocks.move_to_end(path)
+            else:
+                # Another process sharing the directory stored it since the scan.
+                blocks[path] = len(data)
+                self._size += len(data)
+        return data
+
+    def count_misses(self, count: int) -> None:
+        """Count ``count`` blocks fetched without a lookup, such as a size probe's."""
+        with self._lock:
+            self._misses += count
+
+    def put_block(self, url: str, index: int, data: bytes) -> None:
+        """Store a block, evicting the least recently used ones if over the limit."""
+        path = self._block_path(url, index)
+        self._write_atomic(path, data)
+        with self._lock:
+            self._bytes_fetched += len(data)
+            blocks = self._ensure_index()
+            self._size += len(data) - blocks.pop(path, 0)
+            blocks[path] = len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used blocks down to ``_EVICT_TO`` of the limit.
+
+        Must be called with ``_lock`` held.
+        """
+        blocks = self._ensure_index()
+        target = int(self.max_size * _EVICT_TO)
+        while blocks and self._size > target:
+            path, size = blocks.popitem(last=False)
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+                self._evictions += 1
+            self._size -= size
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+    def info(self) -> CacheInfo:
+        """Return the hit and miss counts and the current size."""
+        with self._lock:
+            self._ensure_index()
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                bytes_from_cache=self._bytes_from_cache,
+                bytes_fetched=self._bytes_fetched,
+                evictions=self._evictions,
+                size=self._size,
+                max_size=self.max_size,
+                directory=self.directory,
+            )
+
+    def clear(self) -> None:
+        """Delete every stored block and reset the counts."""
+        with self._lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self._index = OrderedDict()
+            self._size = 0
+            self._hits = self._misses = self._evictions = 0
+            self._bytes_from_cache = self._bytes_fetched = 0
+
+
+class _CachedRemoteFile(io.RawIOBase):
+    """Read-only file object over a remote object, served through a RangeCache."""
+
+    def __init__(self, url: str, cache: RangeCache) -> None:
+        super().__init__()
+        requests = import_optional("requests", extra="stac", purpose="cached remote reads")
+        from urllib3.util.retry import Retry
+
+        self._url = url
+        self._cache = cache
+        self._session = requests.Session()
+        retry = Retry(
+            total=RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            # Once the retries are spent, hand back the last response so
+            # ``raise_for_status`` reports its status.
+            raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._pos = 0
+        size = cache.object_size(url)
+        if size is None:
+            # The first block's response also carries the object's size. The
+            # block was never looked up, but it was downloaded: a miss.
+            size, probed = self._fetch(0, 0)
+            cache.count_misses(len(probed))
+        self._size = size
+
+    def _fetch(self, first: int, last: int) -> tuple[int, dict[int, bytes]]:
+        """Download blocks ``first`` to ``last`` in one request and store them.
+
+        Returns the size of the object, as the response reports it, and the
+        blocks fetched: more than asked for if the server ignored the range.
+        """
+        block = self._cache.block_size
+        start, end = first * block, (last + 1) * block - 1
+        response = self._session.get(
+            self._url, headers={"Range": f"bytes={start}-{end}"}, timeout=TIMEOUT
+        )
+        response.raise_for_status()
+        data = response.content
+        if response.status_code == 206:
+            size = int(response.headers["Content-Range"].rsplit("/", 1)[1])
+        else:
+            # A server without range support sends the whole object: keep all
+            # of it, so the next read is not another full download.
+            size, first = len(data), 0
+        self._cache.set_object_size(self._url, size)
+        blocks = {}
+        for offset in range(0, len(data), block):
+            index = first + offset // block
+            blocks[index] = data[offset : offset + block]
+            self._cache.put_block(self._url, index, blocks[index])
+        return size, blocks
+
+    def _blocks(self, first: int, last: int) -> list[bytes]:
+        """Return blocks ``first`` to ``last``, fetching each missing run once."""
+        blocks: dict[int, bytes] = {}
+        missing: list[int] = []
+        for index in range(first, last + 1):
+            data = self._cache.get_block(self._url, index)
+            if data is None:
+                missing.append(index)
+            else:
+                blocks[index] = data
+        # Group the misses into contiguous runs, one request each.
+        runs: list[list[int]] = []
+        for index in missing:
+            if runs and index == runs[-1][-1] + 1:
+                runs[-1].append(index)
+            else:
+                runs.append([index])
+        for run in runs:
+            fetched = self._fetch(run[0], run[-1])[1]
+            # Blocks downloaded beyond the run were never looked up: misses too.
+            self._cache.count_misses(len(fetched) - len(run))
+            blocks.update(fetched)
+        return [blocks.get(index, b"") for index in range(first, last + 1)]
+
+    # ------------------------------------------------------------------
+    # File protocol
+    # ------------------------------------------------------------------
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        return self._pos
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = self._size if size is None or size < 0 else min(self._pos + size, self._size)
+        if end <= self._pos:
+            return b""
+        block = self._cache.block_size
+        first, last = self._pos // block, (end - 1) // block
+        data = b"".join(self._blocks(first, last))
+        offset = self._pos - first * block
+        chunk = data[offset : offset + end - self._pos]
+        self._pos = end
+        return chunk
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        self._session.close()
+        super().close()
+
+
+_CACHES: dict[tuple[str, int], RangeCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def _active_cache() -> RangeCache | None:
+    """Return the cache the ``remote_cache`` option points at, or None if off."""
+    directory = get_option("remote_cache")
+    if directory is None:
+        return None
+    key = (os.path.abspath(directory), get_option("remote_cache_size"))
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = _CACHES[key] = RangeCache(key[0], key[1])
+        return cache
+
+
+def remote_opener(href: str) -> Any | None:
+    """Return a rasterio ``opener`` reading ``href`` through the cache, or None.
+
+    None when the ``remote_cache`` option is unset or ``href`` is not an
+    HTTP(S) URL; the caller then opens it with GDAL's own network layer.
+    """
+    cache = _active_cache()
+    if cache is None or urlsplit(href).scheme not in ("http", "https"):
+        return None
+
+    def opener(path: str, mode: str = "rb") -> _CachedRemoteFile:
+        # GDAL also probes for sidecars (``.aux.xml``, ``.msk``) through the
+        # opener; COG assets have none, so only the asset itself is served.
+        if path != href:
+            raise FileNotFoundError(path)
+        return _CachedRemoteFile(href, cache)
+
+    return opener
+
+
+def remote_cache_info() -> CacheInfo:
+    """Report how the remote read cache has served reads.
+
+    Returns
+    -------
+    CacheInfo
+        Block hits and misses and the bytes served from disk and downloaded
+        since the cache was last cleared in this session, plus the cache's
+        current size on disk, its limit, and its directory. All zero, with
+        ``directory=None``, when the ``remote_cache`` option is unset.
+
+    Examples
+    --------
+    >>> import eeo
+    >>> with eeo.set_options(remote_cache="~/.cache/eeo"):  # doctest: +SKIP
+    ...     scene = item.load(["B04", "B08"])
+    ...     print(eeo.io.remote_cache_info())
+    """
+    cache = _active_cache()
+    if cache is None:
+        return CacheInfo(0, 0, 0, 0, 0, 0, get_option("remote_cache_size"), None)
+    return cache.info()
+
+
+def clear_remote_cache() -> None:
+    """Delete every block in the remote read cache and reset its counts.
+
+    Does nothing when the ``remote_cache`` option is unset.
+
+    Examples
+    --------
+    >>> import eeo
+    >>> eeo.io.clear_remote_cache()
+    """
+    cache = _active_cache()
+    if cache is not None:
+        cache.clear()
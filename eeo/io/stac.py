@@ -29,17 +29,22 @@ Examples
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import itertools
 import math
 import os
-from collections.abc import Mapping, Sequence
-from typing import Any, NamedTuple, overload
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Literal, NamedTuple, overload
 
 import geopandas as gpd
 import numpy as np
 import rasterio as rio
 import shapely
 from rasterio import windows as rio_windows
+from rasterio.features import geometry_mask
 from rasterio.transform import array_bounds
 from rasterio.vrt import WarpedVRT
 from rasterio.warp import transform_bounds
@@ -49,7 +54,10 @@ from eeo.common import normalize_resampling_method
 from eeo.core.core import EEORasterDataset
 from eeo.core.exceptions import ValidationError
 from eeo.core.loader import load_array
+from eeo.core.options import _positive_int
+from eeo.core.timeseries import EEOTimeSeries
 from eeo.core.types import ResamplingMethod
+from eeo.io.range_cache import remote_opener
 
 #: Microsoft Planetary Computer's STAC API — the default ``catalog`` for
 #: :func:`stac_search`, and the only catalog contacted unless another is given.
@@ -194,6 +202,20 @@ _GDAL_HTTP_ENV = {
 }
 
 
+# Default cap on the assets of one load fetched at once. The reads are network
+# bound, so a thread each is cheap; the cap keeps a load of a whole Sentinel-2
+# band list from opening a dozen connections to one host.
+_DEFAULT_ASSET_WORKERS = 8
+
+# Default number of items a bulk load reads at once. Each item fetches its own
+# assets concurrently too, so this stays small.
+_DEFAULT_ITEM_WORKERS = 4
+
+# Accepted values of the bulk loaders' ``order`` and ``on_error`` arguments.
+LoadOrder = Literal["completed", "chronological"]
+OnError = Literal["raise", "skip"]
+
+
 class _Grid(NamedTuple):
     """The output grid every asset of one load is read onto."""
 
@@ -274,7 +296,7 @@ def _mask_fill(dataset: EEORasterDataset, nodata: float | None) -> float:
     """
     if nodata is not None:
         return float(nodata)
-    if np.issubdtype(np.dtype(dataset.get_metadata()["dtype"]), np.floating):
+    if np.issubdtype(dataset.get_dtype(), np.floating):
         return float("nan")
     return 0.0
 
@@ -291,9 +313,17 @@ def _asset_band_names(src: Any, asset: str) -> list[str | None]:
     return names
 
 
+def _open_asset(href: str) -> Any:
+    """Open an asset, through the on-disk remote read cache when it is enabled."""
+    opener = remote_opener(href)
+    if opener is None:
+        return rio.open(href)
+    return rio.open(href, opener=opener)
+
+
 def _read_first_asset(href: str, asset: str, bbox: Sequence[float] | None) -> tuple:
     """Read the leading asset, which defines the grid the rest are read onto."""
-    with rio.Env(**_GDAL_HTTP_ENV), rio.open(href) as src:
+    with rio.Env(**_GDAL_HTTP_ENV), _open_asset(href) as src:
         window = None if bbox is None else _crop_window(src, bbox)
         array = src.read(window=window)
         transform = src.transform if window is None else src.window_transform(window)
@@ -303,7 +333,7 @@ def _read_first_asset(href: str, asset: str, bbox: Sequence[float] | None) -> tu
 
 def _read_onto_grid(href: str, asset: str, grid: _Grid, resampling: Any) -> tuple:
     """Read a further asset onto ``grid``, warping only when it does not fit."""
-    with rio.Env(**_GDAL_HTTP_ENV), rio.open(href) as src:
+    with rio.Env(**_GDAL_HTTP_ENV), _open_asset(href) as src:
         window = _aligned_window(src, grid)
         if window is not None:
             return src.read(window=window), _asset_band_names(src, asset)
@@ -323,6 +353,85 @@ def _read_onto_grid(href: str, asset: str, grid: _Grid, resampling: Any) -> tupl
             return vrt.read(), _asset_band_names(src, asset)
 
 
+def _cube_layout(href: str, asset: str, bbox: Sequence[float] | None) -> tuple:
+    """Read an asset's header: the grid it would load onto, its dtype, nodata, and bands."""
+    with rio.Env(**_GDAL_HTTP_ENV), _open_asset(href) as src:
+        window = None if bbox is None else _crop_window(src, bbox)
+        if window is None:
+            grid = _Grid(src.crs, src.transform, src.width, src.height)
+        else:
+            transform = src.window_transform(window)
+            grid = _Grid(src.crs, transform, int(window.width), int(window.height))
+        return grid, np.dtype(src.dtypes[0]), src.nodata, _asset_band_names(src, asset)
+
+
+def _read_into(
+    href: str, asset: str, grid: _Grid, resampling: Any, out: np.ndarray, nodata: float
+) -> None:
+    """Read an asset onto ``grid`` straight into ``out``, its slice of a cube.
+
+    Pixels the asset marks as nodata, and pixels of the grid it does not
+    cover, are written as the cube's ``nodata``.
+    """
+    with rio.Env(**_GDAL_HTTP_ENV), _open_asset(href) as src:
+        if src.count != out.shape[0]:
+            raise ValidationError(
+                f"asset {asset!r} of {href} has {src.count} bands where the cube's first "
+                f"item has {out.shape[0]}; every item must share the band layout"
+            )
+        window = _aligned_window(src, grid)
+        if window is None:
+            with WarpedVRT(
+                src,
+                crs=grid.crs,
+                transform=grid.transform,
+                width=grid.width,
+                height=grid.height,
+                resampling=resampling,
+                src_nodata=src.nodata,
+                nodata=nodata,
+            ) as vrt:
+                vrt.read(out=out)
+            return
+        src.read(window=window, out=out)
+        source_nodata = src.nodata
+
+    if source_nodata is None or _same_value(source_nodata, nodata):
+        return
+    missing = np.isnan(out) if math.isnan(source_nodata) else out == source_nodata
+    out[missing] = nodata
+
+
+def _same_value(a: float, b: float) -> bool:
+    """Compare two nodata values, treating NaN as equal to NaN."""
+    return a == b or (math.isnan(a) and math.isnan(b))
+
+
+def _read_remaining(
+    hrefs: Sequence[tuple[str, str]], grid: _Grid, resampling: Any, max_workers: int | None
+) -> list[tuple]:
+    """Read the assets after the first onto ``grid``, concurrently.
+
+    Each read is a blocking remote fetch, so they run on a bounded thread pool
+    and the load costs roughly the latency of the slowest one. Results come
+    back in ``hrefs`` order whatever order they finish in. The first failure
+    is raised once the reads already running have finished; reads not yet
+    started are cancelled.
+    """
+    if not hrefs:
+        return []
+    workers = min(len(hrefs), max_workers or _DEFAULT_ASSET_WORKERS)
+    if workers == 1:
+        return [_read_onto_grid(href, key, grid, resampling) for href, key in hrefs]
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eeo-stac")
+    try:
+        futures = [pool.submit(_read_onto_grid, href, key, grid, resampling) for href, key in hrefs]
+        return [future.result() for future in futures]
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 class STACItem:
     """One scene from a STAC search, with its acquisition time.
 
@@ -497,6 +606,7 @@ class STACItem:
         crop: bool = True,
         mask: bool = False,
         resampling: ResamplingMethod | Any = "nearest",
+        max_workers: int | None = None,
     ) -> EEORasterDataset:
         """Read one or more of the item's assets into a raster dataset.
 
@@ -535,6 +645,11 @@ class STACItem:
             Method used when an asset has to be resampled onto the first
             asset's grid — a Sentinel-2 20 m band stacked with a 10 m one, for
             instance. Nearest neighbour by default so values are never blended.
+        max_workers : int or None, default None
+            Maximum number of assets fetched at once. The assets after the
+            first are read concurrently, each on its own thread; None uses up
+            to 8, and 1 reads them one after another. Band order and names
+            follow ``assets`` either way.
 
         Returns
         -------
@@ -553,7 +668,8 @@ class STACItem:
             If ``assets`` is empty or names an asset the item does not have,
             if ``bbox`` is not four ordered lon/lat values, if ``bbox`` is
             combined with ``crop=False``, if ``mask=True`` without a search
-            geometry, or if the AOI does not overlap the scene.
+            geometry, if ``max_workers`` is not a positive integer, or if the
+            AOI does not overlap the scene.
 
         Notes
         -----
@@ -561,6 +677,10 @@ class STACItem:
         small, so reading a full scene with ``crop=False`` costs a full band in
         RAM. Assets after the first are read onto the first asset's grid, by a
         plain windowed read when they already share it and a warp otherwise.
+        The first asset is read alone, since it defines that grid; the rest
+        are then fetched concurrently, so a multi-band load takes roughly the
+        time of the first read plus the slowest of the others rather than the
+        sum of them all.
 
         Reading a signed Planetary Computer URL must happen while the signature
         is still valid; search, then load, rather than storing items for later.
@@ -584,6 +704,100 @@ class STACItem:
         ... )  # doctest: +SKIP
         >>> scene = results[0].load("B04", mask=True)  # doctest: +SKIP
         """
+        if max_workers is not None:
+            _positive_int("max_workers", max_workers)
+        keys, aoi, resampling_enum = self._plan_load(assets, bbox, crop, mask, resampling)
+
+        first = _read_first_asset(self._href(keys[0]), keys[0], aoi)
+        remaining = [(self._href(key), key) for key in keys[1:]]
+        others = _read_remaining(remaining, first[1], resampling_enum, max_workers)
+        return self._assemble(keys, first, others, mask)
+
+    async def aload(
+        self,
+        assets: str | Sequence[str],
+        *,
+        bbox: Sequence[float] | None = None,
+        crop: bool = True,
+        mask: bool = False,
+        resampling: ResamplingMethod | Any = "nearest",
+        max_concurrency: int | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> EEORasterDataset:
+        """Read assets like :meth:`load`, without blocking the event loop.
+
+        Each remote read runs in the event loop's default executor while the
+        coroutine awaits it, so other tasks keep running. The assets after
+        the first are read concurrently, at most ``max_concurrency`` at once,
+        or under a shared ``semaphore`` so that many loads draw on one
+        concurrency budget.
+
+        Parameters
+        ----------
+        assets, bbox, crop, mask, resampling
+            As for :meth:`load`.
+        max_concurrency : int or None, default None
+            Maximum number of this item's assets read at once. None uses 8.
+            Ignored when ``semaphore`` is given.
+        semaphore : asyncio.Semaphore or None, default None
+            Concurrency budget to read under, shared with other calls; every
+            asset read, the first included, holds one slot while it runs.
+
+        Returns
+        -------
+        EEORasterDataset
+            The same dataset :meth:`load` returns.
+
+        Raises
+        ------
+        ValidationError
+            As for :meth:`load`, or if ``max_concurrency`` is not a positive
+            integer.
+
+        Notes
+        -----
+        GDAL's reads are blocking calls, so each still occupies an executor
+        thread while it runs; the event loop itself never waits on one. The
+        default executor caps how many run at once however large the budget.
+
+        Examples
+        --------
+        >>> results = await eeo.io.astac_search(
+        ...     "sentinel-2-l2a", bbox=(11.0, 46.5, 11.2, 46.7), limit=4
+        ... )  # doctest: +SKIP
+        >>> budget = asyncio.Semaphore(16)  # doctest: +SKIP
+        >>> scenes = await asyncio.gather(
+        ...     *(item.aload(["B04", "B08"], semaphore=budget) for item in results)
+        ... )  # doctest: +SKIP
+        """
+        if max_concurrency is not None:
+            _positive_int("max_concurrency", max_concurrency)
+        keys, aoi, resampling_enum = self._plan_load(assets, bbox, crop, mask, resampling)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency or _DEFAULT_ASSET_WORKERS)
+
+        async def bounded(func: Any, *args: Any) -> Any:
+            async with semaphore:
+                return await asyncio.to_thread(func, *args)
+
+        first = await bounded(_read_first_asset, self._href(keys[0]), keys[0], aoi)
+        others = await asyncio.gather(
+            *(
+                bounded(_read_onto_grid, self._href(key), key, first[1], resampling_enum)
+                for key in keys[1:]
+            )
+        )
+        return await asyncio.to_thread(self._assemble, keys, first, others, mask)
+
+    def _plan_load(
+        self,
+        assets: str | Sequence[str],
+        bbox: Sequence[float] | None,
+        crop: bool,
+        mask: bool,
+        resampling: Any,
+    ) -> tuple[list[str], Sequence[float] | None, Any]:
+        """Validate the load arguments; return the asset keys, AOI, and resampling."""
         keys = self._resolve_assets(assets)
 
         if crop is False and bbox is not None:
@@ -609,12 +823,15 @@ class STACItem:
                 # the pixels outside its outline are then blanked.
                 aoi = shapely.geometry.shape(self._search_intersects).bounds
 
-        resampling_enum = normalize_resampling_method(resampling)
+        return keys, aoi, normalize_resampling_method(resampling)
 
-        array, grid, nodata, band_names = _read_first_asset(self._href(keys[0]), keys[0], aoi)
+    def _assemble(
+        self, keys: list[str], first: tuple, others: Sequence[tuple], mask: bool
+    ) -> EEORasterDataset:
+        """Stack the assets read by a load into its dataset, masking if asked."""
+        array, grid, nodata, band_names = first
         arrays = [array]
-        for key in keys[1:]:
-            other, other_names = _read_onto_grid(self._href(key), key, grid, resampling_enum)
+        for other, other_names in others:
             arrays.append(other)
             band_names.extend(other_names)
 
@@ -812,6 +1029,331 @@ class STACSearchResult(Sequence[STACItem]):
             )
         return self._items[index]
 
+    def iter_load(
+        self,
+        assets: str | Sequence[str],
+        *,
+        bbox: Sequence[float] | None = None,
+        crop: bool = True,
+        mask: bool = False,
+        resampling: ResamplingMethod | Any = "nearest",
+        max_workers: int | None = None,
+        order: LoadOrder = "completed",
+        on_error: OnError = "raise",
+    ) -> Iterator[tuple[STACItem, EEORasterDataset]]:
+        """Load every item concurrently, yielding each scene as it is ready.
+
+        Each item is read with :meth:`STACItem.load` on a bounded thread pool.
+        At most ``max_workers`` scenes are being read or waiting to be yielded
+        at any time, so memory stays bounded however many items the search
+        returned.
+
+        Parameters
+        ----------
+        assets : str or sequence of str
+            Asset key or keys to load from every item, as for
+            :meth:`STACItem.load`.
+        bbox, crop, mask, resampling
+            Passed to :meth:`STACItem.load` for every item.
+        max_workers : int or None, default None
+            Maximum number of items loaded at once. None uses 4. Each item
+            also fetches its own assets concurrently.
+        order : {"completed", "chronological"}, default "completed"
+            ``"completed"`` yields each scene as soon as it has loaded, so a
+            slow scene never holds up the others. ``"chronological"`` yields
+            them oldest first, in the order of this result, holding back
+            scenes that finish early.
+        on_error : {"raise", "skip"}, default "raise"
+            ``"raise"`` stops at the first item that fails to load and raises
+            its error. ``"skip"`` leaves that item out and carries on.
+
+        Yields
+        ------
+        tuple of (STACItem, EEORasterDataset)
+            Each item with the dataset loaded from it.
+
+        Raises
+        ------
+        ValidationError
+            If ``max_workers``, ``order`` or ``on_error`` is invalid (raised
+            by the call, before anything is loaded).
+        Exception
+            With ``on_error="raise"``, whatever :meth:`STACItem.load` raised
+            for the failing item.
+
+        Notes
+        -----
+        Items not yet started are cancelled when the iterator is closed early
+        (by ``break``-ing out of the loop, for instance) or when an item
+        fails under ``on_error="raise"``. Loads already running are allowed
+        to finish first.
+
+        Examples
+        --------
+        >>> results = eeo.stac_search(
+        ...     "sentinel-2-l2a", bbox=(11.0, 46.5, 11.2, 46.7),
+        ...     datetime="2023-06-01/2023-08-31",
+        ... )  # doctest: +SKIP
+        >>> for item, scene in results.iter_load(["B04", "B08"], max_workers=8):
+        ...     scene.ndvi(red="B04", nir="B08").save_raster(f"{item.id}.tif")  # doctest: +SKIP
+        """
+        if max_workers is not None:
+            _positive_int("max_workers", max_workers)
+        if order not in ("completed", "chronological"):
+            raise ValidationError(f'order must be "completed" or "chronological"; got {order!r}')
+        if on_error not in ("raise", "skip"):
+            raise ValidationError(f'on_error must be "raise" or "skip"; got {on_error!r}')
+
+        def load(item: STACItem) -> EEORasterDataset:
+            return item.load(assets, bbox=bbox, crop=crop, mask=mask, resampling=resampling)
+
+        return self._stream(load, max_workers or _DEFAULT_ITEM_WORKERS, order, on_error)
+
+    def _stream(
+        self, load: Any, workers: int, order: LoadOrder, on_error: OnError
+    ) -> Iterator[tuple[STACItem, EEORasterDataset]]:
+        """Run ``load`` over the items, keeping at most ``workers`` in flight."""
+        queue = iter(self._items)
+        # Submitted items, oldest first, until they are yielded or skipped.
+        pending: deque[tuple[STACItem, Any]] = deque()
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eeo-stac")
+        try:
+            while True:
+                for item in itertools.islice(queue, workers - len(pending)):
+                    pending.append((item, pool.submit(load, item)))
+                if not pending:
+                    return
+
+                if order == "chronological":
+                    item, future = pending.popleft()
+                else:
+                    done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                    # Of the scenes that are ready, the oldest goes first.
+                    item, future = next(entry for entry in pending if entry[1] in done)
+                    pending.remove((item, future))
+
+                try:
+                    dataset = future.result()
+                except Exception:
+                    if on_error == "raise":
+                        raise
+                    continue
+                yield item, dataset
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def load_all(
+        self,
+        assets: str | Sequence[str],
+        *,
+        bbox: Sequence[float] | None = None,
+        crop: bool = True,
+        mask: bool = False,
+        resampling: ResamplingMethod | Any = "nearest",
+        max_workers: int | None = None,
+        on_error: OnError = "raise",
+    ) -> list[EEORasterDataset]:
+        """Load every item concurrently into a list of datasets.
+
+        Parameters
+        ----------
+        assets : str or sequence of str
+            Asset key or keys to load from every item, as for
+            :meth:`STACItem.load`.
+        bbox, crop, mask, resampling
+            Passed to :meth:`STACItem.load` for every item.
+        max_workers : int or None, default None
+            Maximum number of items loaded at once. None uses 4.
+        on_error : {"raise", "skip"}, default "raise"
+            ``"raise"`` stops at the first item that fails to load and raises
+            its error. ``"skip"`` leaves that item out of the list.
+
+        Returns
+        -------
+        list of EEORasterDataset
+            One dataset per loaded item, oldest first; each carries its
+            ``timestamp`` and, in ``attrs["stac_item"]``, the item id.
+
+        Raises
+        ------
+        ValidationError
+            If ``max_workers`` or ``on_error`` is invalid.
+        Exception
+            With ``on_error="raise"``, whatever :meth:`STACItem.load` raised
+            for the failing item.
+
+        Notes
+        -----
+        Every scene is held in memory at once. To process a long series
+        scene by scene, use :meth:`iter_load`, which keeps only a few in
+        flight.
+
+        Examples
+        --------
+        >>> scenes = results.load_all(["B04", "B08"], max_workers=8)  # doctest: +SKIP
+        >>> [scene.timestamp for scene in scenes]  # doctest: +SKIP
+        """
+        return [
+            dataset
+            for _, dataset in self.iter_load(
+                assets,
+                bbox=bbox,
+                crop=crop,
+                mask=mask,
+                resampling=resampling,
+                max_workers=max_workers,
+                order="chronological",
+                on_error=on_error,
+            )
+        ]
+
+    def to_cube(
+        self,
+        assets: str | Sequence[str],
+        *,
+        grid: EEORasterDataset | None = None,
+        bbox: Sequence[float] | None = None,
+        crop: bool = True,
+        mask: bool = False,
+        resampling: ResamplingMethod | Any = "nearest",
+        max_workers: int | None = None,
+    ) -> EEOTimeSeries:
+        """Load every item onto one shared grid, as a ``(time, band, y, x)`` cube.
+
+        The cube is allocated once and every asset of every item is read
+        straight into its slice of it, so each pixel is fetched and copied
+        once. An asset already on the grid (same CRS and resolution, pixel
+        aligned) is read as a plain window; only the others are warped.
+
+        Parameters
+        ----------
+        assets : str or sequence of str
+            Asset key or keys to load from every item, in band order, as for
+            :meth:`STACItem.load`.
+        grid : EEORasterDataset or None, default None
+            Dataset whose CRS, transform and shape every item is read onto.
+            None uses the first item's grid: its first asset, cropped to
+            ``bbox`` as :meth:`STACItem.load` would crop it.
+        bbox : sequence of float or None, default None
+            Area to read, as ``(minx, miny, maxx, maxy)`` in WGS 84 lon/lat
+            degrees, when no ``grid`` is given. None uses the search's AOI.
+        crop : bool, default True
+            Whether to crop the first item's grid at all. False reads whole
+            scenes and cannot be combined with ``bbox``.
+        mask : bool, default False
+            If True, set pixels outside the search geometry to nodata at every
+            time step. Requires a search made with ``intersects``.
+        resampling : str or rasterio.enums.Resampling, default "nearest"
+            Method used for assets that have to be warped onto the grid.
+        max_workers : int or None, default None
+            Maximum number of assets read at once, across all items. None
+            uses 8.
+
+        Returns
+        -------
+        EEOTimeSeries
+            One step per item, oldest first, each with the item's timestamp
+            and, in its ``attrs``, the item id, collection and assets. The
+            dtype is the common dtype of the first item's assets. Missing
+            pixels — the asset's own nodata, or grid cells a scene does not
+            cover — hold one nodata value for the whole cube: the first
+            item's, or NaN for floats and 0 for integers when it declares
+            none.
+
+        Raises
+        ------
+        ValidationError
+            If the result is empty, an item lacks one of ``assets``, ``grid``
+            is not a georeferenced dataset or is combined with ``bbox``,
+            ``bbox`` is combined with ``crop=False``, ``mask=True`` without a
+            search geometry, ``max_workers`` is not a positive integer, or an
+            item's asset has a different band count from the first item's.
+
+        Notes
+        -----
+        The whole cube is held in memory: ``len(self) x bands x height x
+        width`` pixels of the cube's dtype. Crop to the area you need, or
+        stream scene by scene with :meth:`iter_load`, when that is too much.
+
+        Examples
+        --------
+        >>> results = eeo.stac_search(
+        ...     "sentinel-2-l2a", bbox=(11.0, 46.5, 11.2, 46.7),
+        ...     datetime="2023-06-01/2023-08-31", cloud_cover=20,
+        ... )  # doctest: +SKIP
+        >>> cube = results.to_cube(["B04", "B08"])  # doctest: +SKIP
+        >>> cube.to_array().shape  # doctest: +SKIP
+        (9, 2, 2213, 1551)
+        >>> cube[0].ndvi(red="B04", nir="B08")  # doctest: +SKIP
+        """
+        if not self._items:
+            raise ValidationError("the search result is empty; there is nothing to stack")
+        if max_workers is not None:
+            _positive_int("max_workers", max_workers)
+        if grid is not None and bbox is not None:
+            raise ValidationError(
+                "grid fixes the area to read and cannot be combined with a bbox; "
+                "pass one or the other"
+            )
+        first = self._items[0]
+        keys, aoi, resampling_enum = first._plan_load(assets, bbox, crop, mask, resampling)
+        for item in self._items[1:]:
+            item._resolve_assets(keys)
+
+        # The first item's headers fix the cube's grid, dtype, nodata and bands.
+        layouts = [
+            _cube_layout(first._href(key), key, aoi if index == 0 and grid is None else None)
+            for index, key in enumerate(keys)
+        ]
+        target = layouts[0][0] if grid is None else _template_grid(grid)
+        dtype = np.result_type(*(layout[1] for layout in layouts))
+        nodata = layouts[0][2]
+        if nodata is None:
+            nodata = float("nan") if np.issubdtype(dtype, np.floating) else 0
+        band_names = [name for layout in layouts for name in layout[3]]
+        counts = [len(layout[3]) for layout in layouts]
+        offsets = np.cumsum([0, *counts])
+
+        cube = np.empty((len(self._items), offsets[-1], target.height, target.width), dtype=dtype)
+        reads = [
+            (item._href(key), key, cube[step, offsets[band] : offsets[band + 1]])
+            for step, item in enumerate(self._items)
+            for band, key in enumerate(keys)
+        ]
+        workers = min(len(reads), max_workers or _DEFAULT_ASSET_WORKERS)
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eeo-stac")
+        try:
+            futures = [
+                pool.submit(_read_into, href, key, target, resampling_enum, out, nodata)
+                for href, key, out in reads
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        if mask:
+            geometry = gpd.GeoSeries(
+                [shapely.geometry.shape(first._search_intersects)], crs="EPSG:4326"
+            ).to_crs(target.crs)
+            outside = geometry_mask(
+                geometry, out_shape=(target.height, target.width), transform=target.transform
+            )
+            cube[:, :, outside] = nodata
+
+        return EEOTimeSeries(
+            cube,
+            timestamps=[item.timestamp for item in self._items],
+            transform=target.transform,
+            crs=target.crs,
+            nodata=nodata,
+            band_names=band_names,
+            attrs=[
+                {"stac_item": item.id, "stac_collection": item.collection, "stac_assets": keys}
+                for item in self._items
+            ],
+        )
+
     def __repr__(self) -> str:
         """Return a one-line summary: item count, time span, and collections."""
         collections = ", ".join(self._collections) or "no collection"
@@ -824,6 +1366,18 @@ class STACSearchResult(Sequence[STACItem]):
         return f"<STACSearchResult: {len(self._items)} items{span} ({collections})>"
 
 
+def _template_grid(grid: Any) -> _Grid:
+    """Return the grid of a template dataset passed as ``grid``."""
+    if not isinstance(grid, EEORasterDataset):
+        raise ValidationError(
+            f"grid must be an EEORasterDataset to take the grid from; got {type(grid).__name__}"
+        )
+    if grid.get_crs() is None:
+        raise ValidationError("grid must be georeferenced; this dataset declares no CRS")
+    height, width = grid.get_shape()
+    return _Grid(grid.get_crs(), grid.get_transform(), width, height)
+
+
 def _validate_collection(collection: str | Sequence[str]) -> list[str]:
     """Normalize the collection argument to a non-empty list of ids."""
     if isinstance(collection, str):
@@ -1064,6 +1618,13 @@ def stac_search(
     client = _open_catalog(catalog, sign)
     found = client.search(**params)
 
+    return _search_result(found.items(), collections, catalog, params)
+
+
+def _search_result(
+    items: Iterable[Any], collections: list[str], catalog: str, params: Mapping[str, Any]
+) -> STACSearchResult:
+    """Wrap the pystac items a search returned, carrying its AOI on each."""
     return STACSearchResult(
         [
             STACItem(
@@ -1071,10 +1632,79 @@ def stac_search(
                 search_bbox=params.get("bbox"),
                 search_intersects=params.get("intersects"),
             )
-            for item in found.items()
+            for item in items
         ],
         collections=collections,
         catalog=catalog,
         bbox=params.get("bbox"),
         intersects=params.get("intersects"),
     )
+
+
+async def _apages(found: Any) -> AsyncIterator[Any]:
+    """Yield the pages of a pystac-client search, each fetched off the event loop."""
+    pages = found.pages()
+    while True:
+        # pystac-client requests the next page when the iterator advances.
+        page = await asyncio.to_thread(next, pages, None)
+        if page is None:
+            return
+        yield page
+
+
+async def astac_search(
+    collection: str | Sequence[str],
+    *,
+    bbox: Sequence[float] | None = None,
+    intersects: IntersectsSpec | None = None,
+    datetime: DatetimeSpec | None = None,
+    cloud_cover: float | None = None,
+    limit: int | None = None,
+    catalog: str = PLANETARY_COMPUTER_STAC_URL,
+    sign: bool | None = None,
+) -> STACSearchResult:
+    """Search a STAC catalog like :func:`stac_search`, without blocking the event loop.
+
+    Opening the catalog and fetching each page of results run in the event
+    loop's default executor, one request at a time, while the coroutine
+    awaits them; other tasks keep running in between.
+
+    Parameters
+    ----------
+    collection, bbox, intersects, datetime, cloud_cover, limit, catalog, sign
+        As for :func:`stac_search`.
+
+    Returns
+    -------
+    STACSearchResult
+        The same result :func:`stac_search` returns. Load its items with
+        :meth:`STACItem.aload` to stay asynchronous.
+
+    Raises
+    ------
+    MissingDependencyError
+        If the ``stac`` extra is not installed.
+    ValidationError
+        As for :func:`stac_search`; raised before any request is made.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> async def ndvi_scenes():
+    ...     results = await eeo.io.astac_search(
+    ...         "sentinel-2-l2a", bbox=(11.0, 46.5, 11.2, 46.7), limit=5
+    ...     )
+    ...     return await asyncio.gather(*(item.aload(["B04", "B08"]) for item in results))
+    >>> scenes = asyncio.run(ndvi_scenes())  # doctest: +SKIP
+    """
+    collections = _validate_collection(collection)
+    params = _search_parameters(collections, bbox, intersects, datetime, cloud_cover, limit)
+
+    client = await asyncio.to_thread(_open_catalog, catalog, sign)
+    # Preparing the search can itself contact the catalog.
+    found = await asyncio.to_thread(client.search, **params)
+
+    items: list[Any] = []
+    async for page in _apages(found):
+        items.extend(page.items)
+    return _search_result(items, collections, catalog, params)
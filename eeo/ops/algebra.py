@@ -1,9 +1,17 @@
-"""Pixel-wise raster algebra operations."""
+"""Pixel-wise raster algebra operations.
+
+Every operation here is element-wise, so it runs block by block through
+:func:`eeo.core.blocks.map_elementwise`: only one window of each operand (sized
+by the ``block_budget`` option) is in memory at a time.
+"""
+
+import operator
+from functools import partial
 
 import numpy as np
-import rasterio as rio
 
-from eeo.common import align_raster_to_target, apply_nodata_contract, get_nodata
+from eeo.common import align_raster_to_target
+from eeo.core.blocks import map_elementwise
 from eeo.core.core import EEORasterDataset
 from eeo.core.decorators import eeo_raster_op
 from eeo.core.exceptions import AlignmentError
@@ -15,36 +23,47 @@ _ALIGN_MISMATCH = (
 )
 
 
-def _write_result(ds: EEORasterDataset, data, nodata) -> EEORasterDataset:
-    """Write ``data`` into a new in-memory raster sharing ``ds``'s georeferencing.
+def _align_operand(ds, other, *, auto_align, method):
+    """Return ``other`` ready to combine with ``ds`` pixel by pixel.
 
-    The output dtype and nodata value are taken from ``data`` and ``nodata``
-    so the result records the dtype and nodata the operation actually produced.
+    A raster operand on a different grid is resampled onto ``ds``'s grid when
+    ``auto_align`` is True (and rejected otherwise); a scalar operand is
+    returned unchanged.
     """
-    meta = ds.get_metadata()
-    meta.update(dtype=data.dtype, nodata=nodata)
-    memfile = rio.io.MemoryFile()
-    out_ds = memfile.open(**meta)
-    out_ds.write(data)
-    return EEORasterDataset.from_rasterio(out_ds)
+    if not isinstance(other, EEORasterDataset):
+        return other
+    if ds.get_shape() != other.get_shape() or ds.get_transform() != other.get_transform():
+        if not auto_align:
+            raise AlignmentError(_ALIGN_MISMATCH.format(other=other.get_shape(), ds=ds.get_shape()))
+        other = align_raster_to_target(other, ds, method=method)
+    return other
+
+
+def _safe_divide(src, other):
+    """Divide, writing 0 where the denominator is zero instead of inf/nan."""
+    if np.isscalar(other):
+        return np.zeros_like(src, dtype=np.float32) if other == 0 else src / other
+    # np.where instead of the in-place out=/where= ufunc form so the
+    # expression stays dispatchable to lazy array backends.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quotient = np.divide(src, other)
+    return np.where(other != 0, quotient, np.float32(0))
+
+
+def _power(src, exponent):
+    """Raise ``src`` to ``exponent``, silencing NumPy's invalid/divide warnings."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return src**exponent
 
 
-def _resolve_operand(ds, other, *, auto_align, method):
-    """Return ``(other_array, other_nodata)`` for a raster or scalar operand.
+def _clamped_sqrt(src):
+    """Square root with negative pixels clamped to 0."""
+    return np.sqrt(np.maximum(src, 0))
 
-    Aligns a raster operand onto ``ds``'s grid when needed; a scalar operand
-    is returned unchanged with a None nodata (scalars carry no nodata).
-    """
-    if isinstance(other, EEORasterDataset):
-        if ds.get_shape() != other.get_shape() or ds.get_transform() != other.get_transform():
-            if auto_align:
-                other = align_raster_to_target(other, ds, method=method)
-            else:
-                raise AlignmentError(
-                    _ALIGN_MISMATCH.format(other=other.get_shape(), ds=ds.get_shape())
-                )
-        return other.read(), get_nodata(other)
-    return other, None
+
+def _clamped_log(src, base):
+    """Logarithm in ``base`` with pixels clamped to a minimum of 1e-10."""
+    return np.log(np.maximum(src, 1e-10)) / np.log(base)
 
 
 # ARITHMETIC AND ALGEBRA
@@ -55,6 +74,7 @@ def add(
     *,
     auto_align: bool = True,
     method: str = "bilinear",
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Add a raster or scalar to this raster, pixel by pixel.
 
@@ -75,6 +95,9 @@ def add(
     method : str, default "bilinear"
         Resampling method used when ``auto_align`` triggers alignment; one of
         rasterio's resampling names (e.g. ``"nearest"``, ``"bilinear"``).
+    workers : int or None, default None
+        Threads to run the blocks on. None uses the ``num_threads`` option
+        (see :func:`eeo.set_options`); the result is identical for every value.
 
     Returns
     -------
@@ -91,29 +114,22 @@ def add(
     AlignmentError
         If ``other`` is a dataset on a different grid and ``auto_align`` is
         False.
+    ValidationError
+        If ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the full array(s) into memory rather than streaming block-wise.
+    Runs block-wise: peak memory is bounded by the ``block_budget`` option
+    (see :func:`eeo.set_options`), not by the raster size. With ``workers``
+    above 1 the blocks run concurrently.
 
     Examples
     --------
     >>> ds = load_array(np.random.rand(64, 64), crs=4326)
     >>> brighter = ds.add(0.1)
     """
-    ds_nodata = get_nodata(ds)
-    other_data, other_nodata = _resolve_operand(ds, other, auto_align=auto_align, method=method)
-    src = ds.read()
-    result = src + other_data
-
-    operands = [(src, ds_nodata)]
-    if isinstance(other, EEORasterDataset):
-        operands.append((other_data, other_nodata))
-
-    data, out_nodata = apply_nodata_contract(
-        result, operands, fractional=False, ds_nodata=ds_nodata
-    )
-    return _write_result(ds, data, out_nodata)
+    other = _align_operand(ds, other, auto_align=auto_align, method=method)
+    return map_elementwise(operator.add, [ds, other], fractional=False, workers=workers)
 
 
 @eeo_raster_op
@@ -123,6 +139,7 @@ def subtract(
     *,
     auto_align: bool = True,
     method: str = "bilinear",
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Subtract a raster or scalar from this raster, pixel by pixel.
 
@@ -143,6 +160,9 @@ def subtract(
     method : str, default "bilinear"
         Resampling method used when ``auto_align`` triggers alignment; one of
         rasterio's resampling names (e.g. ``"nearest"``, ``"bilinear"``).
+    workers : int or None, default None
+        Threads to run the blocks on. None uses the ``num_threads`` option
+        (see :func:`eeo.set_options`); the result is identical for every value.
 
     Returns
     -------
@@ -159,28 +179,21 @@ def subtract(
     AlignmentError
         If ``other`` is a dataset on a different grid and ``auto_align`` is
         False.
+    ValidationError
+        If ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the full array(s) into memory rather than streaming block-wise.
+    Runs block-wise: peak memory is bounded by the ``block_budget`` option
+    (see :func:`eeo.set_options`), not by the raster size. With ``workers``
+    above 1 the blocks run concurrently.
 
     Examples
     --------
     >>> change = ds_after.subtract(ds_before)
     """
-    ds_nodata = get_nodata(ds)
-    other_data, other_nodata = _resolve_operand(ds, other, auto_align=auto_align, method=method)
-    src = ds.read()
-    result = src - other_data
-
-    operands = [(src, ds_nodata)]
-    if isinstance(other, EEORasterDataset):
-        operands.append((other_data, other_nodata))
-
-    data, out_nodata = apply_nodata_contract(
-        result, operands, fractional=False, ds_nodata=ds_nodata
-    )
-    return _write_result(ds, data, out_nodata)
+    other = _align_operand(ds, other, auto_align=auto_align, method=method)
+    return map_elementwise(operator.sub, [ds, other], fractional=False, workers=workers)
 
 
 @eeo_raster_op
@@ -190,6 +203,7 @@ def multiply(
     *,
     auto_align: bool = True,
     method: str = "bilinear",
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Multiply this raster by a raster or scalar, pixel by pixel.
 
@@ -210,6 +224,9 @@ def multiply(
     method : str, default "bilinear"
         Resampling method used when ``auto_align`` triggers alignment; one of
         rasterio's resampling names (e.g. ``"nearest"``, ``"bilinear"``).
+    workers : int or None, default None
+        Threads to run the blocks on. None uses the ``num_threads`` option
+        (see :func:`eeo.set_options`); the result is identical for every value.
 
     Returns
     -------
@@ -226,28 +243,21 @@ def multiply(
     AlignmentError
         If ``other`` is a dataset on a different grid and ``auto_align`` is
         False.
+    ValidationError
+        If ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the full array(s) into memory rather than streaming block-wise.
+    Runs block-wise: peak memory is bounded by the ``block_budget`` option
+    (see :func:`eeo.set_options`), not by the raster size. With ``workers``
+    above 1 the blocks run concurrently.
 
     Examples
     --------
     >>> scaled = ds.multiply(100)
     """
-    ds_nodata = get_nodata(ds)
-    other_data, other_nodata = _resolve_operand(ds, other, auto_align=auto_align, method=method)
-    src = ds.read()
-    result = src * other_data
-
-    operands = [(src, ds_nodata)]
-    if isinstance(other, EEORasterDataset):
-        operands.append((other_data, other_nodata))
-
-    data, out_nodata = apply_nodata_contract(
-        result, operands, fractional=False, ds_nodata=ds_nodata
-    )
-    return _write_result(ds, data, out_nodata)
+    other = _align_operand(ds, other, auto_align=auto_align, method=method)
+    return map_elementwise(operator.mul, [ds, other], fractional=False, workers=workers)
 
 
 @eeo_raster_op
@@ -258,6 +268,7 @@ def divide(
     auto_align: bool = True,
     method: str = "bilinear",
     safe: bool = True,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Divide this raster by a raster or scalar, pixel by pixel.
 
@@ -282,6 +293,9 @@ def divide(
         If True, pixels where the denominator is zero are set to 0 instead of
         producing ``inf``/``nan``. If False, division follows NumPy semantics
         (zero denominators yield ``inf``/``nan`` and emit a warning).
+    workers : int or None, default None
+        Threads to run the blocks on. None uses the ``num_threads`` option
+        (see :func:`eeo.set_options`); the result is identical for every value.
 
     Returns
     -------
@@ -295,43 +309,29 @@ def divide(
     AlignmentError
         If ``other`` is a dataset on a different grid and ``auto_align`` is
         False.
+    ValidationError
+        If ``workers`` is not a positive int.
 
     Notes
     -----
-    Reads the full array(s) into memory rather than streaming block-wise.
+    Runs block-wise: peak memory is bounded by the ``block_budget`` option
+    (see :func:`eeo.set_options`), not by the raster size. With ``workers``
+    above 1 the blocks run concurrently.
 
     Examples
     --------
     >>> ratio = ds_nir.divide(ds_red)
     >>> halved = ds.divide(2)
     """
-    ds_nodata = get_nodata(ds)
-    src = ds.read()
-    other_data, other_nodata = _resolve_operand(ds, other, auto_align=auto_align, method=method)
-
-    # ---- SAFE DIVIDE ----
-    if safe:
-        if np.isscalar(other_data):
-            result = np.zeros_like(src, dtype=np.float32) if other_data == 0 else src / other_data
-        else:
-            # np.where instead of the in-place out=/where= ufunc form so the
-            # expression stays dispatchable to lazy array backends.
-            with np.errstate(divide="ignore", invalid="ignore"):
-                quotient = np.divide(src, other_data)
-            result = np.where(other_data != 0, quotient, np.float32(0))
-    else:
-        result = src / other_data
-
-    operands = [(src, ds_nodata)]
-    if isinstance(other, EEORasterDataset):
-        operands.append((other_data, other_nodata))
-
-    data, out_nodata = apply_nodata_contract(result, operands, fractional=True, ds_nodata=ds_nodata)
-    return _write_result(ds, data, out_nodata)
+    other = _align_operand(ds, other, auto_align=auto_align, method=method)
+    kernel = _safe_divide if safe else operator.truediv
+    return map_elementwise(kernel, [ds, other], fractional=True, workers=workers)
 
 
 @eeo_raster_op
-def power(ds: EEORasterDataset, exponent: int | float) -> EEORasterDataset:
+def power(
+    ds: EEORasterDataset, exponent: int | float, *, workers: int | None = None
+) -> EEORasterDataset:
     """Raise each pixel to a scalar power.
 
     Parameters
@@ -340,6 +340,9 @@ def power(ds: EEORasterDataset, exponent: int | float) -> EEORasterDataset:
         Input raster dataset.
     exponent : int or float
         Scalar exponent applied to every pixel.
+    workers : int or None, default None
+        Threads to run the blocks on. None uses the ``num_threads`` option
+        (see :func:`eeo.set_options`); the result is identical for every value.
 
     Returns
     -------
@@ -350,30 +353,31 @@ def power(ds: EEORasterDataset, exponent: int | float) -> EEORasterDataset:
         truncating). Nodata pixels are nodata in the output — NaN for floating
         outputs, the input's integer sentinel for integer outputs.
 
+    Raises
+    ------
+    ValidationError
+        If ``workers`` is not a positive int.
+
     Notes
     -----
     Follows NumPy's ``**`` semantics; a negative pixel raised to a
     non-integer exponent yields ``nan`` where it is not masked as nodata.
-    Reads the full array into memory rather than streaming block-wise.
+    Runs block-wise: peak memory is bounded by the ``block_budget`` option
+    (see :func:`eeo.set_options`), not by the raster size. With ``workers``
+    above 1 the blocks run concurrently.
 
     Examples
     --------
     >>> squared = ds.power(2)
     """
-    ds_nodata = get_nodata(ds)
-    src = ds.read()
-    with np.errstate(invalid="ignore", divide="ignore"):
-        result = src**exponent
-
-    data, out_nodata = apply_nodata_contract(
-        result, [(src, ds_nodata)], fractional=False, ds_nodata=ds_nodata
+    return map_elementwise(
+        partial(_power, exponent=exponent), [ds], fractional=False, workers=workers
     )
-    return _write_result(ds, data, out_nodata)
 
 
 # TRANSFORMATIONS
 @eeo_raster_op
-def sqrt(ds: EEORasterDataset) -> EEORasterDataset:
+def sqrt(ds: EEORasterDataset, *, workers: int | None = None) -> EEORasterDataset:
     """Take the pixel-wise square root.
 
     Negative pixels are clamped to 0 before the root, so the result never
@@ -383,6 +387,9 @@ def sqrt(ds: EEORasterDataset) -> EEORasterDataset:
     ----------
     ds : EEORasterDataset
         Input raster dataset.
+    workers : int or None, default None
+        Threads to run the blocks on. None uses the ``num_threads`` option
+        (see :func:`eeo.set_options`); the result is identical for every value.
 
     Returns
     -------
@@ -391,26 +398,28 @@ def sqrt(ds: EEORasterDataset) -> EEORasterDataset:
         truncated to an integer dtype). Nodata pixels are nodata (NaN) in the
         output.
 
+    Raises
+    ------
+    ValidationError
+        If ``workers`` is not a positive int.
+
     Notes
     -----
-    Reads the full array into memory rather than streaming block-wise.
+    Runs block-wise: peak memory is bounded by the ``block_budget`` option
+    (see :func:`eeo.set_options`), not by the raster size. With ``workers``
+    above 1 the blocks run concurrently.
 
     Examples
     --------
     >>> rooted = ds.sqrt()
     """
-    ds_nodata = get_nodata(ds)
-    src = ds.read()
-    result = np.sqrt(np.maximum(src, 0))
-
-    data, out_nodata = apply_nodata_contract(
-        result, [(src, ds_nodata)], fractional=True, ds_nodata=ds_nodata
-    )
-    return _write_result(ds, data, out_nodata)
+    return map_elementwise(_clamped_sqrt, [ds], fractional=True, workers=workers)
 
 
 @eeo_raster_op
-def log(ds: EEORasterDataset, base: int | float = np.e) -> EEORasterDataset:
+def log(
+    ds: EEORasterDataset, base: int | float = np.e, *, workers: int | None = None
+) -> EEORasterDataset:
     """Take the pixel-wise logarithm.
 
     Pixels are clamped to a minimum of ``1e-10`` before the logarithm, so
@@ -422,6 +431,9 @@ def log(ds: EEORasterDataset, base: int | float = np.e) -> EEORasterDataset:
         Input raster dataset.
     base : int or float, default ``numpy.e``
         Logarithm base. Defaults to the natural logarithm.
+    workers : int or None, default None
+        Threads to run the blocks on. None uses the ``num_threads`` option
+        (see :func:`eeo.set_options`); the result is identical for every value.
 
     Returns
     -------
@@ -430,33 +442,36 @@ def log(ds: EEORasterDataset, base: int | float = np.e) -> EEORasterDataset:
         truncated to an integer dtype). Nodata pixels are nodata (NaN) in the
         output.
 
+    Raises
+    ------
+    ValidationError
+        If ``workers`` is not a positive int.
+
     Notes
     -----
-    Reads the full array into memory rather than streaming block-wise.
+    Runs block-wise: peak memory is bounded by the ``block_budget`` option
+    (see :func:`eeo.set_options`), not by the raster size. With ``workers``
+    above 1 the blocks run concurrently.
 
     Examples
     --------
     >>> natural = ds.log()
     >>> base10 = ds.log(base=10)
     """
-    ds_nodata = get_nodata(ds)
-    src = ds.read()
-    result = np.log(np.maximum(src, 1e-10)) / np.log(base)
-
-    data, out_nodata = apply_nodata_contract(
-        result, [(src, ds_nodata)], fractional=True, ds_nodata=ds_nodata
-    )
-    return _write_result(ds, data, out_nodata)
+    return map_elementwise(partial(_clamped_log, base=base), [ds], fractional=True, workers=workers)
 
 
 @eeo_raster_op
-def absolute(ds: EEORasterDataset) -> EEORasterDataset:
+def absolute(ds: EEORasterDataset, *, workers: int | None = None) -> EEORasterDataset:
     """Take the pixel-wise absolute value.
 
     Parameters
     ----------
     ds : EEORasterDataset
         Input raster dataset.
+    workers : int or None, default None
+        Threads to run the blocks on. None uses the ``num_threads`` option
+        (see :func:`eeo.set_options`); the result is identical for every value.
 
     Returns
     -------
@@ -465,21 +480,21 @@ def absolute(ds: EEORasterDataset) -> EEORasterDataset:
         narrowed to float32). Nodata pixels are nodata in the output — NaN for
         floating outputs, the input's integer sentinel for integer outputs.
 
+    Raises
+    ------
+    ValidationError
+        If ``workers`` is not a positive int.
+
     Notes
     -----
-    Reads the full array into memory rather than streaming block-wise. Because
-    nodata pixels are masked, a negative nodata sentinel is not turned into its
+    Runs block-wise: peak memory is bounded by the ``block_budget`` option
+    (see :func:`eeo.set_options`), not by the raster size. With ``workers``
+    above 1 the blocks run concurrently. Because nodata
+    pixels are masked, a negative nodata sentinel is not turned into its
     magnitude in the output.
 
     Examples
     --------
     >>> magnitude = ds.absolute()
     """
-    ds_nodata = get_nodata(ds)
-    src = ds.read()
-    result = np.abs(src)
-
-    data, out_nodata = apply_nodata_contract(
-        result, [(src, ds_nodata)], fractional=False, ds_nodata=ds_nodata
-    )
-    return _write_result(ds, data, out_nodata)
+    return map_elementwise(np.abs, [ds], fractional=False, workers=workers)
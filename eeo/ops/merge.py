@@ -3,15 +3,13 @@
 from collections.abc import Iterable
 
 import numpy as np
-import rasterio as rio
 from rasterio.merge import merge
 
-from eeo.common import is_rasterio_backed, normalize_resampling_method
+from eeo.common import get_nodata, normalize_resampling_method
 from eeo.core.core import EEORasterDataset
 from eeo.core.decorators import eeo_raster_op
 from eeo.core.exceptions import (
     AlignmentError,
-    BackendError,
     CRSMismatchError,
     ValidationError,
 )
@@ -57,15 +55,13 @@ def mosaic(
     Returns
     -------
     EEORasterDataset or None
-        New rasterio-backed mosaic in the dtype ``rasterio.merge.merge``
+        New NumPy-backed mosaic in the dtype ``rasterio.merge.merge``
         produces (the inputs' common dtype), carrying ``ds``'s nodata value;
         or None if ``save_path`` was given. Overlapping nodata pixels are
         filled from other tiles where possible.
 
     Raises
     ------
-    BackendError
-        If ``ds`` is not backed by rasterio.
     ValidationError
         If ``others`` is empty, or ``names`` is given and its length does not
         match the mosaic's band count.
@@ -75,20 +71,15 @@ def mosaic(
     Notes
     -----
     Loads every input tile into memory via ``rasterio.merge.merge`` rather
-    than streaming block-wise. With ``save_path`` the mosaic is written to
+    than streaming block-wise; tiles that are not rasterio-backed are
+    promoted to in-memory rasterio datasets first, since the merge reads
+    through GDAL. With ``save_path`` the mosaic is written to
     disk as a side effect and None is returned.
 
     Examples
     --------
     >>> mosaicked = ds.mosaic([ds_tile_2, ds_tile_3])
     """
-    # Ensure mosaic for only rasterio-backend datasets
-    if not is_rasterio_backed(ds):
-        raise BackendError(
-            "mosaic requires a rasterio-backed dataset; this dataset uses the "
-            "NumPy backend. Call .to_rasterio() first."
-        )
-
     # normalize resampling
     resampling_method = normalize_resampling_method(resampling_method)
 
@@ -116,26 +107,17 @@ def mosaic(
 
         src_datasets.append(obj)
 
-    # extract datasets and perform mosaics
-    datasets = [d.ds for d in src_datasets]
-    mosaic_data, out_transform = merge(datasets, resampling=resampling_method, **kwargs)
-
-    # modify metadata
-    meta = ds.get_metadata().copy()
-    meta.update(
-        transform=out_transform,
-        height=mosaic_data.shape[1],
-        width=mosaic_data.shape[2],
-        count=mosaic_data.shape[0],
-        dtype=mosaic_data.dtype,
+    # rasterio.merge reads its sources through GDAL: promote non-rasterio
+    # backends (no-op for those already rasterio). The promoted datasets are
+    # held in this list so they stay open for the merge.
+    src_datasets = [d.to_rasterio() for d in src_datasets]
+    mosaic_data, out_transform = merge(
+        [d.ds for d in src_datasets], resampling=resampling_method, **kwargs
     )
 
-    # write to memory file
-    memfile = rio.io.MemoryFile()
-    out_ds = memfile.open(**meta)
-    out_ds.write(mosaic_data)
-
-    result = EEORasterDataset.from_rasterio(out_ds)
+    result = EEORasterDataset.from_array(
+        mosaic_data, transform=out_transform, crs=target_crs, nodata=get_nodata(ds)
+    )
     # Band identity is unchanged by mosaicking - only the extent grows - so the
     # primary's names carry over unless the caller overrides them.
     result.band_names = ds.band_names if names is None else names
@@ -177,14 +159,12 @@ def stack(
     Returns
     -------
     EEORasterDataset
-        New rasterio-backed dataset whose band count is the sum of all inputs'
+        New NumPy-backed dataset whose band count is the sum of all inputs'
         band counts, in the common dtype ``numpy.vstack`` promotes to, carrying
         ``ds``'s nodata value.
 
     Raises
     ------
-    BackendError
-        If ``ds`` is not backed by rasterio.
     ValidationError
         If ``others`` is empty, or ``names`` is given and its length does not
         match the stacked band count.
@@ -204,13 +184,6 @@ def stack(
     >>> rgb = ds_red.stack([ds_green, ds_blue])
     >>> rgb = ds_red.stack([ds_green, ds_blue], names=["red", "green", "blue"])
     """
-    # Ensure stack for only rasterio-backend datasets
-    if not is_rasterio_backed(ds):
-        raise BackendError(
-            "stack requires a rasterio-backed dataset; this dataset uses the "
-            "NumPy backend. Call .to_rasterio() first."
-        )
-
     # normalize inputs
     others = [others] if isinstance(others, EEORasterDataset) else list(others)
 
@@ -237,16 +210,9 @@ def stack(
     # stack the arrays
     stacked = np.vstack(arrays)
 
-    # metadata update
-    meta = ds.get_metadata().copy()
-    meta.update(count=stacked.shape[0], dtype=stacked.dtype)
-
-    # save to memory file
-    memfile = rio.io.MemoryFile()
-    out_ds = memfile.open(**meta)
-    out_ds.write(stacked)
-
-    result = EEORasterDataset.from_rasterio(out_ds)
+    result = EEORasterDataset.from_array(
+        stacked, transform=ds.get_transform(), crs=ds.get_crs(), nodata=get_nodata(ds)
+    )
     if names is None:
         # Each output band is exactly one input band, so names concatenate in
         # the same order the bands do.
@@ -1,16 +1,19 @@
-"""Preprocessing operations: clip, resample, reproject, and normalize."""
+"""Preprocessing operations: clip, resample, reproject, normalize, and overviews."""
 
-from .clip import clip_raster_with_bbox, clip_raster_with_vector
+from .clip import clip_raster_with_bbox, clip_raster_with_features, clip_raster_with_vector
 from .normalize import normalize_min_max, normalize_percentile, standardize
+from .overviews import build_overviews
 from .reproject import reproject_raster
 from .resample import resample
 
 __all__ = [
     "clip_raster_with_bbox",
+    "clip_raster_with_features",
     "clip_raster_with_vector",
     "standardize",
     "normalize_percentile",
     "normalize_min_max",
     "reproject_raster",
     "resample",
+    "build_overviews",
 ]
@@ -1,16 +1,24 @@
 """Clipping operations by bounding box or vector geometry."""
 
 import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
 
 import geopandas as gpd
+import numpy as np
 import rasterio as rio
+from rasterio.features import rasterize
 from rasterio.mask import mask
-from rasterio.windows import from_bounds
+from rasterio.windows import Window, from_bounds
 
-from eeo.common import is_rasterio_backed
+from eeo.common import RASTERIZE_LOCK, get_nodata, label_layers
 from eeo.core import EEORasterDataset
+from eeo.core.adapters import NumpyRasterioAdapter
+from eeo.core.blocks import resolve_workers, tile_windows
 from eeo.core.decorators import eeo_raster_op
-from eeo.core.exceptions import BackendError, ValidationError
+from eeo.core.exceptions import ValidationError
 from eeo.core.types import StrPath
 
 
@@ -36,7 +44,7 @@ def clip_raster_with_vector(
     Parameters
     ----------
     ds : EEORasterDataset
-        Raster to clip. Must be backed by rasterio.
+        Raster to clip.
     vector_file : geopandas.GeoDataFrame or str or path-like
         Clip geometries, either a GeoDataFrame or a path to a vector file
         readable by GeoPandas.
@@ -62,20 +70,20 @@ def clip_raster_with_vector(
     Returns
     -------
     EEORasterDataset
-        New rasterio-backed dataset covering the clipped area, in the same
+        New NumPy-backed dataset covering the clipped area, in the same
         dtype as ``ds``, carrying ``nodata`` (or the raster's existing nodata
         value) in its metadata.
 
     Raises
     ------
-    BackendError
-        If ``ds`` is not backed by rasterio.
     ValidationError
         If ``vector_file`` is neither a GeoDataFrame nor a valid file path.
 
     Notes
     -----
-    Reads the clipped region into memory via ``rasterio.mask.mask``.
+    Reads the clipped region into memory via ``rasterio.mask.mask``, which
+    rasterizes the geometries through GDAL; a dataset that is not
+    rasterio-backed is promoted to an in-memory rasterio dataset first.
 
     Examples
     --------
@@ -83,13 +91,6 @@ def clip_raster_with_vector(
     >>> boundary = gpd.read_file("aoi.geojson")
     >>> clipped = ds.clip_raster_with_vector(boundary)
     """
-    # Ensure clipping for only rasterio-backend datasets
-    if not is_rasterio_backed(ds):
-        raise BackendError(
-            "clip requires a rasterio-backed dataset; this dataset uses the "
-            "NumPy backend. Call .to_rasterio() first."
-        )
-
     # Load vector data
     if isinstance(vector_file, gpd.GeoDataFrame):
         gdf = vector_file
@@ -107,9 +108,12 @@ def clip_raster_with_vector(
 
     shapes = gdf.geometry.values
 
-    # Perform masking
+    # Masking rasterizes through GDAL: promote non-rasterio backends (no-op
+    # if the backend is already rasterio). Held in a name so the promoted
+    # dataset stays open for the mask.
+    source = ds.to_rasterio()
     clipped, clipped_transform = mask(
-        ds.ds,
+        source.ds,
         shapes,
         crop=crop,
         pad=pad,
@@ -118,28 +122,18 @@ def clip_raster_with_vector(
         nodata=nodata,
     )
 
-    # Update metadata
-    meta = ds.get_metadata().copy()
-    meta.update(
-        height=clipped.shape[1],
-        width=clipped.shape[2],
+    result = EEORasterDataset.from_array(
+        clipped,
         transform=clipped_transform,
-        count=clipped.shape[0],
+        crs=ds.get_crs(),
+        nodata=get_nodata(ds) if nodata is None else nodata,
     )
 
-    if nodata is not None:
-        meta["nodata"] = nodata
-
-    # Write to MemoryFile
-    memfile = rio.io.MemoryFile()
-    out_ds = memfile.open(**meta)
-    out_ds.write(clipped)
-
     # Optional preview
     if show_preview:
-        EEORasterDataset.from_rasterio(out_ds).plot_raster(**(plot_kwargs or {}))
+        result.plot_raster(**(plot_kwargs or {}))
 
-    return EEORasterDataset.from_rasterio(out_ds)
+    return result
 
 
 @eeo_raster_op
@@ -151,7 +145,7 @@ def clip_raster_with_bbox(
     Parameters
     ----------
     ds : EEORasterDataset
-        Raster to clip. Must be backed by rasterio.
+        Raster to clip.
     bbox : tuple or list
         Bounding box as ``(minx, miny, maxx, maxy)`` in the raster's CRS
         units.
@@ -164,31 +158,25 @@ def clip_raster_with_bbox(
     Returns
     -------
     EEORasterDataset
-        New rasterio-backed dataset covering the bounding box, in the same
+        New NumPy-backed dataset covering the bounding box, in the same
         dtype as ``ds``, carrying its nodata value unchanged.
 
     Raises
     ------
-    BackendError
-        If ``ds`` is not backed by rasterio.
     ValidationError
         If ``bbox`` is not four values, or does not intersect the raster.
 
     Notes
     -----
-    Reads only the windowed region into memory, not the whole raster.
+    Reads only the windowed region into memory, not the whole raster; for a
+    NumPy-backed raster only that region of its array is copied. The result
+    never shares memory with ``ds``. A box that overhangs the raster edge is
+    cropped to the overlap.
 
     Examples
     --------
     >>> clipped = ds.clip_raster_with_bbox((500000, 4100000, 510000, 4110000))
     """
-    # Ensure rasterio backend
-    if not is_rasterio_backed(ds):
-        raise BackendError(
-            "clip requires a rasterio-backed dataset; this dataset uses the "
-            "NumPy backend. Call .to_rasterio() first."
-        )
-
     # Validate bbox
     if not (isinstance(bbox, (tuple, list)) and len(bbox) == 4):
         raise ValidationError(f"bbox must be (minx, miny, maxx, maxy) — 4 values; got {bbox!r}")
@@ -196,14 +184,14 @@ def clip_raster_with_bbox(
     minx, miny, maxx, maxy = bbox
 
     # Compute window
-    window = from_bounds(minx, miny, maxx, maxy, ds.ds.transform)
+    window = from_bounds(minx, miny, maxx, maxy, ds.get_transform())
     window = window.round_offsets().round_lengths()
 
     # Ensure the bbox actually overlaps the raster. A degenerate box collapses
     # to zero width/height here; a box that lies entirely outside keeps a
     # positive size but does not intersect the raster window, and would
     # otherwise fail later with a cryptic "0x0 dataset" read error.
-    raster_window = rio.windows.Window(0, 0, ds.ds.width, ds.ds.height)
+    raster_window = rio.windows.Window(0, 0, ds.get_width(), ds.get_height())
     if (
         window.width <= 0
         or window.height <= 0
@@ -214,25 +202,334 @@ def clip_raster_with_bbox(
             f"raster bounds: {ds.get_bounds()}, bbox: {bbox}"
         )
 
-    transform = rio.windows.transform(window, ds.ds.transform)
+    # Crop a box that overhangs the raster edge to the part that overlaps it.
+    window = window.intersection(raster_window)
+    transform = rio.windows.transform(window, ds.get_transform())
 
-    # Read clipped data
-    clipped = ds.ds.read(window=window)
+    # Read only the window. A NumPy-backed raster hands out a view of its
+    # array, which is copied so the clip does not alias the source.
+    clipped = ds._adapter.read_window(window)
+    if isinstance(ds._adapter, NumpyRasterioAdapter):
+        clipped = clipped.copy()
 
-    # Update metadata
-    meta = ds.get_metadata().copy()
-    meta.update(
-        height=clipped.shape[1],
-        width=clipped.shape[2],
-        transform=transform,
+    result = EEORasterDataset.from_array(
+        clipped, transform=transform, crs=ds.get_crs(), nodata=get_nodata(ds)
     )
 
-    # Write to MemoryFile
-    memfile = rio.io.MemoryFile()
-    dataset = memfile.open(**meta)
-    dataset.write(clipped)
-
     if show_preview:
-        EEORasterDataset.from_rasterio(dataset).plot_raster(**(plot_kwargs or {}))
+        result.plot_raster(**(plot_kwargs or {}))
+
+    return result
+
+
+def _feature_windows(ds: EEORasterDataset, geometries: gpd.GeoSeries) -> np.ndarray:
+    """Return each feature's ``(row_start, row_stop, col_start, col_stop)`` on ``ds``.
+
+    The outermost pixels holding the feature's bounds (floor of the offsets,
+    ceiling of the ends), as ``rasterio.features.geometry_window`` computes
+    for a north-up raster, clipped to the raster. A feature that misses the
+    raster, or has no geometry, gets an empty window.
+    """
+    inverse = ~ds.get_transform()
+    minx, miny, maxx, maxy = geometries.bounds.to_numpy().T
+    corners_x = np.stack([minx, maxx, maxx, minx])
+    corners_y = np.stack([maxy, maxy, miny, miny])
+    cols = inverse.a * corners_x + inverse.b * corners_y + inverse.c
+    rows = inverse.d * corners_x + inverse.e * corners_y + inverse.f
+    height, width = ds.get_shape()
+    with np.errstate(invalid="ignore"):
+        windows = np.stack(
+            [
+                np.clip(np.floor(rows.min(axis=0)), 0, height),
+                np.clip(np.ceil(rows.max(axis=0)), 0, height),
+                np.clip(np.floor(cols.min(axis=0)), 0, width),
+                np.clip(np.ceil(cols.max(axis=0)), 0, width),
+            ],
+            axis=1,
+        )
+    empty = ~((windows[:, 1] > windows[:, 0]) & (windows[:, 3] > windows[:, 2]))
+    windows[empty] = 0
+    return windows.astype(np.int64)
+
+
+def _sweep_features(
+    ds: EEORasterDataset,
+    geometries: gpd.GeoSeries,
+    windows: np.ndarray,
+    finish: Callable[[int, np.ndarray, np.ndarray], Any],
+    *,
+    all_touched: bool,
+    workers: int,
+) -> Iterator[Any]:
+    """Read every block under ``windows`` once, and ``finish`` each feature's pixels.
+
+    Walks the rows of the source's block grid top to bottom. Each row's
+    blocks that a feature needs are read once and kept until the last
+    feature needing them is finished; a feature is finished (its window cut
+    out of the kept blocks) as soon as the row holding its bottom edge is
+    read. Blocks no feature needs are never read. The features finishing in
+    a row are burned together, with one ``rasterize`` call per label layer
+    (see :func:`~eeo.common.label_layers`) over their joint window, and
+    ``finish`` gets each one's pixels and the mask of the pixels outside it.
+    Yields ``finish``'s results, in the order the features are finished.
+    """
+    first = tile_windows(ds._adapter)[0]
+    block_rows, block_cols = int(first.height), int(first.width)
+    height, width = ds.get_shape()
+    transform = ds.get_transform()
+    features = np.flatnonzero(windows[:, 1] > windows[:, 0])
+    top = windows[features, 0] // block_rows
+    bottom = (windows[features, 1] - 1) // block_rows
+    left = windows[features, 2] // block_cols
+    right = (windows[features, 3] - 1) // block_cols
+
+    # Which blocks some feature needs: a 2-D difference array over the block
+    # grid, one +1/-1 corner set per feature, summed along both axes.
+    grid_rows, grid_cols = -(-height // block_rows), -(-width // block_cols)
+    corners = np.zeros((grid_rows + 1, grid_cols + 1), dtype=np.int64)
+    np.add.at(corners, (top, left), 1)
+    np.add.at(corners, (top, right + 1), -1)
+    np.add.at(corners, (bottom + 1, left), -1)
+    np.add.at(corners, (bottom + 1, right + 1), 1)
+    needed = corners.cumsum(axis=0).cumsum(axis=1)[:grid_rows, :grid_cols] > 0
+
+    # Features in the order they finish, and, after each block row, the
+    # highest block row an unfinished feature still needs.
+    order = np.argsort(bottom, kind="stable")
+    features, top, bottom, left, right = (
+        array[order] for array in (features, top, bottom, left, right)
+    )
+    keep_from = np.minimum.accumulate(np.append(top, grid_rows)[::-1])[::-1]
+    ends = np.searchsorted(bottom, np.arange(grid_rows), side="right")
+    layers = label_layers(geometries, transform, all_touched=all_touched)
+
+    blocks: dict[tuple[int, int], np.ndarray] = {}
+    outside: dict[int, np.ndarray] = {}
+
+    def read(key: tuple[int, int]) -> np.ndarray:
+        row, col = key[0] * block_rows, key[1] * block_cols
+        window = Window(col, row, min(block_cols, width - col), min(block_rows, height - row))
+        return ds._adapter.read_window(window)
+
+    def burn(slots: np.ndarray) -> None:
+        row_start, _, col_start, _ = windows[features[slots]].min(axis=0).tolist()
+        _, row_stop, _, col_stop = windows[features[slots]].max(axis=0).tolist()
+        joint = Window(col_start, row_start, col_stop - col_start, row_stop - row_start)
+        with RASTERIZE_LOCK:
+            labels = rasterize(
+                zip(geometries.values[features[slots]], (slots + 1).tolist(), strict=True),
+                out_shape=(row_stop - row_start, col_stop - col_start),
+                transform=rio.windows.transform(joint, transform),
+                fill=0,
+                all_touched=all_touched,
+                dtype="int32",
+            )
+        for slot in slots.tolist():
+            r0, r1, c0, c1 = windows[features[slot]].tolist()
+            outside[slot] = (
+                labels[r0 - row_start : r1 - row_start, c0 - col_start : c1 - col_start] != slot + 1
+            )
+
+    def cut(slot: int) -> Any:
+        row_start, row_stop, col_start, col_stop = windows[features[slot]].tolist()
+        pixels = np.empty(
+            (ds.get_count(), row_stop - row_start, col_stop - col_start), dtype=ds.get_dtype()
+        )
+        for block_row in range(top[slot], bottom[slot] + 1):
+            for block_col in range(left[slot], right[slot] + 1):
+                block = blocks[block_row, block_col]
+                row, col = block_row * block_rows, block_col * block_cols
+                r0, r1 = max(row_start, row), min(row_stop, row + block.shape[1])
+                c0, c1 = max(col_start, col), min(col_stop, col + block.shape[2])
+                pixels[:, r0 - row_start : r1 - row_start, c0 - col_start : c1 - col_start] = block[
+                    :, r0 - row : r1 - row, c0 - col : c1 - col
+                ]
+        return finish(int(features[slot]), pixels, outside.pop(slot))
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eeo-clip")
+    run = pool.map if workers > 1 else map
+    try:
+        done = 0
+        for block_row in range(grid_rows):
+            keys = [(block_row, int(col)) for col in np.flatnonzero(needed[block_row])]
+            blocks.update(zip(keys, run(read, keys), strict=True))
+            finishing = np.arange(done, ends[block_row])
+            for layer in np.unique(layers[features[finishing]]).tolist():
+                burn(finishing[layers[features[finishing]] == layer])
+            yield from run(cut, finishing.tolist())
+            done = ends[block_row]
+            for key in [key for key in blocks if key[0] < keep_from[done]]:
+                del blocks[key]
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _check_fill(fill: float, dtype: np.dtype) -> None:
+    """Raise unless ``fill`` can be stored in ``dtype`` exactly."""
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        if np.isnan(fill) or not float(fill).is_integer() or not info.min <= fill <= info.max:
+            raise ValidationError(
+                f"nodata {fill!r} cannot be stored in the raster's {dtype} pixels "
+                f"(whole numbers from {info.min} to {info.max}); pass nodata= a value "
+                "that can, or cast the raster to float first"
+            )
+    elif np.issubdtype(dtype, np.floating) and np.isfinite(fill):
+        if abs(fill) > np.finfo(dtype).max:
+            raise ValidationError(
+                f"nodata {fill!r} is out of range for the raster's {dtype} pixels"
+            )
+
+
+@eeo_raster_op
+def clip_raster_with_features(
+    ds: EEORasterDataset,
+    features: gpd.GeoDataFrame | StrPath,
+    id_column: str | None = None,
+    *,
+    all_touched: bool = False,
+    nodata: int | float | None = None,
+    out_dir: StrPath | None = None,
+    save_kwargs: dict | None = None,
+    workers: int | None = None,
+) -> Iterator[tuple[Any, EEORasterDataset]] | dict[Any, Path]:
+    """Clip the raster to every feature of a vector layer separately, in one pass.
+
+    Each feature gives its own output, cropped to the feature's bounding box
+    with the pixels outside it set to nodata — the same as
+    :func:`clip_raster_with_vector` on that feature alone — but the source is
+    read once for all of them.
 
-    return EEORasterDataset.from_rasterio(dataset)
+    Parameters
+    ----------
+    ds : EEORasterDataset
+        Raster to clip.
+    features : geopandas.GeoDataFrame or str or path-like
+        Clip geometries, either a GeoDataFrame or a path to a vector file
+        readable by GeoPandas. Reprojected onto the raster's CRS, once, when
+        it declares a CRS, and taken to be in it otherwise.
+    id_column : str or None, default None
+        Column identifying each feature; None uses the layer's index. The
+        identifiers must be unique.
+    all_touched : bool, default False
+        If True, keep every pixel a feature touches; if False, only the
+        pixels whose centre falls inside it.
+    nodata : int or float or None, default None
+        Fill value for the pixels outside a feature, and for the raster's
+        own nodata pixels. If None, the raster's nodata value is used, or 0
+        when it declares none.
+    out_dir : str or path-like or None, default None
+        If given, write each clip to ``<out_dir>/<id>.tif`` (creating the
+        directory) instead of yielding it.
+    save_kwargs : dict or None, default None
+        Keyword arguments forwarded to ``save_raster`` for each file written
+        to ``out_dir``, e.g. ``{"compress": "deflate"}``.
+    workers : int or None, default None
+        Threads reading blocks, and cutting out and writing clips,
+        concurrently; None uses the ``num_threads`` option.
+
+    Returns
+    -------
+    iterator of (id, EEORasterDataset), or dict of id to pathlib.Path
+        Without ``out_dir``, a lazy iterator of ``(id, clip)`` pairs; each
+        clip is a NumPy-backed dataset in ``ds``'s dtype, carrying
+        ``nodata`` (or the raster's existing nodata value) and the raster's
+        band names, timestamp and tags. With
+        ``out_dir``, the path written for each feature, once all are
+        written. Features that miss the raster, or have no geometry, are
+        left out. The method form, ``ds.clip_raster_with_features(...)``,
+        returns the same iterator or mapping, not a dataset.
+
+    Raises
+    ------
+    ValidationError
+        If ``features`` is neither a GeoDataFrame nor a valid file path,
+        ``id_column`` is not a column, the identifiers are not unique,
+        ``workers`` is not a positive int, or the fill value (``nodata``, or
+        the raster's own) cannot be stored in the raster's dtype, such as
+        NaN or a fraction for an integer raster.
+
+    Notes
+    -----
+    The features' windows are computed for all of them at once. The source
+    is then walked one row of its native blocks (for a tiled GeoTIFF, its
+    tiles) at a time: the blocks some feature needs are read once, and kept
+    only until the last feature needing them is clipped, so memory is
+    bounded by the tallest feature's rows of blocks, not the raster. Blocks
+    no feature needs are never read. Clips come out in the order their
+    bottom edges are reached, not the layer's order.
+
+    Examples
+    --------
+    >>> fields = gpd.read_file("fields.gpkg")  # doctest: +SKIP
+    >>> for field_id, chip in ds.clip_raster_with_features(fields, "field_id"):  # doctest: +SKIP
+    ...     chip.save_raster(f"chips/{field_id}.tif")
+    >>> paths = ds.clip_raster_with_features(fields, "field_id", out_dir="chips")  # doctest: +SKIP
+    """
+    workers = resolve_workers(workers)
+    if isinstance(features, gpd.GeoDataFrame):
+        gdf = features
+    elif isinstance(features, (str, os.PathLike)) and os.path.isfile(features):
+        gdf = gpd.read_file(features)
+    else:
+        raise ValidationError(
+            "features must be a GeoDataFrame or a path to an existing vector "
+            f"file; got {features!r}"
+        )
+    if id_column is None:
+        ids = gdf.index
+    elif id_column in gdf.columns:
+        ids = gdf[id_column]
+    else:
+        raise ValidationError(f"id_column {id_column!r} is not a column of the features")
+    if not ids.is_unique:
+        duplicated = ids[ids.duplicated()].unique().tolist()[:5]
+        raise ValidationError(f"feature identifiers must be unique; repeated: {duplicated}")
+    ids = ids.tolist()
+    # A layer without a CRS is taken to be in the raster's, as in sampling.
+    if gdf.crs is not None and ds.get_crs() is not None and gdf.crs != ds.get_crs():
+        gdf = gdf.to_crs(ds.get_crs())
+    windows = _feature_windows(ds, gdf.geometry)
+
+    ds_nodata = get_nodata(ds)
+    fill = nodata if nodata is not None else ds_nodata if ds_nodata is not None else 0
+    _check_fill(fill, ds.get_dtype())
+    result_nodata = ds_nodata if nodata is None else nodata
+    transform = ds.get_transform()
+    directory = Path(out_dir) if out_dir is not None else None
+    if directory is not None:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def finish(feature: int, pixels: np.ndarray, outside: np.ndarray) -> tuple[Any, Any]:
+        row_start, row_stop, col_start, col_stop = windows[feature].tolist()
+        clip_transform = rio.windows.transform(
+            Window(col_start, row_start, col_stop - col_start, row_stop - row_start), transform
+        )
+        # As rasterio's mask: the raster's own nodata pixels are refilled too.
+        invalid = np.broadcast_to(outside, pixels.shape)
+        if ds_nodata is not None:
+            invalid = invalid | (np.isnan(pixels) if np.isnan(ds_nodata) else pixels == ds_nodata)
+        pixels[invalid] = fill
+        # Built off the bound method's return, so carry what it would.
+        clip = EEORasterDataset.from_array(
+            pixels,
+            transform=clip_transform,
+            crs=ds.get_crs(),
+            nodata=result_nodata,
+            timestamp=ds.timestamp,
+            attrs=dict(ds.attrs),
+            band_names=ds.band_names,
+        )
+        if directory is None:
+            return ids[feature], clip
+        path = directory / f"{ids[feature]}.tif"
+        clip.save_raster(path, **(save_kwargs or {}))
+        return ids[feature], path
+
+    clips = _sweep_features(
+        ds, gdf.geometry, windows, finish, all_touched=all_touched, workers=workers
+    )
+    if directory is None:
+        return clips
+    return dict(clips)
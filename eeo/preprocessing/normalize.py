@@ -1,25 +1,70 @@
-"""Normalization operations: min-max, percentile, and standardize."""
+"""Normalization operations: min-max, percentile, and standardize.
+
+Each operation first gathers the statistics it needs in block-wise passes
+(see :mod:`eeo.core.statistics` and :mod:`eeo.core.histogram`), then makes
+one more to rescale every window into a preallocated float32 result. None
+holds more than the windows in flight besides that result, and nothing is
+promoted to float64 scene-wide. On a dask-backed (lazy) raster the statistics
+are still gathered eagerly, but the rescaling is added to the dask graph, one
+task per chunk, instead of being computed.
+"""
+
+from collections.abc import Callable
+from functools import partial
 
 import numpy as np
-import rasterio as rio
+from rasterio.windows import Window
 
-from eeo.common import get_nodata, mask_nodata
+from eeo.common import get_nodata
+from eeo.core.adapters import DaskAdapter
+from eeo.core.blocks import execute_blocks, map_elementwise, parallel_windows, resolve_workers
 from eeo.core.core import EEORasterDataset
 from eeo.core.decorators import eeo_raster_op
+from eeo.core.statistics import combined_statistics
+from eeo.core.stats_cache import cached_band_statistics, cached_percentiles
+
+
+def _masked_rescale(
+    rescale: Callable[[np.ndarray], np.ndarray], nodata: float | None, block: np.ndarray
+) -> np.ndarray:
+    """Apply ``rescale`` to ``block`` with its ``nodata`` pixels masked to NaN."""
+    if nodata is not None:
+        block = np.where(block == nodata, np.nan, block)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return rescale(block)
+
+
+def _rescale_blocks(
+    ds: EEORasterDataset, rescale: Callable[[np.ndarray], np.ndarray], workers: int
+) -> EEORasterDataset:
+    """Apply ``rescale`` to ``ds`` window by window into a float32 result.
+
+    ``rescale`` receives each window with nodata masked to NaN. Nodata pixels
+    are NaN in the output (``nodata=nan``); a raster with no declared nodata
+    produces output with no nodata. A dask-backed ``ds`` gives a lazy result,
+    rescaled per chunk when computed.
+    """
+    kernel = partial(_masked_rescale, rescale, get_nodata(ds))
+    if isinstance(ds._adapter, DaskAdapter):
+        return map_elementwise(kernel, [ds], fractional=True)
 
+    height, width = ds.get_shape()
+    out = np.empty((ds.get_count(), height, width), dtype=np.float32)
 
-def _write_normalized(ds: EEORasterDataset, out: np.ndarray, out_nodata) -> EEORasterDataset:
-    """Write a float32 normalization result sharing ``ds``'s georeferencing."""
-    meta = ds.get_metadata()
-    meta.update(dtype="float32", nodata=out_nodata)
-    memfile = rio.io.MemoryFile()
-    out_ds = memfile.open(**meta)
-    out_ds.write(out)
-    return EEORasterDataset.from_rasterio(out_ds)
+    def compute(window: Window) -> np.ndarray:
+        return kernel(ds._adapter.read_window(window))
 
+    execute_blocks(compute, parallel_windows(ds._adapter, workers), out, workers=workers)
+    return EEORasterDataset.from_array(
+        out,
+        transform=ds.get_transform(),
+        crs=ds.get_crs(),
+        nodata=float("nan") if get_nodata(ds) is not None else None,
+    )
 
-@eeo_raster_op
-def standardize(ds: EEORasterDataset) -> EEORasterDataset:
+
+@eeo_raster_op(tileable=False)
+def standardize(ds: EEORasterDataset, *, workers: int | None = None) -> EEORasterDataset:
     """Standardize a raster to zero mean and unit variance (z-score).
 
     Computes ``(x - mean) / std`` over the valid pixels.
@@ -28,6 +73,8 @@ def standardize(ds: EEORasterDataset) -> EEORasterDataset:
     ----------
     ds : EEORasterDataset
         Input raster dataset.
+    workers : int or None, default None
+        Threads to run both passes on. None uses the ``num_threads`` option.
 
     Returns
     -------
@@ -39,28 +86,27 @@ def standardize(ds: EEORasterDataset) -> EEORasterDataset:
 
     Notes
     -----
-    Reads the full array into memory and makes one statistics pass before
-    writing, rather than streaming block-wise.
+    Streams the raster twice, block by block: once to accumulate the mean and
+    variance (over every band together), once to write the result.
 
     Examples
     --------
     >>> z = ds.standardize()
     """
-    ds_nodata = get_nodata(ds)
-    masked = mask_nodata(ds, ds.read())
-
-    mean_value = np.nanmean(masked)
-    std_value = np.nanstd(masked)
-    with np.errstate(divide="ignore", invalid="ignore"):
-        standardized = (masked - mean_value) / std_value
+    workers = resolve_workers(workers)
+    stats = combined_statistics(cached_band_statistics(ds._adapter, workers=workers))
+    mean_value, std_value = stats.mean, stats.std
 
-    out_nodata = float("nan") if ds_nodata is not None else None
-    return _write_normalized(ds, standardized.astype(np.float32), out_nodata)
+    return _rescale_blocks(ds, lambda block: (block - mean_value) / std_value, workers)
 
 
-@eeo_raster_op
+@eeo_raster_op(tileable=False)
 def normalize_min_max(
-    ds: EEORasterDataset, *, new_min: float | int = 0.0, new_max: float | int = 1.0
+    ds: EEORasterDataset,
+    *,
+    new_min: float | int = 0.0,
+    new_max: float | int = 1.0,
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Linearly rescale a raster to a new value range.
 
@@ -74,6 +120,8 @@ def normalize_min_max(
         Lower bound of the output range.
     new_max : float or int, default 1.0
         Upper bound of the output range.
+    workers : int or None, default None
+        Threads to run both passes on. None uses the ``num_threads`` option.
 
     Returns
     -------
@@ -85,32 +133,32 @@ def normalize_min_max(
 
     Notes
     -----
-    Reads the full array into memory and makes one statistics pass before
-    writing, rather than streaming block-wise.
+    Streams the raster twice, block by block: once to find the minimum and
+    maximum (over every band together), once to write the result.
 
     Examples
     --------
     >>> scaled = ds.normalize_min_max()
     >>> centred = ds.normalize_min_max(new_min=-1, new_max=1)
     """
-    ds_nodata = get_nodata(ds)
-    masked = mask_nodata(ds, ds.read())
+    workers = resolve_workers(workers)
+    stats = combined_statistics(cached_band_statistics(ds._adapter, workers=workers))
+    old_min, old_max = stats.min, stats.max
 
-    old_min, old_max = np.nanmin(masked), np.nanmax(masked)
-    with np.errstate(divide="ignore", invalid="ignore"):
-        normalized = (masked - old_min) / (old_max - old_min)
-    normalized = normalized * (new_max - new_min) + new_min
+    def rescale(block: np.ndarray) -> np.ndarray:
+        return (block - old_min) / (old_max - old_min) * (new_max - new_min) + new_min
 
-    out_nodata = float("nan") if ds_nodata is not None else None
-    return _write_normalized(ds, normalized.astype(np.float32), out_nodata)
+    return _rescale_blocks(ds, rescale, workers)
 
 
-@eeo_raster_op
+@eeo_raster_op(tileable=False)
 def normalize_percentile(
     ds: EEORasterDataset,
     *,
     lower_percentile: float | int = 2,
     upper_percentile: float | int = 98,
+    method: str = "exact",
+    workers: int | None = None,
 ) -> EEORasterDataset:
     """Normalize raster values using percentile thresholds.
 
@@ -125,6 +173,13 @@ def normalize_percentile(
         Lower percentile threshold (0-100).
     upper_percentile : float, default 98
         Upper percentile threshold (0-100).
+    method : {"exact", "approx"}, default "exact"
+        How the thresholds are found. ``"exact"`` matches
+        ``numpy.nanpercentile``; ``"approx"`` reads them off a histogram,
+        within 1/4096 of the data range, and saves a pass over the raster.
+        8- and 16-bit integer rasters are exact either way.
+    workers : int or None, default None
+        Threads to run the passes on. None uses the ``num_threads`` option.
 
     Returns
     -------
@@ -136,26 +191,33 @@ def normalize_percentile(
 
     Raises
     ------
-    ValueError
-        If ``lower_percentile >= upper_percentile``, propagated from NumPy.
+    ValidationError
+        If a percentile is outside ``[0, 100]`` or ``method`` is unknown.
 
     Notes
     -----
-    Reads the full array into memory and makes one statistics pass before
-    writing, rather than streaming block-wise. Percentiles are computed with
-    ``numpy.nanpercentile`` over the nodata-masked array.
+    The thresholds are taken over every band together, from histograms built
+    block by block (see :func:`eeo.core.histogram.band_percentiles`), so the
+    raster is never held in memory; the rescaling pass then runs block by
+    block too. The thresholds of a file-backed raster are kept in the
+    statistics cache (the ``stats_cache`` option), so normalizing the same
+    file again skips straight to the rescaling pass.
 
     Examples
     --------
     >>> ds = load_array(np.random.rand(64, 64), crs=4326)
     >>> out = ds.normalize_percentile(lower_percentile=5, upper_percentile=95)
     """
-    ds_nodata = get_nodata(ds)
-    masked = mask_nodata(ds, ds.read())
-
-    array_min, array_max = np.nanpercentile(masked, (lower_percentile, upper_percentile))
-    with np.errstate(divide="ignore", invalid="ignore"):
-        normalized = np.clip((masked - array_min) / (array_max - array_min), 0, 1)
-
-    out_nodata = float("nan") if ds_nodata is not None else None
-    return _write_normalized(ds, normalized.astype(np.float32), out_nodata)
+    workers = resolve_workers(workers)
+    array_min, array_max = cached_percentiles(
+        ds._adapter,
+        (lower_percentile, upper_percentile),
+        combined=True,
+        method=method,
+        workers=workers,
+    )
+
+    def rescale(block: np.ndarray) -> np.ndarray:
+        return np.clip((block - array_min) / (array_max - array_min), 0, 1)
+
+    return _rescale_blocks(ds, rescale, workers)
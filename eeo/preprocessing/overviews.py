@@ -0,0 +1,82 @@
+"""Overview (pyramid) building."""
+
+from rasterio.enums import Resampling
+
+from eeo.common import normalize_resampling_method
+from eeo.core.adapters import RasterioAdapter
+from eeo.core.core import EEORasterDataset
+from eeo.core.decorators import eeo_raster_op
+from eeo.core.exceptions import BackendError
+from eeo.core.overviews import add_overviews, build_dataset_overviews, overview_factors
+from eeo.core.types import OverviewLevels, ResamplingMethod
+
+
+@eeo_raster_op
+def build_overviews(
+    ds: EEORasterDataset,
+    levels: OverviewLevels = "auto",
+    *,
+    resampling: Resampling | ResamplingMethod = "nearest",
+) -> EEORasterDataset:
+    """Build overview (pyramid) levels so decimated reads stay cheap.
+
+    Parameters
+    ----------
+    ds : EEORasterDataset
+        Input raster dataset.
+    levels : "auto", int, or sequence of int, default "auto"
+        ``"auto"`` halves the raster (factors 2, 4, 8, ...) until the smallest
+        level is at most 256 pixels per side; a raster already that small gets
+        none. An int builds that many levels, factors 2 to ``2**levels``. A
+        sequence gives the decimation factors themselves.
+    resampling : str or rasterio.enums.Resampling, default "nearest"
+        How each overview pixel is computed from the pixels it covers.
+        ``"nearest"`` keeps categorical values intact; ``"average"`` suits
+        continuous data.
+
+    Returns
+    -------
+    EEORasterDataset
+        The raster with its overviews. A dataset read from a file is
+        reopened from that file, which now holds them; any other dataset is
+        returned rasterio-backed (in memory, see ``to_rasterio``) with them.
+
+    Raises
+    ------
+    ValidationError
+        If ``levels`` or ``resampling`` is invalid.
+    BackendError
+        If GDAL fails to build the overviews (for instance, the file is not
+        writable).
+
+    Notes
+    -----
+    Like ``gdaladdo``, a file-backed dataset's overviews are written into the
+    file itself (GeoTIFF stores them internally, other formats in an external
+    ``.ovr``), so every later session benefits. Decimated reads —
+    ``describe(stats=True)`` and every plot — are then served from the
+    smallest level that covers the requested size instead of being decimated
+    from full resolution. To write a new file with overviews, use
+    ``save_raster(path, overviews=...)``.
+
+    Examples
+    --------
+    >>> scene = load_raster("scene.tif").build_overviews(resampling="average")
+    >>> scene.describe(stats=True)  # decimated read served from an overview
+    """
+    normalize_resampling_method(resampling)
+    overview_factors(ds.get_shape(), levels)
+
+    adapter = ds._adapter
+    if isinstance(adapter, RasterioAdapter) and adapter.file_path is not None:
+        add_overviews(adapter.file_path, levels, resampling)
+        result = EEORasterDataset.from_path(adapter.file_path)
+        result.band_names = ds.band_names
+        return result
+
+    result = ds.to_rasterio()
+    try:
+        build_dataset_overviews(result._adapter.backend, levels, resampling)
+    except Exception as e:
+        raise BackendError("failed to build overviews in the rasterio backend") from e
+    return result
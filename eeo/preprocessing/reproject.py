@@ -1,5 +1,6 @@
 """Reprojection to a target coordinate reference system."""
 
+import numpy as np
 import pyproj
 import rasterio as rio
 from rasterio.warp import Resampling, calculate_default_transform, reproject
@@ -7,7 +8,7 @@ from rasterio.warp import Resampling, calculate_default_transform, reproject
 from eeo.common import get_nodata, is_rasterio_backed, normalize_resampling_method
 from eeo.core.core import EEORasterDataset
 from eeo.core.decorators import eeo_raster_op
-from eeo.core.exceptions import BackendError, ValidationError
+from eeo.core.exceptions import ValidationError
 
 
 @eeo_raster_op
@@ -22,7 +23,7 @@ def reproject_raster(
     Parameters
     ----------
     ds : EEORasterDataset
-        Raster to reproject. Must be backed by rasterio.
+        Raster to reproject.
     target_crs : int or str or pyproj.CRS
         Destination CRS as an EPSG code, a PROJ/WKT string, or a
         ``pyproj.CRS``.
@@ -33,22 +34,21 @@ def reproject_raster(
     Returns
     -------
     EEORasterDataset
-        New rasterio-backed dataset in ``target_crs``, in the same dtype as
+        New NumPy-backed dataset in ``target_crs``, in the same dtype as
         ``ds``, with a recomputed transform, width, and height; the nodata
         value is carried over unchanged.
 
     Raises
     ------
-    BackendError
-        If ``ds`` is not backed by rasterio.
     ValidationError
         If ``target_crs`` cannot be interpreted as a CRS.
 
     Notes
     -----
-    Warps band-by-band with ``rasterio.warp.reproject`` through rasterio band
-    handles, so the full source array is never materialized at once; the
-    warped output is held in an in-memory dataset. Source nodata pixels are
+    Warps band-by-band with ``rasterio.warp.reproject``. A rasterio-backed
+    source is warped through rasterio band handles, so its full array is never
+    materialized at once; any other backend's array is handed to GDAL as is.
+    The warped output is held in a NumPy array. Source nodata pixels are
     honoured and border pixels exposed by the warp are filled with the nodata
     value; if the raster declares no nodata, those border pixels are filled
     with 0.
@@ -57,13 +57,6 @@ def reproject_raster(
     --------
     >>> reprojected = ds.reproject_raster(target_crs=4326)
     """
-    # Ensure reprojection for only rasterio-backend datasets
-    if not is_rasterio_backed(ds):
-        raise BackendError(
-            "reproject requires a rasterio-backed dataset; this dataset uses "
-            "the NumPy backend. Call .to_rasterio() first."
-        )
-
     # Normalize resampling method
     resampling_method = normalize_resampling_method(resampling_method)
     # Normalise CRS
@@ -92,21 +85,21 @@ def reproject_raster(
         top=top,
     )
 
-    # Update the metadata
-    meta = ds.get_metadata()
-    meta.update({"crs": crs, "transform": transform, "width": width, "height": height})
-
-    # return in-memory dataset
-    memfile = rio.io.MemoryFile()
-    dataset = memfile.open(**meta)
+    # Warp into a preallocated array. A rasterio source is warped band by band
+    # straight from its dataset; any other backend hands GDAL its array.
+    nodata = get_nodata(ds)
+    if is_rasterio_backed(ds):
+        sources = [rio.band(ds.ds, i) for i in range(1, ds.get_count() + 1)]
+    else:
+        sources = list(ds.read())
+    destination = np.zeros((ds.get_count(), height, width), dtype=ds.get_dtype())
 
     # Pass the nodata value both ways so source nodata is not warped into
     # valid data and border pixels exposed by the warp are filled with it.
-    nodata = get_nodata(ds)
-    for i in range(1, ds.get_count() + 1):
+    for source, band in zip(sources, destination, strict=True):
         reproject(
-            source=rio.band(ds.ds, i),
-            destination=rio.band(dataset, i),
+            source=source,
+            destination=band,
             src_transform=ds.get_transform(),
             src_crs=ds.get_crs(),
             dst_transform=transform,
@@ -115,4 +108,4 @@ def reproject_raster(
             dst_nodata=nodata,
             resampling=resampling_method,
         )
-    return EEORasterDataset.from_rasterio(dataset)
+    return EEORasterDataset.from_array(destination, transform=transform, crs=crs, nodata=nodata)
@@ -1,10 +1,9 @@
 """Resampling to a new size, scale factor, or resolution."""
 
-import rasterio as rio
 from rasterio.enums import Resampling
 from rasterio.transform import Affine
 
-from eeo.common import normalize_resampling_method
+from eeo.common import get_nodata, normalize_resampling_method
 from eeo.core.core import EEORasterDataset
 from eeo.core.decorators import eeo_raster_op
 from eeo.core.exceptions import BackendError, ValidationError
@@ -56,7 +55,7 @@ def resample(
     Returns
     -------
     EEORasterDataset
-        New rasterio-backed dataset at the requested size/scale/resolution,
+        New NumPy-backed dataset at the requested size/scale/resolution,
         in the same dtype as the input. The nodata value is carried over
         unchanged in the output metadata.
 
@@ -131,24 +130,13 @@ def resample(
 
         transform = ds.get_transform() * Affine.scale(scale_x, scale_y)
 
-        # Save or return EEORasterDataset
-        # Update metadata
-        meta = ds.get_metadata()
-        meta.update(
-            transform=transform,
-            height=new_height,
-            width=new_width,
+        result = EEORasterDataset.from_array(
+            data, transform=transform, crs=ds.get_crs(), nodata=get_nodata(ds)
         )
-        # Write to MemoryFile
-        memfile = rio.io.MemoryFile()
-        with memfile.open(**meta) as mem:
-            mem.write(data)
-
-        dataset = memfile.open()
 
         if show_preview:
-            EEORasterDataset.from_rasterio(dataset).plot_raster(**(plot_kwargs or {}))
+            result.plot_raster(**(plot_kwargs or {}))
 
-        return EEORasterDataset.from_rasterio(dataset)
+        return result
     except Exception as e:
         raise BackendError("resampling failed in the rasterio backend") from e
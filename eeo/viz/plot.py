@@ -14,6 +14,8 @@ from eeo.common import get_nodata, is_rasterio_backed, resolve_band_index
 from eeo.core.core import EEORasterDataset
 from eeo.core.decorators import eeo_raster_viz
 from eeo.core.exceptions import ValidationError
+from eeo.core.histogram import array_percentiles
+from eeo.core.stats_cache import cached_entry
 from eeo.core.types import StrPath
 
 # Reads for display are capped at the figure's pixel resolution times this
@@ -323,7 +325,7 @@ def _percentile_stretch(array, pmin=2, pmax=98):
     if values.size == 0:  # every pixel is nodata
         return np.zeros_like(array)
 
-    low, high = np.nanpercentile(values, (pmin, pmax))
+    low, high = array_percentiles(values, (pmin, pmax))
     if high - low == 0:
         return np.zeros_like(array)
     return np.clip((array - low) / (high - low), 0, 1)
@@ -361,14 +363,18 @@ def _stretch_limits(array, pmin=2, pmax=98) -> tuple[float, float] | None:
     if values.size == 0:  # every pixel is nodata
         return None
 
-    low, high = np.nanpercentile(values, (pmin, pmax))
+    low, high = array_percentiles(values, (pmin, pmax))
     if not (np.isfinite(low) and np.isfinite(high)) or high - low == 0:
         return None
     return float(low), float(high)
 
 
 def _with_stretch_limits(
-    draw_kwargs: dict[str, Any], array, pmin: float, pmax: float
+    draw_kwargs: dict[str, Any],
+    array,
+    pmin: float,
+    pmax: float,
+    source: tuple[EEORasterDataset, int] | None = None,
 ) -> dict[str, Any]:
     """Copy draw keyword arguments, filling in percentile display limits.
 
@@ -387,6 +393,10 @@ def _with_stretch_limits(
         Lower percentile.
     pmax : float
         Upper percentile.
+    source : tuple of (EEORasterDataset, int) or None, default None
+        Dataset and 1-based band ``array`` was read from. When given, the
+        limits are kept in the statistics cache, so a file-backed band drawn
+        again at the same size reuses them.
 
     Returns
     -------
@@ -396,13 +406,50 @@ def _with_stretch_limits(
         array.
     """
     kwargs = dict(draw_kwargs)
-    limits = _stretch_limits(array, pmin, pmax)
+    if source is None:
+        limits = _stretch_limits(array, pmin, pmax)
+    else:
+        ds, band = source
+        entry = f"{band}:stretch {pmin!r},{pmax!r} {array.shape[0]}x{array.shape[1]}"
+        limits = cached_entry(ds._adapter, entry, lambda: _stretch_limits(array, pmin, pmax))
     if limits is not None:
         kwargs.setdefault("vmin", limits[0])
         kwargs.setdefault("vmax", limits[1])
     return kwargs
 
 
+def _band_histogram(ds: EEORasterDataset, band: int, bins: int) -> tuple[np.ndarray, np.ndarray]:
+    """Bin a band's valid pixels, through the statistics cache.
+
+    The bins are those ``matplotlib.pyplot.hist`` would pick: ``bins`` equal
+    bins spanning the finite valid values. A file-backed band binned before
+    at the same ``bins`` is served from the cache without reading a pixel.
+
+    Parameters
+    ----------
+    ds : EEORasterDataset
+        Dataset to read from.
+    band : int
+        1-based band index.
+    bins : int
+        Number of bins.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The ``(counts, edges)`` of the histogram, as ``numpy.histogram``
+        returns them.
+    """
+
+    def compute() -> dict[str, list[float]]:
+        values = _valid_values(_mask_nodata_for_display(ds, ds.get_band(band)))
+        counts, edges = np.histogram(values[np.isfinite(values)], bins=bins)
+        return {"counts": counts.tolist(), "edges": edges.tolist()}
+
+    histogram = cached_entry(ds._adapter, f"{band}:histogram {bins}", compute)
+    return np.asarray(histogram["counts"]), np.asarray(histogram["edges"])
+
+
 def _colorbar_extend(mappable) -> str:
     """Report which ends of a colorbar are clipping data, as an ``extend`` value.
 
@@ -667,7 +714,7 @@ def plot_band_array(
         array, _ = _read_band_for_display(d, band, size)
         draw_kwargs = imshow_kwargs
         if stretch:
-            draw_kwargs = _with_stretch_limits(imshow_kwargs, array, pmin, pmax)
+            draw_kwargs = _with_stretch_limits(imshow_kwargs, array, pmin, pmax, (d, band))
         image = ax.imshow(array, cmap=cmap, **draw_kwargs)
         ax.set_title(_band_label(d, band))
         ax.axis("off")
@@ -787,8 +834,10 @@ def plot_raster(
     A declared nodata value is excluded per the library's nodata contract: the
     sentinel is masked before the percentiles are taken, so it cannot shift the
     stretch or the colorbar, and those pixels render blank rather than as a
-    colour. Displays the figure with ``matplotlib.pyplot.show`` and, when
-    ``save_path`` is given, writes it to disk as a side effect.
+    colour. The stretch limits of a file-backed band are kept in the
+    statistics cache (the ``stats_cache`` option) and reused by later plots of
+    the same file. Displays the figure with ``matplotlib.pyplot.show`` and,
+    when ``save_path`` is given, writes it to disk as a side effect.
 
     Examples
     --------
@@ -807,7 +856,7 @@ def plot_raster(
         array, transform = _read_band_for_display(d, band, size)
         draw_kwargs = dict(show_kwargs)
         if stretch:
-            draw_kwargs = _with_stretch_limits(draw_kwargs, array, pmin, pmax)
+            draw_kwargs = _with_stretch_limits(draw_kwargs, array, pmin, pmax, (d, band))
         # rasterio 1.5 extended show()'s adjust= to 2D arrays, min-max rescaling
         # the band to [0, 1] before drawing. That silently voids our display
         # limits, which are in the band's own units. Opt out explicitly (a no-op
@@ -903,9 +952,11 @@ def plot_histogram(
 
     Notes
     -----
-    Reads each band at full resolution into memory. A declared nodata value is
-    excluded per the library's nodata contract, so the counts describe valid
-    pixels only. Displays the figure with ``matplotlib.pyplot.show`` and, when
+    Reads each band at full resolution into memory, unless its histogram is
+    already in the statistics cache (the ``stats_cache`` option): the counts
+    of a file-backed band are kept, so plotting the same file again reads no
+    pixels. A declared nodata value is excluded per the library's nodata
+    contract, so the counts describe valid pixels only. Displays the figure with ``matplotlib.pyplot.show`` and, when
     ``save_path`` is given, writes it to disk as a side effect.
 
     Examples
@@ -918,8 +969,14 @@ def plot_histogram(
     fig, panels, _ = _panel_grid(datasets, bands_list, nrows, ncols, figsize, (10, 5))
 
     for ax, d, band in panels:
-        data = _valid_values(_mask_nodata_for_display(d, d.get_band(band)))
-        ax.hist(data, bins=bins, **hist_kwargs)
+        if isinstance(bins, int) and "range" not in hist_kwargs and "weights" not in hist_kwargs:
+            # Draw the precomputed counts: one weighted sample per bin
+            # reproduces the histogram of the pixels themselves.
+            counts, edges = _band_histogram(d, band, bins)
+            ax.hist(edges[:-1], bins=edges, weights=counts, **hist_kwargs)
+        else:
+            data = _valid_values(_mask_nodata_for_display(d, d.get_band(band)))
+            ax.hist(data, bins=bins, **hist_kwargs)
         if log:
             ax.set_yscale("log")
         ax.set_title(_band_label(d, band))
@@ -1037,7 +1094,7 @@ def plot_raster_with_histogram(
         array, transform = _read_band_for_display(ds, band, figsize)
         # Limits scale the image panel only; the histogram bins raw values, so
         # its x-axis stays in the band's own units whatever the stretch does.
-        draw_kwargs = _with_stretch_limits({}, array, pmin, pmax) if stretch else {}
+        draw_kwargs = _with_stretch_limits({}, array, pmin, pmax, (ds, band)) if stretch else {}
         # See plot_raster: rasterio 1.5's show() rescales 2D arrays unless told
         # not to, which would override the display limits set just above.
         draw_kwargs["adjust"] = False
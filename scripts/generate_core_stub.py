@@ -59,23 +59,26 @@ HEADER = """\
 # including the methods bound dynamically by the @eeo_raster_op / @eeo_raster_viz
 # decorators. Regenerate after adding or changing a bound op or a core.py method:
 #     python scripts/generate_core_stub.py
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pyproj
 import rasterio as rio
 from affine import Affine
 from rasterio import CRS
 from rasterio.coords import BoundingBox
 from rasterio.enums import Resampling
+from rasterio.windows import Window
 
 from eeo.analysis.indices import BandSpec
-from eeo.analysis.stats import Coordinate
+from eeo.analysis.stats import Coordinate, Points
 from eeo.core.adapters import BaseRasterAdapter
-from eeo.core.types import ResamplingMethod, StrPath
+from eeo.core.types import OverviewLevels, ResamplingMethod, StrPath
 """
 
 
@@ -1,9 +1,9 @@
 """Shared synthetic-raster fixtures for the Easy-EO test suite.
 
-Every fixture builds a small, deterministic raster fully in memory
+Every raster fixture builds a small, deterministic raster fully in memory
 (rasterio ``MemoryFile`` backend via ``to_rasterio()``, or the NumPy
-backend via ``load_array``); nothing here touches the filesystem or the
-network.
+backend via ``load_array``); nothing here touches the network, and only
+``tiled_scene`` (below) the filesystem.
 
 Grid conventions
 ----------------
@@ -11,10 +11,15 @@ Rasterio-backed fixtures use a Sentinel-2-like grid: EPSG:32633 (UTM 33N),
 10 m square pixels, origin (500000, 4200000), north-up transform. The
 CRS-mismatch partner raster uses EPSG:4326. Pixel values are deterministic
 gradients (``0..n-1``) so tests can assert against hand-computed results.
+
+Tests of the block-wise machinery need files with internal tiles instead:
+the ``tiled_scene`` fixture writes one in the test's ``tmp_path``, on the
+same grid (``GRID`` and ``UTM_CRS``, importable from here).
 """
 
 import socket
 import warnings
+from pathlib import Path
 
 import matplotlib
 
@@ -25,10 +30,11 @@ matplotlib.use("Agg")
 
 import numpy as np
 import pytest
+import rasterio as rio
 from affine import Affine
 from rasterio.crs import CRS
 
-from eeo import load_array
+from eeo import clear_stats_cache, load_array
 
 UTM_CRS = CRS.from_epsg(32633)
 GEO_CRS = CRS.from_epsg(4326)
@@ -68,7 +74,9 @@ def _block_network(request, monkeypatch):
     failure rather than a slow or flaky one.
 
     Tests marked ``@pytest.mark.network`` are exempt (they only run under
-    ``--run-network``). The guard covers Python-level sockets, which is what
+    ``--run-network``). Connections to the loopback interface stay allowed:
+    a server a test starts on ``127.0.0.1`` is a local fixture, not a
+    service. The guard covers Python-level sockets, which is what
     ``requests`` and ``urllib`` use; GDAL's own HTTP stack does not go through
     them, so a remote raster read is kept out of the default suite by review
     rather than by this fixture.
@@ -76,16 +84,49 @@ def _block_network(request, monkeypatch):
     if request.node.get_closest_marker("network"):
         return
 
-    def blocked(*args, **kwargs):
+    def refuse():
         raise RuntimeError(
             "this test tried to open a network connection, which the default "
             "test run forbids; use a recorded response or a local file, or "
             "mark the test with @pytest.mark.network"
         )
 
-    monkeypatch.setattr(socket.socket, "connect", blocked)
-    monkeypatch.setattr(socket.socket, "connect_ex", blocked)
-    monkeypatch.setattr(socket, "create_connection", blocked)
+    def guarded(original):
+        def connect(sock, address, *args, **kwargs):
+            if not _is_loopback(address):
+                refuse()
+            return original(sock, address, *args, **kwargs)
+
+        return connect
+
+    create_connection = socket.create_connection
+
+    def guarded_create_connection(address, *args, **kwargs):
+        if not _is_loopback(address):
+            refuse()
+        return create_connection(address, *args, **kwargs)
+
+    monkeypatch.setattr(socket.socket, "connect", guarded(socket.socket.connect))
+    monkeypatch.setattr(socket.socket, "connect_ex", guarded(socket.socket.connect_ex))
+    monkeypatch.setattr(socket, "create_connection", guarded_create_connection)
+
+
+def _is_loopback(address):
+    """Whether a socket address points at this machine's loopback interface."""
+    host = address[0] if isinstance(address, tuple) else address
+    return host in ("127.0.0.1", "::1", "localhost")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats_cache():
+    """Start every test with an empty statistics cache.
+
+    Fixture files are rewritten in each test's own ``tmp_path``, but a test
+    counting pixel reads must not be answered by another test's entries.
+    """
+    clear_stats_cache()
+    yield
+    clear_stats_cache()
 
 
 @pytest.fixture(autouse=True)
@@ -110,6 +151,49 @@ def _north_up(origin_x: float = ORIGIN_X, origin_y: float = ORIGIN_Y, res: float
     return Affine.translation(origin_x, origin_y) * Affine.scale(res, -res)
 
 
+GRID = _north_up()
+
+
+def write_tiled(
+    path, data: np.ndarray, *, nodata=None, block: int = 16, band_names=None, transform=GRID
+) -> Path:
+    """Write ``(bands, rows, cols)`` ``data`` to a GeoTIFF in square tiles on the UTM grid."""
+    with rio.open(
+        path,
+        "w",
+        driver="GTiff",
+        height=data.shape[1],
+        width=data.shape[2],
+        count=data.shape[0],
+        dtype=data.dtype,
+        crs=UTM_CRS,
+        transform=transform,
+        nodata=nodata,
+        tiled=True,
+        blockxsize=block,
+        blockysize=block,
+    ) as dst:
+        dst.write(data)
+        for i, name in enumerate(band_names or [], start=1):
+            dst.set_band_description(i, name)
+    return Path(path)
+
+
+@pytest.fixture
+def tiled_scene(tmp_path):
+    """Factory writing a tiled GeoTIFF into ``tmp_path`` and returning its path.
+
+    Call it as ``tiled_scene(data, nodata=0, block=16, band_names=[...],
+    name="scene.tif")``; every argument but ``data`` is optional. Writing the
+    same ``name`` again replaces the file.
+    """
+
+    def write(data, *, name="scene.tif", **kwargs):
+        return write_tiled(tmp_path / name, data, **kwargs)
+
+    return write
+
+
 def _gradient(shape: tuple[int, int], dtype) -> np.ndarray:
     """Return a deterministic 0..n-1 gradient array of the given shape."""
     return np.arange(np.prod(shape), dtype=dtype).reshape(shape)
@@ -56,6 +56,115 @@ def test_extract_value_invalid_coordinates(raster_3x3):
         raster_3x3.extract_value_at_coordinate((1,))
 
 
+# extract values at many coordinates
+def _pixel_centres(ds):
+    rows, cols = np.indices(ds.get_shape())
+    xs, ys = ds.get_transform() * (cols.ravel() + 0.5, rows.ravel() + 0.5)
+    return np.column_stack([xs, ys])
+
+
+@pytest.mark.parametrize("backend", ["rasterio", "numpy"])
+def test_extract_values_matches_the_single_point_sampler(multiband_uint16, backend):
+    ds = load_array(multiband_uint16.read(), transform=multiband_uint16.get_transform(), crs=32633)
+    if backend == "rasterio":
+        ds = ds.to_rasterio()
+    points = _pixel_centres(ds)[::-1]
+
+    table = ds.extract_values_at_coordinates(points, bands=[3, 1])
+
+    assert list(table.columns) == ["band_3", "band_1"]
+    assert list(table.index) == list(range(len(points)))
+    for (x, y), (third, first) in zip(points, table.to_numpy(), strict=True):
+        assert third == ds.extract_value_at_coordinate((x, y), band_idx=3)
+        assert first == ds.extract_value_at_coordinate((x, y), band_idx=1)
+
+
+def test_extract_values_marks_nodata_and_outside_points_nan(raster_with_nodata):
+    points = [(500_005.0, 4_199_995.0), (500_025.0, 4_199_975.0), (0.0, 0.0), (np.nan, 1.0)]
+
+    table = raster_with_nodata.extract_values_at_coordinates(points)
+
+    assert table.dtypes.tolist() == [np.float64]
+    np.testing.assert_array_equal(table["band_1"], [np.nan, 14.0, np.nan, np.nan])
+
+
+def test_extract_values_reads_only_the_blocks_holding_points(tiled_scene, monkeypatch):
+    from eeo import load_raster
+    from eeo.core.adapters import RasterioAdapter
+
+    data = np.arange(2 * 64 * 64, dtype=np.uint16).reshape(2, 64, 64)
+    grid = Affine.translation(0, 64) * Affine.scale(1, -1)
+    path = tiled_scene(data, transform=grid, name="tiled.tif")
+    reads = []
+    read_window = RasterioAdapter.read_window
+
+    def spy(self, window, indexes=None):
+        reads.append((window, indexes))
+        return read_window(self, window, indexes)
+
+    monkeypatch.setattr(RasterioAdapter, "read_window", spy)
+    # Three points in the top-left tile, one in the bottom-right one.
+    points = [(1.5, 63.5), (60.5, 1.5), (15.5, 48.5), (3.5, 60.5)]
+
+    table = load_raster(path).extract_values_at_coordinates(points, bands=2, workers=2)
+
+    assert sorted((w.row_off, w.col_off, w.height, w.width) for w, _ in reads) == [
+        (0, 0, 16, 16),
+        (48, 48, 16, 16),
+    ]
+    assert all(indexes == [2] for _, indexes in reads)
+    np.testing.assert_array_equal(table["band_2"], data[1, [0, 62, 15, 3], [1, 60, 15, 3]])
+
+
+def test_extract_values_transforms_points_from_another_crs(multiband_uint16):
+    import geopandas as gpd
+    from rasterio.warp import transform as transform_coordinates
+
+    utm = _pixel_centres(multiband_uint16)[[7, 20, 33]]
+    lon, lat = transform_coordinates(32633, 4326, utm[:, 0], utm[:, 1])
+    expected = multiband_uint16.extract_values_at_coordinates(utm)
+
+    from_array = multiband_uint16.extract_values_at_coordinates(
+        np.column_stack([lon, lat]), crs="EPSG:4326"
+    )
+    plots = gpd.GeoDataFrame(
+        {"plot": ["a", "b", "c"]},
+        geometry=gpd.points_from_xy(lon, lat),
+        crs=4326,
+        index=[10, 11, 12],
+    )
+    from_frame = multiband_uint16.extract_values_at_coordinates(plots, bands=None)
+
+    np.testing.assert_array_equal(from_array.to_numpy(), expected.to_numpy())
+    np.testing.assert_array_equal(from_frame.to_numpy(), expected.to_numpy())
+    assert list(from_frame.index) == [10, 11, 12]
+
+
+@pytest.mark.parametrize(
+    ("points", "kwargs", "match"),
+    [
+        ([1.0, 2.0, 3.0], {}, "shaped"),
+        ([(1.0, 2.0, 3.0)], {}, "shaped"),
+        ("lines", {}, "Point"),
+        ("points", {"crs": 4326}, "own CRS"),
+        ([(1.0, 2.0)], {"bands": "nope"}, "nope"),
+        ([(1.0, 2.0)], {"workers": 0}, "workers"),
+    ],
+)
+def test_extract_values_rejects_invalid_input(raster_3x3, points, kwargs, match):
+    import geopandas as gpd
+    from shapely.geometry import LineString, Point
+
+    frames = {
+        "lines": gpd.GeoSeries([LineString([(0, 0), (1, 1)])], crs=4326),
+        "points": gpd.GeoSeries([Point(1, 1)], crs=4326),
+    }
+    with pytest.raises(ValidationError, match=match):
+        raster_3x3.extract_values_at_coordinates(
+            frames[points] if isinstance(points, str) else points, **kwargs
+        )
+
+
 # Maximum pixel
 def test_get_maximum_pixel_value_and_position(raster_3x3):
     result = raster_3x3.get_maximum_pixel()
@@ -1,7 +1,9 @@
 import numpy as np
+import pytest
 import rasterio.io
+from rasterio.windows import Window
 
-from eeo.core.adapters import RasterioAdapter
+from eeo.core.adapters import NumpyRasterioAdapter, RasterioAdapter
 
 
 def test_numpy_backend_initial(numpy_backed_dataset):
@@ -9,14 +11,14 @@ def test_numpy_backend_initial(numpy_backed_dataset):
     assert isinstance(backend, np.ndarray)
 
 
-# op results are DatasetWriter-backed; to_rasterio() must
-# recognise them as already-rasterio and return self instead of re-reading
-# the full array into a new MemoryFile.
-def test_to_rasterio_is_noop_on_op_result(single_band_float32):
-    result = single_band_float32.add(1)
+# A promoted dataset is DatasetWriter-backed; to_rasterio() must recognise
+# it as already-rasterio and return self instead of re-reading the full array
+# into a new MemoryFile.
+def test_to_rasterio_is_noop_on_promoted_dataset(numpy_backed_dataset):
+    promoted = numpy_backed_dataset.to_rasterio()
 
-    assert isinstance(result.ds, rasterio.io.DatasetWriter)
-    assert result.to_rasterio() is result
+    assert isinstance(promoted.ds, rasterio.io.DatasetWriter)
+    assert promoted.to_rasterio() is promoted
 
 
 def test_to_rasterio_is_noop_on_file_backed(tmp_path, single_band_float32):
@@ -55,13 +57,12 @@ def test_normalized_difference_does_not_repromote_rasterio_dataset(
     assert np.all(result.read() == 0)
 
 
-def test_resample_promotes_to_rasterio(numpy_backed_dataset):
+def test_resample_wraps_result_in_numpy_backend(numpy_backed_dataset):
     resampled = numpy_backed_dataset.resample(scale_factor=2.0)
 
-    # Backend should now be Rasterio
-    backend = resampled._adapter.backend
-    assert backend is not None
-    assert isinstance(backend, rasterio.io.DatasetReader)
+    # The input is promoted for GDAL's decimated read, but the result wraps
+    # the resampled array rather than an in-memory GeoTIFF.
+    assert isinstance(resampled._adapter.backend, np.ndarray)
 
 
 def test_resample_preserves_crs(numpy_backed_dataset):
@@ -84,3 +85,87 @@ def test_resample_output_shape(numpy_backed_dataset):
 
     assert new_h == h * 2
     assert new_w == w * 2
+
+
+# ---------------------------------------------------------------------
+# Op results wrap their computed array; nothing is re-encoded
+# ---------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        lambda ds: ds.add(1),
+        lambda ds: ds.sqrt(),
+        lambda ds: ds.normalized_difference(ds),
+        lambda ds: ds.ndvi(1, nir=1),
+        lambda ds: ds.normalize_min_max(),
+        lambda ds: ds.stack(ds),
+        lambda ds: ds.clip_raster_with_bbox((500_000, 4_199_960, 500_030, 4_200_000)),
+        lambda ds: ds.reproject_raster(target_crs=32634),
+        lambda ds: ds.extract_value_at_coordinate((500_015.0, 4_199_985.0)),
+    ],
+)
+def test_numpy_backed_ops_never_promote(numpy_backed_dataset, monkeypatch, op):
+    _forbid_promotion(monkeypatch)
+
+    result = op(numpy_backed_dataset)
+
+    if not np.isscalar(result):
+        assert isinstance(result._adapter, NumpyRasterioAdapter)
+
+
+def test_op_result_on_rasterio_input_is_numpy_backed(single_band_float32):
+    result = single_band_float32.add(1)
+
+    assert isinstance(result._adapter, NumpyRasterioAdapter)
+    assert result.get_crs() == single_band_float32.get_crs()
+    assert result.get_bounds() == single_band_float32.get_bounds()
+
+
+def test_clip_bbox_of_numpy_backed_dataset_is_a_copy(numpy_backed_dataset):
+    source = numpy_backed_dataset.read().copy()
+    clipped = numpy_backed_dataset.clip_raster_with_bbox((500_000, 4_199_960, 500_030, 4_200_000))
+
+    assert clipped.get_shape() == (4, 3)
+    assert not np.shares_memory(clipped.read(), numpy_backed_dataset.read())
+    np.testing.assert_array_equal(clipped.read(), source[:, :4, :3])
+    clipped.read()[:] = -1  # writing through the clip leaves the source alone
+    np.testing.assert_array_equal(numpy_backed_dataset.read(), source)
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        lambda ds: ds.reproject_raster(target_crs=4326),
+        lambda ds: ds.clip_raster_with_bbox((500_010, 4_199_950, 500_050, 4_199_990)),
+        lambda ds: ds.stack(ds),
+        lambda ds: ds.mosaic(ds),
+        lambda ds: ds.resample(scale_factor=0.5),
+    ],
+)
+def test_numpy_and_rasterio_inputs_agree(numpy_backed_dataset, op):
+    from_numpy = op(numpy_backed_dataset)
+    from_rasterio = op(numpy_backed_dataset.to_rasterio())
+
+    assert from_numpy.get_transform() == from_rasterio.get_transform()
+    assert from_numpy.get_crs() == from_rasterio.get_crs()
+    np.testing.assert_array_equal(from_numpy.read(), from_rasterio.read())
+
+
+def test_numpy_read_honours_rasterio_arguments(numpy_backed_dataset):
+    array = numpy_backed_dataset.read()
+    promoted = numpy_backed_dataset.to_rasterio()
+
+    np.testing.assert_array_equal(numpy_backed_dataset.read(1), array[0])
+    np.testing.assert_array_equal(numpy_backed_dataset.read([1]), array)
+    window = Window(1, 2, 3, 2)
+    np.testing.assert_array_equal(
+        numpy_backed_dataset.read(1, window=window), promoted.read(1, window=window)
+    )
+    # Decimated reads are served by GDAL, exactly as for a rasterio dataset.
+    np.testing.assert_array_equal(
+        numpy_backed_dataset.read(out_shape=(1, 3, 3)), promoted.read(out_shape=(1, 3, 3))
+    )
+    with pytest.raises(IndexError, match="valid 1..1"):
+        numpy_backed_dataset.read(2)
@@ -87,7 +87,9 @@ IDENTITY_OPS = {
     "reproject_raster": lambda ds: ds.reproject_raster(target_crs=4326),
     "clip_raster_with_bbox": lambda ds: ds.clip_raster_with_bbox(_inset_bbox(ds)),
     "clip_raster_with_vector": lambda ds: ds.clip_raster_with_vector(_inset_gdf(ds)),
+    "clip_raster_with_features": lambda ds: next(ds.clip_raster_with_features(_inset_gdf(ds)))[1],
     "to_rasterio": lambda ds: ds.to_rasterio(),
+    "build_overviews": lambda ds: ds.build_overviews([2]),
     "operator_add": lambda ds: ds + 1,
     "operator_mul": lambda ds: ds * 2,
     "operator_pow": lambda ds: ds**2,
@@ -235,6 +237,28 @@ def test_index_names_survive_chaining_into_another_op():
     assert chained.band_names == ["ndvi"]
 
 
+# ---------------------------------------------------------------------------
+# The raster calculator resolves expression names as band names
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("backend", ["rasterio", "numpy"])
+def test_eval_by_name_matches_aliased_indexes(backend):
+    scene = _scene(backend=backend)
+    by_name = scene.eval("(NIR - red) / (nir + red)")
+    by_index = scene.eval("(a - b) / (a + b)", bands={"a": 4, "b": 3})
+    np.testing.assert_array_equal(by_name.get_band(1), by_index.get_band(1))
+
+
+def test_eval_output_is_unnamed_unless_named():
+    scene = _scene()
+    assert scene.eval("nir * 2").band_names == [None]
+    assert scene.eval("nir * 2", name="nir2").band_names == ["nir2"]
+
+
+def test_eval_rejects_an_unknown_band_name():
+    with pytest.raises(ValidationError):
+        _scene().eval("no_such_band + 1")
+
+
 # ---------------------------------------------------------------------------
 # Every pixel-statistic op accepts a name
 # ---------------------------------------------------------------------------
@@ -277,6 +301,30 @@ def test_extract_value_at_coordinate_by_name_matches_by_index(backend):
     )
 
 
+@pytest.mark.parametrize("backend", ["rasterio", "numpy"])
+def test_extract_values_at_coordinates_names_its_columns_after_the_bands(backend):
+    scene = _scene(backend=backend)
+    left, bottom, right, top = scene.get_bounds()
+    points = [((left + right) / 2, (bottom + top) / 2), (left + 1, top - 1)]
+    by_name = scene.extract_values_at_coordinates(points, bands=["swir", "red"])
+    by_index = scene.extract_values_at_coordinates(points, bands=[5, 3])
+    assert list(by_name.columns) == ["swir", "red"]
+    assert by_name.equals(by_index)
+
+
+@pytest.mark.parametrize("backend", ["rasterio", "numpy"])
+def test_zonal_stats_names_its_columns_after_the_bands(backend):
+    scene = _scene(backend=backend)
+    left, bottom, right, top = scene.get_bounds()
+    zones = gpd.GeoDataFrame(
+        geometry=[box(left, bottom, (left + right) / 2, top)], crs=scene.get_crs()
+    )
+    by_name = scene.zonal_stats(zones, "mean", bands=["swir", "red"])
+    by_index = scene.zonal_stats(zones, "mean", bands=[5, 3])
+    assert list(by_name.columns) == ["swir_mean", "red_mean"]
+    assert by_name.equals(by_index)
+
+
 @pytest.mark.parametrize("backend", ["rasterio", "numpy"])
 def test_get_band_by_name_matches_by_index(backend):
     scene = _scene(backend=backend)
@@ -434,7 +482,10 @@ def test_every_bound_op_is_covered_by_this_module():
         | set(STATS_OPS)
         | set(BAND_PLOTS)
         | {
+            "eval",  # covered above
             "extract_value_at_coordinate",
+            "extract_values_at_coordinates",
+            "zonal_stats",
             "normalized_difference",  # covered in test_band_names.py
             "plot_composite",
             "stack",
@@ -0,0 +1,205 @@
+"""Block-wise execution: window planning, the block budget option, and the
+guarantee that splitting an operation into windows never changes its result."""
+
+import numpy as np
+import pytest
+import rasterio as rio
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import ValidationError, load_array, load_raster
+from eeo.common import get_nodata
+from eeo.core.blocks import block_windows
+
+
+@pytest.fixture
+def tiled_path(tiled_scene):
+    """100x90 two-band float32 GeoTIFF stored in 32x32 tiles, with nodata."""
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-5, 50, size=(2, 100, 90)).astype(np.float32)
+    data[:, 3:7, 40:45] = -9999
+    return tiled_scene(data, nodata=-9999, block=32, name="tiled.tif")
+
+
+def _covers_exactly(windows, shape):
+    hit = np.zeros(shape, dtype=int)
+    for w in windows:
+        (r0, r1), (c0, c1) = w.toranges()
+        hit[r0:r1, c0:c1] += 1
+    return np.all(hit == 1)
+
+
+# ---------------------------------------------------------------------
+# Window planning
+# ---------------------------------------------------------------------
+
+
+def test_windows_tile_raster_exactly_on_native_blocks(tiled_path):
+    ds = load_raster(tiled_path)
+    windows = block_windows(ds._adapter, budget=1)
+
+    assert _covers_exactly(windows, (100, 90))
+    # A budget below one block still yields whole native blocks, row-major.
+    assert len(windows) == 4 * 3
+    assert all(w.col_off % 32 == 0 and w.row_off % 32 == 0 for w in windows)
+    assert [(w.row_off, w.col_off) for w in windows[:4]] == [(0, 0), (0, 32), (0, 64), (32, 0)]
+
+
+def test_windows_grow_to_full_width_strips_within_budget(tiled_path):
+    ds = load_raster(tiled_path)
+    # Two bands x float32 = 8 bytes per pixel; room for two block rows.
+    windows = block_windows(ds._adapter, budget=8 * 64 * 90)
+
+    assert _covers_exactly(windows, (100, 90))
+    assert all(w.width == 90 for w in windows)
+    assert [w.row_off for w in windows] == [0, 64]
+
+
+def test_windows_default_budget_covers_small_raster_in_one_window(tiled_path):
+    ds = load_raster(tiled_path)
+    assert len(block_windows(ds._adapter)) == 1
+
+
+def test_numpy_backend_uses_row_strips():
+    ds = load_array(np.zeros((10, 7), dtype=np.float64), transform=GRID, crs=UTM_CRS)
+    windows = block_windows(ds._adapter, budget=8 * 7 * 3)
+
+    assert _covers_exactly(windows, (10, 7))
+    assert [w.height for w in windows] == [3, 3, 3, 1]
+
+
+# ---------------------------------------------------------------------
+# Results are independent of the block budget
+# ---------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        lambda ds: ds.add(ds),
+        lambda ds: ds.subtract(3),
+        lambda ds: ds.multiply(ds),
+        lambda ds: ds.divide(ds.subtract(10)),
+        lambda ds: ds.power(2),
+        lambda ds: ds.sqrt(),
+        lambda ds: ds.log(base=10),
+        lambda ds: ds.absolute(),
+    ],
+)
+def test_blockwise_result_matches_single_window(tiled_path, op):
+    ds = load_raster(tiled_path)
+    whole = op(ds)
+    with eeo.set_options(block_budget=1):
+        blocked = op(ds)
+
+    assert blocked.get_metadata()["dtype"] == whole.get_metadata()["dtype"]
+    np.testing.assert_equal(get_nodata(blocked), get_nodata(whole))
+    np.testing.assert_array_equal(blocked.read(), whole.read())
+
+
+def test_blockwise_integer_sentinel_survives_every_block():
+    data = np.arange(64 * 64, dtype=np.int16).reshape(1, 64, 64)
+    data[0, ::17, ::13] = -1
+    ds = load_array(data, transform=GRID, crs=UTM_CRS, nodata=-1)
+
+    with eeo.set_options(block_budget=2 * 64 * 5):
+        result = ds.add(1)
+
+    expected = np.where(data == -1, -1, data + 1)
+    np.testing.assert_array_equal(result.read(), expected)
+    assert get_nodata(result) == -1
+
+
+# ---------------------------------------------------------------------
+# Streaming writes
+# ---------------------------------------------------------------------
+
+
+def test_save_raster_streams_a_file_window_by_window(tiled_path, tmp_path, monkeypatch):
+    ds = load_raster(tiled_path)
+    ds.band_names = ["a", "b"]
+    expected = ds.read()
+    reads = []
+    original = eeo.RasterioAdapter.read_window
+
+    def spy(self, window, indexes=None):
+        reads.append(window)
+        return original(self, window, indexes)
+
+    monkeypatch.setattr(eeo.RasterioAdapter, "read_window", spy)
+    out = tmp_path / "copy.tif"
+    with eeo.set_options(block_budget=1):
+        ds.save_raster(out)
+
+    assert _covers_exactly(reads, (100, 90))
+    assert len(reads) == 12  # one per 32x32 tile
+    with rio.open(out) as src:
+        assert src.descriptions == ("a", "b")
+        np.testing.assert_array_equal(src.read(), expected)
+
+
+def test_save_raster_writes_numpy_without_an_in_memory_copy(tmp_path, monkeypatch):
+    data = np.arange(3 * 50 * 40, dtype=np.int16).reshape(3, 50, 40)
+    ds = load_array(data, transform=GRID, crs=UTM_CRS, nodata=-1)
+
+    def no_copy(*args, **kwargs):
+        raise AssertionError("the array was copied into an in-memory GeoTIFF")
+
+    monkeypatch.setattr(eeo.RasterioAdapter, "from_array", no_copy)
+    out = tmp_path / "array.tif"
+    with eeo.set_options(block_budget=3 * 2 * 40 * 7):
+        ds.save_raster(out)
+
+    with rio.open(out) as src:
+        assert src.nodata == -1
+        assert src.crs == UTM_CRS
+        np.testing.assert_array_equal(src.read(), data)
+
+
+def test_save_raster_streams_a_deferred_chain_without_materializing(tiled_path, tmp_path):
+    ds = load_raster(tiled_path)
+    with eeo.set_options(deferred=True):
+        lazy = ds.multiply(2).add(1)
+    out = tmp_path / "chain.tif"
+    with eeo.set_options(block_budget=1):
+        lazy.save_raster(out)
+
+    assert not lazy._adapter.is_materialized
+    np.testing.assert_array_equal(load_raster(out).read(), ds.multiply(2).add(1).read())
+
+
+# ---------------------------------------------------------------------
+# Options
+# ---------------------------------------------------------------------
+
+
+def test_set_options_context_manager_restores_previous_value():
+    before = eeo.get_options()["block_budget"]
+    with eeo.set_options(block_budget=1234):
+        assert eeo.get_options()["block_budget"] == 1234
+    assert eeo.get_options()["block_budget"] == before
+
+
+def test_set_options_restores_on_error():
+    before = eeo.get_options()["block_budget"]
+    with pytest.raises(RuntimeError), eeo.set_options(block_budget=99):
+        raise RuntimeError("boom")
+    assert eeo.get_options()["block_budget"] == before
+
+
+def test_get_options_returns_a_copy():
+    eeo.get_options()["block_budget"] = 1
+    assert eeo.get_options()["block_budget"] != 1
+
+
+@pytest.mark.parametrize("value", [0, -1, 1.5, True, "64MB"])
+def test_set_options_rejects_invalid_budget(value):
+    before = eeo.get_options()
+    with pytest.raises(ValidationError, match="block_budget"):
+        eeo.set_options(block_budget=value)
+    assert eeo.get_options() == before
+
+
+def test_set_options_rejects_unknown_name():
+    with pytest.raises(ValidationError, match="unknown option 'blocksize'"):
+        eeo.set_options(blocksize=10)
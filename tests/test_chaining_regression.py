@@ -32,15 +32,15 @@ def _inset_bbox(ds):
     return (left + 10, bottom + 10, right - 10, top - 10)
 
 
-def test_derived_dataset_is_writer_backed_but_rasterio(single_band_float32):
+def test_promoted_dataset_is_writer_backed_but_rasterio(single_band_float32):
     """The precondition that used to trip the old guard.
 
-    A derived dataset's backend is a ``DatasetWriter`` (not a
+    A promoted in-memory dataset's backend is a ``DatasetWriter`` (not a
     ``DatasetReader``), yet it is genuinely rasterio-backed.
     """
-    derived = single_band_float32.add(1)
-    assert not isinstance(derived.ds, DatasetReader)
-    assert is_rasterio_backed(derived)
+    promoted = single_band_float32.add(1).to_rasterio()
+    assert not isinstance(promoted.ds, DatasetReader)
+    assert is_rasterio_backed(promoted)
 
 
 def test_chain_clip_bbox_on_derived(single_band_float32):
@@ -0,0 +1,197 @@
+"""Per-feature clipping (clip_raster_with_features): one output per feature, one pass."""
+
+from collections.abc import Iterator
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+import rasterio as rio
+from shapely.geometry import box
+
+import eeo
+from conftest import GRID
+from eeo import ValidationError
+from eeo.core import EEORasterDataset
+from eeo.preprocessing import clip_raster_with_features
+
+
+@pytest.fixture
+def scene():
+    """Two-band 80x72 int16 scene with a nodata patch."""
+    rng = np.random.default_rng(2)
+    data = rng.integers(1, 1000, size=(2, 80, 72), dtype=np.int16)
+    data[:, 30:34, 20:40] = -1
+    return data
+
+
+@pytest.fixture
+def fields():
+    """Fields of assorted sizes and shapes, overlapping and spanning tiles."""
+    rng = np.random.default_rng(4)
+    shapes = []
+    for _ in range(30):
+        x, y = rng.uniform(500_000, 500_650), rng.uniform(4_199_250, 4_199_950)
+        w, h = rng.uniform(15, 200, size=2)
+        shapes.append(box(x, y - h, x + w, y).buffer(rng.uniform(0, 15)))
+    return gpd.GeoDataFrame(
+        {"field": [f"f{i:02d}" for i in range(len(shapes))]}, geometry=shapes, crs=32633
+    )
+
+
+def one_by_one(ds, fields, **kwargs):
+    """What clipping each field on its own gives, by field id."""
+    clips = {}
+    for field, geometry in zip(fields["field"], fields.geometry, strict=True):
+        single = gpd.GeoDataFrame(geometry=[geometry], crs=fields.crs)
+        clips[field] = ds.clip_raster_with_vector(single, **kwargs)
+    return clips
+
+
+def assert_same_clips(clips, expected):
+    assert set(clips) == set(expected)
+    for field, clip in clips.items():
+        np.testing.assert_array_equal(clip.read(), expected[field].read())
+        assert clip.get_transform() == expected[field].get_transform()
+        assert clip.get_nodata() == expected[field].get_nodata()
+        assert clip.get_dtype() == expected[field].get_dtype()
+
+
+@pytest.mark.parametrize("backend", ["numpy", "tiled"])
+@pytest.mark.parametrize("all_touched", [False, True])
+def test_matches_clipping_each_feature_alone(scene, fields, tiled_scene, backend, all_touched):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-1)
+    if backend == "tiled":
+        ds = eeo.load_raster(tiled_scene(scene, nodata=-1))
+
+    clips = dict(ds.clip_raster_with_features(fields, "field", all_touched=all_touched, workers=2))
+
+    assert_same_clips(clips, one_by_one(ds, fields, all_touched=all_touched))
+
+
+def test_adjacent_features_each_keep_their_edge(scene):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-1)
+    # Shared edges run through pixel centres, where only one side may claim them.
+    grid = gpd.GeoDataFrame(
+        {"field": ["a", "b", "c", "d"]},
+        geometry=[
+            box(500_005, 4_199_605, 500_205, 4_199_805),
+            box(500_205, 4_199_605, 500_405, 4_199_805),
+            box(500_005, 4_199_405, 500_205, 4_199_605),
+            box(500_205, 4_199_405, 500_405, 4_199_605),
+        ],
+        crs=32633,
+    )
+
+    for all_touched in (False, True):
+        clips = dict(ds.clip_raster_with_features(grid, "field", all_touched=all_touched))
+        assert_same_clips(clips, one_by_one(ds, grid, all_touched=all_touched))
+
+
+def test_every_tile_is_read_at_most_once(scene, fields, tiled_scene, monkeypatch):
+    from eeo.core.adapters import RasterioAdapter
+
+    ds = eeo.load_raster(tiled_scene(scene))
+    reads = []
+    read_window = RasterioAdapter.read_window
+
+    def spy(self, window, indexes=None):
+        reads.append((window.row_off, window.col_off, window.height, window.width))
+        return read_window(self, window, indexes)
+
+    monkeypatch.setattr(RasterioAdapter, "read_window", spy)
+    corner = gpd.GeoDataFrame(
+        {"field": ["x", "y"]},
+        geometry=[
+            box(500_005, 4_199_700, 500_300, 4_199_995),
+            box(500_100, 4_199_800, 500_200, 4_199_900),
+        ],
+        crs=32633,
+    )
+    clips = list(ds.clip_raster_with_features(corner, "field", workers=2))
+
+    assert len(clips) == 2
+    assert len(reads) == len(set(reads))  # no tile twice
+    assert sorted(reads) == [(row, col, 16, 16) for row in (0, 16) for col in (0, 16)]
+
+
+def test_writes_one_file_per_feature(scene, fields, tmp_path):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-1)
+
+    paths = ds.clip_raster_with_features(
+        fields, "field", out_dir=tmp_path / "chips", save_kwargs={"compress": "deflate"}
+    )
+
+    assert paths == {field: tmp_path / "chips" / f"{field}.tif" for field in fields["field"]}
+    expected = one_by_one(ds, fields)
+    for field, path in paths.items():
+        written = eeo.load_raster(path)
+        np.testing.assert_array_equal(written.read(), expected[field].read())
+        assert written.get_transform() == expected[field].get_transform()
+        with rio.open(path) as src:
+            assert src.compression.name.lower() == "deflate"
+
+
+def test_features_are_reprojected_and_misses_left_out(scene, fields):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-1)
+    extra = gpd.GeoDataFrame(
+        {"field": ["outside", "empty"]},
+        geometry=[box(400_000, 4_000_000, 400_100, 4_000_100), None],
+        crs=32633,
+    )
+    layer = gpd.GeoDataFrame(pd.concat([fields, extra], ignore_index=True), crs=32633).to_crs(4326)
+
+    clips = dict(ds.clip_raster_with_features(layer, "field"))
+
+    assert set(clips) == set(fields["field"])
+    assert_same_clips(clips, one_by_one(ds, fields.to_crs(4326)))
+
+
+def test_float_raster_takes_a_nan_fill(scene, fields):
+    ds = eeo.load_array(scene.astype(np.float32), transform=GRID, crs=32633, nodata=-1)
+    clips = dict(ds.clip_raster_with_features(fields, "field", nodata=np.nan))
+
+    expected = one_by_one(ds, fields, nodata=np.nan)
+    assert set(clips) == set(expected)
+    for field, clip in clips.items():
+        np.testing.assert_array_equal(clip.read(), expected[field].read())
+        assert np.isnan(clip.get_nodata())
+
+
+def test_method_form_returns_the_clips_not_a_dataset(scene, fields, tmp_path):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-1)
+
+    clips = ds.clip_raster_with_features(fields, "field")
+    paths = ds.clip_raster_with_features(fields, "field", out_dir=tmp_path)
+
+    assert isinstance(clips, Iterator) and not isinstance(clips, EEORasterDataset)
+    assert_same_clips(dict(clips), dict(clip_raster_with_features(ds, fields, "field")))
+    assert isinstance(paths, dict) and set(paths) == set(fields["field"])
+
+
+def test_nodata_override_and_index_ids(scene, fields):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633)
+    clips = dict(ds.clip_raster_with_features(fields.set_index("field"), nodata=-9))
+
+    assert_same_clips(clips, one_by_one(ds, fields, nodata=-9))
+    assert all(clip.get_nodata() == -9 for clip in clips.values())
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"id_column": "missing"}, "id_column"),
+        ({"id_column": "duplicated"}, "unique"),
+        ({"features": "missing.gpkg"}, "features must be"),
+        ({"workers": 0}, "workers"),
+        ({"nodata": np.nan}, "cannot be stored"),
+        ({"nodata": 40_000}, "cannot be stored"),
+        ({"nodata": -1.5}, "cannot be stored"),
+    ],
+)
+def test_invalid_arguments_raise(scene, fields, kwargs, match):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633)
+    fields["duplicated"] = "same"
+    arguments = {"features": fields, "id_column": "field", **kwargs}
+    with pytest.raises(ValidationError, match=match):
+        ds.clip_raster_with_features(**arguments)
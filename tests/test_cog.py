@@ -0,0 +1,128 @@
+"""Cloud-Optimized GeoTIFF output and GeoTIFF creation options on
+``save_raster``: layout, compression, predictor, tiling, internal overviews,
+and window-by-window streaming from the source."""
+
+import numpy as np
+import pytest
+import rasterio as rio
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import ValidationError, load_array, load_raster
+from eeo.core.adapters import NumpyRasterioAdapter
+from eeo.core.writer import geotiff_options
+
+
+@pytest.fixture
+def scene():
+    rng = np.random.default_rng(9)
+    data = rng.normal(100, 20, size=(2, 700, 600)).astype(np.float32)
+    data[:, :10, :10] = -9999
+    return load_array(data, transform=GRID, crs=UTM_CRS, nodata=-9999.0, band_names=["a", "b"])
+
+
+@pytest.fixture
+def window_reads(monkeypatch):
+    """Record the windows read from NumPy-backed sources."""
+    windows = []
+    original = NumpyRasterioAdapter.read_window
+
+    def spy(self, window, indexes=None):
+        windows.append(window)
+        return original(self, window, indexes)
+
+    monkeypatch.setattr(NumpyRasterioAdapter, "read_window", spy)
+    return windows
+
+
+def test_cog_layout(scene, tmp_path, window_reads):
+    path = tmp_path / "scene.tif"
+    with eeo.set_options(block_budget=1):
+        scene.save_raster(path, cog=True, compress="zstd", predictor=True, blocksize=256)
+
+    with rio.open(path) as src:
+        structure = src.tags(ns="IMAGE_STRUCTURE")
+        assert structure["LAYOUT"] == "COG"
+        assert structure["COMPRESSION"] == "ZSTD"
+        assert structure["PREDICTOR"] == "3"
+        assert src.block_shapes[0] == (256, 256)
+        assert src.overviews(1) == [2, 4]
+        assert src.descriptions == ("a", "b")
+        assert src.nodata == -9999.0
+        np.testing.assert_array_equal(src.read(), scene.read())
+    assert len(window_reads) > 1  # streamed, not read whole
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["scene.tif"]  # staging removed
+
+
+def test_cog_with_explicit_overviews(scene, tmp_path):
+    path = tmp_path / "scene.tif"
+    scene.save_raster(path, driver="COG", cog=True, overviews=[2, 4, 8], num_threads="ALL_CPUS")
+
+    with rio.open(path) as src:
+        assert src.overviews(1) == [2, 4, 8]
+        assert src.block_shapes[0] == (512, 512)
+
+
+def test_compressed_geotiff_is_tiled_and_streamed(scene, tmp_path, window_reads):
+    path = tmp_path / "scene.tif"
+    with eeo.set_options(block_budget=1):
+        scene.save_raster(path, compress="deflate", predictor=3, num_threads=2)
+
+    with rio.open(path) as src:
+        assert src.compression.name == "deflate"
+        assert src.block_shapes[0] == (512, 512)
+        assert src.tags(ns="IMAGE_STRUCTURE").get("LAYOUT") != "COG"
+    np.testing.assert_array_equal(load_raster(path).read(), scene.read())
+    assert len(window_reads) > 1
+
+
+@pytest.mark.parametrize(("budget", "shape"), [(1, (256, 256)), (2 * 4 * 256 * 600, (256, 600))])
+def test_tiled_output_is_written_in_whole_tiles(scene, tmp_path, window_reads, budget, shape):
+    path = tmp_path / "scene.tif"
+    with eeo.set_options(block_budget=budget):
+        scene.save_raster(path, compress="deflate", blocksize=256)
+
+    # The NumPy source has no blocks of its own: windows follow the output's.
+    assert len(window_reads) == len(range(0, 700, 256)) * len(range(0, 600, shape[1]))
+    for window in window_reads:
+        assert window.row_off % 256 == 0 and window.col_off % 256 == 0
+        assert window.height == min(shape[0], 700 - window.row_off)
+        assert window.width == min(shape[1], 600 - window.col_off)
+    np.testing.assert_array_equal(load_raster(path).read(), scene.read())
+
+
+def test_geotiff_options():
+    assert geotiff_options(np.dtype("uint16"), predictor=True, blocksize=128) == {
+        "predictor": 2,
+        "tiled": True,
+        "blockxsize": 128,
+        "blockysize": 128,
+    }
+    assert geotiff_options(np.dtype("float32")) == {}
+    with eeo.set_options(num_threads=4):
+        assert geotiff_options(np.dtype("float32"))["num_threads"] == "4"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"compress": "rar"}, "compress"),
+        ({"predictor": 4}, "predictor"),
+        ({"blocksize": 500}, "multiple of 16"),
+        ({"num_threads": 0}, "num_threads"),
+        ({"cog": True, "driver": "PNG"}, "driver"),
+        ({"compress": "lzw", "driver": "PNG"}, "GeoTIFF"),
+        ({"cog": True, "overviews": [1]}, "factors"),
+    ],
+)
+def test_invalid_settings_write_nothing(scene, tmp_path, kwargs, match):
+    path = tmp_path / "never.tif"
+    with pytest.raises(ValidationError, match=match):
+        scene.save_raster(path, **kwargs)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_integer_raster_rejects_the_float_predictor(tmp_path):
+    ds = load_array(np.ones((32, 32), dtype=np.uint8), transform=GRID, crs=32633)
+    with pytest.raises(ValidationError, match="float"):
+        ds.save_raster(tmp_path / "x.tif", cog=True, predictor=3)
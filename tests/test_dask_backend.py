@@ -0,0 +1,189 @@
+"""Dask-backed (lazy, chunked) datasets: construction, lazy element-wise
+algebra, and agreement with the eager backends."""
+
+import numpy as np
+import pytest
+import rasterio as rio
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import DaskAdapter, load_array, load_raster
+from eeo.common import get_nodata
+
+da = pytest.importorskip("dask.array", reason="needs the lazy extra (dask)")
+
+
+@pytest.fixture
+def scene_path(tiled_scene):
+    """50x70 three-band uint16 GeoTIFF in 16x16 tiles, nodata 0, named bands."""
+    rng = np.random.default_rng(2)
+    data = rng.integers(1, 10_000, size=(3, 50, 70)).astype(np.uint16)
+    data[:, 10:14, 20:30] = 0
+    return tiled_scene(data, nodata=0, band_names=["green", "red", "nir"])
+
+
+def test_load_raster_with_chunks_is_lazy(scene_path):
+    ds = load_raster(scene_path, chunks=(16, 32))
+
+    assert isinstance(ds._adapter, DaskAdapter)
+    assert isinstance(ds.ds, da.Array)
+    assert ds.ds.chunks[1][0] == 16 and ds.ds.chunks[2][0] == 32
+    assert ds.band_names == ["green", "red", "nir"]
+    assert get_nodata(ds) == 0
+    np.testing.assert_array_equal(ds.read(), load_raster(scene_path).read())
+
+
+def test_auto_chunks_align_to_native_blocks(scene_path):
+    with eeo.set_options(block_budget=1):
+        ds = load_raster(scene_path, chunks="auto")
+    assert ds.ds.chunks[1][0] == 16 and ds.ds.chunks[2][0] == 16
+
+
+def test_elementwise_chain_stays_lazy_and_matches_eager(scene_path):
+    eager = load_raster(scene_path)
+    lazy = load_raster(scene_path, chunks=(16, 16))
+
+    expected = eager.multiply(0.0001).add(-0.1).divide(eager.add(1)).log()
+    result = lazy.multiply(0.0001).add(-0.1).divide(lazy.add(1)).log()
+
+    assert isinstance(result._adapter, DaskAdapter)
+    assert result.get_metadata()["dtype"] == expected.get_metadata()["dtype"]
+    np.testing.assert_equal(get_nodata(result), get_nodata(expected))
+    np.testing.assert_array_equal(result.read(), expected.read())
+
+
+def test_integer_sentinel_contract_on_dask(scene_path):
+    lazy = load_raster(scene_path, chunks=(16, 16))
+    result = lazy.add(5)
+
+    assert np.dtype(result.get_metadata()["dtype"]) == np.uint16
+    assert get_nodata(result) == 0
+    np.testing.assert_array_equal(result.read(), load_raster(scene_path).add(5).read())
+
+
+def test_mixed_backends_produce_dask_result(scene_path):
+    eager = load_raster(scene_path)
+    lazy = load_raster(scene_path, chunks=(16, 16))
+    numpy_backed = load_array(eager.read(), transform=GRID, crs=UTM_CRS, nodata=0)
+
+    result = numpy_backed.subtract(lazy)
+
+    assert isinstance(result._adapter, DaskAdapter)
+    np.testing.assert_array_equal(result.read(), eager.subtract(eager).read())
+
+
+def test_chunk_and_compute_round_trip():
+    array = np.arange(2 * 30 * 20, dtype=np.float32).reshape(2, 30, 20)
+    ds = load_array(array, transform=GRID, crs=UTM_CRS, band_names=["a", "b"])
+    lazy = ds.chunk((10, 10))
+
+    assert isinstance(lazy._adapter, DaskAdapter)
+    assert lazy.band_names == ["a", "b"]
+
+    doubled = lazy.multiply(2)
+    assert doubled.compute() is doubled
+    assert not isinstance(doubled._adapter, DaskAdapter)
+    np.testing.assert_array_equal(doubled.read(), array * 2)
+
+
+def test_load_array_accepts_dask_array():
+    array = da.ones((3, 12, 12), chunks=(1, 6, 6), dtype=np.float32)
+    ds = load_array(array, transform=GRID, crs=UTM_CRS)
+
+    assert isinstance(ds._adapter, DaskAdapter)
+    # Bands are always gathered into one chunk.
+    assert ds.ds.numblocks[0] == 1
+    assert ds.get_band(2).shape == (12, 12)
+
+
+def test_save_raster_streams_chunks(tmp_path, scene_path):
+    lazy = load_raster(scene_path, chunks=(16, 16))
+    out = tmp_path / "out.tif"
+    lazy.multiply(2).save_raster(out)
+
+    with rio.open(out) as src:
+        np.testing.assert_array_equal(src.read(), load_raster(scene_path).multiply(2).read())
+        assert src.descriptions == ("green", "red", "nir")
+
+
+def test_read_honors_indexes_window_and_out_shape(scene_path):
+    lazy = load_raster(scene_path, chunks=(16, 16))
+    eager = load_raster(scene_path)
+    window = rio.windows.Window(5, 3, 30, 20)
+
+    assert lazy.read(1).shape == (50, 70)
+    np.testing.assert_array_equal(lazy.read(3), eager.read(3))
+    np.testing.assert_array_equal(lazy.read([3, 1]), eager.read([3, 1]))
+    np.testing.assert_array_equal(lazy.read(window=window), eager.read(window=window))
+    np.testing.assert_array_equal(lazy.read(2, window=window), eager.read(2, window=window))
+    np.testing.assert_array_equal(
+        lazy.read(out_shape=(3, 25, 35)), eager.read(out_shape=(3, 25, 35))
+    )
+    np.testing.assert_array_equal(
+        lazy.read(2, out_shape=(25, 35)), eager.read(2, out_shape=(25, 35))
+    )
+    with pytest.raises(IndexError):
+        lazy.read(4)
+
+
+def test_bounds_are_a_bounding_box(scene_path):
+    lazy = load_raster(scene_path, chunks=(16, 16))
+    assert lazy._adapter.get_bounds() == load_raster(scene_path)._adapter.get_bounds()
+    assert isinstance(lazy._adapter.get_bounds(), rio.coords.BoundingBox)
+
+
+def test_gdal_bound_op_materializes(scene_path):
+    lazy = load_raster(scene_path, chunks=(16, 16))
+    resampled = lazy.resample(scale_factor=0.5)
+    expected = load_raster(scene_path).resample(scale_factor=0.5)
+    np.testing.assert_array_equal(resampled.read(), expected.read())
+
+
+def test_iter_blocks_follows_chunks(scene_path):
+    lazy = load_raster(scene_path, chunks=(16, 32))
+    eager = load_raster(scene_path)
+
+    pairs = list(lazy.iter_blocks(bands="nir"))
+
+    assert pairs[0][0] == rio.windows.Window(0, 0, 32, 16)
+    for window, block in pairs:
+        np.testing.assert_array_equal(block, eager.read_window(window, bands=3))
+
+
+def test_indices_stay_lazy_and_match_eager(scene_path):
+    eager = load_raster(scene_path)
+    lazy = load_raster(scene_path, chunks=(16, 32))
+    separate_red = load_array(eager.get_band(2), transform=GRID, crs=UTM_CRS, nodata=0)
+
+    index = lazy.ndvi(red="red", nir="nir", name="ndvi")
+    mixed = lazy.ndvi(red=separate_red, nir=3)
+    evi = lazy.evi(blue=1, red=2, nir=3)
+
+    assert isinstance(index._adapter, DaskAdapter)
+    assert isinstance(mixed._adapter, DaskAdapter)
+    assert index.band_names == ["ndvi"]
+    expected = eager.ndvi(red="red", nir="nir")
+    assert np.isnan(get_nodata(index))
+    np.testing.assert_array_equal(index.read(), expected.read())
+    np.testing.assert_array_equal(mixed.read(), expected.read())
+    np.testing.assert_array_equal(evi.read(), eager.evi(blue=1, red=2, nir=3).read())
+
+
+@pytest.mark.parametrize(
+    ("op", "kwargs"),
+    [
+        ("standardize", {}),
+        ("normalize_min_max", {"new_min": -1, "new_max": 1}),
+        ("normalize_percentile", {"lower_percentile": 5, "upper_percentile": 95}),
+    ],
+)
+def test_normalizations_rescale_lazily(scene_path, op, kwargs):
+    lazy = load_raster(scene_path, chunks=(16, 16))
+
+    result = getattr(lazy, op)(**kwargs)
+
+    assert isinstance(result._adapter, DaskAdapter)
+    assert result.band_names == ["green", "red", "nir"]
+    assert np.isnan(get_nodata(result))
+    expected = getattr(load_raster(scene_path), op)(**kwargs)
+    np.testing.assert_array_equal(result.read(), expected.read())
@@ -0,0 +1,130 @@
+"""Deferred evaluation: element-wise chains recorded as an expression graph and
+evaluated once, in a single fused pass per block, when their pixels are needed."""
+
+import gc
+
+import numpy as np
+import pytest
+import rasterio as rio
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import DeferredAdapter, load_array, load_raster
+from eeo.common import get_nodata
+
+
+@pytest.fixture
+def reflectance():
+    rng = np.random.default_rng(1)
+    data = rng.integers(0, 10_000, size=(2, 40, 30)).astype(np.uint16)
+    data[:, :3, :3] = 0
+    return load_array(data, transform=GRID, crs=UTM_CRS, nodata=0)
+
+
+@pytest.fixture
+def red(reflectance):
+    return load_array(
+        reflectance.read()[1].astype(np.float32) + 1, transform=GRID, crs=UTM_CRS, nodata=None
+    )
+
+
+def _chain(ds, other):
+    return ds.multiply(0.0001).add(-0.1).divide(other).log()
+
+
+def test_deferred_chain_matches_eager(reflectance, red):
+    eager = _chain(reflectance, red)
+    with eeo.set_options(deferred=True, block_budget=1):
+        lazy = _chain(reflectance, red)
+
+    assert isinstance(lazy._adapter, DeferredAdapter)
+    assert lazy.get_metadata()["dtype"] == eager.get_metadata()["dtype"]
+    np.testing.assert_equal(get_nodata(lazy), get_nodata(eager))
+    np.testing.assert_array_equal(lazy.read(), eager.read())
+
+
+def test_metadata_does_not_evaluate(reflectance):
+    with eeo.set_options(deferred=True):
+        result = reflectance.multiply(2)
+
+    assert result.get_shape() == (40, 30)
+    assert result.get_count() == 2
+    assert result.get_transform() == GRID
+    assert np.dtype(result.get_metadata()["dtype"]) == np.uint16
+    assert get_nodata(result) == 0
+    assert not result._adapter.is_materialized
+
+    result.read()
+    assert result._adapter.is_materialized
+
+
+def test_chain_evaluates_without_materializing_intermediates(reflectance, red):
+    with eeo.set_options(deferred=True):
+        scaled = reflectance.multiply(0.0001)
+        shifted = scaled.add(-0.1)
+        final = shifted.divide(red)
+
+    final.read()
+    assert final._adapter.is_materialized
+    assert not scaled._adapter.is_materialized
+    assert not shifted._adapter.is_materialized
+
+
+def test_compute_evaluates_once_and_returns_self(reflectance):
+    with eeo.set_options(deferred=True):
+        result = reflectance.add(1)
+        assert result.compute() is result
+    assert result._adapter.is_materialized
+    # Computing an eager dataset is a no-op.
+    assert reflectance.compute() is reflectance
+
+
+def test_save_raster_evaluates_deferred_chain(tmp_path, reflectance, red):
+    eager = _chain(reflectance, red)
+    with eeo.set_options(deferred=True):
+        lazy = _chain(reflectance, red)
+    path = tmp_path / "chain.tif"
+    lazy.save_raster(path)
+
+    with rio.open(path) as src:
+        np.testing.assert_array_equal(src.read(), eager.read())
+
+
+def test_non_elementwise_op_accepts_deferred_input(reflectance):
+    with eeo.set_options(deferred=True):
+        lazy = reflectance.multiply(2)
+    clipped = lazy.clip_raster_with_bbox((500_000, 4_199_800, 500_100, 4_200_000))
+
+    expected = reflectance.multiply(2).clip_raster_with_bbox(
+        (500_000, 4_199_800, 500_100, 4_200_000)
+    )
+    np.testing.assert_array_equal(clipped.read(), expected.read())
+    # A window clip evaluates only the window it reads.
+    assert not lazy._adapter.is_materialized
+
+
+def test_deferred_node_keeps_temporary_source_open(tmp_path):
+    path = tmp_path / "src.tif"
+    load_array(
+        np.arange(12, dtype=np.float32).reshape(3, 4), transform=GRID, crs=UTM_CRS
+    ).save_raster(path)
+
+    with eeo.set_options(deferred=True):
+        result = load_raster(path).multiply(2)
+    gc.collect()
+
+    np.testing.assert_array_equal(result.read()[0], np.arange(12).reshape(3, 4) * 2)
+
+
+def test_band_names_propagate_without_evaluating(reflectance):
+    reflectance.band_names = ["red", "nir"]
+    with eeo.set_options(deferred=True):
+        result = reflectance.multiply(2)
+
+    assert result.band_names == ["red", "nir"]
+    assert not result._adapter.is_materialized
+
+
+def test_deferred_option_rejects_non_bool():
+    with pytest.raises(eeo.ValidationError, match="deferred"):
+        eeo.set_options(deferred=1)
@@ -19,40 +19,15 @@ from eeo.core.exceptions import (
 )
 
 # ---------------------------------------------------------------------
-# BackendError: rasterio-only ops called on a NumPy-backed dataset
+# BackendError: failures inside the rasterio/GDAL backend
 # ---------------------------------------------------------------------
 
 
-def test_mosaic_on_numpy_backend_raises_backend_error(numpy_backed_dataset):
-    with pytest.raises(BackendError, match="rasterio-backed"):
-        numpy_backed_dataset.mosaic(numpy_backed_dataset)
-
-
-def test_stack_on_numpy_backend_raises_backend_error(numpy_backed_dataset):
-    with pytest.raises(BackendError, match="rasterio-backed"):
-        numpy_backed_dataset.stack(numpy_backed_dataset)
-
-
-def test_clip_bbox_on_numpy_backend_raises_backend_error(numpy_backed_dataset):
-    with pytest.raises(BackendError, match="rasterio-backed"):
-        numpy_backed_dataset.clip_raster_with_bbox((0, 0, 10, 10))
-
-
-def test_clip_vector_on_numpy_backend_raises_backend_error(numpy_backed_dataset):
-    # The backend guard fires before the vector file is ever read.
-    with pytest.raises(BackendError, match="rasterio-backed"):
-        numpy_backed_dataset.clip_raster_with_vector("does_not_matter.geojson")
-
-
-def test_reproject_on_numpy_backend_raises_backend_error(numpy_backed_dataset):
-    with pytest.raises(BackendError, match="rasterio-backed"):
-        numpy_backed_dataset.reproject_raster(target_crs=4326)
-
-
 def test_backend_error_is_runtime_error(numpy_backed_dataset):
-    # Backward compatibility: still catchable as RuntimeError.
+    # Backward compatibility: still catchable as RuntimeError. A zero-size
+    # resample fails inside the decimated read and is wrapped.
     with pytest.raises(RuntimeError):
-        numpy_backed_dataset.reproject_raster(target_crs=4326)
+        numpy_backed_dataset.resample(size=(0, 0))
 
 
 def test_adapter_open_failure_raises_backend_error(tmp_path):
@@ -180,7 +155,7 @@ def test_band_out_of_range_numpy_backend_raises_index_error(numpy_backed_dataset
 @pytest.mark.parametrize(
     "action",
     [
-        lambda ds: ds.reproject_raster(target_crs=4326),  # BackendError on numpy backend
+        lambda ds: ds.resample(size=(0, 0)),  # BackendError
         lambda ds: ds.resample(),  # ValidationError
     ],
 )
@@ -0,0 +1,231 @@
+"""Mergeable histograms and the streaming percentiles built on them: exact
+agreement with ``np.nanpercentile``, approximate-mode error bounds, and the
+operations that switched over from full-array percentiles."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import ValidationError, load_array, load_raster
+from eeo.core import histogram
+from eeo.core.adapters import RasterioAdapter
+from eeo.core.histogram import Histogram, array_percentiles, band_histograms, band_percentiles
+
+LEVELS = [0, 2, 25, 50, 73.5, 98, 100]
+
+
+@pytest.fixture
+def float_path(tiled_scene):
+    """64x80 two-band float32 GeoTIFF in 16x16 tiles, with nodata and NaN."""
+    rng = np.random.default_rng(5)
+    data = rng.gamma(2.0, 300.0, size=(2, 64, 80)).astype(np.float32)
+    data[:, 3:9, 7:30] = -9999
+    data[0, 50, :] = np.nan
+    return tiled_scene(data, nodata=-9999, name="float.tif")
+
+
+@pytest.fixture
+def uint16_path(tiled_scene):
+    rng = np.random.default_rng(6)
+    data = rng.integers(0, 12_000, size=(2, 64, 80)).astype(np.uint16)
+    return tiled_scene(data, nodata=0, name="uint16.tif")
+
+
+def _masked(ds):
+    data = ds.read().astype(np.float64)
+    data[data == ds.get_nodata()] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32, np.int16, np.uint8])
+def test_array_percentiles_match_nanpercentile(dtype):
+    rng = np.random.default_rng(0)
+    values = rng.normal(120, 40, size=20_001).astype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        values[::9] = np.nan
+
+    expected = np.nanpercentile(values, LEVELS)
+
+    np.testing.assert_allclose(array_percentiles(values, LEVELS), expected, rtol=1e-12)
+    width = (np.nanmax(values) - np.nanmin(values)) / 4096
+    approx = array_percentiles(values, LEVELS, method="approx")
+    assert np.all(np.abs(approx - expected) <= width)
+
+
+def test_array_percentiles_edge_cases():
+    assert np.isnan(array_percentiles(np.array([np.nan, np.nan]), 50)).all()
+    np.testing.assert_array_equal(array_percentiles(np.full(7, 2.5), [0, 50, 100]), 2.5)
+    with_inf = np.array([1.0, 2.0, np.inf])
+    with np.errstate(invalid="ignore"):
+        expected = np.nanpercentile(with_inf, [0, 10, 50, 100])
+    np.testing.assert_array_equal(array_percentiles(with_inf, [0, 10, 50, 100]), expected)
+    assert array_percentiles(np.array([5, -1, 5, 9]), 50, nodata=-1)[0] == 5
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_band_percentiles_stream_exactly(float_path, workers):
+    ds = load_raster(float_path)
+    data = _masked(ds)
+    with eeo.set_options(block_budget=1):
+        per_band = band_percentiles(ds._adapter, LEVELS, workers=workers)
+        combined = band_percentiles(ds._adapter, LEVELS, combined=True, workers=workers)
+
+    np.testing.assert_allclose(
+        per_band, [np.nanpercentile(band, LEVELS) for band in data], rtol=1e-6
+    )
+    np.testing.assert_allclose(combined, np.nanpercentile(data, LEVELS), rtol=1e-6)
+
+
+def test_small_integer_bands_are_exact_in_one_pass(uint16_path, monkeypatch):
+    ds = load_raster(uint16_path)
+    data = _masked(ds)
+    reads = []
+    original = RasterioAdapter.read_window
+
+    def counting(self, window, indexes=None):
+        reads.append(window)
+        return original(self, window, indexes)
+
+    monkeypatch.setattr(RasterioAdapter, "read_window", counting)
+    with eeo.set_options(block_budget=1):
+        result = band_percentiles(ds._adapter, LEVELS, bands=[2], method="approx")
+
+    assert len(reads) == 20  # one read per 16x16 tile
+    np.testing.assert_array_equal(result[0], np.nanpercentile(data[1], LEVELS))
+
+
+def test_histograms_merge_across_tiles(float_path):
+    ds = load_raster(float_path)
+    band = ds.read(2)
+    low, high = float(band[band != -9999].min()), float(band.max())
+    top, bottom = (Histogram(low, high, 256) for _ in range(2))
+    top.update(band[:32][band[:32] != -9999])
+    bottom.update(band[32:][band[32:] != -9999])
+
+    whole = band_histograms(ds._adapter, bands=[2], bins=256)[0]
+
+    np.testing.assert_array_equal(top.merge(bottom).counts, whole.counts)
+    assert (top.min, top.max, top.count) == (whole.min, whole.max, whole.count)
+    with pytest.raises(ValidationError, match="different bins"):
+        top.merge(Histogram(low, high, 128))
+
+
+def test_all_nodata_band_gives_nan():
+    data = np.full((2, 8, 8), -1.0, dtype=np.float32)
+    data[1] = np.arange(64).reshape(8, 8)
+    ds = load_array(data, transform=GRID, crs=UTM_CRS, nodata=-1.0)
+
+    result = band_percentiles(ds._adapter, [10, 90])
+
+    assert np.isnan(result[0]).all()
+    np.testing.assert_allclose(result[1], np.percentile(np.arange(64), [10, 90]))
+    assert band_histograms(ds._adapter)[0] is None
+
+
+def test_percentiles_use_bounded_memory():
+    data = np.random.default_rng(1).random((1, 1000, 1000), dtype=np.float32)
+    ds = load_array(data, transform=GRID, crs=UTM_CRS)
+
+    tracemalloc.start()
+    try:
+        with eeo.set_options(block_budget=64 * 1024):
+            result = band_percentiles(ds._adapter, [2, 98])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    np.testing.assert_allclose(result[0], np.percentile(data, [2, 98]), rtol=1e-6)
+    assert peak < data.nbytes / 2
+
+
+def test_near_constant_data_refines_in_bounded_memory():
+    data = np.full((1, 1000, 1000), 3.0, dtype=np.float32)
+    data[0, :5] = np.random.default_rng(2).random((5, 1000), dtype=np.float32) * 50
+    ds = load_array(data, transform=GRID, crs=UTM_CRS)
+
+    tracemalloc.start()
+    try:
+        with eeo.set_options(block_budget=64 * 1024):
+            result = band_percentiles(ds._adapter, LEVELS)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    np.testing.assert_array_equal(result[0], np.percentile(data, LEVELS))
+    assert peak < data.nbytes / 2
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32])
+def test_full_bins_are_split_until_small_enough(dtype, monkeypatch):
+    monkeypatch.setattr(histogram, "_MAX_CANDIDATES", 50)
+    rng = np.random.default_rng(8)
+    # Skewed: most values crowd into a sliver of the range.
+    values = np.concatenate([rng.normal(0, 1, 20_000), rng.uniform(0, 1e6, 200)])
+    values = (values * 1000 if dtype == np.int32 else values).astype(dtype)
+
+    result = array_percentiles(values, LEVELS)
+
+    np.testing.assert_allclose(result, np.percentile(values, LEVELS), rtol=1e-12)
+
+
+def test_split_limit_falls_back_to_the_estimate(monkeypatch):
+    monkeypatch.setattr(histogram, "_MAX_CANDIDATES", 50)
+    monkeypatch.setattr(histogram, "_MAX_SPLITS", 0)
+    values = np.random.default_rng(9).normal(0, 1, 20_000)
+
+    result = array_percentiles(values, LEVELS, bins=64)
+
+    width = np.ptp(values) / 64 / 64
+    np.testing.assert_allclose(result, np.percentile(values, LEVELS), atol=width)
+
+
+def test_get_percentile_pixel_streams(float_path):
+    ds = load_raster(float_path)
+    band = _masked(ds)[1]
+    expected = np.nanpercentile(band, 37)
+    row, col = np.unravel_index(np.nanargmin(np.abs(band - expected)), band.shape)
+
+    with eeo.set_options(block_budget=1, num_threads=3):
+        result = ds.get_percentile_pixel(37, 2, return_position_as_pixel_coordinate=True)
+
+    assert result["value"] == pytest.approx(expected, rel=1e-6)
+    assert result["position"] == (row, col)
+
+
+def test_get_percentile_pixel_rejects_empty_band():
+    ds = load_array(np.zeros((4, 4), dtype=np.float32), crs=4326, nodata=0.0)
+    with pytest.raises(ValidationError, match="no valid pixels"):
+        ds.get_percentile_pixel(50)
+
+
+def test_normalize_percentile_modes(float_path):
+    ds = load_raster(float_path)
+    exact = ds.normalize_percentile(lower_percentile=5, upper_percentile=95).read()
+    approx = ds.normalize_percentile(
+        lower_percentile=5, upper_percentile=95, method="approx"
+    ).read()
+
+    data = _masked(ds)
+    low, high = np.nanpercentile(data, [5, 95])
+    np.testing.assert_allclose(
+        exact, np.clip((data - low) / (high - low), 0, 1), rtol=1e-5, atol=1e-6
+    )
+    np.testing.assert_allclose(approx, exact, atol=2e-3)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"q": 101}, "between 0 and 100"),
+        ({"q": [-1, 50]}, "between 0 and 100"),
+        ({"q": "x"}, "numbers"),
+        ({"q": 50, "method": "fast"}, "method"),
+        ({"q": 50, "bins": 0}, "bins"),
+    ],
+)
+def test_invalid_arguments(kwargs, match):
+    with pytest.raises(ValidationError, match=match):
+        array_percentiles(np.arange(5.0), **kwargs)
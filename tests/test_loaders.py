@@ -116,6 +116,42 @@ def test_load_raster_performs_no_pixel_read(tmp_path, monkeypatch):
     ds.close()
 
 
+# Profile snapshot: metadata is read from GDAL once and handed out as copies
+def test_rasterio_metadata_is_served_from_a_snapshot(tmp_path):
+    path = tmp_path / "snapshot.tif"
+    _write_tiny_tif(path)
+    ds = load_raster(str(path))
+
+    meta = ds.get_metadata()
+    meta["nodata"] = 7
+    assert ds.get_metadata() == ds._adapter.backend.meta
+    assert ds.get_metadata() is not ds.get_metadata()
+    with pytest.raises(TypeError):
+        ds._adapter._profile["nodata"] = 7
+
+    ds.close()
+
+
+@pytest.mark.parametrize("promote", [False, True])
+def test_typed_accessors_match_metadata(promote):
+    ds = load_array(
+        np.ones((2, 3, 4), dtype=np.int16),
+        transform=Affine.translation(0, 3) * Affine.scale(1, -1),
+        crs=4326,
+        nodata=-1,
+    )
+    if promote:
+        ds = ds.to_rasterio()
+
+    meta = ds.get_metadata()
+    assert ds.get_nodata() == meta["nodata"] == -1
+    assert ds.get_dtype() == np.dtype(meta["dtype"]) == np.int16
+    assert isinstance(ds.get_dtype(), np.dtype)
+    assert ds.get_shape() == (meta["height"], meta["width"]) == (3, 4)
+    assert ds.get_transform() == meta["transform"]
+    assert ds.get_count() == meta["count"] == 2
+
+
 # Load array non-empty input
 def test_load_array_rejects_non_numpy():
     with pytest.raises(ValidationError):
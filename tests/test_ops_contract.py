@@ -8,6 +8,7 @@ sentinel for integer outputs).
 """
 
 import math
+import tracemalloc
 
 import numpy as np
 import pytest
@@ -15,6 +16,7 @@ from affine import Affine
 from rasterio.crs import CRS
 
 from eeo import load_array
+from eeo.common import apply_nodata_contract
 
 UTM = CRS.from_epsg(32633)
 GRID = Affine.translation(500_000.0, 4_200_000.0) * Affine.scale(10.0, -10.0)
@@ -189,3 +191,98 @@ def test_absolute_masks_nodata_instead_of_taking_magnitude(raster_with_nodata):
     assert np.isnan(out[:2, :2]).all()
     assert not (out[:2, :2] == 9999.0).any()
     assert out[3, 3] == pytest.approx(21.0)
+
+
+# ---------------------------------------------------------------------
+# apply_nodata_contract itself: semantics and allocations
+# ---------------------------------------------------------------------
+
+
+def _reference_contract(result, operands, *, fractional, ds_nodata):
+    """The contract written out with whole-array temporaries, for comparison."""
+    out_dtype = np.float32 if fractional or result.dtype == np.float64 else result.dtype
+    declared = [nodata for _, nodata in operands if nodata is not None]
+    result = result.astype(out_dtype)
+    if not declared:
+        return result, None
+    masked = np.zeros(result.shape, dtype=bool)
+    for array, nodata in operands:
+        if nodata is None:
+            continue
+        masked |= np.isnan(array) if np.isnan(nodata) else array == nodata
+    if np.issubdtype(out_dtype, np.floating):
+        return np.where(masked, np.nan, result).astype(out_dtype), float("nan")
+    sentinel = ds_nodata if ds_nodata is not None else declared[0]
+    return np.where(masked, sentinel, result).astype(out_dtype), sentinel
+
+
+@pytest.mark.parametrize(
+    ("result_dtype", "fractional", "nodatas"),
+    [
+        (np.float64, False, (-9999, None)),
+        (np.float32, True, (float("nan"), 7)),
+        (np.int32, False, (None, 3)),
+        (np.uint16, False, (0, 0)),
+        (np.int16, True, (None, None)),
+    ],
+)
+def test_contract_matches_whole_array_reference(result_dtype, fractional, nodatas):
+    rng = np.random.default_rng(4)
+    a = rng.integers(0, 10, size=(2, 6, 5)).astype(np.float32)
+    b = rng.integers(0, 10, size=(2, 6, 5)).astype(np.float32)
+    a[0, 0, 0] = np.nan
+    b[1, 2, 3] = -9999
+    with np.errstate(invalid="ignore"):  # the NaN pixel, cast to an integer result
+        result = (a + b).astype(result_dtype)
+    operands = [(a, nodatas[0]), (b, nodatas[1])]
+
+    expected, expected_nodata = _reference_contract(
+        result.copy(), operands, fractional=fractional, ds_nodata=nodatas[0]
+    )
+    final, out_nodata = apply_nodata_contract(
+        result, operands, fractional=fractional, ds_nodata=nodatas[0]
+    )
+
+    assert final.dtype == expected.dtype
+    np.testing.assert_array_equal(final, expected)
+    np.testing.assert_equal(out_nodata, expected_nodata)
+
+
+def test_contract_writes_into_out():
+    result = np.arange(12, dtype=np.float64).reshape(3, 4)
+    operand = np.arange(12).reshape(3, 4)
+    out = np.empty((6, 4), dtype=np.float32)[::2]
+
+    final, nodata = apply_nodata_contract(
+        result, [(operand, 5)], fractional=False, ds_nodata=5, out=out
+    )
+
+    assert final is out
+    assert np.isnan(out[1, 1]) and np.isnan(nodata)
+    assert out[2, 3] == 11.0
+
+
+def test_contract_allocates_at_most_one_output_sized_array():
+    # 1000x1000 float64 result of two int16 operands: the float32 cast is
+    # the one output-sized allocation; masks reuse the per-thread scratch.
+    rng = np.random.default_rng(0)
+    a = rng.integers(-5, 5, size=(1000, 1000)).astype(np.int16)
+    b = rng.integers(-5, 5, size=(1000, 1000)).astype(np.int16)
+    operands = [(a, 0), (b, -1)]
+    out_bytes = a.size * np.dtype(np.float32).itemsize
+    apply_nodata_contract(a * 0.5, operands, fractional=False, ds_nodata=0)  # warm scratch
+
+    casting = a * 0.5
+    in_place = a.astype(np.float32)
+    tracemalloc.start()
+    try:
+        apply_nodata_contract(casting, operands, fractional=False, ds_nodata=0)
+        _, cast_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        apply_nodata_contract(in_place, operands, fractional=True, ds_nodata=0)
+        _, in_place_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert cast_peak < 1.1 * out_bytes
+    assert in_place_peak < 0.1 * out_bytes
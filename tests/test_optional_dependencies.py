@@ -5,7 +5,9 @@ import importlib.metadata
 import importlib.util
 import json
 
+import numpy as np
 import pytest
+from affine import Affine
 
 import eeo
 from eeo import _optional
@@ -18,6 +20,7 @@ EXTRA_MODULES = [
     ("planetary_computer", "stac"),
     ("xarray", "xarray"),
     ("rioxarray", "xarray"),
+    ("dask", "lazy"),
 ]
 
 # `dev` is tooling, not a runtime feature: it is never passed to
@@ -201,9 +204,9 @@ def test_an_unmapped_extra_falls_back_to_the_pip_hint(monkeypatch, by_conda):
     monkeypatch.setattr(_optional, "_installed_by_conda", lambda: by_conda)
 
     with pytest.raises(eeo.MissingDependencyError) as excinfo:
-        import_optional("eeo_not_a_real_package", extra="lazy", purpose="lazy backend")
+        import_optional("eeo_not_a_real_package", extra="cloud", purpose="cloud access")
 
-    assert "pip install 'easy-eo[lazy]'" in str(excinfo.value)
+    assert "pip install 'easy-eo[cloud]'" in str(excinfo.value)
 
 
 def test_every_declared_extra_has_conda_package_names():
@@ -213,3 +216,24 @@ def test_every_declared_extra_has_conda_package_names():
 
     assert feature_extras, "no feature extras found in the installed metadata"
     assert feature_extras <= set(_optional._CONDA_PACKAGES)
+
+
+def test_chunked_load_without_the_lazy_extra_names_it(monkeypatch, tmp_path):
+    """A lazy open reports the missing extra, not an unreadable file."""
+    path = tmp_path / "r.tif"
+    eeo.load_array(
+        np.zeros((4, 4), dtype=np.float32),
+        transform=Affine.translation(12.0, 42.0) * Affine.scale(0.1, -0.1),
+        crs=4326,
+    ).save_raster(path)
+    real_import_module = importlib.import_module
+
+    def fake_import_module(name):
+        if name.startswith("dask"):
+            raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+        return real_import_module(name)
+
+    monkeypatch.setattr(importlib, "import_module", fake_import_module)
+
+    with pytest.raises(eeo.MissingDependencyError, match=r"easy-eo\[lazy\]"):
+        eeo.load_raster(path, chunks=(2, 2))
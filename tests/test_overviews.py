@@ -0,0 +1,97 @@
+"""Overview building: level resolution, the ``build_overviews`` op on file-
+and memory-backed datasets, ``save_raster(overviews=...)``, and decimated reads
+being served from the overviews."""
+
+import numpy as np
+import pytest
+import rasterio as rio
+
+from conftest import GRID, UTM_CRS
+from eeo import BackendError, ValidationError, build_overviews, load_array, load_raster
+from eeo.core.overviews import add_overviews, overview_factors
+
+
+def _scene(shape=(1024, 768)):
+    """Checkerboard of 1s and 3s: nearest decimation sees only the 1s, an
+    averaged overview sees 2 everywhere."""
+    rows, cols = np.indices(shape)
+    data = np.where((rows + cols) % 2 == 0, 1.0, 3.0).astype(np.float32)
+    return load_array(data, transform=GRID, crs=UTM_CRS, band_names=["b"])
+
+
+@pytest.mark.parametrize(
+    ("shape", "levels", "expected"),
+    [
+        ((1024, 768), "auto", [2, 4]),
+        ((5000, 300), "auto", [2, 4, 8, 16, 32]),
+        ((256, 200), "auto", []),
+        ((100, 100), 3, [2, 4, 8]),
+        ((100, 100), [8, 2, 4, 2], [2, 4, 8]),
+    ],
+)
+def test_overview_factors(shape, levels, expected):
+    assert overview_factors(shape, levels) == expected
+
+
+@pytest.mark.parametrize("levels", ["fast", -1, [1, 2], [2.5], 2.0])
+def test_overview_factors_reject_bad_levels(levels):
+    with pytest.raises(ValidationError):
+        overview_factors((512, 512), levels)
+
+
+def test_save_raster_builds_overviews(tmp_path):
+    path = tmp_path / "scene.tif"
+    _scene().save_raster(path, overviews="auto", overview_resampling="average")
+
+    with rio.open(path) as src:
+        assert src.overviews(1) == [2, 4]
+        assert src.tags(ns="rio_overview") == {"resampling": "average"}
+
+    # The decimated read is served from the averaged overview; decimating the
+    # checkerboard from full resolution would return only the 1s.
+    decimated = load_raster(path).read(1, out_shape=(256, 192))
+    np.testing.assert_array_equal(decimated, 2.0)
+
+
+def test_save_raster_without_overviews_has_none(tmp_path):
+    path = tmp_path / "plain.tif"
+    _scene().save_raster(path)
+    with rio.open(path) as src:
+        assert src.overviews(1) == []
+
+
+def test_save_raster_validates_before_writing(tmp_path):
+    path = tmp_path / "never.tif"
+    with pytest.raises(ValidationError):
+        _scene().save_raster(path, overviews=[1])
+    with pytest.raises(ValidationError):
+        _scene().save_raster(path, overviews="auto", overview_resampling="blur")
+    assert not path.exists()
+
+
+def test_build_overviews_updates_the_file(tmp_path):
+    path = tmp_path / "scene.tif"
+    _scene().save_raster(path)
+
+    result = load_raster(path).build_overviews(3, resampling="average")
+
+    assert result.path == str(path)
+    assert result.band_names == ["b"]
+    assert result._adapter.backend.overviews(1) == [2, 4, 8]
+    with rio.open(path) as src:
+        assert src.overviews(1) == [2, 4, 8]
+    np.testing.assert_array_equal(result.read(1, out_shape=(128, 96)), 2.0)
+
+
+def test_build_overviews_on_an_in_memory_dataset():
+    ds = _scene()
+    result = build_overviews(ds, [2, 4], resampling="average")
+
+    assert result._adapter.backend.overviews(1) == [2, 4]
+    np.testing.assert_array_equal(result.read(1), ds.read(1))
+    np.testing.assert_array_equal(result.read(1, out_shape=(256, 192)), 2.0)
+
+
+def test_add_overviews_wraps_gdal_failures(tmp_path):
+    with pytest.raises(BackendError, match="overviews"):
+        add_overviews(tmp_path / "missing.tif")
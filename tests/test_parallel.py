@@ -0,0 +1,164 @@
+"""Thread-parallel block execution: the ``num_threads`` option, per-call
+``workers=``, and the guarantee that the thread count never changes a result."""
+
+import threading
+
+import numpy as np
+import pytest
+from rasterio.windows import Window
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import ValidationError, load_array, load_raster
+from eeo.core.blocks import execute_blocks, parallel_windows
+
+# Small enough that a 96x80 scene splits into a window per 16x16 tile.
+TINY_BUDGET = 1
+
+
+@pytest.fixture
+def scene_path(tiled_scene):
+    """96x80 three-band uint16 GeoTIFF in 16x16 tiles, with nodata pixels."""
+    rng = np.random.default_rng(1)
+    data = rng.integers(1, 10_000, size=(3, 96, 80)).astype(np.uint16)
+    data[:, 10:14, 20:30] = 0
+    return tiled_scene(data, nodata=0)
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        lambda ds, w: ds.add(ds, workers=w),
+        lambda ds, w: ds.divide(7, workers=w),
+        lambda ds, w: ds.sqrt(workers=w),
+        lambda ds, w: ds.normalized_difference(ds.multiply(2), workers=w),
+        lambda ds, w: ds.ndvi(red=1, nir=3, workers=w),
+        lambda ds, w: ds.evi(red=1, blue=2, nir=3, workers=w),
+    ],
+)
+def test_result_is_identical_for_every_thread_count(scene_path, op):
+    ds = load_raster(scene_path)
+    with eeo.set_options(block_budget=TINY_BUDGET):
+        serial = op(ds, 1)
+        results = [op(ds, workers) for workers in (2, 3, 8)]
+
+    for result in results:
+        assert result.get_metadata()["dtype"] == serial.get_metadata()["dtype"]
+        assert np.array_equal(result.read(), serial.read(), equal_nan=True)
+        np.testing.assert_equal(result.get_metadata()["nodata"], serial.get_metadata()["nodata"])
+
+
+def test_num_threads_option_runs_blocks_on_the_pool(scene_path):
+    ds = load_raster(scene_path)
+    seen = set()
+
+    def compute(window):
+        seen.add(threading.current_thread().name)
+        return ds._adapter.read_window(window, [1])[0]
+
+    out = np.empty(ds.get_shape(), dtype=np.uint16)
+    windows = parallel_windows(ds._adapter, 4, budget=TINY_BUDGET)
+    execute_blocks(compute, windows, out, workers=4)
+
+    assert all(name.startswith("eeo-block") for name in seen)
+    np.testing.assert_array_equal(out, ds.get_band(1))
+
+
+def test_option_and_workers_argument_agree(scene_path):
+    ds = load_raster(scene_path)
+    with eeo.set_options(block_budget=TINY_BUDGET):
+        by_argument = ds.ndvi(red=1, nir=3, workers=4)
+        with eeo.set_options(num_threads=4):
+            by_option = ds.ndvi(red=1, nir=3)
+
+    assert np.array_equal(by_argument.read(), by_option.read(), equal_nan=True)
+
+
+def test_rasterio_reads_use_one_handle_per_thread(scene_path):
+    ds = load_raster(scene_path)
+    adapter = ds._adapter
+    with eeo.set_options(block_budget=TINY_BUDGET):
+        ds.multiply(3, workers=4)
+
+    handles = list(adapter._handles.values())
+    assert handles
+    assert all(handle is not adapter.backend for handle in handles)
+    assert len({id(handle) for handle in handles}) == len(handles)
+
+    ds.close()
+    assert all(handle.closed for handle in handles)
+
+
+def test_writer_backed_dataset_reads_under_lock():
+    # An in-memory GTiff is still open for writing and cannot be reopened by
+    # name; parallel reads of it must serialise on the adapter's lock.
+    data = np.arange(64 * 48, dtype=np.float32).reshape(1, 64, 48)
+    ds = load_array(data, transform=GRID, crs=UTM_CRS).to_rasterio()
+
+    with eeo.set_options(block_budget=TINY_BUDGET):
+        result = ds.add(1, workers=4)
+
+    np.testing.assert_array_equal(result.read(), data + 1)
+    assert ds._adapter._handles == {}
+
+
+def test_worker_exception_propagates(scene_path):
+    ds = load_raster(scene_path)
+
+    def compute(window):
+        if window.row_off > 0:
+            raise RuntimeError("boom")
+        return ds._adapter.read_window(window, [1])[0]
+
+    out = np.empty(ds.get_shape(), dtype=np.uint16)
+    with pytest.raises(RuntimeError, match="boom"):
+        execute_blocks(
+            compute, parallel_windows(ds._adapter, 4, budget=TINY_BUDGET), out, workers=4
+        )
+
+
+def test_nested_block_pass_runs_inline():
+    # A block that itself runs a block-wise pass must not wait on the pool it
+    # occupies (which would deadlock once every thread does so).
+    inner = np.zeros((4, 4))
+
+    def compute(window):
+        local = np.zeros((2, 2))
+        execute_blocks(
+            lambda w: np.ones((w.height, w.width)),
+            [Window(0, 0, 2, 1), Window(0, 1, 2, 1)],
+            local,
+            workers=2,
+        )
+        return local
+
+    windows = [Window(c, r, 2, 2) for r in (0, 2) for c in (0, 2)]
+    execute_blocks(compute, windows, inner, workers=2)
+
+    np.testing.assert_array_equal(inner, 1)
+
+
+def test_deferred_chain_materializes_with_its_workers(scene_path):
+    ds = load_raster(scene_path)
+    with eeo.set_options(deferred=True, block_budget=TINY_BUDGET):
+        chained = ds.multiply(2, workers=3).add(1, workers=3)
+        expected = ds.read().astype(np.int64) * 2 + 1
+
+    assert chained._adapter._workers == 3
+    np.testing.assert_array_equal(chained.compute().read(), np.where(ds.read() == 0, 0, expected))
+
+
+@pytest.mark.parametrize("value", [0, -2, 1.5, True, "4"])
+def test_workers_argument_is_validated(scene_path, value):
+    ds = load_raster(scene_path)
+    with pytest.raises(ValidationError, match="workers"):
+        ds.add(1, workers=value)
+    with pytest.raises(ValidationError, match="workers"):
+        ds.ndvi(red=1, nir=3, workers=value)
+
+
+@pytest.mark.parametrize("value", [0, 2.0, False])
+def test_num_threads_option_is_validated(value):
+    with pytest.raises(ValidationError, match="num_threads"):
+        eeo.set_options(num_threads=value)
+    assert eeo.get_options()["num_threads"] == 1
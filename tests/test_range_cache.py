@@ -0,0 +1,275 @@
+"""The on-disk remote read cache (eeo/io/range_cache.py).
+
+Assets are served over real HTTP from a local server that honours range
+requests and counts them, so GDAL reads through the cache exactly as it would
+from a catalog's blob storage — without touching the network.
+"""
+
+import datetime as dt
+import http.server
+import threading
+
+import numpy as np
+import pytest
+import rasterio as rio
+from rasterio.transform import from_origin
+from rasterio.warp import transform_bounds
+
+import eeo
+from eeo.io.range_cache import _BLOCK_SUFFIX, RangeCache, _CachedRemoteFile, unsigned_url
+
+pytest.importorskip("requests", reason="needs the stac extra")
+
+SCENE_CRS = "EPSG:32633"
+
+
+class RangeHandler(http.server.SimpleHTTPRequestHandler):
+    """Serves files from the server's directory, honouring ``Range``.
+
+    The server's ``honour_range`` turns range support off, and its
+    ``failures`` answers that many requests with a 503 first.
+    """
+
+    def do_GET(self):
+        path = self.translate_path(self.path.split("?", 1)[0])
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.send_error(404)
+            return
+        self.server.requests.append(self.headers.get("Range"))
+        if self.server.failures:
+            self.server.failures -= 1
+            self.send_error(503)
+            return
+        status, body = 200, data
+        if self.headers.get("Range") and self.server.honour_range:
+            start, end = self.headers["Range"].removeprefix("bytes=").split("-")
+            start, end = int(start), min(int(end), len(data) - 1)
+            status, body = 206, data[start : end + 1]
+        self.send_response(status)
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    """A local HTTP server over a directory holding two tiled COG-like assets."""
+    root = tmp_path / "blob"
+    root.mkdir()
+    transform = from_origin(500000.0, 5000000.0, 10.0, 10.0)
+    for name, offset in (("B04", 0), ("B08", 7)):
+        data = (np.arange(1024 * 1024, dtype="uint32").reshape(1, 1024, 1024) % 65521) + offset
+        with rio.open(
+            root / f"{name}.tif",
+            "w",
+            driver="GTiff",
+            height=1024,
+            width=1024,
+            count=1,
+            dtype="uint16",
+            crs=SCENE_CRS,
+            transform=transform,
+            tiled=True,
+            blockxsize=256,
+            blockysize=256,
+        ) as dst:
+            dst.write(data.astype("uint16"))
+
+    handler = lambda *args: RangeHandler(*args, directory=str(root))  # noqa: E731
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    httpd.requests = []
+    httpd.honour_range = True
+    httpd.failures = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def signed_item(server, signature):
+    """A STAC item whose assets carry a Planetary-Computer-style SAS token."""
+    host, port = server.server_address
+    query = f"st=2026-10-17&se=2026-10-18&sp=rl&sv=2024-05-04&sr=c&sig={signature}"
+
+    class Asset:
+        def __init__(self, name):
+            self.href = f"http://{host}:{port}/{name}.tif?{query}"
+
+    class Item:
+        id = "S2A_CACHED"
+        datetime = dt.datetime(2026, 7, 21, tzinfo=dt.timezone.utc)
+        collection_id = "sentinel-2-l2a"
+        properties = {}
+        assets = {"B04": Asset("B04"), "B08": Asset("B08")}
+
+    # A 1.5 km box inside the 10 km scene: a few of its 256-pixel tiles.
+    aoi = transform_bounds(
+        SCENE_CRS, "EPSG:4326", 501000.0, 4997000.0, 502500.0, 4998500.0, densify_pts=21
+    )
+    return eeo.io.STACItem(Item(), search_bbox=aoi)
+
+
+def test_unsigned_url_drops_only_the_signature():
+    signed = "https://x.blob.core.windows.net/c/B04.tif?st=1&se=2&sp=rl&sv=v&sr=c&sig=abc%3D"
+    assert unsigned_url(signed) == "https://x.blob.core.windows.net/c/B04.tif"
+    assert unsigned_url("https://x/B04.tif?version=3&X-Amz-Signature=ab") == (
+        "https://x/B04.tif?version=3"
+    )
+    assert unsigned_url("https://x/B04.tif#frag") == "https://x/B04.tif"
+
+
+def test_a_re_signed_load_is_served_from_disk(server, tmp_path):
+    with eeo.set_options(remote_cache=tmp_path / "cache"):
+        first = signed_item(server, "first").load(["B04", "B08"])
+        fetched = len(server.requests)
+        cold = eeo.io.remote_cache_info()
+
+        # A new signature, as a fresh search would hand out: same objects.
+        second = signed_item(server, "second").load(["B04", "B08"])
+        warm = eeo.io.remote_cache_info()
+
+    assert fetched > 0
+    assert len(server.requests) == fetched  # nothing downloaded again
+    assert all(r is not None and r.startswith("bytes=") for r in server.requests)
+    assert warm.hits > cold.hits
+    assert warm.misses == cold.misses
+    assert warm.bytes_fetched == cold.bytes_fetched
+    assert warm.size == cold.size > 0
+    # Every block downloaded, the size probe's included, is a miss.
+    assert cold.misses == len(list((tmp_path / "cache").rglob("*" + _BLOCK_SUFFIX))) > 0
+    np.testing.assert_array_equal(first.to_array(), second.to_array())
+    assert second.band_names == ["B04", "B08"]
+
+
+def test_cached_reads_match_gdal_reading_directly(server, tmp_path):
+    uncached = signed_item(server, "a").load(["B04", "B08"])
+    with eeo.set_options(remote_cache=tmp_path / "cache"):
+        cached = signed_item(server, "b").load(["B04", "B08"])
+
+    assert cached.get_transform() == uncached.get_transform()
+    np.testing.assert_array_equal(cached.to_array(), uncached.to_array())
+
+
+def test_cache_persists_across_sessions(server, tmp_path):
+    with eeo.set_options(remote_cache=tmp_path / "cache"):
+        signed_item(server, "a").load("B04")
+    fetched = len(server.requests)
+
+    # A new RangeCache over the same directory stands in for a new process.
+    eeo.io.range_cache._CACHES.clear()
+    with eeo.set_options(remote_cache=tmp_path / "cache"):
+        signed_item(server, "b").load("B04")
+        assert eeo.io.remote_cache_info().misses == 0
+
+    assert len(server.requests) == fetched
+
+
+def asset_url(server, name="B04"):
+    host, port = server.server_address
+    return f"http://{host}:{port}/{name}.tif"
+
+
+def test_a_server_ignoring_ranges_is_downloaded_once(server, tmp_path):
+    server.honour_range = False
+    cache = RangeCache(tmp_path / "cache", max_size=2**30, block_size=64 * 1024)
+    size = (tmp_path / "blob" / "B04.tif").stat().st_size
+
+    with _CachedRemoteFile(asset_url(server), cache) as f:
+        f.seek(size // 2)
+        middle = f.read(1000)
+        f.seek(0)
+        whole = f.read()
+
+    assert len(server.requests) == 1  # the size probe brought the whole object
+    assert whole == (tmp_path / "blob" / "B04.tif").read_bytes()
+    assert middle == whole[size // 2 : size // 2 + 1000]
+    assert cache.info().size == size
+    assert cache.info().misses == -(-size // cache.block_size)
+
+
+def test_transient_errors_are_retried(server, tmp_path):
+    server.failures = 2
+    cache = RangeCache(tmp_path / "cache", max_size=2**30)
+
+    with _CachedRemoteFile(asset_url(server), cache) as f:
+        assert f.read(4) in (b"II*\x00", b"MM\x00*")
+
+    assert len(server.requests) == 3
+
+
+def test_requests_carry_a_timeout(server, tmp_path, monkeypatch):
+    cache = RangeCache(tmp_path / "cache", max_size=2**30)
+    with _CachedRemoteFile(asset_url(server), cache) as f:
+        timeouts = []
+        get = f._session.get
+        monkeypatch.setattr(
+            f._session, "get", lambda *a, **kw: timeouts.append(kw.get("timeout")) or get(*a, **kw)
+        )
+        f.seek(2 * cache.block_size)
+        f.read(10)
+
+    assert timeouts == [eeo.io.range_cache.TIMEOUT]
+
+
+def test_writes_do_not_rescan_the_directory(tmp_path, monkeypatch):
+    cache = RangeCache(tmp_path / "cache", max_size=1000, block_size=100)
+    scans = []
+    block_files = cache._block_files
+    monkeypatch.setattr(cache, "_block_files", lambda: scans.append(1) or block_files())
+
+    for index in range(30):
+        cache.put_block("https://x/a.tif", index, bytes(100))
+
+    assert len(scans) == 1
+    assert cache.info().size <= 1000
+    assert cache.info().size == sum(p.stat().st_size for p in (tmp_path / "cache").rglob("*.blk"))
+
+
+def test_least_recently_used_blocks_are_evicted(tmp_path):
+    cache = RangeCache(tmp_path / "cache", max_size=1000, block_size=100)
+    for index in range(10):
+        cache.put_block("https://x/a.tif", index, bytes(100))
+    assert cache.info().size == 1000
+    assert cache.get_block("https://x/a.tif", 0) is not None  # block 0 used most recently
+
+    cache.put_block("https://x/b.tif?sig=1", 0, bytes(100))
+
+    info = cache.info()
+    assert info.size <= 900
+    assert info.evictions == 2
+    assert cache.get_block("https://x/a.tif", 0) is not None
+    assert cache.get_block("https://x/a.tif", 1) is None
+    assert cache.get_block("https://x/b.tif?sig=2", 0) is not None
+
+
+def test_clear_remote_cache_empties_it(server, tmp_path):
+    with eeo.set_options(remote_cache=tmp_path / "cache"):
+        signed_item(server, "a").load("B04")
+        eeo.io.clear_remote_cache()
+        info = eeo.io.remote_cache_info()
+
+    assert (info.hits, info.misses, info.size) == (0, 0, 0)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_cache_is_off_by_default(server):
+    info = eeo.io.remote_cache_info()
+    assert info.directory is None
+    assert eeo.get_options()["remote_cache"] is None
+    signed_item(server, "a").load("B04")
+    assert eeo.io.remote_cache_info().hits == 0
+
+
+@pytest.mark.parametrize(("name", "value"), [("remote_cache", 3), ("remote_cache_size", 0)])
+def test_invalid_cache_options_raise(name, value):
+    with pytest.raises(eeo.ValidationError, match=name):
+        eeo.set_options(**{name: value})
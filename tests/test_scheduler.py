@@ -0,0 +1,175 @@
+"""The process-pool tile scheduler: steps dispatched by registered op name,
+windows reopened by path in workers, and tiles stitched into one GeoTIFF."""
+
+import weakref
+from concurrent.futures import Future
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from rasterio.windows import Window
+from rasterio.windows import transform as window_transform
+from shapely.geometry import box
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import ValidationError, load_raster, run_tiled
+from eeo.core import EEORasterDataset
+from eeo.core.decorators import _OP_REGISTRY, eeo_raster_op
+from eeo.core.scheduler import _Tile, _write_tiles
+
+
+@pytest.fixture
+def scene_path(tiled_scene):
+    """64x48 three-band uint16 GeoTIFF in 16x16 tiles, with named bands."""
+    rng = np.random.default_rng(3)
+    data = rng.integers(1, 10_000, size=(3, 64, 48)).astype(np.uint16)
+    data[:, 5:9, 5:9] = 0
+    return tiled_scene(data, nodata=0, band_names=["green", "red", "nir"])
+
+
+def test_tiled_chain_matches_whole_raster(scene_path, tmp_path):
+    # The AOI cuts across tile boundaries, so the mask is applied per tile.
+    aoi = gpd.GeoDataFrame(geometry=[box(500_100, 4_199_500, 500_400, 4_199_900)], crs=UTM_CRS)
+    steps = [
+        ("ndvi", {"red": "red", "nir": "nir", "name": "ndvi"}),
+        ("multiply", {"other": 100}),
+        ("clip_raster_with_vector", {"vector_file": aoi, "crop": False}),
+    ]
+
+    out = run_tiled(scene_path, steps, tmp_path / "out.tif", tile_shape=(16, 32), max_workers=2)
+
+    expected = (
+        load_raster(scene_path)
+        .ndvi(red="red", nir="nir", name="ndvi")
+        .multiply(100)
+        .clip_raster_with_vector(aoi, crop=False)
+    )
+    assert out.get_shape() == expected.get_shape()
+    assert out.get_transform() == expected.get_transform()
+    assert out.get_metadata()["dtype"] == "float32"
+    assert np.isnan(out.get_metadata()["nodata"])
+    assert out.band_names == ["ndvi"]
+    np.testing.assert_array_equal(out.read(), expected.read())
+
+
+def test_invalid_steps_fail_before_any_worker_starts(scene_path, tmp_path):
+    with pytest.raises(ValidationError, match="unknown operation 'no_such_op'"):
+        run_tiled(scene_path, ["sqrt", "no_such_op"], tmp_path / "out.tif")
+    with pytest.raises(ValidationError, match="registered"):
+        run_tiled(scene_path, ["plot_raster"], tmp_path / "out.tif")
+    with pytest.raises(ValidationError, match="each step"):
+        run_tiled(scene_path, [("sqrt", 1)], tmp_path / "out.tif")
+    with pytest.raises(ValidationError, match="non-empty"):
+        run_tiled(scene_path, "sqrt", tmp_path / "out.tif")
+    for name in ("standardize", "normalize_min_max", "normalize_percentile"):
+        assert getattr(eeo, name).__eeo_tileable__ is False
+        with pytest.raises(ValidationError, match=f"{name}.*whole raster"):
+            run_tiled(scene_path, ["ndvi", name], tmp_path / "out.tif")
+    assert not (tmp_path / "out.tif").exists()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"tile_shape": (0, 16)}, {"tile_shape": [16, 16]}, {"max_workers": 0}],
+)
+def test_invalid_tiling_arguments(scene_path, tmp_path, kwargs):
+    with pytest.raises(ValidationError):
+        run_tiled(scene_path, ["sqrt"], tmp_path / "out.tif", **kwargs)
+
+
+def test_grid_changing_step_is_rejected(scene_path, tmp_path):
+    with pytest.raises(ValidationError, match="changed the tile's grid"):
+        run_tiled(
+            scene_path,
+            [("resample", {"scale_factor": 0.5})],
+            tmp_path / "out.tif",
+            max_workers=1,
+        )
+
+
+def test_missing_source(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        eeo.run_tiled(tmp_path / "absent.tif", ["sqrt"], tmp_path / "out.tif")
+
+
+def test_written_tiles_are_released_before_more_are_submitted(tmp_path):
+    windows = [Window(col, row, 8, 8) for row in range(0, 32, 8) for col in range(0, 32, 8)]
+    submitted = []
+    most_alive = 0
+
+    def submit(window):
+        nonlocal most_alive
+        future = Future()
+        pixels = np.full((1, 8, 8), window.row_off, "int16")
+        future.set_result(
+            _Tile(window, pixels, None, [None], UTM_CRS, window_transform(window, GRID))
+        )
+        submitted.append(weakref.ref(future))
+        most_alive = max(most_alive, sum(ref() is not None for ref in submitted))
+        return future
+
+    profile = {"driver": "GTiff", "height": 32, "width": 32, "crs": UTM_CRS, "transform": GRID}
+    _write_tiles(submit, windows, tmp_path / "out.tif", profile, in_flight=3)
+
+    assert len(submitted) == 16
+    assert most_alive == 3  # never every tile at once
+    expected = np.repeat(np.arange(0, 32, 8, dtype="int16"), 8)[:, None] * np.ones(32, "int16")
+    np.testing.assert_array_equal(load_raster(tmp_path / "out.tif").read(), expected[None])
+
+
+def test_operations_opt_out_of_tiling(scene_path, tmp_path):
+    @eeo_raster_op(tileable=False)
+    def subtract_scene_mean(ds):
+        return ds.subtract(float(ds.read().mean()))
+
+    try:
+        assert subtract_scene_mean.__eeo_tileable__ is False
+        assert eeo.sqrt.__eeo_tileable__ is True
+        with pytest.raises(ValidationError, match="subtract_scene_mean.*whole raster"):
+            run_tiled(scene_path, ["subtract_scene_mean"], tmp_path / "out.tif")
+    finally:
+        _OP_REGISTRY.remove((subtract_scene_mean, "op"))
+        del EEORasterDataset.subtract_scene_mean
+
+
+def _tile(window, *, nodata=None, crs=UTM_CRS, transform=None, dtype="int16"):
+    pixels = np.zeros((1, window.height, window.width), dtype)
+    transform = window_transform(window, GRID) if transform is None else transform
+    return _Tile(window, pixels, nodata, [None], crs, transform)
+
+
+@pytest.mark.parametrize(
+    ("second", "match"),
+    [
+        ({"nodata": -1}, "disagree"),
+        ({"dtype": "float32"}, "disagree"),
+        ({"crs": "EPSG:4326"}, "CRS"),
+        ({"transform": GRID * GRID.scale(2)}, "transform"),
+    ],
+)
+def test_tiles_disagreeing_on_the_output_are_rejected(tmp_path, second, match):
+    windows = [Window(0, 0, 8, 8), Window(8, 0, 8, 8)]
+    tiles = iter([_tile(windows[0], nodata=0), _tile(windows[1], **{"nodata": 0, **second})])
+
+    def submit(window):
+        future = Future()
+        future.set_result(next(tiles))
+        return future
+
+    profile = {"driver": "GTiff", "height": 8, "width": 16, "crs": UTM_CRS, "transform": GRID}
+    with pytest.raises(ValidationError, match=match):
+        _write_tiles(submit, windows, tmp_path / "out.tif", profile, in_flight=1)
+
+
+def test_nan_nodata_tiles_agree(tmp_path):
+    windows = [Window(0, 0, 8, 8), Window(8, 0, 8, 8)]
+
+    def submit(window):
+        future = Future()
+        future.set_result(_tile(window, nodata=float("nan"), dtype="float32"))
+        return future
+
+    profile = {"driver": "GTiff", "height": 8, "width": 16, "crs": UTM_CRS, "transform": GRID}
+    _write_tiles(submit, windows, tmp_path / "out.tif", profile, in_flight=1)
+    assert np.isnan(load_raster(tmp_path / "out.tif").get_nodata())
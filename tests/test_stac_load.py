@@ -7,6 +7,7 @@ the network.
 """
 
 import datetime as dt
+import threading
 
 import numpy as np
 import pytest
@@ -209,6 +210,50 @@ def test_first_asset_defines_the_grid(scene, aoi):
     assert coarse_first.band_names == ["B11", "B04"]
 
 
+def test_assets_after_the_first_are_fetched_concurrently(scene, aoi, monkeypatch):
+    from eeo.io import stac
+
+    # Each read waits for the other: a serial load would never get past the
+    # barrier and fail with BrokenBarrierError.
+    barrier = threading.Barrier(2, timeout=5)
+    read_onto_grid = stac._read_onto_grid
+
+    def rendezvous(*args):
+        barrier.wait()
+        return read_onto_grid(*args)
+
+    monkeypatch.setattr(stac, "_read_onto_grid", rendezvous)
+    ds = make_item(scene, search_bbox=aoi).load(["B04", "B11", "B08"])
+
+    assert ds.band_names == ["B04", "B11", "B08"]
+    values = ds.to_array()
+    assert np.all(values[1] == 500) and np.all(values[2] == 1000)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, None])
+def test_band_order_does_not_depend_on_max_workers(scene, aoi, max_workers):
+    serial = make_item(scene, search_bbox=aoi).load(["B08", "B11", "B04"], max_workers=1)
+    ds = make_item(scene, search_bbox=aoi).load(["B08", "B11", "B04"], max_workers=max_workers)
+
+    assert ds.band_names == ["B08", "B11", "B04"]
+    np.testing.assert_array_equal(ds.to_array(), serial.to_array())
+
+
+def test_a_failing_asset_fails_the_whole_load(tmp_path, scene, aoi):
+    broken = tmp_path / "broken.tif"
+    broken.write_bytes(b"not a GeoTIFF")
+    item = eeo.io.STACItem(FakeItem({**scene, "B12": broken}), search_bbox=aoi)
+
+    with pytest.raises(rio.errors.RasterioIOError):
+        item.load(["B04", "B08", "B12", "B11"], max_workers=3)
+
+
+@pytest.mark.parametrize("bad", [0, -2, 1.5, True])
+def test_invalid_max_workers_raises_validation_error(scene, bad):
+    with pytest.raises(eeo.ValidationError, match="max_workers"):
+        make_item(scene).load(["B04", "B08"], max_workers=bad)
+
+
 def test_multiband_asset_names_its_bands_after_the_asset(tmp_path, aoi):
     href = write_asset(tmp_path / "visual.tif", count=3)
     item = eeo.io.STACItem(FakeItem({"visual": href}), search_bbox=aoi)
@@ -351,6 +396,224 @@ def test_invalid_resampling_method_raises_validation_error(scene, aoi):
         make_item(scene, search_bbox=aoi).load(["B04", "B11"], resampling="teleport")
 
 
+# --------------------------------------------------------------------------
+# Bulk loading over a search result
+# --------------------------------------------------------------------------
+def make_result(scene, aoi, days=5, broken=()):
+    """A search result of ``days`` daily scenes, listed newest first."""
+    items = []
+    for day in reversed(range(days)):
+        item = FakeItem(scene, timestamp=TIMESTAMP + dt.timedelta(days=day))
+        item.id = f"S2A_DAY{day}"
+        if day in broken:
+            item.assets["B04"] = FakeAsset("/nonexistent/B04.tif")
+        items.append(eeo.io.STACItem(item, search_bbox=aoi))
+    return eeo.io.STACSearchResult(items, collections=["sentinel-2-l2a"], catalog="fake")
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    """Count item loads as they start, and the most running at once."""
+    calls = {"started": 0, "running": 0, "peak": 0}
+    lock = threading.Lock()
+    load = eeo.io.STACItem.load
+
+    def counted(self, *args, **kwargs):
+        with lock:
+            calls["started"] += 1
+            calls["running"] += 1
+            calls["peak"] = max(calls["peak"], calls["running"])
+        try:
+            return load(self, *args, **kwargs)
+        finally:
+            with lock:
+                calls["running"] -= 1
+
+    monkeypatch.setattr(eeo.io.STACItem, "load", counted)
+    return calls
+
+
+def test_load_all_returns_every_scene_oldest_first(scene, aoi, load_calls):
+    scenes = make_result(scene, aoi).load_all(["B04", "B08"], max_workers=3)
+
+    assert [ds.timestamp for ds in scenes] == sorted(ds.timestamp for ds in scenes)
+    assert [ds.attrs["stac_item"] for ds in scenes] == [f"S2A_DAY{d}" for d in range(5)]
+    assert all(ds.band_names == ["B04", "B08"] for ds in scenes)
+    assert load_calls["started"] == 5
+    assert load_calls["peak"] <= 3
+
+
+def test_iter_load_yields_in_completion_order(scene, aoi, monkeypatch):
+    oldest_may_finish = threading.Event()
+    load = eeo.io.STACItem.load
+
+    def slow_oldest(self, *args, **kwargs):
+        if self.id == "S2A_DAY0":
+            assert oldest_may_finish.wait(timeout=5)
+        return load(self, *args, **kwargs)
+
+    monkeypatch.setattr(eeo.io.STACItem, "load", slow_oldest)
+    stream = make_result(scene, aoi, days=3).iter_load("B04", max_workers=3)
+
+    first_item, first = next(stream)
+    assert first_item.id != "S2A_DAY0"
+    assert first.attrs["stac_item"] == first_item.id
+    oldest_may_finish.set()
+    rest = [item.id for item, _ in stream]
+    assert sorted([first_item.id, *rest]) == ["S2A_DAY0", "S2A_DAY1", "S2A_DAY2"]
+
+
+def test_iter_load_bounds_the_scenes_in_flight(scene, aoi, load_calls):
+    stream = make_result(scene, aoi, days=6).iter_load("B04", max_workers=2, order="chronological")
+
+    item, _ = next(stream)
+    assert item.id == "S2A_DAY0"
+    # Two submitted, one yielded, one more submitted to refill the pool.
+    assert load_calls["started"] <= 3
+    stream.close()
+    # Closing the iterator cancels the items not yet started.
+    assert load_calls["started"] <= 3
+    assert load_calls["peak"] <= 2
+
+
+def test_on_error_skip_leaves_the_failing_item_out(scene, aoi):
+    result = make_result(scene, aoi, broken={2})
+
+    scenes = result.load_all("B04", on_error="skip")
+
+    assert [ds.attrs["stac_item"] for ds in scenes] == [
+        "S2A_DAY0",
+        "S2A_DAY1",
+        "S2A_DAY3",
+        "S2A_DAY4",
+    ]
+    streamed = {item.id for item, _ in result.iter_load("B04", on_error="skip")}
+    assert streamed == {"S2A_DAY0", "S2A_DAY1", "S2A_DAY3", "S2A_DAY4"}
+
+
+def test_on_error_raise_stops_at_the_failing_item(scene, aoi):
+    with pytest.raises(rio.errors.RasterioIOError):
+        make_result(scene, aoi, broken={1}).load_all("B04", max_workers=2)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_workers": 0}, "max_workers"),
+        ({"order": "newest"}, "order"),
+        ({"on_error": "ignore"}, "on_error"),
+    ],
+)
+def test_invalid_bulk_load_arguments_raise_before_loading(scene, aoi, load_calls, kwargs, match):
+    with pytest.raises(eeo.ValidationError, match=match):
+        make_result(scene, aoi).iter_load("B04", **kwargs)
+    assert load_calls["started"] == 0
+
+
+# --------------------------------------------------------------------------
+# Temporal cubes
+# --------------------------------------------------------------------------
+def test_to_cube_stacks_every_item_oldest_first(scene, aoi):
+    result = make_result(scene, aoi)
+
+    cube = result.to_cube(["B04", "B08"], max_workers=3)
+
+    assert isinstance(cube, eeo.EEOTimeSeries)
+    assert len(cube) == 5
+    assert cube.timestamps == sorted(cube.timestamps)
+    assert [attrs["stac_item"] for attrs in cube.attrs] == [f"S2A_DAY{d}" for d in range(5)]
+    assert cube.band_names == ["B04", "B08"]
+    assert cube.get_nodata() == 0
+    expected = result[0].load(["B04", "B08"])
+    assert cube.get_shape() == expected.get_shape()
+    assert cube.get_transform() == expected.get_transform()
+    for step in range(5):
+        np.testing.assert_array_equal(cube.to_array()[step], expected.to_array())
+
+
+def test_to_cube_warps_only_the_assets_off_the_grid(scene, aoi, monkeypatch):
+    import eeo.io.stac as stac
+
+    warped = []
+    vrt = stac.WarpedVRT
+
+    def spy(src, **kwargs):
+        warped.append(src.name)
+        return vrt(src, **kwargs)
+
+    monkeypatch.setattr(stac, "WarpedVRT", spy)
+    cube = make_result(scene, aoi, days=2).to_cube(["B04", "B11"])
+
+    assert warped and all(name.endswith("B11.tif") for name in warped)
+    assert len(warped) == 2
+    assert np.all(cube.to_array()[:, 1] == 500)
+
+
+def test_to_cube_reads_onto_a_template_grid(scene):
+    # Half the template hangs off the scene's west edge.
+    left, top = SCENE_ORIGIN
+    template = eeo.load_array(
+        np.zeros((1, 30, 40), dtype="float32"),
+        transform=from_origin(left - 200.0, top - 100.0, 10.0, 10.0),
+        crs=SCENE_CRS,
+    )
+
+    cube = make_result(scene, None, days=2).to_cube("B04", grid=template)
+
+    assert cube.get_shape() == (30, 40)
+    assert cube.get_transform() == template.get_transform()
+    data = cube.to_array()
+    assert np.all(data[:, :, :, :20] == 0)  # off the scene: nodata
+    band = np.arange(SCENE_SIZE * SCENE_SIZE, dtype="uint16").reshape(SCENE_SIZE, SCENE_SIZE)
+    np.testing.assert_array_equal(data[0, 0, :, 20:], band[10:40, :20])
+
+
+def test_to_cube_unifies_nodata_across_items(tmp_path, scene, aoi):
+    other = dict(scene, B04=write_asset(tmp_path / "B04_nd7.tif", nodata=7, fill=7))
+    items = [
+        eeo.io.STACItem(
+            FakeItem(hrefs, timestamp=TIMESTAMP + dt.timedelta(days=day)), search_bbox=aoi
+        )
+        for day, hrefs in enumerate([scene, other])
+    ]
+    result = eeo.io.STACSearchResult(items, collections=["sentinel-2-l2a"], catalog="fake")
+
+    cube = result.to_cube("B04")
+
+    assert cube.get_nodata() == 0
+    assert np.all(cube.to_array()[1] == 0)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_workers": 0}, "max_workers"),
+        ({"grid": "scene.tif"}, "EEORasterDataset"),
+        ({"grid": eeo.load_array(np.zeros((4, 4))), "bbox": (11.0, 46.0, 11.1, 46.1)}, "bbox"),
+        ({"mask": True}, "intersects"),
+    ],
+)
+def test_invalid_cube_arguments_raise(scene, aoi, kwargs, match):
+    with pytest.raises(eeo.ValidationError, match=match):
+        make_result(scene, aoi, days=2).to_cube("B04", **kwargs)
+
+
+def test_to_cube_needs_matching_items(tmp_path, scene, aoi):
+    with pytest.raises(eeo.ValidationError, match="empty"):
+        make_result(scene, aoi, days=0).to_cube("B04")
+
+    visual = write_asset(tmp_path / "visual.tif", count=3)
+    mismatched = make_result(scene, aoi, days=2)
+    mismatched[1].assets["B04"].href = str(visual)
+    with pytest.raises(eeo.ValidationError, match="band layout"):
+        mismatched.to_cube("B04", max_workers=1)
+
+    missing = make_result(scene, aoi, days=2)
+    del missing[1].assets["B08"]
+    with pytest.raises(eeo.ValidationError, match="no asset 'B08'"):
+        missing.to_cube(["B04", "B08"])
+
+
 # --------------------------------------------------------------------------
 # Search integration
 # --------------------------------------------------------------------------
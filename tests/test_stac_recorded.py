@@ -8,7 +8,10 @@ what catches a wrong request body or an attribute Easy-EO reads that real STAC
 items do not have — without any network access.
 """
 
+import asyncio
+import copy
 import json
+import threading
 from pathlib import Path
 
 import numpy as np
@@ -191,6 +194,156 @@ def test_load_reads_assets_of_a_real_item(planetary_computer, tmp_path):
     assert np.all(scene.to_array()[1] == 3400)
 
 
+# --------------------------------------------------------------------------
+# The asyncio API
+# --------------------------------------------------------------------------
+class PagedTransport(ReplayTransport):
+    """Serves the recorded page split in two, linked by a ``next`` token."""
+
+    def __init__(self, root, page):
+        first, second = copy.deepcopy(page), copy.deepcopy(page)
+        first["features"], second["features"] = page["features"][:1], page["features"][1:]
+        first["links"] = [
+            {
+                "rel": "next",
+                "href": f"{PLANETARY_COMPUTER_STAC_URL}/search?token=page2",
+                "type": "application/geo+json",
+                "method": "GET",
+            }
+        ]
+        super().__init__(root, first)
+        self.second = second
+        self.threads = []
+
+    def __call__(self, prepared, **kwargs):
+        self.threads.append(threading.current_thread())
+        if "token=page2" in prepared.url:
+            self.requests.append(prepared)
+            return self._response(self.second, prepared.url)
+        return super().__call__(prepared, **kwargs)
+
+
+@pytest.fixture
+def paged_catalog(monkeypatch):
+    transport = PagedTransport(recording("pc_root"), recording("pc_search_page"))
+    monkeypatch.setattr(requests.Session, "send", transport)
+    return transport
+
+
+def test_astac_search_follows_every_page_off_the_event_loop(paged_catalog):
+    async def search():
+        return threading.current_thread(), await eeo.io.astac_search("sentinel-2-l2a", sign=False)
+
+    loop_thread, results = asyncio.run(search())
+
+    assert paged_catalog.requests[-1].url.endswith("token=page2")
+    assert len(results) == 2
+    assert results.timestamps == sorted(results.timestamps)
+    # Every request, the landing page included, ran outside the loop's thread.
+    assert paged_catalog.threads and loop_thread not in paged_catalog.threads
+
+
+def test_astac_search_matches_the_blocking_search(planetary_computer):
+    blocking = eeo.stac_search("sentinel-2-l2a", bbox=(11.0, 46.5, 11.2, 46.7), sign=False)
+    awaited = asyncio.run(
+        eeo.io.astac_search("sentinel-2-l2a", bbox=(11.0, 46.5, 11.2, 46.7), sign=False)
+    )
+
+    assert [item.id for item in awaited] == [item.id for item in blocking]
+    assert awaited.bbox == blocking.bbox
+    assert awaited[0].search_bbox == blocking[0].search_bbox
+    assert len(asyncio.run(eeo.io.astac_search("sentinel-2-l2a", limit=1, sign=False))) == 1
+
+
+def test_astac_search_validates_before_any_request(planetary_computer):
+    with pytest.raises(eeo.ValidationError, match="cloud_cover"):
+        asyncio.run(eeo.io.astac_search("sentinel-2-l2a", cloud_cover=150, sign=False))
+    assert planetary_computer.requests == []
+
+
+@pytest.fixture
+def local_item(planetary_computer, tmp_path):
+    """A real recorded item whose assets point at local rasters."""
+    item = eeo.stac_search("sentinel-2-l2a", sign=False)[0]
+    transform = from_origin(660000.0, 5180000.0, 10.0, 10.0)
+    for value, name in enumerate(("B04", "B08", "B11"), start=1):
+        path = tmp_path / f"{name}.tif"
+        with rio.open(
+            path,
+            "w",
+            driver="GTiff",
+            height=50,
+            width=50,
+            count=1,
+            dtype="uint16",
+            crs="EPSG:32632",
+            transform=transform,
+            nodata=0,
+        ) as dst:
+            dst.write(np.full((1, 50, 50), value * 100, dtype="uint16"))
+        item.assets[name].href = str(path)
+    return item
+
+
+def test_aload_reads_assets_concurrently(local_item, monkeypatch):
+    from eeo.io import stac
+
+    expected = local_item.load(["B04", "B11", "B08"], crop=False, max_workers=1)
+    # Both remaining assets must be in flight together to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    read_onto_grid = stac._read_onto_grid
+
+    def rendezvous(*args):
+        barrier.wait()
+        return read_onto_grid(*args)
+
+    monkeypatch.setattr(stac, "_read_onto_grid", rendezvous)
+    scene = asyncio.run(local_item.aload(["B04", "B11", "B08"], crop=False))
+
+    assert scene.band_names == ["B04", "B11", "B08"]
+    assert scene.attrs == expected.attrs
+    assert scene.timestamp == local_item.timestamp
+    np.testing.assert_array_equal(scene.to_array(), expected.to_array())
+
+
+def test_aload_shares_a_semaphore_budget(local_item, monkeypatch):
+    from eeo.io import stac
+
+    running, peak = 0, 0
+    lock = threading.Lock()
+    read_onto_grid = stac._read_onto_grid
+
+    def counted(*args):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        try:
+            return read_onto_grid(*args)
+        finally:
+            with lock:
+                running -= 1
+
+    monkeypatch.setattr(stac, "_read_onto_grid", counted)
+
+    async def load_twice():
+        budget = asyncio.Semaphore(1)
+        return await asyncio.gather(
+            *(local_item.aload(["B04", "B08", "B11"], crop=False, semaphore=budget) for _ in "ab")
+        )
+
+    scenes = asyncio.run(load_twice())
+
+    assert peak == 1
+    assert [scene.band_names for scene in scenes] == [["B04", "B08", "B11"]] * 2
+
+
+@pytest.mark.parametrize("bad", [0, -1, 2.5])
+def test_aload_rejects_an_invalid_concurrency(local_item, bad):
+    with pytest.raises(eeo.ValidationError, match="max_concurrency"):
+        asyncio.run(local_item.aload("B04", max_concurrency=bad))
+
+
 # --------------------------------------------------------------------------
 # Catalog failures
 # --------------------------------------------------------------------------
@@ -0,0 +1,147 @@
+"""Streaming per-band statistics: mergeable accumulators, the block-wise
+``band_statistics`` pass, and the describe/normalize operations built on it."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import load_array, load_raster
+from eeo.core.statistics import BandStatistics, band_statistics, combined_statistics
+
+
+@pytest.fixture
+def scene_path(tiled_scene):
+    """80x72 three-band float32 GeoTIFF in 16x16 tiles, with nodata and NaN."""
+    rng = np.random.default_rng(11)
+    data = rng.normal(100, 25, size=(3, 80, 72)).astype(np.float32)
+    data[:, 4:9, 10:20] = -9999
+    data[1, 40:42, :] = np.nan
+    data[2] = -9999  # an all-nodata band
+    return tiled_scene(data, nodata=-9999)
+
+
+def _reference(band, nodata):
+    valid = band[(band != nodata) & ~np.isnan(band)].astype(np.float64)
+    return valid.size, valid.min(), valid.max(), valid.mean(), valid.std()
+
+
+def test_band_statistics_match_numpy(scene_path):
+    ds = load_raster(scene_path)
+    data = ds.read()
+    with eeo.set_options(block_budget=1):
+        stats = band_statistics(ds._adapter)
+
+    for band, band_stats in zip(data[:2], stats[:2], strict=True):
+        count, vmin, vmax, mean, std = _reference(band, -9999)
+        assert band_stats.count == count
+        assert band_stats.total == band.size
+        assert band_stats.nodata == band.size - count
+        assert (band_stats.min, band_stats.max) == (vmin, vmax)
+        assert band_stats.mean == pytest.approx(mean, rel=1e-12)
+        assert band_stats.std == pytest.approx(std, rel=1e-10)
+
+    assert stats[2].count == 0
+    assert np.isnan(stats[2].mean)
+    assert np.isnan(stats[2].std)
+
+
+def test_band_statistics_do_not_depend_on_blocks_or_threads(scene_path):
+    ds = load_raster(scene_path)
+    whole = band_statistics(ds._adapter)
+    with eeo.set_options(block_budget=1):
+        results = [band_statistics(ds._adapter, workers=w) for w in (1, 3, 8)]
+
+    for result in results:
+        assert [repr(s) for s in result] == [repr(s) for s in results[0]]
+        for band_stats, reference in zip(result[:2], whole[:2], strict=True):
+            assert band_stats.count == reference.count
+            assert band_stats.mean == pytest.approx(reference.mean, rel=1e-12)
+
+
+def test_merge_equals_a_single_update():
+    rng = np.random.default_rng(2)
+    left, right = rng.integers(0, 1000, size=(2, 500)).astype(np.uint16)
+
+    merged = BandStatistics().update(left).merge(BandStatistics().update(right))
+    single = BandStatistics().update(np.concatenate([left, right]))
+
+    assert (merged.count, merged.min, merged.max) == (single.count, single.min, single.max)
+    assert merged.mean == pytest.approx(single.mean, rel=1e-12)
+    assert merged.variance == pytest.approx(single.variance, rel=1e-12)
+    assert combined_statistics([BandStatistics(), merged]).mean == merged.mean
+
+
+def test_integer_band_without_nodata_counts_every_pixel():
+    stats = BandStatistics().update(np.arange(10, dtype=np.int32), None)
+
+    assert (stats.count, stats.nodata, stats.min, stats.max) == (10, 0, 0, 9)
+    assert stats.mean == 4.5
+    assert stats.std == pytest.approx(np.arange(10).std())
+
+
+def test_nan_nodata_excludes_nan_pixels():
+    stats = BandStatistics().update(np.array([1.0, np.nan, 3.0]), float("nan"))
+
+    assert (stats.count, stats.total, stats.mean) == (2, 3, 2.0)
+
+
+def test_normalizations_are_blockwise_invariant(scene_path):
+    ds = load_raster(scene_path)
+    ops = [
+        lambda d, w: d.standardize(workers=w),
+        lambda d, w: d.normalize_min_max(new_min=-1, new_max=1, workers=w),
+        lambda d, w: d.normalize_percentile(workers=w),
+    ]
+    for op in ops:
+        whole = op(ds, 1)
+        with eeo.set_options(block_budget=1):
+            blocked = op(ds, 4)
+        np.testing.assert_allclose(blocked.read(), whole.read(), rtol=1e-6, equal_nan=True)
+
+
+def test_standardize_matches_reference(scene_path):
+    ds = load_raster(scene_path)
+    data = ds.read()[:2]
+    valid = (data != -9999) & ~np.isnan(data)
+    mean, std = data[valid].astype(np.float64).mean(), data[valid].astype(np.float64).std()
+
+    out = ds.standardize().read()[:2]
+
+    np.testing.assert_allclose(out[valid], (data[valid] - mean) / std, rtol=1e-5, atol=1e-6)
+    assert np.isnan(out[~valid]).all()
+
+
+def test_exact_stats_and_standardize_stay_within_the_block_budget():
+    # Exact statistics used to mask a whole band to float64 (8 MB here); the
+    # streaming pass holds a few 64 KiB windows at a time.
+    data = np.random.default_rng(0).random((2, 1000, 1000), dtype=np.float32)
+    ds = load_array(data, transform=GRID, crs=UTM_CRS, nodata=-1.0)
+
+    tracemalloc.start()
+    try:
+        with eeo.set_options(block_budget=64 * 1024):
+            band_statistics(ds._adapter)
+            _, stats_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            ds.standardize()
+            _, standardize_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert stats_peak < 1_000_000
+    assert standardize_peak < data.nbytes + 1_000_000
+
+
+def test_describe_exact_reports_streamed_statistics(scene_path, capsys):
+    ds = load_raster(scene_path)
+    with eeo.set_options(block_budget=1):
+        ds.describe(stats="exact")
+    out = capsys.readouterr().out
+
+    count, vmin, *_ = _reference(ds.read(1), -9999)
+    assert f"min {vmin:.6g} " in out
+    assert f"({80 * 72 - count:,} nodata)" in out
+    assert "band 3      : all nodata" in out
@@ -0,0 +1,149 @@
+"""The per-file statistics cache: repeat calls read no pixels, entries are
+keyed on the file's identity so a rewrite invalidates them, sidecars persist
+them across sessions, and the in-process cache stays within its size."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+import eeo
+from conftest import GRID, write_tiled
+from eeo import ValidationError, clear_stats_cache, load_array, load_raster
+from eeo.core import stats_cache
+from eeo.core.adapters import RasterioAdapter
+
+
+@pytest.fixture
+def scene_path(tiled_scene):
+    data = np.random.default_rng(3).normal(50, 10, size=(2, 48, 64)).astype(np.float32)
+    data[:, :4, :4] = -9999
+    return tiled_scene(data, nodata=-9999)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Record every pixel read made through a rasterio adapter."""
+    calls = []
+    original_window, original_read = RasterioAdapter.read_window, RasterioAdapter.read
+
+    def read_window(self, window, indexes=None):
+        calls.append(window)
+        return original_window(self, window, indexes)
+
+    def read(self, *args, **kwargs):
+        calls.append(args)
+        return original_read(self, *args, **kwargs)
+
+    monkeypatch.setattr(RasterioAdapter, "read_window", read_window)
+    monkeypatch.setattr(RasterioAdapter, "read", read)
+    return calls
+
+
+def _rewrite(path, data):
+    """Rewrite ``path`` in place and move its mtime on, as a later edit would."""
+    before = os.stat(path).st_mtime_ns
+    write_tiled(path, data, nodata=-9999)
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+@pytest.mark.parametrize("stats", ["exact", "approx"])
+def test_repeat_describe_reads_no_pixels(scene_path, reads, capsys, stats):
+    load_raster(scene_path).describe(stats=stats)
+    first = capsys.readouterr().out
+    assert reads
+
+    reads.clear()
+    load_raster(scene_path).describe(stats=stats)
+
+    assert reads == []
+    assert capsys.readouterr().out == first
+
+
+def test_normalizations_and_plots_reuse_entries(scene_path, reads):
+    ds = load_raster(scene_path)
+    expected = [ds.standardize().read(), ds.normalize_percentile().read()]
+    ds.plot_histogram()
+    ds.get_percentile_pixel(2)
+
+    reads.clear()
+    again = load_raster(scene_path)
+    again.describe(stats="exact")  # shares the standardize pass's entries
+    again.plot_histogram()
+    assert reads == []
+
+    np.testing.assert_array_equal(again.standardize().read(), expected[0])
+    np.testing.assert_array_equal(again.normalize_percentile().read(), expected[1])
+    assert again.get_percentile_pixel(2)["value"] == ds.get_percentile_pixel(2)["value"]
+
+
+def test_rewritten_file_is_recomputed(scene_path, capsys):
+    load_raster(scene_path).describe(stats="exact")
+    capsys.readouterr()
+
+    _rewrite(scene_path, np.full((2, 48, 64), 7, dtype=np.float32))
+    load_raster(scene_path).describe(stats="exact")
+
+    assert "min 7   max 7   mean 7" in capsys.readouterr().out
+
+
+def test_sidecar_persists_across_sessions(scene_path, reads):
+    sidecar = f"{scene_path}{stats_cache.SIDECAR_SUFFIX}"
+    with eeo.set_options(stats_cache="sidecar"):
+        load_raster(scene_path).normalize_percentile()
+        assert os.path.isfile(sidecar)
+
+        clear_stats_cache()  # a new session starts with an empty memory cache
+        reads.clear()
+        ds = load_raster(scene_path)
+        stats = stats_cache.cached_percentiles(ds._adapter, (2, 98), combined=True)
+        assert reads == []
+        assert np.isfinite(stats).all()
+
+        _rewrite(scene_path, np.ones((2, 48, 64), dtype=np.float32))
+        clear_stats_cache()
+        ds = load_raster(scene_path)
+        np.testing.assert_array_equal(
+            stats_cache.cached_percentiles(ds._adapter, (2, 98), combined=True), [1.0, 1.0]
+        )
+
+    with open(sidecar, encoding="utf-8") as f:
+        assert json.load(f)["mtime_ns"] == os.stat(scene_path).st_mtime_ns
+
+
+def test_memory_mode_writes_no_sidecar(scene_path):
+    load_raster(scene_path).describe(stats="exact")
+    assert os.listdir(os.path.dirname(scene_path)) == ["scene.tif"]
+
+
+def test_lru_evicts_least_recently_used(scene_path, reads):
+    ds = load_raster(scene_path)
+    adapter = ds._adapter
+    with eeo.set_options(stats_cache_size=2):
+        for q in (10, 20, 10, 30):  # 20 is now the least recently used
+            stats_cache.cached_percentiles(adapter, q, bands=[1])
+        reads.clear()
+        stats_cache.cached_percentiles(adapter, 10, bands=[1])
+        stats_cache.cached_percentiles(adapter, 30, bands=[1])
+        assert reads == []
+        stats_cache.cached_percentiles(adapter, 20, bands=[1])
+        assert reads
+
+
+def test_uncached_sources(scene_path, reads):
+    with eeo.set_options(stats_cache="off"):
+        load_raster(scene_path).describe(stats="exact")
+        reads.clear()
+        load_raster(scene_path).describe(stats="exact")
+        assert reads
+
+    in_memory = load_array(np.arange(16.0).reshape(4, 4), transform=GRID, crs=32633)
+    in_memory.normalize_percentile()
+    assert stats_cache._MEMORY == {}
+
+
+@pytest.mark.parametrize(("option", "value"), [("stats_cache", "disk"), ("stats_cache_size", 0)])
+def test_invalid_options(option, value):
+    with pytest.raises(ValidationError, match=option):
+        eeo.set_options(**{option: value})
@@ -0,0 +1,217 @@
+"""Tests for EEOTimeSeries (eeo/core/timeseries.py), the (time, band, y, x) cube."""
+
+import datetime as dt
+import warnings
+
+import numpy as np
+import pytest
+
+import eeo
+from conftest import GRID
+from eeo import EEOTimeSeries, ValidationError
+from eeo.core import EEORasterDataset
+
+DAYS = [dt.datetime(2023, 6, day, tzinfo=dt.timezone.utc) for day in (1, 11, 21)]
+
+
+@pytest.fixture
+def series():
+    data = np.arange(3 * 2 * 4 * 5, dtype="float32").reshape(3, 2, 4, 5)
+    return EEOTimeSeries(
+        data,
+        timestamps=DAYS,
+        transform=GRID,
+        crs=32633,
+        nodata=-1.0,
+        band_names=["red", "nir"],
+        attrs=[{"scene": i} for i in range(3)],
+    )
+
+
+def test_metadata(series):
+    assert len(series) == 3
+    assert series.get_shape() == (4, 5)
+    assert series.get_count() == 2
+    assert series.get_crs().to_epsg() == 32633
+    assert series.get_transform() == GRID
+    assert series.get_nodata() == -1.0
+    assert series.get_dtype() == np.float32
+    assert series.timestamps == DAYS
+    assert series.band_names == ["red", "nir"]
+    assert repr(series) == (
+        "<EEOTimeSeries: 3 steps x 2 bands x 4x5 float32 from 2023-06-01 to 2023-06-21>"
+    )
+
+
+def test_a_step_is_a_dataset_viewing_the_cube(series):
+    step = series[-1]
+
+    assert isinstance(step, EEORasterDataset)
+    assert step.timestamp == DAYS[2]
+    assert step.attrs == {"scene": 2}
+    assert step.band_names == ["red", "nir"]
+    assert step.get_nodata() == -1.0
+    assert step.get_transform() == GRID
+    assert np.shares_memory(step.read(), series.to_array())
+    np.testing.assert_array_equal(step.to_array(), series.to_array()[2])
+    # Operations work on it like on any scene.
+    assert step.ndvi(red="red", nir="nir").get_count() == 1
+    with pytest.raises(IndexError):
+        series[3]
+
+
+def test_slicing_gives_a_shorter_series(series):
+    later = series[1:]
+
+    assert isinstance(later, EEOTimeSeries)
+    assert later.timestamps == DAYS[1:]
+    assert [attrs["scene"] for attrs in later.attrs] == [1, 2]
+    assert np.shares_memory(later.to_array(), series.to_array())
+    assert [step.timestamp for step in series] == DAYS
+
+
+def test_attrs_are_copied(series):
+    series.attrs[0]["scene"] = "edited"
+    assert series.attrs[0]["scene"] == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"data": np.zeros((2, 4, 5))}, "4-D"),
+        ({"timestamps": DAYS[:2]}, "timestamps"),
+        ({"attrs": [{}]}, "attrs"),
+        ({"band_names": ["red"]}, "band_names"),
+    ],
+)
+def test_invalid_series_raise(kwargs, match):
+    arguments = {
+        "data": np.zeros((3, 2, 4, 5)),
+        "timestamps": DAYS,
+        "transform": GRID,
+        "crs": 32633,
+        **kwargs,
+    }
+    data = arguments.pop("data")
+    with pytest.raises(ValidationError, match=match):
+        EEOTimeSeries(data, **arguments)
+
+
+# --------------------------------------------------------------------------
+# Compositing
+# --------------------------------------------------------------------------
+NODATA = 0
+
+
+@pytest.fixture
+def scenes():
+    """Five uint16 scenes of (red, nir) with scattered nodata pixels."""
+    rng = np.random.default_rng(3)
+    data = rng.integers(100, 5000, size=(5, 2, 40, 30), dtype=np.uint16)
+    data[rng.random(data.shape) < 0.3] = NODATA
+    data[:, :, 0, 0] = NODATA  # never observed
+    return data
+
+
+def as_series(data):
+    return EEOTimeSeries(
+        data,
+        timestamps=[dt.datetime(2023, 6, day + 1) for day in range(len(data))],
+        transform=GRID,
+        crs=32633,
+        nodata=NODATA,
+        band_names=["red", "nir"],
+    )
+
+
+def masked(data):
+    stack = data.astype("float32")
+    stack[data == NODATA] = np.nan
+    return stack
+
+
+@pytest.mark.parametrize(
+    ("method", "reduce"),
+    [
+        ("median", lambda s: np.nanmedian(s, axis=0)),
+        ("mean", lambda s: np.nanmean(s, axis=0)),
+        ("p90", lambda s: np.nanpercentile(s, 90, axis=0)),
+        ("p2.5", lambda s: np.nanpercentile(s, 2.5, axis=0)),
+    ],
+)
+def test_reductions_skip_nodata(scenes, method, reduce):
+    result = eeo.composite(as_series(scenes), method)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # the never-observed pixel
+        expected = reduce(masked(scenes))
+    np.testing.assert_allclose(result.to_array(), expected, rtol=1e-6)
+    assert np.isnan(result.to_array()[:, 0, 0]).all()
+    assert result.get_dtype() == np.float32
+    assert np.isnan(result.get_nodata())
+    assert result.band_names == ["red", "nir"]
+    assert result.get_transform() == GRID
+
+
+def test_max_ndvi_takes_every_band_from_the_greenest_observation(scenes):
+    result = as_series(scenes).composite("max_ndvi", red="red", nir=2)
+
+    stack = masked(scenes)
+    ndvi = (stack[:, 1] - stack[:, 0]) / (stack[:, 1] + stack[:, 0])
+    best = np.argmax(np.where(np.isnan(ndvi), -np.inf, ndvi), axis=0)
+    rows, cols = np.indices(best.shape)
+    expected = stack[best, :, rows, cols].transpose(2, 0, 1)
+    expected[:, np.isnan(ndvi).all(axis=0)] = np.nan
+    np.testing.assert_array_equal(result.to_array(), expected)
+
+
+def test_file_backed_scenes_are_read_block_by_block(scenes, tiled_scene, monkeypatch):
+    from eeo.core.adapters import RasterioAdapter
+
+    paths = []
+    for index, scene in enumerate(scenes):
+        paths.append(tiled_scene(scene, nodata=NODATA, name=f"scene{index}.tif"))
+    windows = []
+    read_window = RasterioAdapter.read_window
+
+    def spy(self, window, indexes=None):
+        windows.append(window)
+        return read_window(self, window, indexes)
+
+    monkeypatch.setattr(RasterioAdapter, "read_window", spy)
+    # One 16x16 tile of all five scenes fits the budget, and nothing more.
+    with eeo.set_options(block_budget=5 * 16 * 16 * 2 * 2):
+        result = eeo.composite([eeo.load_raster(path) for path in paths], "median", workers=2)
+
+    assert len(windows) == 5 * 6  # every tile of every scene, read once
+    assert all(window.height <= 16 and window.width <= 16 for window in windows)
+    np.testing.assert_array_equal(
+        result.to_array(), eeo.composite(as_series(scenes), "median").to_array()
+    )
+
+
+@pytest.mark.parametrize(
+    ("source", "kwargs", "error", "match"),
+    [
+        ("series", {"method": "mode"}, ValidationError, "method"),
+        ("series", {"method": "p101"}, ValidationError, "method"),
+        ("series", {"method": "max_ndvi"}, ValidationError, "red= and nir="),
+        ("series", {"workers": 0}, ValidationError, "workers"),
+        ("one", {}, ValidationError, "single"),
+        ("none", {}, ValidationError, "at least one"),
+        ("misaligned", {}, eeo.AlignmentError, "grid"),
+    ],
+)
+def test_invalid_composites_raise(scenes, source, kwargs, error, match):
+    series = as_series(scenes)
+    sources = {
+        "series": series,
+        "one": series[0],
+        "none": [],
+        "misaligned": [
+            series[0],
+            series[1].clip_raster_with_bbox((500000, 4199800, 500100, 4200000)),
+        ],
+    }
+    with pytest.raises(error, match=match):
+        eeo.composite(sources[source], **kwargs)
@@ -0,0 +1,142 @@
+"""Windowed reads and block iteration on EEORasterDataset, across backends."""
+
+import numpy as np
+import pytest
+import rasterio as rio
+from rasterio.windows import Window
+
+import eeo
+from conftest import GRID, UTM_CRS
+from eeo import load_array, load_raster
+
+
+@pytest.fixture
+def scene():
+    rng = np.random.default_rng(5)
+    return rng.integers(1, 10_000, size=(3, 50, 70)).astype(np.uint16)
+
+
+@pytest.fixture
+def tiled_path(tiled_scene, scene):
+    """50x70 three-band GeoTIFF in 16x16 tiles with named bands."""
+    return tiled_scene(scene, nodata=0, band_names=["green", "red", "nir"], name="tiled.tif")
+
+
+@pytest.fixture(params=["rasterio", "numpy"])
+def ds(request, tiled_path, scene):
+    if request.param == "rasterio":
+        return load_raster(tiled_path)
+    return load_array(
+        scene, transform=GRID, crs=UTM_CRS, nodata=0, band_names=["green", "red", "nir"]
+    )
+
+
+def test_read_window_by_pixel_window(ds, scene):
+    block = ds.read_window(Window(10, 5, 20, 8))
+
+    np.testing.assert_array_equal(block, scene[:, 5:13, 10:30])
+
+
+def test_read_window_by_bounds(ds, scene):
+    # Columns 2..5 and rows 1..3 of the 10 m grid.
+    block = ds.read_window((500_020, 4_199_970, 500_060, 4_199_990), bands="nir")
+
+    np.testing.assert_array_equal(block, scene[2, 1:3, 2:6])
+
+
+def test_read_window_band_selection(ds, scene):
+    window = Window(0, 0, 4, 4)
+
+    assert ds.read_window(window, bands=2).shape == (4, 4)
+    np.testing.assert_array_equal(ds.read_window(window, bands=["nir", 1]), scene[[2, 0], :4, :4])
+
+
+def test_read_window_crops_overhang(ds, scene):
+    block = ds.read_window(Window(60, 45, 20, 20))
+
+    np.testing.assert_array_equal(block, scene[:, 45:, 60:])
+
+
+@pytest.mark.parametrize(
+    "window",
+    [Window(100, 100, 5, 5), (0, 0, 1, 1), "not a window", (1, 2, 3)],
+)
+def test_read_window_rejects_bad_regions(ds, window):
+    with pytest.raises(eeo.ValidationError):
+        ds.read_window(window)
+
+
+def test_read_window_bad_band(ds):
+    with pytest.raises(IndexError):
+        ds.read_window(Window(0, 0, 2, 2), bands=4)
+    with pytest.raises(eeo.ValidationError):
+        ds.read_window(Window(0, 0, 2, 2), bands="swir")
+
+
+def test_iter_blocks_follows_native_tiles(tiled_path, scene):
+    ds = load_raster(tiled_path)
+    with rio.open(tiled_path) as src:
+        native = [window for _, window in src.block_windows(1)]
+
+    pairs = list(ds.iter_blocks())
+
+    assert [window for window, _ in pairs] == native
+    for window, block in pairs:
+        (r0, r1), (c0, c1) = window.toranges()
+        np.testing.assert_array_equal(block, scene[:, r0:r1, c0:c1])
+
+
+def test_iter_blocks_covers_raster_once(ds, scene):
+    out = np.zeros_like(scene)
+    hits = np.zeros(scene.shape[1:], dtype=int)
+    for window, block in ds.iter_blocks((12, 25)):
+        (r0, r1), (c0, c1) = window.toranges()
+        out[:, r0:r1, c0:c1] = block
+        hits[r0:r1, c0:c1] += 1
+
+    np.testing.assert_array_equal(out, scene)
+    assert (hits == 1).all()
+
+
+def test_iter_blocks_with_overlap(ds, scene):
+    windows = [window for window, _ in ds.iter_blocks((16, 16), overlap=2)]
+
+    assert windows[0] == Window(0, 0, 18, 18)
+    assert windows[1] == Window(14, 0, 20, 18)
+    for window, block in ds.iter_blocks((16, 16), overlap=2, bands="red"):
+        (r0, r1), (c0, c1) = window.toranges()
+        np.testing.assert_array_equal(block, scene[1, r0:r1, c0:c1])
+
+
+def test_iter_blocks_numpy_backend_uses_budget_strips(scene):
+    ds = load_array(scene, transform=GRID, crs=UTM_CRS)
+    with eeo.set_options(block_budget=3 * 2 * 70 * 10):
+        windows = [window for window, _ in ds.iter_blocks()]
+
+    assert windows[0] == Window(0, 0, 70, 10)
+    assert len(windows) == 5
+
+
+def test_iter_blocks_on_deferred_result_stays_unevaluated(ds, scene):
+    with eeo.set_options(deferred=True):
+        doubled = ds.multiply(2)
+
+    for window, block in doubled.iter_blocks((25, 35)):
+        (r0, r1), (c0, c1) = window.toranges()
+        np.testing.assert_array_equal(block, scene[:, r0:r1, c0:c1] * 2)
+    assert not doubled._adapter.is_materialized
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"block_shape": (0, 4)}, "block_shape"),
+        ({"block_shape": (4,)}, "block_shape"),
+        ({"overlap": -1}, "overlap"),
+        ({"overlap": 1.5}, "overlap"),
+    ],
+)
+def test_iter_blocks_validates_arguments(ds, kwargs, match):
+    # Checked on the call itself, before any iteration.
+    with pytest.raises(eeo.ValidationError, match=match):
+        ds.iter_blocks(**kwargs)
@@ -0,0 +1,203 @@
+"""Zonal statistics (eeo/analysis/zonal.py): per-zone summaries in one pass."""
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+import rasterio as rio
+from affine import Affine
+from rasterio.features import geometry_mask
+from shapely.geometry import Point, box
+
+import eeo
+from conftest import GRID
+from eeo import ValidationError
+
+STATS = ["count", "sum", "mean", "min", "max", "std"]
+
+
+@pytest.fixture
+def scene():
+    """Two-band 80x72 float32 scene with nodata and NaN pixels."""
+    rng = np.random.default_rng(5)
+    data = rng.normal(100, 25, size=(2, 80, 72)).astype(np.float32)
+    data[:, 4:9, 10:20] = -9999
+    data[1, 40:42, :] = np.nan
+    return data
+
+
+@pytest.fixture
+def parcels():
+    """Parcels of assorted sizes, some spanning blocks, plus awkward zones."""
+    rng = np.random.default_rng(8)
+    shapes = []
+    for _ in range(40):
+        x, y = rng.uniform(500_000, 500_650), rng.uniform(4_199_250, 4_199_950)
+        w, h = rng.uniform(15, 120, size=2)
+        shapes.append(box(x, y - h, x + w, y).buffer(rng.uniform(0, 10)))
+    shapes += [
+        box(500_100, 4_199_910, 500_200, 4_199_960),  # nodata only
+        box(400_000, 4_000_000, 400_100, 4_000_100),  # outside the raster
+        None,
+    ]
+    return gpd.GeoDataFrame(
+        {"parcel": [f"p{i}" for i in range(len(shapes))]},
+        geometry=shapes,
+        crs=32633,
+        index=np.arange(100, 100 + len(shapes)),
+    )
+
+
+def reference(data, parcels, nodata=-9999):
+    """Clip-and-summarize, zone by zone, on the whole scene."""
+    rows = []
+    for geometry in parcels.geometry:
+        row = {}
+        for band, pixels in zip(("b1", "b2"), data, strict=True):
+            inside = (
+                ~geometry_mask([geometry], pixels.shape, GRID)
+                if geometry is not None
+                else np.zeros(pixels.shape, bool)
+            )
+            values = pixels[inside & (pixels != nodata) & ~np.isnan(pixels)].astype("float64")
+            empty = values.size == 0
+            row[f"{band}_count"] = values.size
+            row[f"{band}_sum"] = np.nan if empty else values.sum()
+            row[f"{band}_mean"] = np.nan if empty else values.mean()
+            row[f"{band}_min"] = np.nan if empty else values.min()
+            row[f"{band}_max"] = np.nan if empty else values.max()
+            row[f"{band}_std"] = np.nan if empty else values.std()
+        rows.append(row)
+    return rows
+
+
+def test_matches_clipping_zone_by_zone(scene, parcels):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-9999, band_names=["b1", "b2"])
+
+    table = ds.zonal_stats(parcels, stats=STATS)
+
+    assert list(table.index) == list(parcels.index)
+    assert table["b1_count"].dtype == np.int64
+    expected = reference(scene, parcels)
+    for column in table.columns:
+        np.testing.assert_allclose(
+            table[column].to_numpy(), [row[column] for row in expected], rtol=1e-9
+        )
+    assert table.loc[140, "b1_count"] == 0 and np.isnan(table.loc[140, "b1_mean"])
+    assert table.loc[141:142, "b2_count"].eq(0).all()
+
+
+def test_every_block_is_read_once_and_empty_blocks_never(scene, parcels, tiled_scene, monkeypatch):
+    from eeo.core.adapters import RasterioAdapter
+
+    path = tiled_scene(scene, nodata=-9999)
+    windows = []
+    read_window = RasterioAdapter.read_window
+
+    def spy(self, window, indexes=None):
+        windows.append((window.row_off, window.col_off))
+        return read_window(self, window, indexes)
+
+    monkeypatch.setattr(RasterioAdapter, "read_window", spy)
+    zone = gpd.GeoDataFrame(geometry=[box(500_005, 4_199_850, 500_250, 4_199_995)], crs=32633)
+    with eeo.set_options(block_budget=16 * 16 * 4 * 2):
+        table = eeo.load_raster(path).zonal_stats(zone, "mean", bands=2, workers=2)
+
+    assert sorted(windows) == [(0, 0), (0, 16)]  # the two tiles under the zone
+    inside = ~geometry_mask(zone.geometry, (80, 72), GRID)
+    values = scene[1][inside]
+    assert table.loc[0, "mean"] == pytest.approx(values[values != -9999].mean())
+
+
+def test_results_do_not_depend_on_threads_or_blocks(scene, parcels, tiled_scene):
+    ds = eeo.load_raster(tiled_scene(scene, nodata=-9999))
+
+    whole = ds.zonal_stats(parcels, STATS)
+    with eeo.set_options(block_budget=16 * 16 * 4 * 2):
+        single = ds.zonal_stats(parcels, STATS, workers=1)
+        threaded = ds.zonal_stats(parcels, STATS, workers=4)
+
+    assert threaded.equals(single)  # merged in window order, not completion order
+    pd.testing.assert_frame_equal(single, whole, rtol=1e-9)
+
+
+def test_zones_are_reprojected_once(scene, parcels):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-9999)
+    lonlat = parcels.to_crs(4326)
+
+    np.testing.assert_allclose(
+        ds.zonal_stats(lonlat, "mean", bands=1).to_numpy(),
+        ds.zonal_stats(parcels, "mean", bands=1).to_numpy(),
+        rtol=1e-6,
+    )
+
+
+def test_overlapping_zones_each_get_every_pixel():
+    data = np.arange(16, dtype="int16").reshape(1, 4, 4)
+    ds = eeo.load_array(data, transform=Affine.translation(0, 4) * Affine.scale(1, -1), crs=32633)
+    zones = gpd.GeoDataFrame(
+        geometry=[
+            box(0, 0, 4, 4),
+            box(1, 2, 2, 3),  # inside the first: pixel (1, 1)
+            box(2, 2, 4, 4),  # shares an edge with the second
+            box(1.1, 2.1, 1.9, 2.9),  # inside the second, away from its pixel's edges
+        ],
+        crs=32633,
+    )
+
+    centres = ds.zonal_stats(zones, ["count", "sum"])
+    touched = ds.zonal_stats(zones, "count", all_touched=True)
+
+    assert centres["count"].tolist() == [16, 1, 4, 1]
+    assert centres["sum"].tolist() == [120, 5, 2 + 3 + 6 + 7, 5]
+    grid = ds.get_transform()
+    alone = [(~geometry_mask([g], (4, 4), grid, all_touched=True)).sum() for g in zones.geometry]
+    assert touched["count"].tolist() == alone
+    point = gpd.GeoDataFrame(geometry=[Point(2.5, 2.5)], crs=32633)
+    assert ds.zonal_stats(point, "count", all_touched=True)["count"].tolist() == [1]
+
+
+def test_a_pixel_centre_on_a_shared_edge_counts_for_both_zones():
+    data = np.arange(16, dtype="int16").reshape(1, 4, 4)
+    grid = Affine.translation(0, 4) * Affine.scale(1, -1)
+    ds = eeo.load_array(data, transform=grid, crs=32633)
+    halves = gpd.GeoDataFrame(geometry=[box(0, 0, 4, 2.5), box(0, 2.5, 4, 4)], crs=32633)
+
+    counts = ds.zonal_stats(halves, "count")["count"].tolist()
+
+    # GDAL burns the row of centres on y=2.5 into each half drawn on its own.
+    alone = [(~geometry_mask([g], (4, 4), grid)).sum() for g in halves.geometry]
+    assert counts == alone == [12, 8]
+
+
+def test_zones_from_a_file(scene, parcels, tmp_path):
+    path = tmp_path / "parcels.gpkg"
+    parcels.iloc[:5].reset_index(drop=True).to_file(path)
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-9999)
+
+    table = ds.zonal_stats(str(path), "count", bands=[1])
+
+    assert list(table.columns) == ["count"]
+    assert table["count"].tolist() == [row["b1_count"] for row in reference(scene, parcels[:5])]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error", "match"),
+    [
+        ({"stats": "median"}, ValidationError, "unknown zonal statistic"),
+        ({"zones": "missing.gpkg"}, ValidationError, "zones must be"),
+        ({"bands": 3}, IndexError, "3"),
+        ({"workers": 0}, ValidationError, "workers"),
+    ],
+)
+def test_invalid_zonal_stats_raise(scene, parcels, kwargs, error, match):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633)
+    arguments = {"zones": parcels, **kwargs}
+    with pytest.raises(error, match=match):
+        ds.zonal_stats(**arguments)
+
+
+def test_rasterio_and_numpy_backends_agree(scene, parcels):
+    ds = eeo.load_array(scene, transform=GRID, crs=32633, nodata=-9999)
+    with rio.Env():
+        assert ds.to_rasterio().zonal_stats(parcels, STATS).equals(ds.zonal_stats(parcels, STATS))